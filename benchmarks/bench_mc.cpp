@@ -1,13 +1,31 @@
+#include "quant/american.hpp"
 #include "quant/asian.hpp"
 #include "quant/barrier.hpp"
+#include "quant/heston.hpp"
+#include "quant/lookback.hpp"
 #include "quant/mc.hpp"
 #include "quant/mc_barrier.hpp"
+#include "quant/mc_greeks.hpp"
+#include "quant/mlmc.hpp"
+#include "quant/multi.hpp"
+#include "quant/portfolio.hpp"
+#include "quant/qmc/sobol.hpp"
+#include "quant/risk.hpp"
+#include <algorithm>
 #include <benchmark/benchmark.h>
+#include <cmath>
+#include <fstream>
+#include <string>
+#include <vector>
 
 #ifdef QUANT_HAS_OPENMP
 #include <omp.h>
 #endif
 
+#ifdef __GLIBC__
+#include <malloc.h>
+#endif
+
 static void BM_MC_PathsPerSecond(benchmark::State& state) {
     const int threads = static_cast<int>(state.range(0));
     quant::mc::McParams mp{.spot = 100.0,
@@ -80,7 +98,64 @@ static void BM_MC_Rmse_QMC(benchmark::State& state) {
     state.counters["std_error"] = last.estimate.std_error;
 }
 
+// Strike ladder of range(0) calls and puts: one shared simulation vs one simulation per option.
+static quant::mc::McParams ladder_params() {
+    return quant::mc::McParams{.spot = 100.0,
+                               .strike = 100.0,
+                               .rate = 0.03,
+                               .dividend = 0.01,
+                               .vol = 0.2,
+                               .time = 1.0,
+                               .num_paths = static_cast<std::uint64_t>(50'000),
+                               .seed = 2024,
+                               .antithetic = true,
+                               .control_variate = true,
+                               .qmc = quant::mc::McParams::Qmc::None,
+                               .bridge = quant::mc::McParams::Bridge::None,
+                               .num_steps = 16};
+}
+
+static std::vector<quant::mc::OptionSpec> ladder_options(int count) {
+    std::vector<quant::mc::OptionSpec> options;
+    for (int i = 0; i < count; ++i) {
+        const double strike = 70.0 + 60.0 * static_cast<double>(i) / std::max(1, count - 1);
+        options.push_back({strike, (i % 2 == 0) ? quant::OptionType::Call : quant::OptionType::Put});
+    }
+    return options;
+}
+
+static void BM_MC_StrikeLadder_Loop(benchmark::State& state) {
+    const auto options = ladder_options(static_cast<int>(state.range(0)));
+    auto mp = ladder_params();
+    for (auto _ : state) {
+        for (const auto& option : options) {
+            mp.strike = option.strike;
+            if (option.type == quant::OptionType::Call) {
+                benchmark::DoNotOptimize(quant::mc::price_european_call(mp).estimate.value);
+            } else {
+                auto batch = quant::mc::price_european_batch(mp, {option});
+                benchmark::DoNotOptimize(batch.estimates.front().value);
+            }
+        }
+    }
+    state.counters["options/s"] = benchmark::Counter(static_cast<double>(options.size()),
+                                                     benchmark::Counter::kIsIterationInvariantRate);
+}
+
+static void BM_MC_StrikeLadder_Batch(benchmark::State& state) {
+    const auto options = ladder_options(static_cast<int>(state.range(0)));
+    const auto mp = ladder_params();
+    for (auto _ : state) {
+        auto batch = quant::mc::price_european_batch(mp, options);
+        benchmark::DoNotOptimize(batch.estimates.data());
+    }
+    state.counters["options/s"] = benchmark::Counter(static_cast<double>(options.size()),
+                                                     benchmark::Counter::kIsIterationInvariantRate);
+}
+
 BENCHMARK(BM_MC_PathsPerSecond)->Arg(1)->Arg(2)->Arg(4)->Arg(8);
+BENCHMARK(BM_MC_StrikeLadder_Loop)->Arg(8)->Arg(32)->Unit(benchmark::kMillisecond);
+BENCHMARK(BM_MC_StrikeLadder_Batch)->Arg(8)->Arg(32)->Unit(benchmark::kMillisecond);
 BENCHMARK(BM_MC_Rmse_PRNG);
 BENCHMARK(BM_MC_Rmse_QMC);
 
@@ -168,9 +243,561 @@ static void BM_MC_EqualTime_Barrier_QMC(benchmark::State& state) {
     state.counters["std_error"] = last.estimate.std_error;
 }
 
+// Cost-vs-RMSE curve: state.range(0) is the target RMSE in units of 1e-3. "cost" counts simulated
+// time steps; "std_cost" is what single-level MC needs at the finest step count for the same RMSE.
+template <typename Pricer> static void run_mlmc_cost_vs_rmse(benchmark::State& state, Pricer&& price) {
+    const quant::mlmc::MlmcParams params{.target_rmse = 1e-3 * static_cast<double>(state.range(0))};
+    quant::mlmc::MlmcResult last{};
+    for (auto _ : state) {
+        last = price(params);
+        benchmark::DoNotOptimize(last.value);
+    }
+    const double eps2 = params.target_rmse * params.target_rmse;
+    const double std_cost = last.levels.front().variance * last.levels.back().steps / (0.5 * eps2);
+    state.counters["rmse"] = std::hypot(last.std_error, last.bias_estimate);
+    state.counters["levels"] = static_cast<double>(last.levels.size());
+    state.counters["cost"] = last.total_cost;
+    state.counters["std_cost"] = std_cost;
+    state.counters["savings"] = std_cost / last.total_cost;
+}
+
+static void BM_MLMC_CostVsRmse_Barrier(benchmark::State& state) {
+    auto params = make_barrier_params(quant::mc::McParams::Qmc::None);
+    const quant::BarrierSpec spec{quant::BarrierType::DownOut, 80.0, 0.0};
+    run_mlmc_cost_vs_rmse(state, [&](const quant::mlmc::MlmcParams& mlmc) {
+        return quant::mc::price_barrier_mlmc(params, params.strike, quant::OptionType::Call, spec, mlmc);
+    });
+}
+
+static void BM_MLMC_CostVsRmse_Lookback(benchmark::State& state) {
+    const quant::lookback::McParams params{.spot = 100.0,
+                                           .strike = 100.0,
+                                           .rate = 0.05,
+                                           .dividend = 0.0,
+                                           .vol = 0.2,
+                                           .time = 1.0,
+                                           .num_paths = 0,
+                                           .seed = 3,
+                                           .num_steps = 0,
+                                           .antithetic = true,
+                                           .use_bridge = false,
+                                           .opt = quant::OptionType::Call,
+                                           .type = quant::lookback::Type::FloatingStrike};
+    run_mlmc_cost_vs_rmse(state, [&](const quant::mlmc::MlmcParams& mlmc) {
+        return quant::lookback::price_mlmc(params, mlmc);
+    });
+}
+
+static void BM_MLMC_CostVsRmse_HestonQE(benchmark::State& state) {
+    const quant::heston::Params h{1.5, 0.04, 0.5, -0.5, 0.04};
+    const quant::heston::MarketParams mkt{100.0, 100.0, 0.01, 0.0, 1.0};
+    const quant::heston::McParams params{mkt, h, 0, 2025, 0, true};
+    run_mlmc_cost_vs_rmse(state, [&](const quant::mlmc::MlmcParams& mlmc) {
+        return quant::heston::call_qe_mlmc(params, mlmc);
+    });
+}
+
+// Price + delta/gamma/vega/rho/theta of a down-and-out call: one shared-path pass versus
+// re-running the barrier pricer at the base and each of the 7 bumped markets.
+static quant::mc::McParams greeks_barrier_params() {
+    quant::mc::McParams mp{.spot = 100.0,
+                           .strike = 100.0,
+                           .rate = 0.02,
+                           .dividend = 0.0,
+                           .vol = 0.25,
+                           .time = 1.0,
+                           .num_paths = static_cast<std::uint64_t>(50'000),
+                           .seed = 2024,
+                           .antithetic = true,
+                           .control_variate = false};
+    mp.num_steps = 64;
+    return mp;
+}
+
+static void BM_MC_ExoticGreeks_OnePass(benchmark::State& state) {
+    const auto mp = greeks_barrier_params();
+    const quant::BarrierSpec barrier{quant::BarrierType::DownOut, 85.0, 0.0};
+    quant::mc::PathGreeksResult last{};
+    for (auto _ : state) {
+        last = quant::mc::greeks_barrier(mp, mp.strike, quant::OptionType::Call, barrier);
+        benchmark::DoNotOptimize(last.delta.data());
+    }
+    state.counters["delta_se"] = last.delta.front().std_error;
+    state.counters["vega_se"] = last.vega.front().std_error;
+}
+
+static void BM_MC_ExoticGreeks_Rerun(benchmark::State& state) {
+    const auto mp = greeks_barrier_params();
+    const quant::BarrierSpec barrier{quant::BarrierType::DownOut, 85.0, 0.0};
+    const auto price = [&](double spot, double vol, double rate, double time) {
+        auto bumped = mp;
+        bumped.spot = spot;
+        bumped.vol = vol;
+        bumped.rate = rate;
+        bumped.time = time;
+        return quant::mc::price_barrier_option(bumped, mp.strike, quant::OptionType::Call, barrier)
+            .estimate.value;
+    };
+    for (auto _ : state) {
+        const double values[8] = {price(mp.spot, mp.vol, mp.rate, mp.time),
+                                  price(1.01 * mp.spot, mp.vol, mp.rate, mp.time),
+                                  price(0.99 * mp.spot, mp.vol, mp.rate, mp.time),
+                                  price(mp.spot, mp.vol + 0.01, mp.rate, mp.time),
+                                  price(mp.spot, mp.vol - 0.01, mp.rate, mp.time),
+                                  price(mp.spot, mp.vol, mp.rate + 1e-4, mp.time),
+                                  price(mp.spot, mp.vol, mp.rate - 1e-4, mp.time),
+                                  price(mp.spot, mp.vol, mp.rate, mp.time - 1.0 / 365.0)};
+        benchmark::DoNotOptimize(values);
+    }
+}
+
+static quant::mc::McParams adjoint_schedule_params(int buckets) {
+    quant::mc::McParams mp{.spot = 100.0,
+                           .strike = 100.0,
+                           .rate = 0.0,
+                           .dividend = 0.0,
+                           .vol = 0.0,
+                           .time = 1.0,
+                           .num_paths = 20000,
+                           .seed = 13,
+                           .antithetic = true,
+                           .control_variate = false};
+    mp.num_steps = 64;
+    quant::PiecewiseConstant rates{{}, {}};
+    quant::PiecewiseConstant vols{{}, {}};
+    for (int j = 0; j < buckets; ++j) {
+        const double t = static_cast<double>(j + 1) / buckets;
+        rates.times.push_back(t);
+        rates.values.push_back(0.02 + 0.01 * t);
+        vols.times.push_back(t);
+        vols.values.push_back(0.25 - 0.05 * t);
+    }
+    mp.rate_schedule = rates;
+    mp.vol_schedule = vols;
+    return mp;
+}
+
+// Every rate and vol bucket sensitivity from one adjoint pass.
+static void BM_MC_BucketGreeks_Adjoint(benchmark::State& state) {
+    const auto mp = adjoint_schedule_params(static_cast<int>(state.range(0)));
+    for (auto _ : state) {
+        const auto res = quant::mc::greeks_european_call_adjoint(mp);
+        benchmark::DoNotOptimize(res.vol_buckets.data());
+    }
+}
+
+// The same sensitivities from central bumps of each bucket with common random numbers.
+static void BM_MC_BucketGreeks_Bumped(benchmark::State& state) {
+    const auto mp = adjoint_schedule_params(static_cast<int>(state.range(0)));
+    const auto bumped = [&](bool rate, std::size_t j, double h) {
+        auto p = mp;
+        (rate ? *p.rate_schedule : *p.vol_schedule).values[j] += h;
+        return quant::mc::price_european_call(p).estimate.value;
+    };
+    for (auto _ : state) {
+        std::vector<double> sens;
+        for (std::size_t j = 0; j < mp.rate_schedule->values.size(); ++j) {
+            sens.push_back((bumped(true, j, 1e-4) - bumped(true, j, -1e-4)) / 2e-4);
+            sens.push_back((bumped(false, j, 1e-3) - bumped(false, j, -1e-3)) / 2e-3);
+        }
+        benchmark::DoNotOptimize(sens.data());
+    }
+}
+
+static quant::heston::McParams adjoint_heston_params() {
+    const quant::heston::MarketParams mkt{100.0, 100.0, 0.01, 0.0, 1.0};
+    const quant::heston::Params h{1.5, 0.04, 0.5, -0.5, 0.04};
+    return quant::heston::McParams{mkt, h, 20000, 2025, 64};
+}
+
+static void BM_Heston_Greeks_Adjoint(benchmark::State& state) {
+    const auto p = adjoint_heston_params();
+    for (auto _ : state) {
+        const auto res = quant::heston::greeks_call_adjoint(p);
+        benchmark::DoNotOptimize(res.vega.value);
+    }
+}
+
+static void BM_Heston_Greeks_Bumped(benchmark::State& state) {
+    const auto p = adjoint_heston_params();
+    const auto price = [&](double spot, double rate, double v0) {
+        auto bumped = p;
+        bumped.mkt.spot = spot;
+        bumped.mkt.rate = rate;
+        bumped.h.v0 = v0;
+        return quant::heston::call_qe_mc(bumped).price;
+    };
+    const double S = p.mkt.spot, r = p.mkt.rate, v0 = p.h.v0;
+    for (auto _ : state) {
+        const double values[7] = {price(S, r, v0),        price(1.01 * S, r, v0), price(0.99 * S, r, v0),
+                                  price(S, r + 1e-4, v0), price(S, r - 1e-4, v0), price(S, r, v0 + 1e-3),
+                                  price(S, r, v0 - 1e-3)};
+        benchmark::DoNotOptimize(values);
+    }
+}
+
+// Resident-set sizes from /proc/self/status in MiB (0 where unavailable). Writing "5" to
+// /proc/self/clear_refs resets the peak (VmHWM) to the current RSS on Linux; freed heap is returned
+// first so earlier benchmarks do not hide later allocations.
+static double proc_status_mib(const std::string& key) {
+    std::ifstream status("/proc/self/status");
+    std::string field;
+    double kib = 0.0;
+    while (status >> field) {
+        if (field == key + ":") {
+            status >> kib;
+            break;
+        }
+    }
+    return kib / 1024.0;
+}
+
+static void reset_peak_rss() {
+#ifdef __GLIBC__
+    malloc_trim(0);
+#endif
+    std::ofstream("/proc/self/clear_refs") << "5";
+}
+
+// Peak RSS of one American put LSMC run at 250 dates vs range(0) paths (antithetic pairs);
+// range(1) = 0 stores the shock matrix, 1 streams paths by Brownian bridge.
+static void BM_LSMC_PeakRss(benchmark::State& state) {
+    const quant::american::LsmcParams params{.base = {.spot = 100.0,
+                                                      .strike = 100.0,
+                                                      .rate = 0.03,
+                                                      .dividend = 0.0,
+                                                      .vol = 0.2,
+                                                      .time = 1.0,
+                                                      .type = quant::OptionType::Put},
+                                             .num_paths = static_cast<std::uint64_t>(state.range(0)),
+                                             .seed = 2024,
+                                             .num_steps = 250,
+                                             .min_itm = 0,
+                                             .streaming = state.range(1) != 0};
+    double baseline = 0.0;
+    double peak = 0.0;
+    double price = 0.0;
+    for (auto _ : state) {
+        reset_peak_rss();
+        baseline = proc_status_mib("VmRSS");
+        const auto res = quant::american::price_lsmc(params);
+        benchmark::DoNotOptimize(res.price);
+        peak = proc_status_mib("VmHWM");
+        price = res.price;
+    }
+    state.counters["peak_rss_mib"] = peak;
+    state.counters["extra_rss_mib"] = peak - baseline;
+    state.counters["price"] = price;
+}
+
+// American put LSMC at 50 dates, 100k antithetic pairs, by regression basis range(0) (0 = monomial,
+// 1 = Laguerre, 2 = Hermite) and degree range(1); range(2) = 1 prices the fitted rule out of sample.
+static void BM_LSMC_Basis(benchmark::State& state) {
+    quant::american::LsmcParams params{.base = {.spot = 100.0,
+                                                .strike = 100.0,
+                                                .rate = 0.03,
+                                                .dividend = 0.0,
+                                                .vol = 0.2,
+                                                .time = 1.0,
+                                                .type = quant::OptionType::Put},
+                                       .num_paths = 100000,
+                                       .seed = 2024,
+                                       .num_steps = 50,
+                                       .min_itm = 0,
+                                       .streaming = true};
+    params.basis = {.family = static_cast<quant::american::LsmcBasis::Family>(state.range(0)),
+                    .degree = static_cast<int>(state.range(1))};
+    params.out_of_sample = state.range(2) != 0;
+    quant::american::LsmcResult last{};
+    for (auto _ : state) {
+        const auto res = quant::american::price_lsmc(params);
+        benchmark::DoNotOptimize(res.price);
+        last = res;
+    }
+    state.counters["price"] = last.price;
+    state.counters["std_error"] = last.std_error;
+}
+
+// 100k-position vanilla book over 200 underlyings (500 positions each).
+static std::vector<quant::portfolio::VanillaPosition> tick_book(std::vector<std::size_t>* underlyings) {
+    std::vector<quant::portfolio::VanillaPosition> positions;
+    for (std::size_t i = 0; i < 100'000; ++i) {
+        const auto type =
+            (i % 2 == 0) ? quant::portfolio::OptionType::Call : quant::portfolio::OptionType::Put;
+        positions.push_back({type, (i % 3 == 0) ? -2.0 : 1.5, 100.0, 75.0 + static_cast<double>(i % 50),
+                             0.01 + 0.005 * static_cast<double>(i % 5), 0.0,
+                             0.12 + 0.03 * static_cast<double>(i % 9),
+                             (7.0 + static_cast<double>(i % 720)) / 365.0});
+        underlyings->push_back(i % 200);
+    }
+    return positions;
+}
+
+// Latency of one spot tick on one underlying, repricing its 500 positions and updating totals.
+static void BM_TickRisk_SpotUpdate(benchmark::State& state) {
+    std::vector<std::size_t> underlyings;
+    const auto positions = tick_book(&underlyings);
+    quant::portfolio::TickRiskEngine engine(positions, underlyings);
+    std::size_t tick = 0;
+    for (auto _ : state) {
+        const double spot = 100.0 + 0.01 * static_cast<double>(tick % 17);
+        benchmark::DoNotOptimize(engine.apply({.underlying = tick % 200, .spot = spot}));
+        benchmark::DoNotOptimize(engine.totals().value);
+        ++tick;
+    }
+    state.counters["positions_repriced"] = 500;
+}
+
+// Baseline: full price_risk of the same 100k-position book.
+static void BM_TickRisk_FullRecompute(benchmark::State& state) {
+    std::vector<std::size_t> underlyings;
+    const auto positions = tick_book(&underlyings);
+    for (auto _ : state) {
+        const auto risk = quant::portfolio::price_risk(positions);
+        benchmark::DoNotOptimize(risk.totals.value);
+    }
+    state.counters["positions_repriced"] = static_cast<double>(positions.size());
+}
+
+// 2000 one-day historical-style scenarios over the first 10k positions of tick_book; range(0)
+// selects Full, Taylor or Hybrid revaluation (tolerance 0.1 per cell).
+static void BM_ScenarioPnl_Revaluation(benchmark::State& state) {
+    std::vector<std::size_t> underlyings;
+    auto positions = tick_book(&underlyings);
+    positions.resize(10'000);
+    std::vector<quant::portfolio::MarketShock> shocks;
+    for (std::uint64_t s = 0; s < 2000; ++s) {
+        shocks.push_back({0.012 * quant::rng::normal(3, s, 0U, 0U, 0U),
+                          0.008 * quant::rng::normal(3, s, 0U, 1U, 0U),
+                          0.0002 * quant::rng::normal(3, s, 0U, 2U, 0U), 0.0, 1.0 / 252.0});
+    }
+    const auto mode = static_cast<quant::portfolio::Revaluation>(state.range(0));
+    const quant::portfolio::Portfolio book(positions);
+    std::size_t revalued = 0;
+    for (auto _ : state) {
+        auto run = book;
+        const auto res = run.scenario_pnl(shocks, quant::portfolio::ScenarioOptions{mode, 0.1, false});
+        benchmark::DoNotOptimize(res.portfolio_pnl.data());
+        revalued = res.revalued_cells.size();
+    }
+    const double cells = static_cast<double>(positions.size() * shocks.size());
+    state.counters["cells_per_second"] =
+        benchmark::Counter(cells * static_cast<double>(state.iterations()), benchmark::Counter::kIsRate);
+    state.counters["revalued_fraction"] = static_cast<double>(revalued) / cells;
+}
+
+// Rolling-backtest shape: VaR/ES at three alphas for 2000 windows of 250 daily P&L samples, held
+// row-major (rows = days, columns = windows).
+constexpr std::size_t kVarWindowRows = 250;
+constexpr std::size_t kVarWindowCount = 2000;
+
+static std::vector<double> var_windows() {
+    std::vector<double> pnl(kVarWindowRows * kVarWindowCount);
+    for (std::size_t i = 0; i < pnl.size(); ++i) {
+        pnl[i] = quant::rng::normal(5, i, 0U, 0U, 0U);
+    }
+    return pnl;
+}
+
+static void BM_VarCvar_Batch(benchmark::State& state) {
+    const auto pnl = var_windows();
+    const std::vector<double> alphas{0.95, 0.975, 0.99};
+    for (auto _ : state) {
+        const auto res = quant::risk::var_cvar_batch(pnl.data(), kVarWindowRows, kVarWindowCount,
+                                                     kVarWindowCount, 1, alphas);
+        benchmark::DoNotOptimize(res.var.data());
+    }
+    state.counters["windows_per_second"] = benchmark::Counter(static_cast<double>(kVarWindowCount),
+                                                              benchmark::Counter::kIsIterationInvariantRate);
+}
+
+// Baseline: gather each window and copy-and-sort it once per alpha.
+static void BM_VarCvar_SortPerCall(benchmark::State& state) {
+    const auto pnl = var_windows();
+    const std::vector<double> alphas{0.95, 0.975, 0.99};
+    std::vector<double> window(kVarWindowRows);
+    for (auto _ : state) {
+        double total = 0.0;
+        for (std::size_t c = 0; c < kVarWindowCount; ++c) {
+            for (std::size_t r = 0; r < kVarWindowRows; ++r) {
+                window[r] = pnl[r * kVarWindowCount + c];
+            }
+            for (double alpha : alphas) {
+                std::vector<double> sorted = window;
+                std::sort(sorted.begin(), sorted.end());
+                const auto idx = static_cast<std::size_t>(std::floor((1.0 - alpha) * kVarWindowRows));
+                double es = 0.0;
+                for (std::size_t i = 0; i <= idx; ++i) {
+                    es -= sorted[i];
+                }
+                total += es / static_cast<double>(idx + 1) - sorted[idx];
+            }
+        }
+        benchmark::DoNotOptimize(total);
+    }
+    state.counters["windows_per_second"] = benchmark::Counter(static_cast<double>(kVarWindowCount),
+                                                              benchmark::Counter::kIsIterationInvariantRate);
+}
+
+// Streaming rolling backtest over 100k daily returns; range(0) is the window length.
+static void BM_RollingVar_Backtest(benchmark::State& state) {
+    std::vector<double> returns(100'000);
+    for (std::size_t t = 0; t < returns.size(); ++t) {
+        returns[t] = 0.01 * quant::rng::normal(9, t, 0U, 0U, 0U);
+    }
+    const quant::risk::RollingVarParams params{.window = static_cast<std::size_t>(state.range(0)),
+                                               .alphas = {0.95, 0.975, 0.99}};
+    for (auto _ : state) {
+        const auto res = quant::risk::rolling_var_backtest(returns, params);
+        benchmark::DoNotOptimize(res.var.data());
+    }
+    state.counters["steps_per_second"] = benchmark::Counter(static_cast<double>(returns.size()),
+                                                            benchmark::Counter::kIsIterationInvariantRate);
+}
+
+// Gaussian-copula portfolio VaR; range(0) is the number of risk factors (equicorrelated at 0.3).
+static void BM_VarCvar_Portfolio(benchmark::State& state) {
+    const auto n = static_cast<std::size_t>(state.range(0));
+    const std::vector<double> mu(n, 0.03);
+    const std::vector<double> sigma(n, 0.2);
+    const std::vector<double> weights(n, 1.0 / static_cast<double>(n));
+    std::vector<double> corr(n * n, 0.3);
+    for (std::size_t i = 0; i < n; ++i) {
+        corr[i * n + i] = 1.0;
+    }
+    const unsigned long sims = 20000;
+    for (auto _ : state) {
+        const auto res =
+            quant::risk::var_cvar_portfolio(mu, sigma, corr, weights, 10.0 / 252.0, sims, 3, 0.99);
+        benchmark::DoNotOptimize(res.var);
+    }
+    state.counters["sims_per_second"] =
+        benchmark::Counter(static_cast<double>(sims), benchmark::Counter::kIsIterationInvariantRate);
+}
+
+static void BM_VarCvar_StudentT(benchmark::State& state) {
+    const unsigned long sims = 200000;
+    for (auto _ : state) {
+        const auto res = quant::risk::var_cvar_t(0.0, 0.2, 4.0, 10.0 / 252.0, 1.0, sims, 3, 0.99);
+        benchmark::DoNotOptimize(res.var);
+    }
+    state.counters["sims_per_second"] =
+        benchmark::Counter(static_cast<double>(sims), benchmark::Counter::kIsIterationInvariantRate);
+}
+
+// 50-name equicorrelated basket call; range(0): 0 = MC, 1 = MC + geometric CV, 2 = scrambled Sobol + CV.
+static void BM_Basket50(benchmark::State& state) {
+    const std::size_t n = 50;
+    quant::multi::BasketMcParams p{};
+    for (std::size_t k = 0; k < n; ++k) {
+        p.spots.push_back(80.0 + 0.8 * static_cast<double>(k));
+        p.vols.push_back(0.15 + 0.05 * static_cast<double>(k % 5));
+        p.dividends.push_back(0.01);
+        p.weights.push_back(1.0 / static_cast<double>(n));
+    }
+    p.corr.assign(n * n, 0.3);
+    for (std::size_t k = 0; k < n; ++k) {
+        p.corr[k * n + k] = 1.0;
+    }
+    p.rate = 0.03;
+    p.strike = 100.0;
+    p.time = 1.0;
+    p.num_paths = 20000;
+    p.seed = 11;
+    p.use_geometric_cv = state.range(0) >= 1;
+    p.qmc = (state.range(0) == 2) ? quant::multi::Qmc::SobolScrambled : quant::multi::Qmc::None;
+    double std_error = 0.0;
+    for (auto _ : state) {
+        const auto res = quant::multi::basket_option_mc(p);
+        std_error = res.std_error;
+        benchmark::DoNotOptimize(res.value);
+    }
+    state.counters["paths_per_second"] =
+        benchmark::Counter(static_cast<double>(p.num_paths), benchmark::Counter::kIsIterationInvariantRate);
+    state.counters["std_error"] = std_error;
+}
+
+static void BM_Sobol_RandomAccess(benchmark::State& state) {
+    const quant::qmc::SobolSequence seq(static_cast<std::size_t>(state.range(0)), true, 7);
+    std::vector<double> point(seq.dimension());
+    const std::uint64_t points = 4096;
+    for (auto _ : state) {
+        for (std::uint64_t i = 0; i < points; ++i) {
+            seq.generate(i, point.data());
+        }
+        benchmark::DoNotOptimize(point.data());
+    }
+    state.counters["points/s"] =
+        benchmark::Counter(static_cast<double>(points), benchmark::Counter::kIsIterationInvariantRate);
+}
+
+static void BM_Sobol_Cursor(benchmark::State& state) {
+    const quant::qmc::SobolSequence seq(static_cast<std::size_t>(state.range(0)), true, 7);
+    std::vector<double> point(seq.dimension());
+    const std::uint64_t points = 4096;
+    for (auto _ : state) {
+        auto cursor = seq.cursor(0);
+        for (std::uint64_t i = 0; i < points; ++i) {
+            cursor.next(point.data());
+        }
+        benchmark::DoNotOptimize(point.data());
+    }
+    state.counters["points/s"] =
+        benchmark::Counter(static_cast<double>(points), benchmark::Counter::kIsIterationInvariantRate);
+}
+
+BENCHMARK(BM_MC_ExoticGreeks_OnePass)->Unit(benchmark::kMillisecond);
+BENCHMARK(BM_MC_ExoticGreeks_Rerun)->Unit(benchmark::kMillisecond);
+BENCHMARK(BM_MC_BucketGreeks_Adjoint)->Arg(4)->Arg(16)->Unit(benchmark::kMillisecond);
+BENCHMARK(BM_MC_BucketGreeks_Bumped)->Arg(4)->Arg(16)->Unit(benchmark::kMillisecond);
+BENCHMARK(BM_Heston_Greeks_Adjoint)->Unit(benchmark::kMillisecond);
+BENCHMARK(BM_Heston_Greeks_Bumped)->Unit(benchmark::kMillisecond);
+BENCHMARK(BM_LSMC_PeakRss)
+    ->ArgsProduct({{25'000, 100'000, 400'000}, {0, 1}})
+    ->ArgNames({"paths", "streaming"})
+    ->Iterations(1)
+    ->Unit(benchmark::kMillisecond);
+BENCHMARK(BM_LSMC_Basis)
+    ->ArgsProduct({{0, 1, 2}, {3, 6}, {0, 1}})
+    ->ArgNames({"family", "degree", "oos"})
+    ->Unit(benchmark::kMillisecond);
+BENCHMARK(BM_Sobol_RandomAccess)->Arg(64)->Arg(512);
+BENCHMARK(BM_Sobol_Cursor)->Arg(64)->Arg(512);
+
 BENCHMARK(BM_MC_EqualTime_Asian_PRNG)->Name("BM_MC_EqualTime/Asian/PRNG");
 BENCHMARK(BM_MC_EqualTime_Asian_QMC)->Name("BM_MC_EqualTime/Asian/QMC");
 BENCHMARK(BM_MC_EqualTime_Barrier_PRNG)->Name("BM_MC_EqualTime/Barrier/PRNG");
 BENCHMARK(BM_MC_EqualTime_Barrier_QMC)->Name("BM_MC_EqualTime/Barrier/QMC");
+BENCHMARK(BM_MLMC_CostVsRmse_Barrier)
+    ->Name("BM_MLMC_CostVsRmse/Barrier")
+    ->Arg(80)
+    ->Arg(40)
+    ->Arg(20)
+    ->Arg(10)
+    ->Unit(benchmark::kMillisecond);
+BENCHMARK(BM_MLMC_CostVsRmse_Lookback)
+    ->Name("BM_MLMC_CostVsRmse/Lookback")
+    ->Arg(80)
+    ->Arg(40)
+    ->Arg(20)
+    ->Arg(10)
+    ->Unit(benchmark::kMillisecond);
+BENCHMARK(BM_MLMC_CostVsRmse_HestonQE)
+    ->Name("BM_MLMC_CostVsRmse/HestonQE")
+    ->Arg(80)
+    ->Arg(40)
+    ->Arg(20)
+    ->Arg(10)
+    ->Unit(benchmark::kMillisecond);
+
+BENCHMARK(BM_TickRisk_SpotUpdate)->Unit(benchmark::kMicrosecond);
+BENCHMARK(BM_TickRisk_FullRecompute)->Unit(benchmark::kMicrosecond);
+BENCHMARK(BM_ScenarioPnl_Revaluation)->DenseRange(0, 2)->ArgName("mode")->Unit(benchmark::kMillisecond);
+BENCHMARK(BM_VarCvar_Batch)->Unit(benchmark::kMillisecond);
+BENCHMARK(BM_VarCvar_SortPerCall)->Unit(benchmark::kMillisecond);
+BENCHMARK(BM_RollingVar_Backtest)->Arg(250)->Arg(1000)->Unit(benchmark::kMillisecond);
+BENCHMARK(BM_VarCvar_Portfolio)->Arg(10)->Arg(100)->Arg(500)->Unit(benchmark::kMillisecond);
+BENCHMARK(BM_VarCvar_StudentT)->Unit(benchmark::kMillisecond);
+BENCHMARK(BM_Basket50)->Arg(0)->Arg(1)->Arg(2)->Unit(benchmark::kMillisecond);
 
 BENCHMARK_MAIN();
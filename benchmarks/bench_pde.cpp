@@ -1,5 +1,7 @@
+#include <algorithm>
 #include <benchmark/benchmark.h>
 #include <cmath>
+#include <vector>
 
 #include "quant/american.hpp"
 #include "quant/black_scholes.hpp"
@@ -22,8 +24,9 @@ static void BM_PDE_WallTime(benchmark::State& state) {
                                  .use_rannacher = true};
     quant::pde::PdeResult last{};
     for (auto _ : state) {
-        last = quant::pde::price_crank_nicolson(params);
-        benchmark::DoNotOptimize(last.price);
+        const auto res = quant::pde::price_crank_nicolson(params);
+        benchmark::DoNotOptimize(res.price);
+        last = res;
     }
     state.counters["price"] = last.price;
 }
@@ -47,13 +50,202 @@ static void BM_PSOR_Iterations(benchmark::State& state) {
                                        .use_rannacher = true};
     quant::american::PsorResult last{};
     for (auto _ : state) {
-        last = quant::american::price_psor(params);
-        benchmark::DoNotOptimize(last.price);
+        const auto res = quant::american::price_psor(params);
+        benchmark::DoNotOptimize(res.price);
+        last = res;
     }
     state.counters["iterations"] = static_cast<double>(last.total_iterations);
     state.counters["residual"] = last.max_residual;
 }
 
+// PSOR on the same put with N = M - 1 = range(0); range(1) bit 0 enables warm starts, bit 1 adaptive omega.
+static void BM_PSOR_Adaptive(benchmark::State& state) {
+    const int nodes = static_cast<int>(state.range(0));
+    const int mode = static_cast<int>(state.range(1));
+    quant::american::PsorParams params{.base = {.spot = 100.0,
+                                                .strike = 100.0,
+                                                .rate = 0.05,
+                                                .dividend = 0.02,
+                                                .vol = 0.25,
+                                                .time = 1.0,
+                                                .type = quant::OptionType::Put},
+                                       .grid = quant::pde::GridSpec{nodes, nodes - 1, 4.0, 2.0},
+                                       .log_space = true,
+                                       .upper_boundary = quant::pde::PdeParams::UpperBoundary::Neumann,
+                                       .stretch = 2.0,
+                                       .omega = 1.5,
+                                       .max_iterations = 8000,
+                                       .tolerance = 1e-8,
+                                       .use_rannacher = true,
+                                       .adaptive_omega = (mode & 2) != 0,
+                                       .warm_start = (mode & 1) != 0};
+    quant::american::PsorResult last{};
+    for (auto _ : state) {
+        const auto res = quant::american::price_psor(params);
+        benchmark::DoNotOptimize(res.price);
+        last = res;
+    }
+    state.counters["iterations"] = static_cast<double>(last.total_iterations);
+    state.counters["omega"] = last.omega;
+    state.counters["price"] = last.price;
+}
+
+// Same put as BM_PSOR_Iterations at omega = 1.5, solved by range(0): 0 = PSOR, 1 = Brennan-Schwartz,
+// 2 = policy iteration.
+static void BM_American_Solver(benchmark::State& state) {
+    using Solver = quant::american::PsorParams::Solver;
+    quant::american::PsorParams params{.base = {.spot = 100.0,
+                                                .strike = 100.0,
+                                                .rate = 0.05,
+                                                .dividend = 0.02,
+                                                .vol = 0.25,
+                                                .time = 1.0,
+                                                .type = quant::OptionType::Put},
+                                       .grid = quant::pde::GridSpec{181, 180, 4.0, 2.0},
+                                       .log_space = true,
+                                       .upper_boundary = quant::pde::PdeParams::UpperBoundary::Neumann,
+                                       .stretch = 2.0,
+                                       .omega = 1.5,
+                                       .max_iterations = 8000,
+                                       .tolerance = 1e-8,
+                                       .use_rannacher = true,
+                                       .solver = static_cast<Solver>(state.range(0))};
+    quant::american::PsorResult last{};
+    for (auto _ : state) {
+        const auto res = quant::american::price_psor(params);
+        benchmark::DoNotOptimize(res.price);
+        last = res;
+    }
+    state.counters["iterations"] = static_cast<double>(last.total_iterations);
+    state.counters["price"] = last.price;
+}
+
+// American put delta, gamma and vega: range(0) = 0 bumps and reprices (five PSOR solves, vega by a
+// central vol bump), 1 reads them (and theta) off one solve plus one warm-started vega solve.
+static void BM_American_Greeks(benchmark::State& state) {
+    const quant::american::PsorParams params{.base = {.spot = 100.0,
+                                                      .strike = 100.0,
+                                                      .rate = 0.05,
+                                                      .dividend = 0.02,
+                                                      .vol = 0.25,
+                                                      .time = 1.0,
+                                                      .type = quant::OptionType::Put},
+                                             .grid = quant::pde::GridSpec{181, 180, 4.0, 2.0},
+                                             .log_space = true,
+                                             .upper_boundary = quant::pde::PdeParams::UpperBoundary::Neumann,
+                                             .stretch = 2.0,
+                                             .omega = 1.5,
+                                             .max_iterations = 8000,
+                                             .tolerance = 1e-8,
+                                             .use_rannacher = true};
+    const bool grid_greeks = state.range(0) != 0;
+    double vega = 0.0;
+    for (auto _ : state) {
+        if (grid_greeks) {
+            const auto res = quant::american::greeks_psor(params, true);
+            benchmark::DoNotOptimize(res.delta);
+            vega = *res.vega;
+        } else {
+            const auto res = quant::american::greeks_psor_bump(params, 1e-2);
+            auto up = params;
+            up.base.vol += 1e-2;
+            auto down = params;
+            down.base.vol -= 1e-2;
+            const double up_price = quant::american::price_psor(up).price;
+            const double down_price = quant::american::price_psor(down).price;
+            benchmark::DoNotOptimize(res.delta);
+            vega = (up_price - down_price) / 2e-2;
+        }
+    }
+    state.counters["vega"] = vega;
+}
+
+// 64 American calls and puts across strikes on a CRR lattice with range(0) steps: range(1) = 0 loops
+// over price_binomial_crr, 1 calls the parallel batch, 2 the batch with Richardson extrapolation.
+static void BM_Binomial_Batch(benchmark::State& state) {
+    const int steps = static_cast<int>(state.range(0));
+    const int mode = static_cast<int>(state.range(1));
+    std::vector<quant::american::Params> options;
+    for (int i = 0; i < 32; ++i) {
+        const double K = 70.0 + 60.0 * static_cast<double>(i) / 31.0;
+        for (const auto type : {quant::OptionType::Call, quant::OptionType::Put}) {
+            options.push_back({.spot = 100.0,
+                               .strike = K,
+                               .rate = 0.04,
+                               .dividend = 0.03,
+                               .vol = 0.3,
+                               .time = 1.0,
+                               .type = type});
+        }
+    }
+    for (auto _ : state) {
+        std::vector<double> prices;
+        if (mode == 0) {
+            for (const auto& option : options) {
+                prices.push_back(quant::american::price_binomial_crr(option, steps));
+            }
+        } else {
+            prices = quant::american::price_binomial_crr_batch(options, steps, mode == 2);
+        }
+        benchmark::DoNotOptimize(prices.data());
+        benchmark::ClobberMemory();
+    }
+    state.counters["options/s"] = benchmark::Counter(static_cast<double>(options.size()),
+                                                     benchmark::Counter::kIsIterationInvariantRate);
+}
+
+// Strike x maturity grid of calls and puts: range(0) strikes at each of four maturities.
+static std::vector<quant::pde::BatchOption> batch_options(int strikes) {
+    std::vector<quant::pde::BatchOption> options;
+    for (const double T : {0.25, 0.5, 1.0, 2.0}) {
+        for (int i = 0; i < strikes; ++i) {
+            const double K = 70.0 + 60.0 * static_cast<double>(i) / std::max(1, strikes - 1);
+            options.push_back({K, quant::OptionType::Call, T});
+            options.push_back({K, quant::OptionType::Put, T});
+        }
+    }
+    return options;
+}
+
+static quant::pde::PdeParams batch_params() {
+    return quant::pde::PdeParams{.spot = 100.0,
+                                 .strike = 100.0,
+                                 .rate = 0.03,
+                                 .dividend = 0.01,
+                                 .vol = 0.2,
+                                 .time = 2.0,
+                                 .type = quant::OptionType::Call,
+                                 .grid = quant::pde::GridSpec{201, 400, 4.0, 2.0},
+                                 .log_space = true,
+                                 .upper_boundary = quant::pde::PdeParams::UpperBoundary::Neumann};
+}
+
+static void BM_PDE_Batch_Loop(benchmark::State& state) {
+    const auto options = batch_options(static_cast<int>(state.range(0)));
+    const auto base = batch_params();
+    for (auto _ : state) {
+        for (const auto& option : options) {
+            auto params = base;
+            params.strike = option.strike;
+            params.type = option.type;
+            params.time = option.time;
+            params.grid.num_time = static_cast<int>(std::ceil(base.grid.num_time * option.time / base.time));
+            benchmark::DoNotOptimize(quant::pde::price_crank_nicolson(params).price);
+        }
+    }
+    state.counters["options"] = static_cast<double>(options.size());
+}
+
+static void BM_PDE_Batch_Shared(benchmark::State& state) {
+    const auto options = batch_options(static_cast<int>(state.range(0)));
+    const auto base = batch_params();
+    for (auto _ : state) {
+        const auto results = quant::pde::price_crank_nicolson_batch(base, options);
+        benchmark::DoNotOptimize(results.data());
+    }
+    state.counters["options"] = static_cast<double>(options.size());
+}
+
 static void BM_PDE_OrderSlope(benchmark::State& state) {
     const int M = static_cast<int>(state.range(0));
     const int N = static_cast<int>(state.range(1));
@@ -73,14 +265,24 @@ static void BM_PDE_OrderSlope(benchmark::State& state) {
                                              params.vol, params.time);
     quant::pde::PdeResult last{};
     for (auto _ : state) {
-        last = quant::pde::price_crank_nicolson(params);
-        benchmark::DoNotOptimize(last.price);
+        const auto res = quant::pde::price_crank_nicolson(params);
+        benchmark::DoNotOptimize(res.price);
+        last = res;
     }
     state.counters["abs_error"] = std::abs(last.price - ref);
 }
 
 BENCHMARK(BM_PDE_WallTime)->Args({101, 100})->Args({201, 200})->Args({321, 320});
 BENCHMARK(BM_PSOR_Iterations)->DenseRange(110, 190, 20);
+BENCHMARK(BM_PSOR_Adaptive)->ArgsProduct({{181, 361}, {0, 1, 2, 3}})->ArgNames({"nodes", "mode"});
+BENCHMARK(BM_American_Solver)->DenseRange(0, 2)->ArgName("solver");
+BENCHMARK(BM_American_Greeks)->Arg(0)->Arg(1)->Unit(benchmark::kMillisecond);
+BENCHMARK(BM_Binomial_Batch)
+    ->ArgsProduct({{500, 2000}, {0, 1, 2}})
+    ->ArgNames({"steps", "mode"})
+    ->Unit(benchmark::kMillisecond);
+BENCHMARK(BM_PDE_Batch_Loop)->Arg(8)->Arg(32)->Unit(benchmark::kMillisecond);
+BENCHMARK(BM_PDE_Batch_Shared)->Arg(8)->Arg(32)->Unit(benchmark::kMillisecond);
 BENCHMARK(BM_PDE_OrderSlope)->Args({101, 100})->Args({161, 160})->Args({201, 200})->Args({321, 320});
 
 BENCHMARK_MAIN();
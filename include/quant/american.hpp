@@ -22,7 +22,21 @@ struct Params {
 
 double price_binomial_crr(const Params& p, int steps);
 
+/// `price_binomial_crr` for every option at the same step count, in parallel with one lattice
+/// buffer per thread. With `richardson`, both lattices use a Black-Scholes final step
+/// (Broadie-Detemple) and each price is extrapolated from `steps` and `steps / 2` as
+/// (n V_n - m V_m) / (n - m), cancelling the O(1/n) lattice error.
+std::vector<double> price_binomial_crr_batch(const std::vector<Params>& options, int steps,
+                                             bool richardson = false);
+
 struct PsorParams {
+    /// Linear complementarity solver applied at each time step.
+    /// - Psor: projected SOR sweeps with relaxation `omega` (any payoff)
+    /// - BrennanSchwartz: one projected Thomas pass; exact for a single exercise boundary
+    ///   (puts exercise below it, calls above it)
+    /// - PolicyIteration: Howard iteration on min(A V - b, V - payoff) = 0 with direct solves
+    enum class Solver { Psor, BrennanSchwartz, PolicyIteration };
+
     Params base;
     quant::pde::GridSpec grid;
     bool log_space{false};
@@ -32,16 +46,47 @@ struct PsorParams {
     int max_iterations{10000};
     double tolerance{1e-8};
     bool use_rannacher{true};
+    Solver solver{Solver::Psor};
+    /// PSOR only: run the first Crank-Nicolson step as Gauss-Seidel, estimate the Jacobi spectral
+    /// radius from its convergence rate and relax with the optimal omega = 2 / (1 + sqrt(1 - rho^2))
+    /// thereafter; `omega` is used until then.
+    bool adaptive_omega{false};
+    /// Start each step's iteration from the linear extrapolation 2 V(t) - V(t + dt), projected onto
+    /// the payoff, instead of from V(t).
+    bool warm_start{false};
 };
 
 struct PsorResult {
     double price;
-    int total_iterations;
-    double max_residual;
+    int total_iterations; // SOR sweeps, Brennan-Schwartz passes, or policy iterations over all steps
+    double max_residual;  // last step's final update size (0 for Brennan-Schwartz)
+    double omega;         // relaxation in effect at the last step
+    std::vector<int> step_iterations; // per time step, in solve order
 };
 
 PsorResult price_psor(const PsorParams& params);
 
+/// Regression functions for the LSMC continuation value: a constant followed by per-variable terms
+/// f_1..f_degree of the family, evaluated at the regression state x.
+struct LsmcBasis {
+    /// - Monomial: f_n(x) = x^n, with x = S / K - 1
+    /// - Laguerre: f_n(x) = exp(-x / 2) L_{n-1}(x), with x = S / K (Longstaff-Schwartz 2001)
+    /// - Hermite: f_n(x) = He_n(x), with x = ln(S / K) / (sigma sqrt(t)) at exercise date t
+    enum class Family { Monomial, Laguerre, Hermite };
+
+    Family family{Family::Monomial};
+    int degree{3};           // highest term per state variable, in [1, 10]
+    bool cross_terms{false}; // with several state variables, add every product of total degree <= degree
+};
+
+/// Number of regression functions of `basis` over `dims` state variables: 1 + dims * degree, or
+/// binomial(dims + degree, degree) with cross terms.
+std::size_t basis_size(const LsmcBasis& basis, std::size_t dims);
+
+/// Write the basis_size(basis, dims) regression functions at `state` to `out`, constant first.
+/// `state` holds each variable already transformed as the family expects.
+void evaluate_basis(const LsmcBasis& basis, const double* state, std::size_t dims, double* out);
+
 struct LsmcParams {
     Params base;
     std::uint64_t num_paths;
@@ -51,6 +96,16 @@ struct LsmcParams {
     double ridge_lambda{0.0};
     double itm_moneyness_eps{0.0};
     std::size_t min_itm{32};
+    /// Regenerate paths backward in time by Brownian bridge from the counter-based RNG instead of
+    /// storing a steps x paths shock matrix, so memory is O(paths); the draws differ from the
+    /// stored-shock (pcg64) engine.
+    bool streaming{false};
+    LsmcBasis basis{};
+    /// Two-pass pricing: fit the exercise rule on the paths above, then price it on independent
+    /// forward paths (counter-based RNG, stream 1). The result is an unbiased estimate of the value
+    /// of that rule and so of a lower bound on the American price; its standard error treats each
+    /// antithetic pair as one sample.
+    bool out_of_sample{false};
 };
 
 struct LsmcDiagnostics {
@@ -72,6 +127,21 @@ struct Greeks {
     double gamma;
 };
 
+/// Price and Greeks read off a single finite-difference solve.
+struct PsorGreeks {
+    double price;
+    double delta;               // quadratic through the grid nodes around spot
+    double gamma;               // same quadratic, second derivative
+    double theta;               // dV/dt from the solutions one time step apart, per year
+    std::optional<double> vega; // forward difference from one extra solve at vol + vol_bump
+    int total_iterations;       // across all solves
+};
+
+/// Delta, gamma and theta of `price_psor` from its solved grid. With `compute_vega` one further solve
+/// at vol + vol_bump reuses the grid and the tuned omega, and starts each step from the base
+/// solution's change over that step.
+PsorGreeks greeks_psor(const PsorParams& params, bool compute_vega = false, double vol_bump = 1e-3);
+
 // Compute Greeks via bump-and-reprice around spot using PSOR as pricer.
 // rel_bump is a small relative bump (e.g., 1e-3)
 Greeks greeks_psor_bump(PsorParams params, double rel_bump);
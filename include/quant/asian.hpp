@@ -3,9 +3,11 @@
 
 #include <cstdint>
 
+#include "quant/mc_greeks.hpp"
+
 namespace quant::asian {
 
-enum class Payoff { FixedStrike, FloatingStrike };
+enum class Payoff { FixedStrike, FloatingStrike }; // call on A: max(A - K, 0) or max(S_T - A, 0)
 enum class Average { Arithmetic, Geometric };
 enum class Qmc { None, Sobol, SobolScrambled };
 
@@ -35,4 +37,9 @@ struct McStatistic {
 
 McStatistic price_mc(const McParams& p);
 
+/// Price and Greeks from one parallel pass of `mc::path_greeks` over `num_steps` averaging dates,
+/// with common random numbers across bumps. Uses counter-based streams and no geometric control
+/// variate; `qmc` is not used.
+quant::mc::PathGreeksResult greeks_mc(const McParams& p, const quant::mc::GreeksBumps& bumps = {});
+
 } // namespace quant::asian
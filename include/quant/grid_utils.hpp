@@ -37,6 +37,7 @@ struct OperatorWorkspace {
     std::vector<double> diag;
     std::vector<double> upper;
     std::vector<double> rhs;
+    std::vector<double> scratch; // modified super-diagonal for in-place Thomas solves
 };
 
 // Assemble interior tridiagonal coefficients for a backward Euler/Crank-Nicolson step.
@@ -44,6 +45,34 @@ struct OperatorWorkspace {
 void assemble_operator(const SpaceGrid& grid, const DiffusionCoefficients& coeffs, double dt, double theta,
                        const std::vector<double>& v_curr, OperatorWorkspace& op);
 
+// Solve the system held in `op` with the Thomas algorithm, overwriting op.rhs with the solution.
+// Uses op.scratch, so repeated solves of the same size do not allocate.
+void solve_in_place(OperatorWorkspace& op);
+
+// Thomas factorization of a fixed tridiagonal matrix, reused across right-hand sides.
+struct TridiagonalFactor {
+    std::vector<double> lower;     // sub-diagonal a_i (size n-1)
+    std::vector<double> upper;     // c_i / pivot_i (size n-1)
+    std::vector<double> inv_pivot; // 1 / pivot_i (size n)
+};
+
+// Factor the matrix with sub/main/super diagonals (lower, diag, upper); throws on a near-zero pivot.
+TridiagonalFactor factor_tridiagonal(const std::vector<double>& lower, const std::vector<double>& diag,
+                                     const std::vector<double>& upper);
+
+// Overwrite `x` (the right-hand side on entry) with the solution of the factored system.
+void solve_factored(const TridiagonalFactor& factor, std::vector<double>& x);
+
+struct NodeGreeks {
+    double value;
+    double delta; // dV/dS
+    double gamma; // d2V/dS2
+};
+
+// Value, delta and gamma at S0 from the quadratic through the three nodes around it
+// (clamped to the interior); `spot` must be increasing with at least three nodes.
+NodeGreeks interpolate_greeks(const std::vector<double>& spot, const std::vector<double>& V, double S0);
+
 struct PayoffBoundaryParams {
     ::quant::OptionType type;
     double strike;
@@ -4,7 +4,9 @@
 #include <complex>
 #include <cstdint>
 
+#include "quant/mlmc.hpp"
 #include "quant/rng.hpp"
+#include "quant/stats.hpp"
 
 namespace quant::heston {
 
@@ -39,6 +41,8 @@ double implied_vol_call(const MarketParams& mkt, const Params& h);
 struct McResult {
     double price;
     double std_error;
+    std::uint64_t paths_used{0}; // primary paths simulated (< num_paths when stopped early)
+    double elapsed_seconds{0.0}; // wall-clock time spent simulating
 };
 
 struct McParams {
@@ -51,9 +55,33 @@ struct McParams {
     quant::rng::Mode rng{quant::rng::Mode::Counter};
     enum class Scheme { Euler, QE };
     Scheme scheme{Scheme::QE};
+    quant::stats::StoppingRule stopping{}; // optional early stopping; num_paths is then the cap
 };
 
 // Andersen QE Monte Carlo pricing of European call
 McResult call_qe_mc(const McParams& p);
 
+// Multilevel QE (or Euler) pricing of the European call. Coarse steps use scaled sums of the fine
+// Gaussians and a single uniform per step drives both QE branches; num_paths, num_steps and rng
+// are not used (streams are counter-based per level).
+mlmc::MlmcResult call_qe_mlmc(const McParams& p, const mlmc::MlmcParams& mlmc_params);
+
+struct Estimate {
+    double value;
+    double std_error;
+};
+
+struct AdjointGreeks {
+    Estimate price;
+    Estimate delta; // dV/dS0
+    Estimate vega;  // dV/dv0 (initial variance)
+    Estimate rho;   // dV/dr, discounting included
+};
+
+// Pathwise call Greeks from one forward pass and a reverse (adjoint) sweep through the QE or
+// Euler variance recursion. Paths reuse call_qe_mc's counter streams, so `price` matches it with
+// the same seed. Branch switches and clipping at zero variance are held fixed per path. Requires
+// the counter RNG.
+AdjointGreeks greeks_call_adjoint(const McParams& p);
+
 } // namespace quant::heston
@@ -2,6 +2,8 @@
 #pragma once
 
 #include "quant/barrier.hpp"
+#include "quant/mc_greeks.hpp"
+#include "quant/mlmc.hpp"
 #include <cstdint>
 
 namespace quant::lookback {
@@ -33,4 +35,13 @@ struct McStatistic {
 
 McStatistic price_mc(const McParams& p);
 
+/// Price and Greeks of the discretely observed lookback from one parallel pass of `mc::path_greeks`,
+/// with common random numbers across bumps. Uses counter-based streams; `use_bridge` is not used.
+quant::mc::PathGreeksResult greeks_mc(const McParams& p, const quant::mc::GreeksBumps& bumps = {});
+
+/// Multilevel Monte Carlo price with a continuously monitored extremum. Level l observes the path on
+/// `mlmc::steps_at_level(mlmc_params, l)` dates and its coarse partner on every M-th of them, using
+/// counter-based streams. `num_paths`, `num_steps` and `use_bridge` are not used.
+quant::mlmc::MlmcResult price_mlmc(const McParams& p, const quant::mlmc::MlmcParams& mlmc_params);
+
 } // namespace quant::lookback
@@ -6,7 +6,9 @@
 #include <random>
 #include <vector>
 
+#include "quant/barrier.hpp"
 #include "quant/rng.hpp"
+#include "quant/stats.hpp"
 #include "quant/term_structures.hpp"
 
 namespace quant::mc {
@@ -26,18 +28,24 @@ struct McParams {
     bool antithetic{true};
     bool control_variate{true}; // control variate on discounted S_T vs E[S_T]
     quant::rng::Mode rng{quant::rng::Mode::Counter};
-    enum class Qmc { None, Sobol, SobolScrambled };
+    enum class Qmc { None, Sobol, SobolScrambled, SobolOwen };
     enum class Bridge { None, BrownianBridge };
     Qmc qmc{Qmc::None};
     Bridge bridge{Bridge::None};
     int num_steps{1};
+    // Randomized QMC: with a scrambled sampler and qmc_replicates >= 2, num_paths is split across
+    // independently scrambled replicates and the error estimate is taken across replicate means.
+    int qmc_replicates{1};
     // Optional piecewise-constant schedules; when set, override scalar rate/div/vol
     std::optional<quant::PiecewiseConstant> rate_schedule{};
     std::optional<quant::PiecewiseConstant> dividend_schedule{};
     std::optional<quant::PiecewiseConstant> vol_schedule{};
+    // Optional early stopping on a standard-error target or time budget; num_paths is then the cap
+    quant::stats::StoppingRule stopping{};
 };
 
-/// Summary of a Monte Carlo estimator (mean, standard error, 95% CI)
+/// Summary of a Monte Carlo estimator (mean, standard error, 95% CI).
+/// For randomized QMC the error is the spread of replicate means and the CI uses Student-t.
 struct McStatistic {
     double value;     // sample mean
     double std_error; // standard error of the estimate
@@ -47,16 +55,41 @@ struct McStatistic {
 
 /// Monte Carlo pricing result
 struct McResult {
-    McStatistic estimate; // price estimate and uncertainty
+    McStatistic estimate;        // price estimate and uncertainty
+    std::uint64_t paths_used{0}; // primary paths simulated (< num_paths when stopped early)
+    double elapsed_seconds{0.0}; // wall-clock time spent simulating
 };
 
 /// Price European call via terminal payoff; uses streaming for cache friendliness.
 ///
 /// Uses GBM analytic terminal distribution, optional antithetic and control variates.
-/// Supports Sobol quasi Monte Carlo sequences (with optional scramble) and Brownian
-/// bridge ordering when `num_steps > 1`.
+/// Supports Sobol quasi Monte Carlo sequences (digital shift or Owen scrambling) and Brownian
+/// bridge ordering when `num_steps > 1`. Scrambled samplers accept `qmc_replicates` for
+/// randomized QMC error estimates; replicates run in parallel.
+/// An enabled `stopping` rule simulates in batches and stops at the error target or time budget.
 McResult price_european_call(const McParams& p);
 
+/// European option priced by `price_european_batch`.
+struct OptionSpec {
+    double strike;                     // K
+    OptionType type{OptionType::Call}; // call or put payoff
+};
+
+/// Batched pricing result: one estimate per option, in input order.
+struct EuropeanBatchResult {
+    std::vector<McStatistic> estimates; // price estimate and uncertainty per option
+    std::uint64_t paths_used{0};        // primary paths simulated (shared by every option)
+    double elapsed_seconds{0.0};        // wall-clock time spent simulating
+};
+
+/// Price many European calls/puts on one set of simulated paths (`p.strike` is ignored).
+///
+/// Paths follow `price_european_call` exactly (samplers, steps, bridge, schedules, replicates), so a
+/// call in the batch reproduces the single-option price with the same seed and strike differences
+/// carry common random numbers. The control variate enters with coefficient +1 for calls and -1
+/// for puts. A stopping rule is only accepted for a single option.
+EuropeanBatchResult price_european_batch(const McParams& p, const std::vector<OptionSpec>& options);
+
 /// Monte Carlo Greeks result (mean/SE/CI per estimator).
 struct GreeksResult {
     McStatistic delta;       // pathwise
@@ -72,4 +105,23 @@ struct GreeksResult {
 /// - Theta: finite-difference in time using common random numbers
 GreeksResult greeks_european_call(const McParams& p);
 
+/// Adjoint (reverse-mode) Greeks of a European call. Bucket vectors follow the pieces of
+/// `rate_schedule` / `vol_schedule` and are empty when the corresponding schedule is unset.
+struct AdjointGreeksResult {
+    McStatistic price;
+    McStatistic delta;                     // dV/dS0
+    McStatistic vega;                      // dV/dsigma for a parallel shift of every volatility
+    McStatistic rho;                       // dV/dr for a parallel shift, discounting included
+    std::vector<McStatistic> rate_buckets; // dV/d(rate_schedule.values[j])
+    std::vector<McStatistic> vol_buckets;  // dV/d(vol_schedule.values[j])
+};
+
+/// Pathwise Greeks of a European call by a hand-written adjoint sweep over the simulated GBM path.
+///
+/// One forward/backward pass per path yields delta, vega, rho and every schedule bucket at a cost
+/// independent of the number of buckets. Paths use `max(1, num_steps)` uniform steps, midpoint
+/// schedule values and the counter RNG streams of `price_european_call`, so `price` matches it
+/// without control variate. Requires the counter RNG, no QMC and no Brownian bridge.
+AdjointGreeksResult greeks_european_call_adjoint(const McParams& p);
+
 } // namespace quant::mc
@@ -3,12 +3,31 @@
 
 #include "quant/barrier.hpp"
 #include "quant/mc.hpp"
+#include "quant/mc_greeks.hpp"
+#include "quant/mlmc.hpp"
 
 namespace quant::mc {
 
 /// Price a barrier option via Monte Carlo. The control variate is disabled for
 /// knock-in structures even if requested, to avoid bias from parity mismatches.
+/// Supports the same `stopping` rule as `price_european_call`.
 McResult price_barrier_option(const McParams& base, double strike, OptionType opt,
                               const BarrierSpec& barrier);
 
+/// Multilevel Monte Carlo price of a continuously monitored barrier option. Level l takes
+/// `mlmc::steps_at_level(mlmc_params, l)` exact GBM steps on counter-based streams and weights the payoff
+/// by the Brownian-bridge survival probability of every step, so coarse and fine paths share
+/// increments and the level corrections stay smooth. `num_paths`, `num_steps`, the QMC sampler and
+/// the control variate of `base` are not used.
+mlmc::MlmcResult price_barrier_mlmc(const McParams& base, double strike, OptionType opt,
+                                    const BarrierSpec& barrier, const mlmc::MlmcParams& mlmc_params);
+
+/// Price, delta, gamma, vega, rho and theta of a continuously monitored barrier option from one
+/// parallel pass of `path_greeks`. Each path carries the Brownian-bridge survival weight over
+/// `num_steps` steps instead of a knock indicator, so bumped payoffs stay smooth under common random
+/// numbers. Uses counter-based streams and ignores the QMC sampler and control variate; schedules
+/// are rejected.
+PathGreeksResult greeks_barrier(const McParams& base, double strike, OptionType opt,
+                                const BarrierSpec& barrier, const GreeksBumps& bumps = {});
+
 } // namespace quant::mc
@@ -0,0 +1,56 @@
+/// Monte Carlo Greeks for path-dependent payoffs from one pass over shared paths
+#pragma once
+
+#include <cstdint>
+#include <functional>
+#include <vector>
+
+#include "quant/mc.hpp"
+
+namespace quant::mc {
+
+/// Market point at which a path payoff is evaluated; the Greeks engine bumps these fields.
+struct PathMarket {
+    std::vector<double> spots; // S0 per underlying
+    std::vector<double> vols;  // sigma per underlying
+    double rate;               // r (also the discount rate)
+    double time;               // T
+};
+
+/// Finite-difference bump sizes. Every bump reuses the path's normals (common random numbers).
+struct GreeksBumps {
+    double spot_rel{0.01};        // relative spot bump h: S0 (1 +/- h)
+    double vol_abs{0.01};         // absolute volatility bump
+    double rate_abs{1e-4};        // absolute rate bump
+    double time_abs{1.0 / 365.0}; // maturity shortening for theta (capped at T/2)
+};
+
+/// Discounted payoff of one path evaluated at `market` from the path's standard normals.
+/// Must be a deterministic, thread-safe function of its arguments.
+using PathPayoff = std::function<double(const PathMarket& market, const double* normals)>;
+
+struct PathGreeksParams {
+    PathMarket market;
+    int normals_per_path;    // standard normals consumed by one payoff evaluation
+    std::uint64_t num_paths; // primary paths (antithetic pairs count once)
+    std::uint64_t seed;      // counter-based RNG seed
+    bool antithetic{true};
+    GreeksBumps bumps{};
+};
+
+/// Price and Greeks; per-underlying vectors follow `PathMarket::spots`.
+struct PathGreeksResult {
+    McStatistic price;
+    std::vector<McStatistic> delta; // central spot bump
+    std::vector<McStatistic> gamma; // central second difference in spot
+    std::vector<McStatistic> vega;  // central volatility bump (one-sided near zero vol)
+    McStatistic rho;                // central rate bump
+    McStatistic theta;              // dV/dt = (V(T - dT) - V(T)) / dT
+};
+
+/// Evaluate `payoff` at the base market and at every bumped market on the same paths, in parallel.
+/// Each Greek is averaged per path before accumulation, so its standard error reflects the
+/// variance of the common-random-number difference rather than of the price.
+PathGreeksResult path_greeks(const PathGreeksParams& params, const PathPayoff& payoff);
+
+} // namespace quant::mc
@@ -0,0 +1,53 @@
+/// Multilevel Monte Carlo driver (Giles) with adaptive level selection
+#pragma once
+
+#include <cstdint>
+#include <functional>
+#include <vector>
+
+#include "quant/stats.hpp"
+
+namespace quant::mlmc {
+
+/// Level l uses `base_steps * refinement^l` time steps; the fine and coarse paths of a level
+/// correction share the same Brownian increments.
+struct MlmcParams {
+    double target_rmse;              // epsilon: variance target eps^2/2, bias target eps/sqrt(2)
+    int base_steps{2};               // time steps on level 0
+    int refinement{2};               // M: step multiplier between levels
+    int min_levels{3};               // levels simulated before the bias test (>= 2)
+    int max_levels{10};              // hard cap on the number of levels
+    std::uint64_t pilot_paths{2000}; // initial samples on each newly added level
+};
+
+/// Per-level statistics of the correction Y_l = P_l - P_{l-1} (Y_0 = P_0).
+struct LevelStats {
+    int steps;           // fine time steps on this level
+    std::uint64_t paths; // samples of Y_l
+    double mean;         // E[Y_l] estimate
+    double variance;     // Var[Y_l] estimate
+    double cost;         // time steps per sample (fine + coarse)
+};
+
+struct MlmcResult {
+    double value;           // sum of level means
+    double std_error;       // sqrt(sum_l Var[Y_l] / N_l)
+    double bias_estimate;   // extrapolated |E[P - P_L]| from the finest levels
+    double total_cost;      // sum_l N_l * cost_l, in time steps
+    double elapsed_seconds; // wall-clock time
+    bool converged;         // bias test passed before reaching max_levels
+    std::vector<LevelStats> levels;
+};
+
+/// Accumulate Y_level over path indices [begin, end). Called concurrently on disjoint ranges,
+/// so it must derive its random numbers from (level, path index) and keep no shared state.
+using LevelSampler = std::function<quant::stats::Welford(int level, std::uint64_t begin, std::uint64_t end)>;
+
+/// Time steps used by `level`.
+int steps_at_level(const MlmcParams& params, int level);
+
+/// Run the adaptive MLMC algorithm: choose N_l from the sampled variances and costs, add levels
+/// until the extrapolated bias is below eps/sqrt(2), and stop once the variance target holds.
+MlmcResult run(const MlmcParams& params, const LevelSampler& sampler);
+
+} // namespace quant::mlmc
@@ -4,8 +4,14 @@
 #include <cstdint>
 #include <vector>
 
+#include "quant/barrier.hpp"
+#include "quant/mc_greeks.hpp"
+#include "quant/stats.hpp"
+
 namespace quant::multi {
 
+enum class Qmc { None, Sobol, SobolScrambled };
+
 struct BasketMcParams {
     std::vector<double> spots;     // S0 per asset
     std::vector<double> vols;      // sigma per asset
@@ -18,15 +24,44 @@ struct BasketMcParams {
     std::uint64_t num_paths;       // paths
     std::uint64_t seed;            // RNG seed
     bool antithetic{true};
+    quant::stats::StoppingRule stopping{};           // optional early stopping; num_paths is then the cap
+    quant::OptionType type{quant::OptionType::Call}; // basket_option_mc only
+    int num_steps{1};                                // equally spaced monitoring dates
+    bool average{false};                             // pay on the basket averaged over the dates
+    bool use_geometric_cv{false};                    // geometric-basket control variate
+    Qmc qmc{Qmc::None};                              // Sobol dimension: assets * num_steps <= 1024
+    bool use_bridge{true};                           // Brownian-bridge Sobol ordering over dates
 };
 
 struct McStat {
     double value;
     double std_error;
+    std::uint64_t paths_used{0}; // primary paths simulated
+    double elapsed_seconds{0.0}; // wall-clock time spent simulating (basket engine)
 };
 
+/// Basket option on sum_k w_k S_k, paid at `time` on the terminal basket or, with `average`, on its
+/// arithmetic average over the `num_steps` dates. Paths are simulated in parallel over fixed tiles
+/// that are merged in path order, and each path draws from its own PCG stream keyed by the seed and
+/// path index, so results do not depend on the thread count. Any stopping-rule batch size draws the
+/// same paths; the estimate then differs only by floating-point merge order. With
+/// Sobol points the first `assets` dimensions drive the terminal values when the bridge is on; the
+/// standard error is then the sample error of the points, not a QMC error estimate. The control
+/// variate adds the closed-form price of the option on the weighted geometric basket (lognormal)
+/// minus its simulated payoff, with unit coefficient; it requires positive weights. Throws
+/// std::invalid_argument for mismatched sizes, num_steps < 1 or an unsupported Sobol dimension.
+McStat basket_option_mc(const BasketMcParams& p);
+
+/// basket_option_mc() for a call; `type` is ignored.
 McStat basket_european_call_mc(const BasketMcParams& p);
 
+/// basket_option_mc() price with per-asset delta, gamma and vega plus rho and theta from one parallel
+/// pass of `mc::path_greeks` (common random numbers across bumps, counter-based streams). Honours
+/// `type`, `num_steps`, `average` and `use_geometric_cv`; `stopping` and `use_bridge` are not used.
+/// Throws std::invalid_argument for the inputs basket_option_mc rejects and for Sobol `qmc`.
+quant::mc::PathGreeksResult basket_greeks_mc(const BasketMcParams& p,
+                                             const quant::mc::GreeksBumps& bumps = {});
+
 struct MertonParams {
     double spot;
     double strike;
@@ -58,4 +58,21 @@ struct PdeResult {
 /// Boundary conditions: Dirichlet at S=0, Dirichlet or Neumann at Smax.
 PdeResult price_crank_nicolson(const PdeParams& p);
 
+/// European option priced by `price_crank_nicolson_batch`.
+struct BatchOption {
+    double strike;            // K
+    ::quant::OptionType type; // call or put payoff
+    double time;              // maturity T
+};
+
+/// Price many European options on one shared grid and factored operator (constant coefficients).
+///
+/// `p` supplies spot, rate, dividend, vol and grid settings; `p.strike` anchors the stretch, the
+/// S-space upper bound covers the largest strike, and `p.grid.num_time` steps span the longest
+/// maturity. Options with the same strike and type share one backward solve whose values are
+/// snapshotted at each of their maturities; distinct payoffs are solved in parallel. Results are in
+/// input order; theta is filled when `p.compute_theta` is set.
+std::vector<PdeResult> price_crank_nicolson_batch(const PdeParams& p,
+                                                  const std::vector<BatchOption>& options);
+
 } // namespace quant::pde
@@ -1,7 +1,12 @@
 /// Vectorized vanilla-option portfolio valuation and deterministic stress P&L.
 #pragma once
 
+#include <array>
 #include <cstddef>
+#include <cstdint>
+#include <limits>
+#include <optional>
+#include <unordered_map>
 #include <vector>
 
 namespace quant::portfolio {
@@ -51,6 +56,19 @@ struct MarketShock {
     double time_elapsed;
 };
 
+/// How scenario_pnl() values each (scenario, position) cell.
+enum class Revaluation {
+    Full,   // exact Black-Scholes repricing
+    Taylor, // delta-gamma-vega-theta-rho (and dividend) expansion around the base Greeks
+    Hybrid  // Taylor, fully repricing cells whose truncation-error estimate exceeds the tolerance
+};
+
+struct ScenarioOptions {
+    Revaluation revaluation{Revaluation::Full};
+    double tolerance{0.0}; // Hybrid: absolute P&L error accepted per cell
+    bool include_position_pnl{false};
+};
+
 struct ScenarioResult {
     std::size_t scenario_count{};
     std::size_t position_count{};
@@ -58,6 +76,8 @@ struct ScenarioResult {
     std::vector<double> portfolio_pnl;
     // Scenario-major (scenario_count, position_count); empty in aggregate-only mode.
     std::vector<double> position_pnl;
+    // Hybrid mode: fully repriced cells as ascending scenario * position_count + position.
+    std::vector<std::size_t> revalued_cells;
 };
 
 /// Validate and value a non-empty portfolio. Throws std::invalid_argument on
@@ -66,7 +86,179 @@ RiskResult price_risk(const std::vector<VanillaPosition>& positions);
 
 /// Exact-reprice each position under each shock. When include_position_pnl is
 /// false, the potentially large scenario-by-position matrix is not allocated.
+/// Scenarios are revalued in parallel over fixed-size position blocks, and each
+/// total is summed in block order, so results do not depend on the thread count.
 ScenarioResult scenario_pnl(const std::vector<VanillaPosition>& positions,
                             const std::vector<MarketShock>& shocks, bool include_position_pnl = false);
 
+/// scenario_pnl() with a choice of revaluation. Taylor replaces repricing with the second-order
+/// spot and first-order volatility, rate, dividend and time terms of each position's Greeks, so a
+/// cell costs a few multiplies. Hybrid estimates each Taylor cell's error from the leading
+/// neglected terms (speed dS^3 / 6, vanna dS dvol, volga dvol^2 / 2 and theta curvature
+/// |theta| dt^2 / (4 t)) and fully reprices cells above `tolerance`, along with cells that expire,
+/// reach zero volatility or start from degenerate Greeks. The estimate is leading-order, not a
+/// strict bound: it grows faster than the expansion's error, so large shocks are caught.
+ScenarioResult scenario_pnl(const std::vector<VanillaPosition>& positions,
+                            const std::vector<MarketShock>& shocks, const ScenarioOptions& options);
+
+/// Persistent vanilla book held as structure-of-arrays columns for repeated re-risking.
+///
+/// Positions are validated once, when added or amended. Changed rows are marked stale and only
+/// those are repriced (in parallel) by the next risk() or scenario_pnl(), so a small amendment to
+/// a large book costs O(changed rows) pricing plus an O(n) total. Column and metric references
+/// are invalidated by add() and remove().
+class Portfolio {
+  public:
+    enum class Column { Type, Quantity, Spot, Strike, Rate, Dividend, Volatility, Time };
+    enum class Metric { Price, Value, Delta, Gamma, Vega, Theta, Rho };
+    static constexpr std::size_t kColumnCount = 8;
+    static constexpr std::size_t kMetricCount = 7;
+
+    Portfolio() = default;
+    explicit Portfolio(const std::vector<VanillaPosition>& positions);
+
+    std::size_t size() const { return columns_[0].size(); }
+    bool empty() const { return columns_[0].empty(); }
+
+    /// Append a position and return its index.
+    std::size_t add(const VanillaPosition& position);
+    /// Append positions and return the index of the first. Nothing is added if any is invalid.
+    std::size_t add(const std::vector<VanillaPosition>& positions);
+    /// Replace the position at `index`.
+    void amend(std::size_t index, const VanillaPosition& position);
+    /// Replace positions[k] at indices[k]. Nothing is changed if any index or position is invalid.
+    void amend(const std::vector<std::size_t>& indices, const std::vector<VanillaPosition>& positions);
+    /// Remove the position at `index` in O(1) by moving the last position into its slot.
+    void remove(std::size_t index);
+    VanillaPosition position(std::size_t index) const;
+
+    /// Input column; Type holds +1 for calls and -1 for puts.
+    const std::vector<double>& column(Column column) const {
+        return columns_[static_cast<std::size_t>(column)];
+    }
+    /// Per-position results as of the last risk() or scenario_pnl() call; Value and the Greeks are
+    /// quantity-weighted as in PositionRisk.
+    const std::vector<double>& metric(Metric metric) const {
+        return metrics_[static_cast<std::size_t>(metric)];
+    }
+    /// Positions amended or added since they were last priced.
+    std::size_t stale_count() const { return stale_.size(); }
+
+    /// Reprice stale positions (in parallel) without totalling.
+    void refresh();
+
+    /// Reprice stale positions and return the book totals, summed in index order.
+    PortfolioTotals risk();
+
+    /// scenario_pnl() over this book; base values come from the refreshed metrics.
+    ScenarioResult scenario_pnl(const std::vector<MarketShock>& shocks, bool include_position_pnl = false);
+    ScenarioResult scenario_pnl(const std::vector<MarketShock>& shocks, const ScenarioOptions& options);
+
+  private:
+    void write_row(std::size_t index, const VanillaPosition& position);
+    void mark_stale(std::size_t index);
+
+    std::array<std::vector<double>, kColumnCount> columns_;
+    std::vector<double> log_moneyness_; // ln(S / K)
+    std::array<std::vector<double>, kMetricCount> metrics_;
+    std::vector<std::size_t> stale_;      // indices to reprice, without duplicates
+    std::vector<unsigned char> is_stale_; // membership flag per position
+};
+
+/// Market move for one underlying, applied by TickRiskEngine. Unset fields are left unchanged.
+struct MarketUpdate {
+    std::size_t underlying{0};
+    std::optional<double> spot{};             // new spot level
+    std::optional<double> rate{};             // new risk-free rate
+    std::optional<double> volatility_shift{}; // added to each volatility in the expiry window
+    double min_expiry{0.0};                   // volatility window [min_expiry, max_expiry] in years
+    double max_expiry{std::numeric_limits<double>::infinity()};
+};
+
+/// Incremental risk on market-data ticks. Positions are indexed by underlying and, within an
+/// underlying, by expiry; an update reprices only the positions it moves and adjusts compensated
+/// running totals by their change, so its cost does not grow with the rest of the book.
+class TickRiskEngine {
+  public:
+    /// underlyings[i] identifies the underlying of positions[i].
+    TickRiskEngine(const std::vector<VanillaPosition>& positions,
+                   const std::vector<std::size_t>& underlyings);
+
+    /// Apply `update` and return the number of positions repriced. Throws std::invalid_argument,
+    /// leaving the book unchanged, for an unknown underlying or invalid resulting market data.
+    std::size_t apply(const MarketUpdate& update);
+
+    /// Running book totals, including every update applied so far.
+    PortfolioTotals totals() const;
+
+    /// Recompute the running totals from the per-position metrics in index order.
+    void resync();
+
+    const Portfolio& book() const { return book_; }
+
+  private:
+    void accumulate(std::size_t field, double amount);
+
+    Portfolio book_;
+    std::unordered_map<std::size_t, std::vector<std::size_t>> by_underlying_; // indices sorted by expiry
+    std::array<double, Portfolio::kMetricCount - 1> sum_{};                   // value, delta, ..., rho
+    std::array<double, Portfolio::kMetricCount - 1> compensation_{};          // Neumaier correction terms
+};
+
+/// Implied volatility on an expiry-by-strike grid, interpolated bilinearly and held flat beyond the
+/// grid edges (sticky strike).
+struct VolSurface {
+    std::vector<double> expiries; // strictly increasing, in years
+    std::vector<double> strikes;  // strictly increasing
+    std::vector<double> vols;     // row-major (expiries, strikes)
+
+    double volatility(double expiry, double strike) const;
+};
+
+/// Market data of one underlying. Underlyings may share a surface.
+struct UnderlyingState {
+    double spot;
+    double rate;
+    double dividend;
+    std::size_t surface; // index into MarketState::surfaces
+};
+
+/// Market-state table; an underlying's id is its index in `underlyings`.
+struct MarketState {
+    std::vector<UnderlyingState> underlyings;
+    std::vector<VolSurface> surfaces;
+};
+
+/// Vanilla position that takes its spot, rates and volatility from a MarketState.
+struct MarketPosition {
+    OptionType type;
+    double quantity;
+    std::size_t underlying;
+    double strike;
+    double time;
+};
+
+/// Self-contained positions for `positions` at `market`, e.g. for price_risk(). Throws
+/// std::invalid_argument for a malformed market or an unknown underlying or surface.
+std::vector<VanillaPosition> resolve_positions(const MarketState& market,
+                                               const std::vector<MarketPosition>& positions);
+
+/// Exact-reprice a cross-asset book under per-underlying shocks. `shocks` is scenario-major
+/// (scenario_count, underlying_count): shocks[s * underlying_count + u] moves underlying u in
+/// scenario s, and its volatility shift applies to every position on u. Market data is read
+/// through each position's underlying id rather than copied per position or per scenario; the
+/// blocking and summation order match the VanillaPosition overload.
+ScenarioResult scenario_pnl(const MarketState& market, const std::vector<MarketPosition>& positions,
+                            const std::vector<MarketShock>& shocks, bool include_position_pnl = false);
+ScenarioResult scenario_pnl(const MarketState& market, const std::vector<MarketPosition>& positions,
+                            const std::vector<MarketShock>& shocks, const ScenarioOptions& options);
+
+/// Correlated spot shocks for scenario_pnl(const MarketState&, ...). Log returns over `horizon`
+/// years are jointly normal with annualised volatilities `return_vols` and correlation `corr`
+/// (row-major, positive semi-definite) and have zero mean return; other shock fields are zero.
+/// Draws come from the counter-based RNG, so scenario s is the same for any scenario_count.
+std::vector<MarketShock> correlated_spot_shocks(const std::vector<double>& return_vols,
+                                                const std::vector<double>& corr, double horizon,
+                                                std::size_t scenario_count, std::uint64_t seed);
+
 } // namespace quant::portfolio
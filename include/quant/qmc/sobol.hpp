@@ -1,4 +1,4 @@
-/// Sobol quasi-random sequence (Joe–Kuo direction numbers with optional scramble)
+/// Sobol quasi-random sequence (Joe–Kuo direction numbers with optional scrambling)
 #pragma once
 
 #include <array>
@@ -10,24 +10,66 @@ namespace quant::qmc {
 
 class SobolSequence {
   public:
-    static constexpr std::size_t kMaxSupportedDimension = 64;
+    static constexpr std::size_t kMaxSupportedDimension = 1024;
     static constexpr std::size_t kMaxBits = 64;
 
+    /// Randomization applied to the integer points before mapping to (0,1).
+    enum class Scramble {
+        None,
+        DigitalShift, ///< XOR with a random shift per dimension
+        Owen          ///< nested uniform (Owen) scramble via a hash-based digit permutation
+    };
+
+    /// Sequential generator over consecutive indices.
+    ///
+    /// Moving from index n to n + 1 XORs a single precomputed carry mask per dimension
+    /// (the prefix XOR of the direction numbers flipped by the binary carry), i.e. the
+    /// Antonov–Saleev Gray-code update cost while keeping the natural index order used by
+    /// `generate(index)`. Points are bit-identical to random access generation.
+    class Cursor {
+      public:
+        Cursor(const SobolSequence& sequence, std::uint64_t index);
+
+        std::uint64_t index() const { return index_; }
+
+        /// Reposition the cursor (O(dimension * log2(index))).
+        void seek(std::uint64_t index);
+
+        /// Write the point at `index()` into `out` and advance to the next index.
+        void next(double* out);
+
+      private:
+        const SobolSequence* sequence_;
+        std::uint64_t index_{0};
+        std::vector<std::uint64_t> state_; // unscrambled integer point at index_
+    };
+
     SobolSequence(std::size_t dimension, bool scrambled = false, std::uint64_t seed = 0);
+    SobolSequence(std::size_t dimension, Scramble scramble, std::uint64_t seed = 0);
 
     std::size_t dimension() const { return dimension_; }
+    Scramble scramble() const { return scramble_mode_; }
 
     void generate(std::uint64_t index, double* out) const;
     std::vector<double> generate(std::uint64_t index) const;
 
+    /// Fill `out` (row-major, `count x dimension()`) with points `begin, ..., begin + count - 1`.
+    void generate_block(std::uint64_t begin, std::size_t count, double* out) const;
+
+    Cursor cursor(std::uint64_t index = 0) const { return Cursor(*this, index); }
+
   private:
+    std::uint64_t randomize(std::uint64_t value, std::size_t dim) const;
+
     struct DirectionRow {
         std::array<std::uint64_t, kMaxBits> values{};
     };
 
     std::size_t dimension_;
+    Scramble scramble_mode_;
     std::vector<DirectionRow> directions_;
-    std::vector<std::uint64_t> scramble_; // digital shift per dimension
+    std::vector<std::uint64_t> carry_masks_; // [bit * dimension + dim]: XOR of directions 0..bit
+    std::vector<std::uint64_t> scramble_;    // digital shift or Owen seed per dimension
 };
 
 } // namespace quant::qmc
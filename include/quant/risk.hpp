@@ -1,6 +1,13 @@
 /// Simple VaR/CVaR computation utilities
 #pragma once
 
+#include "quant/portfolio.hpp"
+
+#include <cstddef>
+#include <cstdint>
+#include <deque>
+#include <set>
+#include <utility>
 #include <vector>
 
 namespace quant::risk {
@@ -12,7 +19,25 @@ struct VarEs {
     double cvar;
 };
 
+// Selection (nth_element) rather than a full sort: O(n) per call.
 VarEs var_cvar_from_pnl(const std::vector<double>& pnl, double alpha);
+// Same, selecting inside `pnl` without a copy; its order is unspecified afterwards.
+VarEs var_cvar_from_pnl(std::vector<double>&& pnl, double alpha);
+
+// VaR/ES for each column of a P&L matrix at each alpha; var and cvar are (columns, alphas) row-major.
+struct VarEsBatch {
+    std::size_t columns{};
+    std::size_t alphas{};
+    std::vector<double> var;
+    std::vector<double> cvar;
+};
+
+// Element (r, c) of the (rows x columns) matrix is pnl[r * row_stride + c * column_stride], so any
+// strided layout (e.g. a NumPy view) is read in place; only one column per thread is buffered.
+// Alphas share one selection pass per column, from the widest tail inward. Columns are processed
+// in parallel. Throws std::invalid_argument for an empty matrix or an alpha outside (0, 1).
+VarEsBatch var_cvar_batch(const double* pnl, std::size_t rows, std::size_t columns, std::ptrdiff_t row_stride,
+                          std::ptrdiff_t column_stride, const std::vector<double>& alphas);
 
 // Monte Carlo VaR under GBM for a single asset position
 // Returns VaR/CVaR of horizon P&L for position size (positive long)
@@ -21,6 +46,8 @@ VarEs var_cvar_gbm(double spot, double mu, double sigma, double horizon_years, d
 
 // Portfolio VaR/CVaR under joint normal/Gaussian copula (Cholesky)
 // mu, sigma, weights have size N; corr is N x N row-major correlation matrix
+// Simulations run in parallel on counter-based draws (reproducible for any thread count); the
+// Cholesky factor folds into one loading vector, so each simulation costs O(N) for hundreds of factors.
 VarEs var_cvar_portfolio(const std::vector<double>& mu, const std::vector<double>& sigma,
                          const std::vector<double>& corr, const std::vector<double>& weights,
                          double horizon_years, unsigned long num_sims, unsigned long seed, double alpha);
@@ -41,8 +68,131 @@ struct BacktestStats {
 // Compute Kupiec (POF) and Christoffersen (independence) tests from exception sequence (0/1)
 BacktestStats kupiec_christoffersen(const std::vector<int>& exceptions, double alpha);
 
+// Online form of kupiec_christoffersen(): exceptions are pushed as they occur and stats() is
+// available at any point in O(1).
+class ExceptionTracker {
+  public:
+    explicit ExceptionTracker(double alpha) : alpha_(alpha) {}
+
+    void push(bool exception);
+    BacktestStats stats() const;
+
+  private:
+    double alpha_;
+    unsigned long T_{0};
+    unsigned long N_{0};
+    unsigned long transitions_[2][2]{}; // [previous][current]
+    bool last_{false};
+};
+
+enum class VarMethod {
+    Historical,        // empirical quantile of the trailing returns
+    FilteredHistorical // EWMA-standardised residual quantile, rescaled by the forecast volatility
+};
+
+struct RollingVarParams {
+    std::size_t window{250};
+    std::vector<double> alphas{0.99};
+    VarMethod method{VarMethod::Historical};
+    double ewma_lambda{0.94}; // FilteredHistorical variance decay
+};
+
+// Streaming rolling-window VaR/ES with online backtest statistics. The window is held in an
+// ordered set with, per alpha, an iterator to the VaR order statistic and the running sum of the
+// tail below it, so each return costs O(log W + alphas) with no re-sort. Ranks follow
+// var_cvar_from_pnl(). FilteredHistorical seeds the EWMA variance with the mean square of the first
+// window. Throws std::invalid_argument for invalid parameters or non-finite returns.
+class RollingVar {
+  public:
+    explicit RollingVar(const RollingVarParams& params);
+
+    // True once `window` returns have been seen and forecasts are available.
+    bool ready() const { return ready_; }
+    // VaR/ES forecast for the next return at alphas[index]; {0, 0} before ready().
+    VarEs forecast(std::size_t index) const;
+    // Score `ret` against the current forecasts (an exception is ret < -VaR), then slide it into the
+    // window. Returns the per-alpha exception flags, all zero during warm-up.
+    const std::vector<unsigned char>& push(double ret);
+    // Backtest statistics over every forecast scored so far at alphas[index].
+    BacktestStats stats(std::size_t index) const { return trackers_.at(index).stats(); }
+
+  private:
+    using Key = std::pair<double, std::uint64_t>; // (sample, arrival) keeps duplicates distinct
+    struct Tail {
+        std::size_t rank;
+        std::set<Key>::const_iterator kth;
+        double sum; // samples of rank <= `rank`
+    };
+
+    void start();
+
+    RollingVarParams params_;
+    std::set<Key> sorted_;
+    std::deque<Key> arrivals_;
+    std::vector<double> warmup_;
+    std::vector<Tail> tails_;
+    std::vector<ExceptionTracker> trackers_;
+    std::vector<unsigned char> flags_;
+    std::uint64_t count_{0};
+    double variance_{1.0}; // next-return EWMA variance (FilteredHistorical)
+    bool ready_{false};
+};
+
+// Rolling VaR/ES forecasts, exceptions and statistics over a whole return history.
+struct RollingBacktestResult {
+    std::size_t forecasts{}; // returns.size() - window; forecast f is for returns[window + f]
+    std::size_t alphas{};
+    std::vector<double> var; // (forecasts, alphas) row-major
+    std::vector<double> cvar;
+    std::vector<unsigned char> exceptions;
+    std::vector<BacktestStats> stats; // per alpha
+};
+
+RollingBacktestResult rolling_var_backtest(const std::vector<double>& returns,
+                                           const RollingVarParams& params);
+
 // t-Student VaR/CVaR for a single asset P&L over a horizon
+// Parallel and counter-based like var_cvar_portfolio; t = z / sqrt(chi2(nu) / nu) scaled to unit variance.
 VarEs var_cvar_t(double mu, double sigma, double nu, double horizon_years, double position,
                  unsigned long num_sims, unsigned long seed, double alpha);
 
+// Risk-factor model for portfolio_var(). Each underlying u has a log-spot factor and an implied-vol
+// factor, and one rate factor moves every underlying's rate in parallel. Factors are ordered
+// [spot_0..spot_{U-1}, vol_0..vol_{U-1}, rate]; corr is either (2U+1) x (2U+1) over all factors or
+// U x U over the spot factors alone, with vol and rate factors then independent.
+struct PortfolioVarParams {
+    std::vector<double> spot_vols; // annualised log-return vol per underlying
+    // Annualised vol of the log of each underlying's vol level. The surface shifts in parallel by
+    // the move of its lowest position volatility, so every shifted volatility stays non-negative.
+    std::vector<double> vol_vols;
+    double rate_vol{0.0}; // annualised std dev of the parallel rate shift
+    std::vector<double> corr;
+    double horizon_years;
+    std::size_t num_sims;
+    std::uint64_t seed;
+    double alpha;
+    quant::portfolio::Revaluation revaluation{quant::portfolio::Revaluation::Full};
+    double tolerance{0.0};    // Hybrid revaluation tolerance
+    bool contributions{true}; // compute per-position component and incremental VaR
+};
+
+struct PortfolioVarResult {
+    VarEs total; // of the book's horizon P&L
+    double base_value{};
+    std::vector<double> pnl;             // book P&L per simulation
+    std::vector<double> component_var;   // Euler allocation of total.var; sums to total.var
+    std::vector<double> component_cvar;  // -E[position P&L | tail]; sums to total.cvar
+    std::vector<double> incremental_var; // total.var minus the VaR of the book without the position
+};
+
+// Full-revaluation Monte Carlo VaR/ES of a cross-asset option book. Factor moves come from the
+// counter-based RNG (simulation s is the same for any num_sims) and each simulation revalues the
+// whole book, aged by the horizon, through portfolio::scenario_pnl() in parallel. Component VaR
+// averages each position's P&L over the simulations ranked within 0.5% of num_sims of the VaR
+// simulation, rescaled to sum to VaR. Contributions cost a second revaluation pass over position
+// chunks, so memory stays O(num_sims x chunk) for large books. Throws std::invalid_argument.
+PortfolioVarResult portfolio_var(const quant::portfolio::MarketState& market,
+                                 const std::vector<quant::portfolio::MarketPosition>& positions,
+                                 const PortfolioVarParams& params);
+
 } // namespace quant::risk
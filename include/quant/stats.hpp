@@ -2,6 +2,8 @@
 #pragma once
 
 #include <algorithm>
+#include <chrono>
+#include <cmath>
 #include <cstdint>
 
 namespace quant::stats {
@@ -34,6 +36,76 @@ struct Welford {
     }
 
     inline double variance() const { return (count > 1) ? m2 / static_cast<double>(count - 1) : 0.0; }
+
+    inline double std_error() const {
+        return (count > 1) ? std::sqrt(std::max(0.0, variance()) / static_cast<double>(count)) : 0.0;
+    }
+};
+
+/// Early-stopping rule for batched Monte Carlo.
+///
+/// With any positive target the engine simulates `batch_paths` at a time, merges the batch into
+/// a running Welford accumulator and stops once the standard error is at most
+/// `max(target_std_error, target_rel_error * |mean|)`, the time budget is spent, or the engine's
+/// `num_paths` (which becomes the path cap) is reached. All targets zero means a fixed-size run.
+struct StoppingRule {
+    double target_std_error{0.0};    // absolute standard error target (0 disables)
+    double target_rel_error{0.0};    // standard error relative to |mean| (0 disables)
+    double time_budget_seconds{0.0}; // wall-clock budget, checked between batches (0 disables)
+    std::uint64_t batch_paths{8192}; // paths simulated between checks
+    std::uint64_t min_paths{4096};   // error targets are not trusted before this many paths
+
+    bool enabled() const {
+        return target_std_error > 0.0 || target_rel_error > 0.0 || time_budget_seconds > 0.0;
+    }
+
+    bool target_met(const Welford& acc) const {
+        if (target_std_error <= 0.0 && target_rel_error <= 0.0) {
+            return false;
+        }
+        const double tolerance = std::max(target_std_error, target_rel_error * std::abs(acc.mean));
+        return acc.count > 1 && acc.std_error() <= tolerance;
+    }
 };
 
+/// Outcome of `run_batches`: merged accumulator, primary paths simulated and wall time.
+struct BatchRun {
+    Welford acc;
+    std::uint64_t paths{0};
+    std::uint64_t batches{0};
+    double elapsed_seconds{0.0};
+};
+
+/// Drive `batch(begin, end, batch_index) -> Welford` over path indices `[0, max_paths)` under `rule`.
+/// A disabled rule runs a single batch covering every path.
+template <typename Batch>
+BatchRun run_batches(const StoppingRule& rule, std::uint64_t max_paths, Batch&& batch) {
+    using clock = std::chrono::steady_clock;
+    const auto start = clock::now();
+    const auto seconds_since_start = [&] {
+        return std::chrono::duration<double>(clock::now() - start).count();
+    };
+
+    BatchRun run;
+    const bool adaptive = rule.enabled();
+    const std::uint64_t step = adaptive ? std::max<std::uint64_t>(1, rule.batch_paths) : max_paths;
+    while (run.paths < max_paths) {
+        const std::uint64_t end = run.paths + std::min(step, max_paths - run.paths);
+        run.acc.merge(batch(run.paths, end, run.batches));
+        run.paths = end;
+        ++run.batches;
+        if (!adaptive) {
+            continue;
+        }
+        if (rule.time_budget_seconds > 0.0 && seconds_since_start() >= rule.time_budget_seconds) {
+            break;
+        }
+        if (run.paths >= rule.min_paths && rule.target_met(run.acc)) {
+            break;
+        }
+    }
+    run.elapsed_seconds = seconds_since_start();
+    return run;
+}
+
 } // namespace quant::stats
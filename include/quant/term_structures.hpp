@@ -2,6 +2,7 @@
 #pragma once
 
 #include <algorithm>
+#include <cstddef>
 #include <stdexcept>
 #include <vector>
 
@@ -11,19 +12,20 @@ struct PiecewiseConstant {
     std::vector<double> times;  // strictly increasing, terminal time inclusive
     std::vector<double> values; // same size as times (value on (t_{i-1}, t_i])
 
-    double value(double t) const {
+    double value(double t) const { return values[index(t)]; }
+
+    /// Index of the piece that supplies value(t).
+    std::size_t index(double t) const {
         if (times.empty() || values.empty() || times.size() != values.size()) {
             throw std::runtime_error("PiecewiseConstant: invalid schedule");
         }
         // Right-closed intervals: value is constant on (t_{i-1}, t_i],
         // and for t <= times.front() we return the first value.
         if (t <= times.front())
-            return values.front();
+            return 0;
         auto it = std::lower_bound(times.begin(), times.end(), t); // first time >= t
         std::size_t idx = static_cast<std::size_t>(std::distance(times.begin(), it));
-        if (idx >= values.size())
-            return values.back();
-        return values[idx];
+        return std::min(idx, values.size() - 1);
     }
 };
 
@@ -36,3 +36,12 @@ print("scenario P&L:", aggregate["portfolio_pnl"])
 # scenario_count * position_count * 8 bytes.
 detail = qp.bs_portfolio_scenarios(positions, shocks, detail=True)
 print("position P&L attribution:\n", detail["position_pnl"])
+
+# A persistent book validates positions once; later calls reprice only what
+# changed and return zero-copy, read-only NumPy views of the results.
+book = qp.Portfolio(*positions.T)
+book.risk()
+amended = np.array([[-1, -80, 101, 105, 0.03, 0.01, 0.26, 90 / 365]])
+book.amend(np.array([1]), *amended.T)
+refreshed = book.risk()
+print("repriced:", refreshed["repriced"], "values:", refreshed["metrics"]["value"])
@@ -4,11 +4,15 @@
 #include <pybind11/stl.h>
 
 #include "quant/american.hpp"
+#include "quant/asian.hpp"
 #include "quant/black_scholes.hpp"
 #include "quant/bs_barrier.hpp"
 #include "quant/heston.hpp"
+#include "quant/lookback.hpp"
 #include "quant/mc.hpp"
 #include "quant/mc_barrier.hpp"
+#include "quant/mc_greeks.hpp"
+#include "quant/mlmc.hpp"
 #include "quant/multi.hpp"
 #include "quant/pde.hpp"
 #include "quant/pde_barrier.hpp"
@@ -16,10 +20,15 @@
 #include "quant/risk.hpp"
 #include "quant/version.hpp"
 #include <algorithm>
+#include <array>
 #include <cmath>
+#include <cstdint>
 #include <limits>
+#include <memory>
+#include <optional>
 #include <semaphore>
 #include <stdexcept>
+#include <string>
 #include <thread>
 #include <vector>
 
@@ -278,6 +287,131 @@ parse_portfolio_shocks(const py::array_t<double, py::array::c_style | py::array:
     return parsed;
 }
 
+py::dict
+mc_european_batch(const quant::mc::McParams& params,
+                  const py::array_t<double, py::array::c_style | py::array::forcecast>& strikes,
+                  const py::array_t<double, py::array::c_style | py::array::forcecast>& option_types) {
+    if (strikes.ndim() != 1 || option_types.ndim() != 1 || strikes.shape(0) != option_types.shape(0)) {
+        throw std::invalid_argument("strikes and option_types must be 1-D arrays of equal length");
+    }
+    const auto count = static_cast<std::size_t>(strikes.shape(0));
+    std::vector<quant::mc::OptionSpec> options;
+    options.reserve(count);
+    for (std::size_t index = 0; index < count; ++index) {
+        const double type = option_types.data()[index];
+        if (type != 1.0 && type != -1.0) {
+            throw std::invalid_argument("option_types must be exactly 1 (call) or -1 (put)");
+        }
+        const auto option_type = type == 1.0 ? quant::OptionType::Call : quant::OptionType::Put;
+        options.push_back({strikes.data()[index], option_type});
+    }
+    quant::mc::EuropeanBatchResult result;
+    {
+        py::gil_scoped_release release;
+        result = quant::mc::price_european_batch(params, options);
+    }
+    py::array_t<double> price(py::array::ShapeContainer{static_cast<py::ssize_t>(count)});
+    py::array_t<double> std_error(py::array::ShapeContainer{static_cast<py::ssize_t>(count)});
+    py::array_t<double> ci_low(py::array::ShapeContainer{static_cast<py::ssize_t>(count)});
+    py::array_t<double> ci_high(py::array::ShapeContainer{static_cast<py::ssize_t>(count)});
+    for (std::size_t index = 0; index < count; ++index) {
+        const auto& estimate = result.estimates[index];
+        price.mutable_data()[index] = estimate.value;
+        std_error.mutable_data()[index] = estimate.std_error;
+        ci_low.mutable_data()[index] = estimate.ci_low;
+        ci_high.mutable_data()[index] = estimate.ci_high;
+    }
+    py::dict output;
+    output["price"] = std::move(price);
+    output["std_error"] = std::move(std_error);
+    output["ci_low"] = std::move(ci_low);
+    output["ci_high"] = std::move(ci_high);
+    output["paths_used"] = result.paths_used;
+    output["elapsed_seconds"] = result.elapsed_seconds;
+    return output;
+}
+
+py::dict pde_batch(const quant::pde::PdeParams& params,
+                   const py::array_t<double, py::array::c_style | py::array::forcecast>& strikes,
+                   const py::array_t<double, py::array::c_style | py::array::forcecast>& option_types,
+                   const py::array_t<double, py::array::c_style | py::array::forcecast>& times) {
+    if (strikes.ndim() != 1 || option_types.ndim() != 1 || times.ndim() != 1 ||
+        strikes.shape(0) != option_types.shape(0) || strikes.shape(0) != times.shape(0)) {
+        throw std::invalid_argument("strikes, option_types and times must be 1-D arrays of equal length");
+    }
+    const auto count = static_cast<std::size_t>(strikes.shape(0));
+    std::vector<quant::pde::BatchOption> options;
+    options.reserve(count);
+    for (std::size_t index = 0; index < count; ++index) {
+        const double type = option_types.data()[index];
+        if (type != 1.0 && type != -1.0) {
+            throw std::invalid_argument("option_types must be exactly 1 (call) or -1 (put)");
+        }
+        const auto option_type = type == 1.0 ? quant::OptionType::Call : quant::OptionType::Put;
+        options.push_back({strikes.data()[index], option_type, times.data()[index]});
+    }
+    std::vector<quant::pde::PdeResult> results;
+    {
+        py::gil_scoped_release release;
+        results = quant::pde::price_crank_nicolson_batch(params, options);
+    }
+    py::array_t<double> price(py::array::ShapeContainer{static_cast<py::ssize_t>(count)});
+    py::array_t<double> delta(py::array::ShapeContainer{static_cast<py::ssize_t>(count)});
+    py::array_t<double> gamma(py::array::ShapeContainer{static_cast<py::ssize_t>(count)});
+    for (std::size_t index = 0; index < count; ++index) {
+        price.mutable_data()[index] = results[index].price;
+        delta.mutable_data()[index] = results[index].delta;
+        gamma.mutable_data()[index] = results[index].gamma;
+    }
+    py::dict output;
+    output["price"] = std::move(price);
+    output["delta"] = std::move(delta);
+    output["gamma"] = std::move(gamma);
+    if (params.compute_theta) {
+        py::array_t<double> theta(py::array::ShapeContainer{static_cast<py::ssize_t>(count)});
+        for (std::size_t index = 0; index < count; ++index) {
+            theta.mutable_data()[index] = results[index].theta.value_or(0.0);
+        }
+        output["theta"] = std::move(theta);
+    }
+    return output;
+}
+
+py::array_t<double> mc_statistics_array(const std::vector<quant::mc::McStatistic>& stats, bool std_error) {
+    py::array_t<double> values(py::array::ShapeContainer{static_cast<py::ssize_t>(stats.size())});
+    for (std::size_t index = 0; index < stats.size(); ++index) {
+        values.mutable_data()[index] = std_error ? stats[index].std_error : stats[index].value;
+    }
+    return values;
+}
+
+py::dict path_greeks_dict(const quant::mc::PathGreeksResult& result) {
+    py::dict output;
+    output["price"] = result.price.value;
+    output["price_std_error"] = result.price.std_error;
+    output["delta"] = mc_statistics_array(result.delta, false);
+    output["delta_std_error"] = mc_statistics_array(result.delta, true);
+    output["gamma"] = mc_statistics_array(result.gamma, false);
+    output["gamma_std_error"] = mc_statistics_array(result.gamma, true);
+    output["vega"] = mc_statistics_array(result.vega, false);
+    output["vega_std_error"] = mc_statistics_array(result.vega, true);
+    output["rho"] = result.rho.value;
+    output["rho_std_error"] = result.rho.std_error;
+    output["theta"] = result.theta.value;
+    output["theta_std_error"] = result.theta.std_error;
+    return output;
+}
+
+template <typename Params, typename Engine>
+py::dict path_greeks_binding(const Params& params, const quant::mc::GreeksBumps& bumps, Engine engine) {
+    quant::mc::PathGreeksResult result;
+    {
+        py::gil_scoped_release release;
+        result = engine(params, bumps);
+    }
+    return path_greeks_dict(result);
+}
+
 py::dict
 portfolio_risk_batch(const py::array_t<double, py::array::c_style | py::array::forcecast>& positions) {
     const auto parsed = parse_portfolio_positions(positions);
@@ -307,16 +441,8 @@ portfolio_risk_batch(const py::array_t<double, py::array::c_style | py::array::f
 }
 
 py::dict
-portfolio_scenario_pnl(const py::array_t<double, py::array::c_style | py::array::forcecast>& positions,
-                       const py::array_t<double, py::array::c_style | py::array::forcecast>& shocks,
-                       bool detail) {
-    const auto parsed_positions = parse_portfolio_positions(positions);
-    const auto parsed_shocks = parse_portfolio_shocks(shocks);
-    quant::portfolio::ScenarioResult result;
-    {
-        py::gil_scoped_release release;
-        result = quant::portfolio::scenario_pnl(parsed_positions, parsed_shocks, detail);
-    }
+scenario_result_dict(const quant::portfolio::ScenarioResult& result, bool detail,
+                     quant::portfolio::Revaluation revaluation = quant::portfolio::Revaluation::Full) {
     py::array_t<double> portfolio_pnl(
         py::array::ShapeContainer{static_cast<py::ssize_t>(result.scenario_count)});
     std::copy(result.portfolio_pnl.begin(), result.portfolio_pnl.end(), portfolio_pnl.mutable_data());
@@ -332,9 +458,341 @@ portfolio_scenario_pnl(const py::array_t<double, py::array::c_style | py::array:
     } else {
         output["position_pnl"] = py::none();
     }
+    if (revaluation == quant::portfolio::Revaluation::Full) {
+        output["revalued_cells"] = py::none();
+    } else {
+        // (k, 2) rows of (scenario, position).
+        py::array_t<std::int64_t> cells(py::array::ShapeContainer{
+            static_cast<py::ssize_t>(result.revalued_cells.size()), static_cast<py::ssize_t>(2)});
+        std::int64_t* out = cells.mutable_data();
+        for (std::size_t cell : result.revalued_cells) {
+            *out++ = static_cast<std::int64_t>(cell / result.position_count);
+            *out++ = static_cast<std::int64_t>(cell % result.position_count);
+        }
+        output["revalued_cells"] = std::move(cells);
+    }
+    return output;
+}
+
+// Reads float64 input through its strides; other dtypes are converted once by forcecast.
+py::dict var_cvar_batch_arrays(const py::array_t<double, py::array::forcecast>& pnl,
+                               const std::vector<double>& alphas) {
+    if (pnl.ndim() != 1 && pnl.ndim() != 2) {
+        throw std::invalid_argument("pnl must be a 1-D or 2-D array");
+    }
+    constexpr auto item = static_cast<py::ssize_t>(sizeof(double));
+    const py::ssize_t columns = pnl.ndim() == 2 ? pnl.shape(1) : 1;
+    const py::ssize_t column_stride = pnl.ndim() == 2 ? pnl.strides(1) : 0;
+    if (pnl.strides(0) % item != 0 || column_stride % item != 0) {
+        throw std::invalid_argument("pnl strides must be whole float64 elements");
+    }
+    quant::risk::VarEsBatch result;
+    {
+        py::gil_scoped_release release;
+        result = quant::risk::var_cvar_batch(pnl.data(), static_cast<std::size_t>(pnl.shape(0)),
+                                             static_cast<std::size_t>(columns), pnl.strides(0) / item,
+                                             column_stride / item, alphas);
+    }
+    py::array::ShapeContainer shape =
+        pnl.ndim() == 2 ? py::array::ShapeContainer{columns, static_cast<py::ssize_t>(alphas.size())}
+                        : py::array::ShapeContainer{static_cast<py::ssize_t>(alphas.size())};
+    py::array_t<double> var(shape);
+    py::array_t<double> cvar(shape);
+    std::copy(result.var.begin(), result.var.end(), var.mutable_data());
+    std::copy(result.cvar.begin(), result.cvar.end(), cvar.mutable_data());
+    py::dict output;
+    output["var"] = std::move(var);
+    output["cvar"] = std::move(cvar);
+    return output;
+}
+
+// One dict per window: var/cvar/exceptions of shape (forecasts, alphas) and per-alpha stats.
+py::list rolling_var_backtest_arrays(const std::vector<double>& returns,
+                                     const std::vector<std::size_t>& windows,
+                                     const std::vector<double>& alphas, quant::risk::VarMethod method,
+                                     double ewma_lambda) {
+    std::vector<quant::risk::RollingBacktestResult> results(windows.size());
+    {
+        py::gil_scoped_release release;
+        for (std::size_t w = 0; w < windows.size(); ++w) {
+            const quant::risk::RollingVarParams params{
+                .window = windows[w], .alphas = alphas, .method = method, .ewma_lambda = ewma_lambda};
+            results[w] = quant::risk::rolling_var_backtest(returns, params);
+        }
+    }
+    py::list output;
+    for (std::size_t w = 0; w < windows.size(); ++w) {
+        const auto& result = results[w];
+        const py::array::ShapeContainer shape{static_cast<py::ssize_t>(result.forecasts),
+                                              static_cast<py::ssize_t>(result.alphas)};
+        py::array_t<double> var(shape);
+        py::array_t<double> cvar(shape);
+        py::array_t<bool> exceptions(shape);
+        std::copy(result.var.begin(), result.var.end(), var.mutable_data());
+        std::copy(result.cvar.begin(), result.cvar.end(), cvar.mutable_data());
+        std::transform(result.exceptions.begin(), result.exceptions.end(), exceptions.mutable_data(),
+                       [](unsigned char flag) { return flag != 0; });
+        py::dict entry;
+        entry["window"] = windows[w];
+        entry["var"] = std::move(var);
+        entry["cvar"] = std::move(cvar);
+        entry["exceptions"] = std::move(exceptions);
+        entry["stats"] = py::cast(result.stats);
+        output.append(std::move(entry));
+    }
+    return output;
+}
+
+py::dict
+portfolio_scenario_pnl(const py::array_t<double, py::array::c_style | py::array::forcecast>& positions,
+                       const py::array_t<double, py::array::c_style | py::array::forcecast>& shocks,
+                       bool detail, quant::portfolio::Revaluation revaluation, double tolerance) {
+    const auto parsed_positions = parse_portfolio_positions(positions);
+    const auto parsed_shocks = parse_portfolio_shocks(shocks);
+    quant::portfolio::ScenarioResult result;
+    {
+        py::gil_scoped_release release;
+        const quant::portfolio::ScenarioOptions options{revaluation, tolerance, detail};
+        result = quant::portfolio::scenario_pnl(parsed_positions, parsed_shocks, options);
+    }
+    return scenario_result_dict(result, detail, revaluation);
+}
+
+using PortfolioColumn = py::array_t<double, py::array::c_style | py::array::forcecast>;
+using PortfolioColumns = std::array<PortfolioColumn, quant::portfolio::Portfolio::kColumnCount>;
+using PortfolioIndices = py::array_t<std::int64_t, py::array::c_style | py::array::forcecast>;
+
+quant::portfolio::VolSurface make_vol_surface(const PortfolioColumn& expiries, const PortfolioColumn& strikes,
+                                              const PortfolioColumn& vols) {
+    if (expiries.ndim() != 1 || strikes.ndim() != 1 || vols.ndim() != 2 ||
+        vols.shape(0) != expiries.shape(0) || vols.shape(1) != strikes.shape(0)) {
+        throw std::invalid_argument("vol surface requires 1-D expiries/strikes and vols of shape "
+                                    "(len(expiries), len(strikes))");
+    }
+    return quant::portfolio::VolSurface{
+        std::vector<double>(expiries.data(), expiries.data() + expiries.shape(0)),
+        std::vector<double>(strikes.data(), strikes.data() + strikes.shape(0)),
+        std::vector<double>(vols.data(), vols.data() + vols.size())};
+}
+
+// Market state from an (u,4) underlying table (spot, rate, dividend, surface index).
+quant::portfolio::MarketState parse_market_state(const PortfolioColumn& underlyings,
+                                                 const std::vector<quant::portfolio::VolSurface>& surfaces) {
+    if (underlyings.ndim() != 2 || underlyings.shape(1) != 4 || underlyings.shape(0) == 0) {
+        throw std::invalid_argument("underlyings must have shape (u, 4): spot, rate, dividend, surface");
+    }
+    quant::portfolio::MarketState market{{}, surfaces};
+    const double* data = underlyings.data();
+    for (py::ssize_t index = 0; index < underlyings.shape(0); ++index) {
+        const double* row = data + index * 4;
+        if (!(row[3] >= 0.0) || row[3] != std::floor(row[3])) {
+            throw std::invalid_argument("underlying surface index must be a non-negative integer");
+        }
+        market.underlyings.push_back({row[0], row[1], row[2], static_cast<std::size_t>(row[3])});
+    }
+    return market;
+}
+
+std::vector<quant::portfolio::MarketPosition> parse_market_positions(const PortfolioColumn& positions) {
+    if (positions.ndim() != 2 || positions.shape(1) != 5 || positions.shape(0) == 0) {
+        throw std::invalid_argument(
+            "positions must have shape (n, 5): option_type, quantity, underlying, strike, time");
+    }
+    std::vector<quant::portfolio::MarketPosition> parsed;
+    parsed.reserve(static_cast<std::size_t>(positions.shape(0)));
+    const double* data = positions.data();
+    for (py::ssize_t index = 0; index < positions.shape(0); ++index) {
+        const double* row = data + index * 5;
+        if (row[0] != 1.0 && row[0] != -1.0) {
+            throw std::invalid_argument("portfolio option_type must be exactly 1 (call) or -1 (put)");
+        }
+        if (!(row[2] >= 0.0) || row[2] != std::floor(row[2])) {
+            throw std::invalid_argument("position underlying must be a non-negative integer");
+        }
+        const auto type =
+            row[0] == 1.0 ? quant::portfolio::OptionType::Call : quant::portfolio::OptionType::Put;
+        parsed.push_back({type, row[1], static_cast<std::size_t>(row[2]), row[3], row[4]});
+    }
+    return parsed;
+}
+
+py::dict market_scenario_pnl(const PortfolioColumn& underlyings,
+                             const std::vector<quant::portfolio::VolSurface>& surfaces,
+                             const PortfolioColumn& positions, const PortfolioColumn& shocks, bool detail,
+                             quant::portfolio::Revaluation revaluation, double tolerance) {
+    const auto market = parse_market_state(underlyings, surfaces);
+    const auto parsed_positions = parse_market_positions(positions);
+    if (shocks.ndim() != 3 || shocks.shape(1) != underlyings.shape(0) || shocks.shape(2) != 5 ||
+        shocks.shape(0) == 0) {
+        throw std::invalid_argument("shocks must have shape (m, u, 5): spot_return, volatility_shift, "
+                                    "rate_shift, dividend_shift, time_elapsed");
+    }
+    std::vector<quant::portfolio::MarketShock> parsed_shocks;
+    parsed_shocks.reserve(static_cast<std::size_t>(shocks.shape(0) * shocks.shape(1)));
+    for (py::ssize_t index = 0; index < shocks.shape(0) * shocks.shape(1); ++index) {
+        const double* row = shocks.data() + index * 5;
+        parsed_shocks.push_back({row[0], row[1], row[2], row[3], row[4]});
+    }
+    quant::portfolio::ScenarioResult result;
+    {
+        py::gil_scoped_release release;
+        const quant::portfolio::ScenarioOptions options{revaluation, tolerance, detail};
+        result = quant::portfolio::scenario_pnl(market, parsed_positions, parsed_shocks, options);
+    }
+    return scenario_result_dict(result, detail, revaluation);
+}
+
+py::array_t<double> correlated_spot_shock_array(const PortfolioColumn& return_vols,
+                                                const PortfolioColumn& corr, double horizon,
+                                                std::size_t scenario_count, std::uint64_t seed) {
+    if (return_vols.ndim() != 1 || corr.ndim() != 2) {
+        throw std::invalid_argument("return_vols must be 1-D and corr 2-D");
+    }
+    const auto n = static_cast<std::size_t>(return_vols.shape(0));
+    std::vector<quant::portfolio::MarketShock> shocks;
+    {
+        const std::vector<double> vols(return_vols.data(), return_vols.data() + n);
+        const std::vector<double> matrix(corr.data(), corr.data() + corr.size());
+        py::gil_scoped_release release;
+        shocks = quant::portfolio::correlated_spot_shocks(vols, matrix, horizon, scenario_count, seed);
+    }
+    py::array_t<double> output(py::array::ShapeContainer{static_cast<py::ssize_t>(scenario_count),
+                                                         static_cast<py::ssize_t>(n), py::ssize_t{5}});
+    double* out = output.mutable_data();
+    for (const auto& shock : shocks) {
+        *out++ = shock.spot_return;
+        *out++ = shock.volatility_shift;
+        *out++ = shock.rate_shift;
+        *out++ = shock.dividend_shift;
+        *out++ = shock.time_elapsed;
+    }
+    return output;
+}
+
+py::dict portfolio_var_dict(const PortfolioColumn& underlyings,
+                            const std::vector<quant::portfolio::VolSurface>& surfaces,
+                            const PortfolioColumn& positions, const PortfolioColumn& spot_vols,
+                            const PortfolioColumn& vol_vols, double rate_vol, const PortfolioColumn& corr,
+                            double horizon_years, std::size_t num_sims, std::uint64_t seed, double alpha,
+                            quant::portfolio::Revaluation revaluation, double tolerance, bool contributions) {
+    const auto market = parse_market_state(underlyings, surfaces);
+    const auto parsed_positions = parse_market_positions(positions);
+    if (spot_vols.ndim() != 1 || vol_vols.ndim() != 1 || corr.ndim() != 2) {
+        throw std::invalid_argument("spot_vols and vol_vols must be 1-D and corr 2-D");
+    }
+    const quant::risk::PortfolioVarParams params{
+        .spot_vols = std::vector<double>(spot_vols.data(), spot_vols.data() + spot_vols.shape(0)),
+        .vol_vols = std::vector<double>(vol_vols.data(), vol_vols.data() + vol_vols.shape(0)),
+        .rate_vol = rate_vol,
+        .corr = std::vector<double>(corr.data(), corr.data() + corr.size()),
+        .horizon_years = horizon_years,
+        .num_sims = num_sims,
+        .seed = seed,
+        .alpha = alpha,
+        .revaluation = revaluation,
+        .tolerance = tolerance,
+        .contributions = contributions};
+    quant::risk::PortfolioVarResult result;
+    {
+        py::gil_scoped_release release;
+        result = quant::risk::portfolio_var(market, parsed_positions, params);
+    }
+    const auto to_array = [](const std::vector<double>& values) -> py::object {
+        if (values.empty()) {
+            return py::none();
+        }
+        py::array_t<double> array(py::array::ShapeContainer{static_cast<py::ssize_t>(values.size())});
+        std::copy(values.begin(), values.end(), array.mutable_data());
+        return std::move(array);
+    };
+    py::dict output;
+    output["var"] = result.total.var;
+    output["cvar"] = result.total.cvar;
+    output["base_portfolio_value"] = result.base_value;
+    output["portfolio_pnl"] = to_array(result.pnl);
+    output["component_var"] = to_array(result.component_var);
+    output["component_cvar"] = to_array(result.component_cvar);
+    output["incremental_var"] = to_array(result.incremental_var);
     return output;
 }
 
+constexpr const char* kPortfolioColumnNames[quant::portfolio::Portfolio::kColumnCount]{
+    "option_type", "quantity", "spot", "strike", "rate", "dividend", "volatility", "time"};
+constexpr const char* kPortfolioMetricNames[quant::portfolio::Portfolio::kMetricCount]{
+    "price", "value", "delta", "gamma", "vega", "theta", "rho"};
+
+// Positions from the eight equal-length 1-D columns named in kPortfolioColumnNames.
+std::vector<quant::portfolio::VanillaPosition> parse_portfolio_columns(const PortfolioColumns& columns) {
+    const py::ssize_t count = columns[0].ndim() == 1 ? columns[0].shape(0) : -1;
+    for (const auto& column : columns) {
+        if (column.ndim() != 1 || column.shape(0) != count) {
+            throw std::invalid_argument("portfolio columns must be 1-D arrays of equal length");
+        }
+    }
+    std::vector<quant::portfolio::VanillaPosition> parsed;
+    parsed.reserve(static_cast<std::size_t>(count));
+    for (py::ssize_t index = 0; index < count; ++index) {
+        const double type = columns[0].data()[index];
+        if (type != 1.0 && type != -1.0) {
+            throw std::invalid_argument("portfolio option_type must be exactly 1 (call) or -1 (put)");
+        }
+        const auto option_type =
+            type == 1.0 ? quant::portfolio::OptionType::Call : quant::portfolio::OptionType::Put;
+        parsed.push_back({option_type, columns[1].data()[index], columns[2].data()[index],
+                          columns[3].data()[index], columns[4].data()[index], columns[5].data()[index],
+                          columns[6].data()[index], columns[7].data()[index]});
+    }
+    return parsed;
+}
+
+template <std::size_t N>
+std::size_t lookup_name(const char* const (&names)[N], const std::string& name, const char* what) {
+    for (std::size_t index = 0; index < N; ++index) {
+        if (name == names[index]) {
+            return index;
+        }
+    }
+    throw std::invalid_argument(std::string("unknown portfolio ") + what + ": " + name);
+}
+
+// Python-side book. Counts the NumPy views exported over its columns and metrics so that add()
+// and remove(), which may reallocate or shrink that storage, can refuse while any view is alive.
+struct PyPortfolio : quant::portfolio::Portfolio {
+    using Portfolio::Portfolio;
+    std::size_t exported_views{0};
+};
+
+void require_no_exported_views(const PyPortfolio& book) {
+    if (book.exported_views != 0) {
+        throw py::buffer_error("cannot add or remove positions while column or metric views exist");
+    }
+}
+
+// Read-only NumPy view of `values`; `owner` keeps the book alive while the view exists. With
+// `exports`, the view is counted there until it is released.
+py::array_t<double> portfolio_view(const std::vector<double>& values, py::handle owner,
+                                   std::size_t* exports = nullptr) {
+    struct Export {
+        py::object owner;
+        std::size_t* count;
+    };
+    py::object base = py::reinterpret_borrow<py::object>(owner);
+    if (exports) {
+        auto export_guard = std::make_unique<Export>(Export{base, exports});
+        base = py::capsule(export_guard.get(), [](void* pointer) {
+            auto* guard = static_cast<Export*>(pointer);
+            --*guard->count;
+            delete guard;
+        });
+        export_guard.release();
+        ++*exports;
+    }
+    py::array_t<double> view(py::array::ShapeContainer{static_cast<py::ssize_t>(values.size())},
+                             values.data(), base);
+    view.attr("flags").attr("writeable") = false;
+    return view;
+}
+
 } // namespace
 
 PYBIND11_MODULE(pyquant_pricer, m) {
@@ -360,6 +818,12 @@ PYBIND11_MODULE(pyquant_pricer, m) {
     // Monte Carlo: price and Greeks
     m.def("mc_european_call", &quant::mc::price_european_call, "MC price (European call)", py::arg("params"));
     m.def("mc_greeks_call", &quant::mc::greeks_european_call, "MC Greeks (European call)", py::arg("params"));
+    m.def("mc_adjoint_greeks_call", &quant::mc::greeks_european_call_adjoint,
+          "Adjoint MC Greeks (European call) with per-bucket rate/vol schedule sensitivities",
+          py::arg("params"));
+    m.def("mc_european_batch", &mc_european_batch,
+          "MC prices for many strikes and call (1) / put (-1) flags on shared paths", py::arg("params"),
+          py::arg("strikes"), py::arg("option_types"));
 
     py::class_<quant::PiecewiseConstant>(m, "PiecewiseConstant")
         .def(py::init<>())
@@ -370,7 +834,8 @@ PYBIND11_MODULE(pyquant_pricer, m) {
     py::enum_<quant::mc::McParams::Qmc>(m, "McSampler")
         .value("None", quant::mc::McParams::Qmc::None)
         .value("Sobol", quant::mc::McParams::Qmc::Sobol)
-        .value("SobolScrambled", quant::mc::McParams::Qmc::SobolScrambled);
+        .value("SobolScrambled", quant::mc::McParams::Qmc::SobolScrambled)
+        .value("SobolOwen", quant::mc::McParams::Qmc::SobolOwen);
 
     py::enum_<quant::mc::McParams::Bridge>(m, "McBridge")
         .value("None", quant::mc::McParams::Bridge::None)
@@ -380,6 +845,39 @@ PYBIND11_MODULE(pyquant_pricer, m) {
         .value("Mt19937", quant::rng::Mode::Mt19937)
         .value("Counter", quant::rng::Mode::Counter);
 
+    py::class_<quant::stats::StoppingRule>(m, "StoppingRule")
+        .def(py::init<>())
+        .def_readwrite("target_std_error", &quant::stats::StoppingRule::target_std_error)
+        .def_readwrite("target_rel_error", &quant::stats::StoppingRule::target_rel_error)
+        .def_readwrite("time_budget_seconds", &quant::stats::StoppingRule::time_budget_seconds)
+        .def_readwrite("batch_paths", &quant::stats::StoppingRule::batch_paths)
+        .def_readwrite("min_paths", &quant::stats::StoppingRule::min_paths);
+
+    py::class_<quant::mlmc::MlmcParams>(m, "MlmcParams")
+        .def(py::init<>())
+        .def_readwrite("target_rmse", &quant::mlmc::MlmcParams::target_rmse)
+        .def_readwrite("base_steps", &quant::mlmc::MlmcParams::base_steps)
+        .def_readwrite("refinement", &quant::mlmc::MlmcParams::refinement)
+        .def_readwrite("min_levels", &quant::mlmc::MlmcParams::min_levels)
+        .def_readwrite("max_levels", &quant::mlmc::MlmcParams::max_levels)
+        .def_readwrite("pilot_paths", &quant::mlmc::MlmcParams::pilot_paths);
+
+    py::class_<quant::mlmc::LevelStats>(m, "MlmcLevelStats")
+        .def_readonly("steps", &quant::mlmc::LevelStats::steps)
+        .def_readonly("paths", &quant::mlmc::LevelStats::paths)
+        .def_readonly("mean", &quant::mlmc::LevelStats::mean)
+        .def_readonly("variance", &quant::mlmc::LevelStats::variance)
+        .def_readonly("cost", &quant::mlmc::LevelStats::cost);
+
+    py::class_<quant::mlmc::MlmcResult>(m, "MlmcResult")
+        .def_readonly("value", &quant::mlmc::MlmcResult::value)
+        .def_readonly("std_error", &quant::mlmc::MlmcResult::std_error)
+        .def_readonly("bias_estimate", &quant::mlmc::MlmcResult::bias_estimate)
+        .def_readonly("total_cost", &quant::mlmc::MlmcResult::total_cost)
+        .def_readonly("elapsed_seconds", &quant::mlmc::MlmcResult::elapsed_seconds)
+        .def_readonly("converged", &quant::mlmc::MlmcResult::converged)
+        .def_readonly("levels", &quant::mlmc::MlmcResult::levels);
+
     py::class_<quant::mc::McParams>(m, "McParams")
         .def(py::init<>())
         .def_readwrite("spot", &quant::mc::McParams::spot)
@@ -396,9 +894,11 @@ PYBIND11_MODULE(pyquant_pricer, m) {
         .def_readwrite("qmc", &quant::mc::McParams::qmc)
         .def_readwrite("bridge", &quant::mc::McParams::bridge)
         .def_readwrite("num_steps", &quant::mc::McParams::num_steps)
+        .def_readwrite("qmc_replicates", &quant::mc::McParams::qmc_replicates)
         .def_readwrite("rate_schedule", &quant::mc::McParams::rate_schedule)
         .def_readwrite("dividend_schedule", &quant::mc::McParams::dividend_schedule)
-        .def_readwrite("vol_schedule", &quant::mc::McParams::vol_schedule);
+        .def_readwrite("vol_schedule", &quant::mc::McParams::vol_schedule)
+        .def_readwrite("stopping", &quant::mc::McParams::stopping);
 
     py::class_<quant::mc::McStatistic>(m, "McStatistic")
         .def_readonly("value", &quant::mc::McStatistic::value)
@@ -406,7 +906,10 @@ PYBIND11_MODULE(pyquant_pricer, m) {
         .def_readonly("ci_low", &quant::mc::McStatistic::ci_low)
         .def_readonly("ci_high", &quant::mc::McStatistic::ci_high);
 
-    py::class_<quant::mc::McResult>(m, "McResult").def_readonly("estimate", &quant::mc::McResult::estimate);
+    py::class_<quant::mc::McResult>(m, "McResult")
+        .def_readonly("estimate", &quant::mc::McResult::estimate)
+        .def_readonly("paths_used", &quant::mc::McResult::paths_used)
+        .def_readonly("elapsed_seconds", &quant::mc::McResult::elapsed_seconds);
 
     py::class_<quant::mc::GreeksResult>(m, "McGreeks")
         .def_readonly("delta", &quant::mc::GreeksResult::delta)
@@ -415,6 +918,80 @@ PYBIND11_MODULE(pyquant_pricer, m) {
         .def_readonly("gamma_mixed", &quant::mc::GreeksResult::gamma_mixed)
         .def_readonly("theta", &quant::mc::GreeksResult::theta);
 
+    py::class_<quant::mc::AdjointGreeksResult>(m, "McAdjointGreeks")
+        .def_readonly("price", &quant::mc::AdjointGreeksResult::price)
+        .def_readonly("delta", &quant::mc::AdjointGreeksResult::delta)
+        .def_readonly("vega", &quant::mc::AdjointGreeksResult::vega)
+        .def_readonly("rho", &quant::mc::AdjointGreeksResult::rho)
+        .def_readonly("rate_buckets", &quant::mc::AdjointGreeksResult::rate_buckets)
+        .def_readonly("vol_buckets", &quant::mc::AdjointGreeksResult::vol_buckets);
+
+    // Path-dependent Greeks: one pass over shared paths, dict of per-underlying arrays
+    py::class_<quant::mc::GreeksBumps>(m, "GreeksBumps")
+        .def(py::init<>())
+        .def_readwrite("spot_rel", &quant::mc::GreeksBumps::spot_rel)
+        .def_readwrite("vol_abs", &quant::mc::GreeksBumps::vol_abs)
+        .def_readwrite("rate_abs", &quant::mc::GreeksBumps::rate_abs)
+        .def_readwrite("time_abs", &quant::mc::GreeksBumps::time_abs);
+
+    py::enum_<quant::asian::Payoff>(m, "AsianPayoff")
+        .value("FixedStrike", quant::asian::Payoff::FixedStrike)
+        .value("FloatingStrike", quant::asian::Payoff::FloatingStrike);
+
+    py::enum_<quant::asian::Average>(m, "AsianAverage")
+        .value("Arithmetic", quant::asian::Average::Arithmetic)
+        .value("Geometric", quant::asian::Average::Geometric);
+
+    py::class_<quant::asian::McParams>(m, "AsianMcParams")
+        .def(py::init<>())
+        .def_readwrite("spot", &quant::asian::McParams::spot)
+        .def_readwrite("strike", &quant::asian::McParams::strike)
+        .def_readwrite("rate", &quant::asian::McParams::rate)
+        .def_readwrite("dividend", &quant::asian::McParams::dividend)
+        .def_readwrite("vol", &quant::asian::McParams::vol)
+        .def_readwrite("time", &quant::asian::McParams::time)
+        .def_readwrite("num_paths", &quant::asian::McParams::num_paths)
+        .def_readwrite("seed", &quant::asian::McParams::seed)
+        .def_readwrite("num_steps", &quant::asian::McParams::num_steps)
+        .def_readwrite("antithetic", &quant::asian::McParams::antithetic)
+        .def_readwrite("payoff", &quant::asian::McParams::payoff)
+        .def_readwrite("avg", &quant::asian::McParams::avg);
+
+    m.def(
+        "asian_mc_greeks",
+        [](const quant::asian::McParams& params, const quant::mc::GreeksBumps& bumps) {
+            return path_greeks_binding(
+                params, bumps, [](const auto& p, const auto& b) { return quant::asian::greeks_mc(p, b); });
+        },
+        py::arg("params"), py::arg("bumps") = quant::mc::GreeksBumps{});
+
+    py::enum_<quant::lookback::Type>(m, "LookbackType")
+        .value("FixedStrike", quant::lookback::Type::FixedStrike)
+        .value("FloatingStrike", quant::lookback::Type::FloatingStrike);
+
+    py::class_<quant::lookback::McParams>(m, "LookbackMcParams")
+        .def(py::init<>())
+        .def_readwrite("spot", &quant::lookback::McParams::spot)
+        .def_readwrite("strike", &quant::lookback::McParams::strike)
+        .def_readwrite("rate", &quant::lookback::McParams::rate)
+        .def_readwrite("dividend", &quant::lookback::McParams::dividend)
+        .def_readwrite("vol", &quant::lookback::McParams::vol)
+        .def_readwrite("time", &quant::lookback::McParams::time)
+        .def_readwrite("num_paths", &quant::lookback::McParams::num_paths)
+        .def_readwrite("seed", &quant::lookback::McParams::seed)
+        .def_readwrite("num_steps", &quant::lookback::McParams::num_steps)
+        .def_readwrite("antithetic", &quant::lookback::McParams::antithetic)
+        .def_readwrite("opt", &quant::lookback::McParams::opt)
+        .def_readwrite("type", &quant::lookback::McParams::type);
+
+    m.def(
+        "lookback_mc_greeks",
+        [](const quant::lookback::McParams& params, const quant::mc::GreeksBumps& bumps) {
+            return path_greeks_binding(
+                params, bumps, [](const auto& p, const auto& b) { return quant::lookback::greeks_mc(p, b); });
+        },
+        py::arg("params"), py::arg("bumps") = quant::mc::GreeksBumps{});
+
     // PDE pricing (Δ/Γ/Θ)
     py::class_<quant::pde::GridSpec>(m, "GridSpec")
         .def(py::init<>())
@@ -446,6 +1023,10 @@ PYBIND11_MODULE(pyquant_pricer, m) {
         });
 
     m.def("pde_price", &quant::pde::price_crank_nicolson, "PDE price (Crank–Nicolson)", py::arg("params"));
+    m.def("pde_batch", &pde_batch,
+          "Crank–Nicolson prices/deltas/gammas for strike, call (1) / put (-1) and maturity arrays on one "
+          "shared grid",
+          py::arg("params"), py::arg("strikes"), py::arg("option_types"), py::arg("times"));
 
     // American
     py::enum_<quant::OptionType>(m, "OptionType")
@@ -469,6 +1050,13 @@ PYBIND11_MODULE(pyquant_pricer, m) {
         .def_readwrite("type", &quant::american::Params::type);
 
     m.def("american_binomial", &quant::american::price_binomial_crr, py::arg("params"), py::arg("steps"));
+    m.def("american_binomial_batch", &quant::american::price_binomial_crr_batch, py::arg("options"),
+          py::arg("steps"), py::arg("richardson") = false);
+
+    py::enum_<quant::american::PsorParams::Solver>(m, "AmericanSolver")
+        .value("Psor", quant::american::PsorParams::Solver::Psor)
+        .value("BrennanSchwartz", quant::american::PsorParams::Solver::BrennanSchwartz)
+        .value("PolicyIteration", quant::american::PsorParams::Solver::PolicyIteration);
 
     py::class_<quant::american::PsorParams>(m, "PsorParams")
         .def(py::init<>())
@@ -478,22 +1066,52 @@ PYBIND11_MODULE(pyquant_pricer, m) {
         .def_readwrite("omega", &quant::american::PsorParams::omega)
         .def_readwrite("max_iterations", &quant::american::PsorParams::max_iterations)
         .def_readwrite("tolerance", &quant::american::PsorParams::tolerance)
-        .def_readwrite("use_rannacher", &quant::american::PsorParams::use_rannacher);
+        .def_readwrite("use_rannacher", &quant::american::PsorParams::use_rannacher)
+        .def_readwrite("solver", &quant::american::PsorParams::solver)
+        .def_readwrite("adaptive_omega", &quant::american::PsorParams::adaptive_omega)
+        .def_readwrite("warm_start", &quant::american::PsorParams::warm_start);
 
     py::class_<quant::american::PsorResult>(m, "PsorResult")
         .def_readonly("price", &quant::american::PsorResult::price)
         .def_readonly("total_iterations", &quant::american::PsorResult::total_iterations)
-        .def_readonly("max_residual", &quant::american::PsorResult::max_residual);
+        .def_readonly("max_residual", &quant::american::PsorResult::max_residual)
+        .def_readonly("omega", &quant::american::PsorResult::omega)
+        .def_readonly("step_iterations", &quant::american::PsorResult::step_iterations);
 
     m.def("american_psor", &quant::american::price_psor, py::arg("params"));
 
+    py::class_<quant::american::PsorGreeks>(m, "PsorGreeks")
+        .def_readonly("price", &quant::american::PsorGreeks::price)
+        .def_readonly("delta", &quant::american::PsorGreeks::delta)
+        .def_readonly("gamma", &quant::american::PsorGreeks::gamma)
+        .def_readonly("theta", &quant::american::PsorGreeks::theta)
+        .def_readonly("vega", &quant::american::PsorGreeks::vega)
+        .def_readonly("total_iterations", &quant::american::PsorGreeks::total_iterations);
+
+    m.def("american_psor_greeks", &quant::american::greeks_psor, py::arg("params"),
+          py::arg("compute_vega") = false, py::arg("vol_bump") = 1e-3);
+
+    py::enum_<quant::american::LsmcBasis::Family>(m, "LsmcBasisFamily")
+        .value("Monomial", quant::american::LsmcBasis::Family::Monomial)
+        .value("Laguerre", quant::american::LsmcBasis::Family::Laguerre)
+        .value("Hermite", quant::american::LsmcBasis::Family::Hermite);
+
+    py::class_<quant::american::LsmcBasis>(m, "LsmcBasis")
+        .def(py::init<>())
+        .def_readwrite("family", &quant::american::LsmcBasis::family)
+        .def_readwrite("degree", &quant::american::LsmcBasis::degree)
+        .def_readwrite("cross_terms", &quant::american::LsmcBasis::cross_terms);
+
     py::class_<quant::american::LsmcParams>(m, "LsmcParams")
         .def(py::init<>())
         .def_readwrite("base", &quant::american::LsmcParams::base)
         .def_readwrite("num_paths", &quant::american::LsmcParams::num_paths)
         .def_readwrite("seed", &quant::american::LsmcParams::seed)
         .def_readwrite("num_steps", &quant::american::LsmcParams::num_steps)
-        .def_readwrite("antithetic", &quant::american::LsmcParams::antithetic);
+        .def_readwrite("antithetic", &quant::american::LsmcParams::antithetic)
+        .def_readwrite("streaming", &quant::american::LsmcParams::streaming)
+        .def_readwrite("basis", &quant::american::LsmcParams::basis)
+        .def_readwrite("out_of_sample", &quant::american::LsmcParams::out_of_sample);
 
     py::class_<quant::american::LsmcResult>(m, "LsmcResult")
         .def_readonly("price", &quant::american::LsmcResult::price)
@@ -514,6 +1132,20 @@ PYBIND11_MODULE(pyquant_pricer, m) {
     m.def("barrier_mc", &quant::mc::price_barrier_option, py::arg("params"), py::arg("K"), py::arg("opt"),
           py::arg("barrier"));
 
+    m.def("barrier_mlmc", &quant::mc::price_barrier_mlmc, py::arg("params"), py::arg("K"), py::arg("opt"),
+          py::arg("barrier"), py::arg("mlmc"));
+
+    m.def(
+        "barrier_mc_greeks",
+        [](const quant::mc::McParams& params, double K, quant::OptionType opt,
+           const quant::BarrierSpec& barrier, const quant::mc::GreeksBumps& bumps) {
+            return path_greeks_binding(params, bumps, [&](const auto& p, const auto& b) {
+                return quant::mc::greeks_barrier(p, K, opt, barrier, b);
+            });
+        },
+        py::arg("params"), py::arg("K"), py::arg("opt"), py::arg("barrier"),
+        py::arg("bumps") = quant::mc::GreeksBumps{});
+
     m.def("barrier_pde_price", &quant::pde::price_barrier_crank_nicolson, py::arg("params"), py::arg("opt"));
 
     // Heston
@@ -597,20 +1229,44 @@ PYBIND11_MODULE(pyquant_pricer, m) {
         .def_readwrite("num_steps", &quant::heston::McParams::num_steps)
         .def_readwrite("antithetic", &quant::heston::McParams::antithetic)
         .def_readwrite("rng", &quant::heston::McParams::rng)
-        .def_readwrite("scheme", &quant::heston::McParams::scheme);
+        .def_readwrite("scheme", &quant::heston::McParams::scheme)
+        .def_readwrite("stopping", &quant::heston::McParams::stopping);
 
     py::class_<quant::heston::McResult>(m, "HestonMcResult")
         .def_readonly("price", &quant::heston::McResult::price)
-        .def_readonly("std_error", &quant::heston::McResult::std_error);
+        .def_readonly("std_error", &quant::heston::McResult::std_error)
+        .def_readonly("paths_used", &quant::heston::McResult::paths_used)
+        .def_readonly("elapsed_seconds", &quant::heston::McResult::elapsed_seconds);
 
     m.def("heston_call_qe_mc", &quant::heston::call_qe_mc, py::arg("params"));
+    m.def("heston_call_qe_mlmc", &quant::heston::call_qe_mlmc, py::arg("params"), py::arg("mlmc"));
+
+    py::class_<quant::heston::Estimate>(m, "HestonEstimate")
+        .def_readonly("value", &quant::heston::Estimate::value)
+        .def_readonly("std_error", &quant::heston::Estimate::std_error);
+
+    py::class_<quant::heston::AdjointGreeks>(m, "HestonAdjointGreeks")
+        .def_readonly("price", &quant::heston::AdjointGreeks::price)
+        .def_readonly("delta", &quant::heston::AdjointGreeks::delta)
+        .def_readonly("vega", &quant::heston::AdjointGreeks::vega)
+        .def_readonly("rho", &quant::heston::AdjointGreeks::rho);
+
+    m.def("heston_adjoint_greeks_call", &quant::heston::greeks_call_adjoint, py::arg("params"),
+          "Adjoint MC call Greeks under Heston: delta, dV/dv0 and rho from one pass");
 
     // Risk
     py::class_<quant::risk::VarEs>(m, "VarEs")
         .def_readonly("var", &quant::risk::VarEs::var)
         .def_readonly("cvar", &quant::risk::VarEs::cvar);
 
-    m.def("var_cvar_from_pnl", &quant::risk::var_cvar_from_pnl, py::arg("pnl"), py::arg("alpha"));
+    m.def("var_cvar_from_pnl",
+          static_cast<quant::risk::VarEs (*)(const std::vector<double>&, double)>(
+              &quant::risk::var_cvar_from_pnl),
+          py::arg("pnl"), py::arg("alpha"));
+    m.def("var_cvar_batch", &var_cvar_batch_arrays, py::arg("pnl"), py::arg("alphas"),
+          "VaR/ES of each column of an (m, k) float64 P&L array (read in place, any strides) at each "
+          "alpha; returns {'var', 'cvar'} arrays of shape (k, len(alphas)), or (len(alphas),) for 1-D "
+          "input.");
     m.def("var_cvar_gbm", &quant::risk::var_cvar_gbm, py::arg("spot"), py::arg("mu"), py::arg("sigma"),
           py::arg("horizon_years"), py::arg("position"), py::arg("num_sims"), py::arg("seed"),
           py::arg("alpha"));
@@ -626,6 +1282,38 @@ PYBIND11_MODULE(pyquant_pricer, m) {
         .def_readonly("p_cc", &quant::risk::BacktestStats::p_cc);
     m.def("kupiec_christoffersen", &quant::risk::kupiec_christoffersen, py::arg("exceptions"),
           py::arg("alpha"));
+    py::class_<quant::risk::ExceptionTracker>(m, "ExceptionTracker")
+        .def(py::init<double>(), py::arg("alpha"))
+        .def("push", &quant::risk::ExceptionTracker::push, py::arg("exception"))
+        .def("stats", &quant::risk::ExceptionTracker::stats);
+    py::enum_<quant::risk::VarMethod>(m, "VarMethod")
+        .value("Historical", quant::risk::VarMethod::Historical)
+        .value("FilteredHistorical", quant::risk::VarMethod::FilteredHistorical);
+    py::class_<quant::risk::RollingVar>(m, "RollingVar",
+                                        "Streaming rolling-window VaR/ES with online Kupiec/Christoffersen "
+                                        "statistics; O(log window) per return.")
+        .def(py::init([](std::size_t window, const std::vector<double>& alphas, quant::risk::VarMethod method,
+                         double ewma_lambda) {
+                 return quant::risk::RollingVar(
+                     {.window = window, .alphas = alphas, .method = method, .ewma_lambda = ewma_lambda});
+             }),
+             py::arg("window"), py::arg("alphas"), py::arg("method") = quant::risk::VarMethod::Historical,
+             py::arg("ewma_lambda") = 0.94)
+        .def_property_readonly("ready", &quant::risk::RollingVar::ready)
+        .def("forecast", &quant::risk::RollingVar::forecast, py::arg("index") = 0)
+        .def(
+            "push",
+            [](quant::risk::RollingVar& engine, double ret) {
+                const auto& flags = engine.push(ret);
+                return std::vector<bool>(flags.begin(), flags.end());
+            },
+            py::arg("ret"), "Score the return against the current forecasts, then add it to the window.")
+        .def("stats", &quant::risk::RollingVar::stats, py::arg("index") = 0);
+    m.def("rolling_var_backtest", &rolling_var_backtest_arrays, py::arg("returns"), py::arg("windows"),
+          py::arg("alphas"), py::arg("method") = quant::risk::VarMethod::Historical,
+          py::arg("ewma_lambda") = 0.94,
+          "Rolling historical or filtered-HS VaR/ES backtest of a return history for each window at each "
+          "alpha.");
     m.def("var_cvar_t", &quant::risk::var_cvar_t, py::arg("mu"), py::arg("sigma"), py::arg("nu"),
           py::arg("horizon_years"), py::arg("position"), py::arg("num_sims"), py::arg("seed"),
           py::arg("alpha"));
@@ -634,12 +1322,217 @@ PYBIND11_MODULE(pyquant_pricer, m) {
     m.def("bs_portfolio_risk", &portfolio_risk_batch, py::arg("positions"),
           "Return position metrics and quantity-weighted portfolio Black-Scholes risk totals for an (n,8) "
           "matrix.");
+    py::enum_<quant::portfolio::Revaluation>(m, "ScenarioRevaluation")
+        .value("Full", quant::portfolio::Revaluation::Full)
+        .value("Taylor", quant::portfolio::Revaluation::Taylor)
+        .value("Hybrid", quant::portfolio::Revaluation::Hybrid);
     m.def("bs_portfolio_scenarios", &portfolio_scenario_pnl, py::arg("positions"), py::arg("shocks"),
-          py::arg("detail") = false,
-          "Exact-reprice an (n,8) vanilla portfolio under an (m,5) shock matrix; detail=False avoids the m*n "
-          "output.");
+          py::arg("detail") = false, py::arg("revaluation") = quant::portfolio::Revaluation::Full,
+          py::arg("tolerance") = 0.0,
+          "Reprice an (n,8) vanilla portfolio under an (m,5) shock matrix; detail=False avoids the m*n "
+          "output. Taylor/Hybrid revaluation also returns the fully repriced (scenario, position) cells.");
+
+    // Cross-asset books over a shared market-state table.
+    using quant::portfolio::VolSurface;
+    py::class_<VolSurface>(m, "VolSurface",
+                           "Expiry x strike implied-vol grid; bilinear, flat beyond the edges.")
+        .def(py::init(&make_vol_surface), py::arg("expiries"), py::arg("strikes"), py::arg("vols"))
+        .def("volatility", &VolSurface::volatility, py::arg("expiry"), py::arg("strike"));
+    m.def("bs_market_scenarios", &market_scenario_pnl, py::arg("underlyings"), py::arg("surfaces"),
+          py::arg("positions"), py::arg("shocks"), py::arg("detail") = false,
+          py::arg("revaluation") = quant::portfolio::Revaluation::Full, py::arg("tolerance") = 0.0,
+          "Reprice (n,5) positions referencing a (u,4) underlying table under an (m,u,5) "
+          "per-underlying shock tensor.");
+    m.def("correlated_spot_shocks", &correlated_spot_shock_array, py::arg("return_vols"), py::arg("corr"),
+          py::arg("horizon"), py::arg("scenario_count"), py::arg("seed"),
+          "Return an (m,u,5) shock tensor of correlated zero-mean spot returns over the horizon.");
+    m.def("portfolio_var", &portfolio_var_dict, py::arg("underlyings"), py::arg("surfaces"),
+          py::arg("positions"), py::arg("spot_vols"), py::arg("vol_vols"), py::arg("rate_vol"),
+          py::arg("corr"), py::arg("horizon_years"), py::arg("num_sims"), py::arg("seed"), py::arg("alpha"),
+          py::arg("revaluation") = quant::portfolio::Revaluation::Full, py::arg("tolerance") = 0.0,
+          py::arg("contributions") = true,
+          "Full-revaluation Monte Carlo VaR/ES of (n,5) positions on a (u,4) underlying table under "
+          "correlated spot, vol and rate factors, with per-position component and incremental VaR.");
+
+    // Persistent columnar book. Methods keep the GIL: the book is shared, mutable state.
+    using quant::portfolio::Portfolio;
+    py::class_<PyPortfolio>(m, "Portfolio",
+                            "Columnar vanilla book: positions are validated once and only amended rows are "
+                            "repriced by risk() and scenarios(). column() and metric() return read-only "
+                            "zero-copy views; add() and remove() raise BufferError while any is alive.")
+        .def(py::init([](const PortfolioColumn& option_type, const PortfolioColumn& quantity,
+                         const PortfolioColumn& spot, const PortfolioColumn& strike,
+                         const PortfolioColumn& rate, const PortfolioColumn& dividend,
+                         const PortfolioColumn& volatility, const PortfolioColumn& time) {
+                 return PyPortfolio(parse_portfolio_columns(
+                     {option_type, quantity, spot, strike, rate, dividend, volatility, time}));
+             }),
+             py::arg("option_type"), py::arg("quantity"), py::arg("spot"), py::arg("strike"), py::arg("rate"),
+             py::arg("dividend"), py::arg("volatility"), py::arg("time"))
+        .def("__len__", &Portfolio::size)
+        .def(
+            "add",
+            [](PyPortfolio& book, const PortfolioColumn& option_type, const PortfolioColumn& quantity,
+               const PortfolioColumn& spot, const PortfolioColumn& strike, const PortfolioColumn& rate,
+               const PortfolioColumn& dividend, const PortfolioColumn& volatility,
+               const PortfolioColumn& time) {
+                require_no_exported_views(book);
+                return book.add(parse_portfolio_columns(
+                    {option_type, quantity, spot, strike, rate, dividend, volatility, time}));
+            },
+            py::arg("option_type"), py::arg("quantity"), py::arg("spot"), py::arg("strike"), py::arg("rate"),
+            py::arg("dividend"), py::arg("volatility"), py::arg("time"),
+            "Append positions (all or none) and return the index of the first.")
+        .def(
+            "amend",
+            [](PyPortfolio& book, const PortfolioIndices& indices, const PortfolioColumn& option_type,
+               const PortfolioColumn& quantity, const PortfolioColumn& spot, const PortfolioColumn& strike,
+               const PortfolioColumn& rate, const PortfolioColumn& dividend,
+               const PortfolioColumn& volatility, const PortfolioColumn& time) {
+                if (indices.ndim() != 1) {
+                    throw std::invalid_argument("indices must be a 1-D array");
+                }
+                std::vector<std::size_t> rows;
+                rows.reserve(static_cast<std::size_t>(indices.shape(0)));
+                for (py::ssize_t k = 0; k < indices.shape(0); ++k) {
+                    const std::int64_t index = indices.data()[k];
+                    if (index < 0) {
+                        throw std::out_of_range("portfolio position index out of range");
+                    }
+                    rows.push_back(static_cast<std::size_t>(index));
+                }
+                const auto positions = parse_portfolio_columns(
+                    {option_type, quantity, spot, strike, rate, dividend, volatility, time});
+                book.amend(rows, positions);
+            },
+            py::arg("indices"), py::arg("option_type"), py::arg("quantity"), py::arg("spot"),
+            py::arg("strike"), py::arg("rate"), py::arg("dividend"), py::arg("volatility"), py::arg("time"),
+            "Replace the positions at `indices` (all or none).")
+        .def(
+            "remove",
+            [](PyPortfolio& book, std::size_t index) {
+                require_no_exported_views(book);
+                book.remove(index);
+            },
+            py::arg("index"), "Remove a position by moving the last position into its slot.")
+        .def_property_readonly("stale_count", &Portfolio::stale_count)
+        .def(
+            "column",
+            [](py::object self, const std::string& name) {
+                auto& book = self.cast<PyPortfolio&>();
+                const auto index = lookup_name(kPortfolioColumnNames, name, "column");
+                return portfolio_view(book.column(static_cast<Portfolio::Column>(index)), self,
+                                      &book.exported_views);
+            },
+            py::arg("name"))
+        .def(
+            "metric",
+            [](py::object self, const std::string& name) {
+                auto& book = self.cast<PyPortfolio&>();
+                const auto index = lookup_name(kPortfolioMetricNames, name, "metric");
+                return portfolio_view(book.metric(static_cast<Portfolio::Metric>(index)), self,
+                                      &book.exported_views);
+            },
+            py::arg("name"), "Per-position result as of the last risk() or scenarios() call.")
+        .def(
+            "risk",
+            [](py::object self) {
+                auto& book = self.cast<PyPortfolio&>();
+                const std::size_t repriced = book.stale_count();
+                const auto totals = book.risk();
+                py::array_t<double> values(py::array::ShapeContainer{py::ssize_t{6}});
+                const double row[6]{totals.value, totals.delta, totals.gamma,
+                                    totals.vega,  totals.theta, totals.rho};
+                std::copy(row, row + 6, values.mutable_data());
+                py::dict metrics;
+                for (std::size_t index = 0; index < Portfolio::kMetricCount; ++index) {
+                    metrics[kPortfolioMetricNames[index]] = portfolio_view(
+                        book.metric(static_cast<Portfolio::Metric>(index)), self, &book.exported_views);
+                }
+                py::dict output;
+                output["portfolio_totals"] = std::move(values);
+                output["total_columns"] = py::make_tuple("value", "delta", "gamma", "vega", "theta", "rho");
+                output["metrics"] = std::move(metrics);
+                output["repriced"] = repriced;
+                return output;
+            },
+            "Reprice stale positions; returns totals and zero-copy per-position metric views.")
+        .def(
+            "scenarios",
+            [](PyPortfolio& book, const PortfolioColumn& shocks, bool detail,
+               quant::portfolio::Revaluation revaluation, double tolerance) {
+                const quant::portfolio::ScenarioOptions options{revaluation, tolerance, detail};
+                const auto result = book.scenario_pnl(parse_portfolio_shocks(shocks), options);
+                return scenario_result_dict(result, detail, revaluation);
+            },
+            py::arg("shocks"), py::arg("detail") = false,
+            py::arg("revaluation") = quant::portfolio::Revaluation::Full, py::arg("tolerance") = 0.0,
+            "bs_portfolio_scenarios over this book without re-parsing positions.");
+
+    using quant::portfolio::TickRiskEngine;
+    py::class_<TickRiskEngine>(m, "TickRiskEngine",
+                               "Incremental book risk: each market update reprices only the positions of its "
+                               "underlying (and expiry window) and adjusts running totals.")
+        .def(py::init([](const PortfolioColumn& option_type, const PortfolioColumn& quantity,
+                         const PortfolioColumn& spot, const PortfolioColumn& strike,
+                         const PortfolioColumn& rate, const PortfolioColumn& dividend,
+                         const PortfolioColumn& volatility, const PortfolioColumn& time,
+                         const PortfolioIndices& underlyings) {
+                 const auto positions = parse_portfolio_columns(
+                     {option_type, quantity, spot, strike, rate, dividend, volatility, time});
+                 if (underlyings.ndim() != 1) {
+                     throw std::invalid_argument("underlyings must be a 1-D array");
+                 }
+                 std::vector<std::size_t> ids;
+                 ids.reserve(static_cast<std::size_t>(underlyings.shape(0)));
+                 for (py::ssize_t k = 0; k < underlyings.shape(0); ++k) {
+                     if (underlyings.data()[k] < 0) {
+                         throw std::invalid_argument("underlying ids must be non-negative");
+                     }
+                     ids.push_back(static_cast<std::size_t>(underlyings.data()[k]));
+                 }
+                 return TickRiskEngine(positions, ids);
+             }),
+             py::arg("option_type"), py::arg("quantity"), py::arg("spot"), py::arg("strike"), py::arg("rate"),
+             py::arg("dividend"), py::arg("volatility"), py::arg("time"), py::arg("underlyings"))
+        .def(
+            "apply",
+            [](TickRiskEngine& engine, std::size_t underlying, std::optional<double> spot,
+               std::optional<double> rate, std::optional<double> volatility_shift, double min_expiry,
+               double max_expiry) {
+                return engine.apply({underlying, spot, rate, volatility_shift, min_expiry, max_expiry});
+            },
+            py::arg("underlying"), py::arg("spot") = py::none(), py::arg("rate") = py::none(),
+            py::arg("volatility_shift") = py::none(), py::arg("min_expiry") = 0.0,
+            py::arg("max_expiry") = std::numeric_limits<double>::infinity(),
+            "Apply one market update and return the number of positions repriced.")
+        .def(
+            "totals",
+            [](const TickRiskEngine& engine) {
+                const auto totals = engine.totals();
+                py::array_t<double> values(py::array::ShapeContainer{py::ssize_t{6}});
+                const double row[6]{totals.value, totals.delta, totals.gamma,
+                                    totals.vega,  totals.theta, totals.rho};
+                std::copy(row, row + 6, values.mutable_data());
+                return values;
+            },
+            "Running (value, delta, gamma, vega, theta, rho).")
+        .def("resync", &TickRiskEngine::resync)
+        .def(
+            "metric",
+            [](py::object self, const std::string& name) {
+                const auto& engine = self.cast<const TickRiskEngine&>();
+                const auto index = lookup_name(kPortfolioMetricNames, name, "metric");
+                return portfolio_view(engine.book().metric(static_cast<Portfolio::Metric>(index)), self);
+            },
+            py::arg("name"));
 
     // Multi-asset & jumps
+    py::enum_<quant::multi::Qmc>(m, "BasketSampler")
+        .value("None", quant::multi::Qmc::None)
+        .value("Sobol", quant::multi::Qmc::Sobol)
+        .value("SobolScrambled", quant::multi::Qmc::SobolScrambled);
+
     py::class_<quant::multi::BasketMcParams>(m, "BasketMcParams")
         .def(py::init<>())
         .def_readwrite("spots", &quant::multi::BasketMcParams::spots)
@@ -652,13 +1545,31 @@ PYBIND11_MODULE(pyquant_pricer, m) {
         .def_readwrite("time", &quant::multi::BasketMcParams::time)
         .def_readwrite("num_paths", &quant::multi::BasketMcParams::num_paths)
         .def_readwrite("seed", &quant::multi::BasketMcParams::seed)
-        .def_readwrite("antithetic", &quant::multi::BasketMcParams::antithetic);
+        .def_readwrite("antithetic", &quant::multi::BasketMcParams::antithetic)
+        .def_readwrite("stopping", &quant::multi::BasketMcParams::stopping)
+        .def_readwrite("type", &quant::multi::BasketMcParams::type)
+        .def_readwrite("num_steps", &quant::multi::BasketMcParams::num_steps)
+        .def_readwrite("average", &quant::multi::BasketMcParams::average)
+        .def_readwrite("use_geometric_cv", &quant::multi::BasketMcParams::use_geometric_cv)
+        .def_readwrite("qmc", &quant::multi::BasketMcParams::qmc)
+        .def_readwrite("use_bridge", &quant::multi::BasketMcParams::use_bridge);
 
     py::class_<quant::multi::McStat>(m, "McStat")
         .def_readonly("value", &quant::multi::McStat::value)
-        .def_readonly("std_error", &quant::multi::McStat::std_error);
+        .def_readonly("std_error", &quant::multi::McStat::std_error)
+        .def_readonly("paths_used", &quant::multi::McStat::paths_used)
+        .def_readonly("elapsed_seconds", &quant::multi::McStat::elapsed_seconds);
 
     m.def("basket_call_mc", &quant::multi::basket_european_call_mc, py::arg("params"));
+    m.def("basket_option_mc", &quant::multi::basket_option_mc, py::arg("params"));
+    m.def(
+        "basket_mc_greeks",
+        [](const quant::multi::BasketMcParams& params, const quant::mc::GreeksBumps& bumps) {
+            return path_greeks_binding(params, bumps, [](const auto& p, const auto& b) {
+                return quant::multi::basket_greeks_mc(p, b);
+            });
+        },
+        py::arg("params"), py::arg("bumps") = quant::mc::GreeksBumps{});
 
     py::class_<quant::multi::MertonParams>(m, "MertonParams")
         .def(py::init<>())
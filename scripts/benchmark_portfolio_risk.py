@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import platform
@@ -23,6 +24,17 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--module-dir", type=Path, required=True)
     parser.add_argument("--output", type=Path, required=True)
     parser.add_argument("--repetitions", type=int, default=7)
+    parser.add_argument("--scaling-positions", type=int, default=10_000)
+    parser.add_argument("--scaling-scenarios", type=int, default=10_000)
+    parser.add_argument("--scaling-repetitions", type=int, default=3)
+    parser.add_argument(
+        "--scaling-threads",
+        type=str,
+        default="",
+        help="comma-separated OpenMP thread counts (default: powers of two <= CPUs)",
+    )
+    # Internal: time one thread count in a child (OMP_NUM_THREADS is read at startup).
+    parser.add_argument("--scaling-child", action="store_true", help=argparse.SUPPRESS)
     return parser.parse_args()
 
 
@@ -61,6 +73,102 @@ def make_positions(count: int) -> np.ndarray:
     return positions
 
 
+def make_shocks(count: int) -> np.ndarray:
+    index = np.arange(count, dtype=np.float64)
+    steps = index.astype(np.int64)
+    shocks = np.empty((count, 5), dtype=np.float64)
+    shocks[:, 0] = -0.30 + 0.60 * index / count
+    shocks[:, 1] = 0.09 - 0.015 * np.mod(steps, 7)
+    shocks[:, 2] = -0.02 + 0.004 * np.mod(steps, 9)
+    shocks[:, 3] = -0.006 + 0.002 * np.mod(steps, 6)
+    shocks[:, 4] = np.mod(steps, 8) / 365.0
+    return shocks
+
+
+def scaling_child(args: argparse.Namespace) -> int:
+    sys.path.insert(0, str(args.module_dir.resolve()))
+    import pyquant_pricer as qp
+
+    positions = make_positions(args.scaling_positions)
+    shocks = make_shocks(args.scaling_scenarios)
+    median, samples = timed(
+        args.scaling_repetitions,
+        lambda: qp.bs_portfolio_scenarios(positions, shocks, False),
+    )
+    pnl = qp.bs_portfolio_scenarios(positions, shocks, False)["portfolio_pnl"]
+    print(
+        json.dumps(
+            {
+                "median_seconds": median,
+                "samples_seconds": samples,
+                "pnl_sha256": hashlib.sha256(
+                    np.ascontiguousarray(pnl).tobytes()
+                ).hexdigest(),
+            }
+        )
+    )
+    return 0
+
+
+def thread_scaling(args: argparse.Namespace) -> dict:
+    if args.scaling_threads:
+        counts = [int(value) for value in args.scaling_threads.split(",")]
+    else:
+        counts = [1]
+        while counts[-1] * 2 <= (os.cpu_count() or 1):
+            counts.append(counts[-1] * 2)
+    runs = []
+    for threads in counts:
+        env = dict(os.environ, OMP_NUM_THREADS=str(threads))
+        child = subprocess.run(
+            [
+                sys.executable,
+                str(Path(__file__).resolve()),
+                "--module-dir",
+                str(args.module_dir),
+                "--output",
+                str(args.output),
+                "--scaling-child",
+                "--scaling-positions",
+                str(args.scaling_positions),
+                "--scaling-scenarios",
+                str(args.scaling_scenarios),
+                "--scaling-repetitions",
+                str(args.scaling_repetitions),
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+            env=env,
+        )
+        runs.append({"threads": threads, **json.loads(child.stdout)})
+    # Scenario totals are reduced in a fixed order: every thread count must agree.
+    digests = {run["pnl_sha256"] for run in runs}
+    if len(digests) != 1:
+        raise AssertionError(
+            f"scenario P&L differs across thread counts: {sorted(digests)}"
+        )
+    cells = args.scaling_positions * args.scaling_scenarios
+    single = runs[0]["median_seconds"]
+    return {
+        "positions": args.scaling_positions,
+        "scenario_count": args.scaling_scenarios,
+        "repetitions": args.scaling_repetitions,
+        "statistic": "median_after_one_warmup",
+        "bitwise_identical_across_threads": True,
+        "runs": [
+            {
+                "threads": run["threads"],
+                "median_seconds": run["median_seconds"],
+                "samples_seconds": run["samples_seconds"],
+                "cells_per_second": cells / run["median_seconds"],
+                "speedup_vs_first": single / run["median_seconds"],
+            }
+            for run in runs
+        ],
+    }
+
+
 def scalar_risk_baseline(qp, positions: np.ndarray) -> float:
     # Existing installed surface exposes call price, delta, gamma, and vega as
     # scalar calls. The native candidate computes these plus theta/rho and puts.
@@ -132,6 +240,8 @@ def scalar_scenario_baseline(
 
 def main() -> int:
     args = parse_args()
+    if args.scaling_child:
+        return scaling_child(args)
     if args.repetitions < 7:
         raise SystemExit("at least seven repetitions are required")
     sys.path.insert(0, str(args.module_dir.resolve()))
@@ -187,6 +297,8 @@ def main() -> int:
     for repeated in deterministic:
         np.testing.assert_array_equal(repeated, native_scenarios)
 
+    scaling = thread_scaling(args)
+
     risk_speedup = risk_scalar_median / risk_native_median
     scenario_speedup = scenario_scalar_median / scenario_native_median
     if risk_speedup < 10.0 or scenario_speedup < 10.0:
@@ -232,6 +344,7 @@ def main() -> int:
                 np.max(np.abs(native_scenarios - scalar_scenarios))
             ),
         },
+        "thread_scaling": scaling,
         "resources": {
             "peak_process_rss_bytes": int(peak_rss),
             "risk_input_bytes": int(scalar_risk_positions.nbytes),
@@ -269,6 +382,10 @@ def main() -> int:
             {
                 "risk_speedup": risk_speedup,
                 "scenario_speedup": scenario_speedup,
+                "thread_scaling": {
+                    run["threads"]: round(run["speedup_vs_first"], 3)
+                    for run in scaling["runs"]
+                },
                 "output": str(args.output),
             },
             indent=2,
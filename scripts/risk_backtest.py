@@ -6,6 +6,10 @@ Inputs: CSV with columns date, ret (decimal), close
 
 Usage:
   python scripts/risk_backtest.py --csv data/spy_returns.csv --alpha 0.99 --horizon 1 --out docs/artifacts/var_backtest_99.json
+
+--method historical|filtered runs the native streaming engine
+(pyquant_pricer.rolling_var_backtest) and adds Christoffersen statistics; the
+default normal method needs only NumPy.
 """
 import argparse
 import json
@@ -43,12 +47,22 @@ def main():
     ap.add_argument("--alpha", type=float, default=0.99)
     ap.add_argument("--horizon", type=int, default=1, help="days")
     ap.add_argument("--out", required=True)
+    ap.add_argument(
+        "--method", choices=("normal", "historical", "filtered"), default="normal"
+    )
+    ap.add_argument("--window", type=int, default=250)
+    ap.add_argument(
+        "--ewma-lambda", type=float, default=0.94, help="filtered-HS variance decay"
+    )
     args = ap.parse_args()
 
     df = pd.read_csv(args.csv)
     df = df.dropna(subset=["ret"])
+    if args.method != "normal":
+        write_result(args.out, native_backtest(df["ret"].to_numpy(), args))
+        return
     # rolling VaR using normal approximation (placeholder); plug in quant.risk via CLI if preferred
-    window = 250
+    window = args.window
     rets = df["ret"].to_numpy()
     rolling_var = []
     exceptions = []
@@ -80,11 +94,38 @@ def main():
         "exceptions": x,
         "kupiec_pvalue": pval,
     }
-    os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
-    with open(args.out, "w") as fh:
+    write_result(args.out, result)
+
+
+def native_backtest(rets: np.ndarray, args: argparse.Namespace) -> dict:
+    import pyquant_pricer as qp
+
+    method = (
+        qp.VarMethod.Historical
+        if args.method == "historical"
+        else qp.VarMethod.FilteredHistorical
+    )
+    (run,) = qp.rolling_var_backtest(
+        rets.tolist(), [args.window], [args.alpha], method, args.ewma_lambda
+    )
+    stats = run["stats"][0]
+    return {
+        "alpha": args.alpha,
+        "method": args.method,
+        "obs": int(stats.T),
+        "exceptions": int(stats.N),
+        "kupiec_pvalue": stats.p_pof,
+        "christoffersen_ind_pvalue": stats.p_ind,
+        "conditional_coverage_pvalue": stats.p_cc,
+    }
+
+
+def write_result(path: str, result: dict) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as fh:
         json.dump(result, fh, indent=2)
         fh.write("\n")
-    print("wrote", args.out)
+    print("wrote", path)
 
 
 if __name__ == "__main__":
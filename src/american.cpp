@@ -1,5 +1,8 @@
 #include "quant/american.hpp"
+#include "quant/black_scholes.hpp"
 #include "quant/grid_utils.hpp"
+#include "quant/rng.hpp"
+#include "quant/stats.hpp"
 
 #include <algorithm>
 #include <array>
@@ -8,6 +11,7 @@
 #include <limits>
 #include <random>
 #include <stdexcept>
+#include <utility>
 #include <vector>
 
 #include <pcg_random.hpp>
@@ -121,254 +125,403 @@ double interpolate_price(const std::vector<double>& S, const std::vector<double>
     return V_lo + w * (V_hi - V_lo);
 }
 
-std::array<double, 4> polynomial_features(double x) {
-    double x2 = x * x;
-    return {1.0, x, x2, x2 * x};
-}
+// Least-squares fit by blocked Householder QR, so the normal equations are never formed. Rows are
+// buffered beneath the current triangular factor [R | Q^T y] and the stack is re-triangularised
+// every kBlock rows. Fits over disjoint path ranges merge by appending one factor's rows to the
+// other (TSQR).
+struct QrLeastSquares {
+    static constexpr std::size_t kBlock = 64;
+
+    std::size_t size{0};
+    std::size_t pending{0};
+    std::size_t ld{0};        // column stride: size factor rows followed by kBlock buffered rows
+    std::vector<double> cols; // column-major [A | y]; column `size` holds the targets
 
-struct NormalEquations {
-    double ata[4][4]{};
-    double atb[4]{};
+    explicit QrLeastSquares(std::size_t n = 0) : size(n), ld(n + kBlock), cols((n + kBlock) * (n + 1), 0.0) {}
 
-    void add(const std::array<double, 4>& phi, double y) {
-        for (int i = 0; i < 4; ++i) {
-            atb[i] += phi[i] * y;
-            for (int j = i; j < 4; ++j) {
-                ata[i][j] += phi[i] * phi[j];
+    void add(const double* phi, double y) {
+        const std::size_t i = size + pending;
+        for (std::size_t j = 0; j < size; ++j) {
+            cols[j * ld + i] = phi[j];
+        }
+        cols[size * ld + i] = y;
+        if (++pending == kBlock) {
+            flush();
+        }
+    }
+
+    void flush() {
+        if (pending == 0) {
+            return;
+        }
+        const std::size_t height = size + pending;
+        for (std::size_t k = 0; k < size; ++k) {
+            double* v = cols.data() + k * ld;
+            double norm_sq = 0.0;
+            for (std::size_t i = k; i < height; ++i) {
+                norm_sq += v[i] * v[i];
+            }
+            if (norm_sq == 0.0) {
+                continue;
             }
+            // Reflect column k onto alpha e_k with v = x - alpha e_k, alpha of opposite sign to x_k.
+            const double alpha = (v[k] > 0.0) ? -std::sqrt(norm_sq) : std::sqrt(norm_sq);
+            const double beta = 1.0 / (norm_sq - alpha * v[k]); // 2 / |v|^2
+            v[k] -= alpha;
+            for (std::size_t j = k + 1; j <= size; ++j) {
+                double* c = cols.data() + j * ld;
+                double dot = 0.0;
+                for (std::size_t i = k; i < height; ++i) {
+                    dot += v[i] * c[i];
+                }
+                const double scale = beta * dot;
+                for (std::size_t i = k; i < height; ++i) {
+                    c[i] -= scale * v[i];
+                }
+            }
+            v[k] = alpha;
+            std::fill(v + k + 1, v + height, 0.0);
         }
+        pending = 0;
     }
 
-    void symmetrize() {
-        for (int i = 0; i < 4; ++i) {
-            for (int j = 0; j < i; ++j) {
-                ata[i][j] = ata[j][i];
+    void merge(QrLeastSquares other) {
+        other.flush();
+        std::vector<double> row(size);
+        for (std::size_t k = 0; k < size; ++k) {
+            for (std::size_t j = 0; j < size; ++j) {
+                row[j] = other.r(k, j);
             }
+            add(row.data(), other.qty(k));
         }
     }
+
+    double r(std::size_t i, std::size_t j) const { return cols[j * ld + i]; }
+    double qty(std::size_t i) const { return cols[size * ld + i]; }
 };
 
 struct RegressionSolution {
-    std::array<double, 4> beta{};
-    double condition_number{0.0};
+    std::vector<double> beta;
+    double condition_number{0.0}; // estimate of cond(A^T A) = cond(R)^2 from the diagonal of R
     bool success{false};
 };
 
-namespace {
-
-std::array<double, 4> mat_vec(const double mat[4][4], const std::array<double, 4>& v) {
-    std::array<double, 4> out{};
-    for (int i = 0; i < 4; ++i) {
-        double sum = 0.0;
-        for (int j = 0; j < 4; ++j) {
-            sum += mat[i][j] * v[j];
+RegressionSolution solve_least_squares(QrLeastSquares fit, double ridge_lambda) {
+    const std::size_t n = fit.size;
+    if (ridge_lambda > 0.0) {
+        const double weight = std::sqrt(ridge_lambda);
+        std::vector<double> penalty(n, 0.0);
+        for (std::size_t j = 0; j < n; ++j) {
+            penalty[j] = weight;
+            fit.add(penalty.data(), 0.0);
+            penalty[j] = 0.0;
         }
-        out[i] = sum;
     }
-    return out;
-}
+    fit.flush();
 
-double dot(const std::array<double, 4>& a, const std::array<double, 4>& b) {
-    double sum = 0.0;
-    for (int i = 0; i < 4; ++i) {
-        sum += a[i] * b[i];
+    RegressionSolution result{};
+    double max_diag = 0.0;
+    double min_diag = std::numeric_limits<double>::infinity();
+    for (std::size_t k = 0; k < n; ++k) {
+        const double d = std::abs(fit.r(k, k));
+        max_diag = std::max(max_diag, d);
+        min_diag = std::min(min_diag, d);
+    }
+    if (!(min_diag > 0.0)) {
+        result.condition_number = std::numeric_limits<double>::infinity();
+        return result;
     }
-    return sum;
+    const double cond_r = max_diag / min_diag;
+    result.condition_number = cond_r * cond_r;
+
+    result.beta.assign(n, 0.0);
+    for (std::size_t k = n; k-- > 0;) {
+        double sum = fit.qty(k);
+        for (std::size_t j = k + 1; j < n; ++j) {
+            sum -= fit.r(k, j) * result.beta[j];
+        }
+        result.beta[k] = sum / fit.r(k, k);
+    }
+    result.success = true;
+    return result;
 }
 
-double normalize(std::array<double, 4>& v) {
-    double norm_sq = dot(v, v);
-    double norm = std::sqrt(norm_sq);
-    if (norm > 0.0) {
-        for (double& x : v) {
-            x /= norm;
-        }
+// Per-step CRR quantities for one option.
+struct CrrLattice {
+    double dt;
+    double up;
+    double disc_up;   // disc * prob
+    double disc_down; // disc * (1 - prob)
+};
+
+CrrLattice make_crr_lattice(const Params& p, int steps) {
+    if (steps <= 0) {
+        throw std::invalid_argument("Binomial steps must be positive");
     }
-    return norm;
+    const double dt = p.time / static_cast<double>(steps);
+    const double up = std::exp(p.vol * std::sqrt(dt));
+    const double down = 1.0 / up;
+    const double disc = std::exp(-p.rate * dt);
+    const double growth = std::exp((p.rate - p.dividend) * dt);
+    const double prob = (growth - down) / (up - down);
+    if (prob < 0.0 || prob > 1.0) {
+        throw std::runtime_error("Arbitrage detected in binomial parameters");
+    }
+    return CrrLattice{dt, up, disc * prob, disc * (1.0 - prob)};
 }
 
-bool solve_linear_system(const double mat_in[4][4], const double rhs_in[4], double sol_out[4]) {
-    double a[4][5];
-    for (int i = 0; i < 4; ++i) {
-        for (int j = 0; j < 4; ++j) {
-            a[i][j] = mat_in[i][j];
-        }
-        a[i][4] = rhs_in[i];
-    }
-    for (int i = 0; i < 4; ++i) {
-        int pivot = i;
-        double max_val = std::abs(a[i][i]);
-        for (int r = i + 1; r < 4; ++r) {
-            double val = std::abs(a[r][i]);
-            if (val > max_val) {
-                max_val = val;
-                pivot = r;
-            }
-        }
-        if (max_val < 1e-12) {
-            return false;
-        }
-        if (pivot != i) {
-            for (int c = i; c < 5; ++c) {
-                std::swap(a[i][c], a[pivot][c]);
-            }
-        }
-        const double pivot_inv = 1.0 / a[i][i];
-        for (int c = i; c < 5; ++c) {
-            a[i][c] *= pivot_inv;
-        }
-        for (int r = 0; r < 4; ++r) {
-            if (r == i) {
-                continue;
-            }
-            const double factor = a[r][i];
-            for (int c = i; c < 5; ++c) {
-                a[r][c] -= factor * a[i][c];
-            }
+// Backward induction in `prices` and `spots` (each at least steps + 1 long). Node i of level n sits
+// at S0 u^(n - 2i), so stepping back one level scales every spot by d = 1 / u; the inner loop is
+// branch-free and reads prices[i + 1] before it is overwritten, which lets it vectorize.
+// With `smooth` (Broadie-Detemple), the last step is replaced by the Black-Scholes European value,
+// which removes the odd-even oscillation of the lattice error in `steps`.
+double crr_backward(const Params& p, const CrrLattice& lattice, int steps, bool smooth, double* prices,
+                    double* spots) {
+    const double sign = (p.type == OptionType::Call) ? 1.0 : -1.0;
+    const double down = 1.0 / lattice.up;
+    const int top = smooth ? steps - 1 : steps;
+    for (int i = 0; i <= top; ++i) {
+        spots[i] = p.spot * std::pow(lattice.up, top - 2 * i);
+        const double exercise = sign * (spots[i] - p.strike);
+        if (smooth) {
+            const double european =
+                (p.type == OptionType::Call)
+                    ? quant::bs::call_price(spots[i], p.strike, p.rate, p.dividend, p.vol, lattice.dt)
+                    : quant::bs::put_price(spots[i], p.strike, p.rate, p.dividend, p.vol, lattice.dt);
+            prices[i] = std::max(european, exercise);
+        } else {
+            prices[i] = std::max(exercise, 0.0);
         }
     }
-    for (int i = 0; i < 4; ++i) {
-        sol_out[i] = a[i][4];
+    for (int step = top - 1; step >= 0; --step) {
+        for (int i = 0; i <= step; ++i) {
+            spots[i] *= down;
+            const double cont = lattice.disc_up * prices[i] + lattice.disc_down * prices[i + 1];
+            prices[i] = std::max(cont, sign * (spots[i] - p.strike));
+        }
     }
-    return true;
+    return prices[0];
 }
 
-double rayleigh_quotient(const double mat[4][4], const std::array<double, 4>& v) {
-    auto Av = mat_vec(mat, v);
-    return dot(v, Av);
-}
+} // namespace
 
-double largest_eigenvalue(const double mat[4][4]) {
-    std::array<double, 4> v{1.0, 0.3, -0.2, 0.1};
-    normalize(v);
-    double lambda = 0.0;
-    for (int iter = 0; iter < 30; ++iter) {
-        auto w = mat_vec(mat, v);
-        double norm = normalize(w);
-        if (norm < 1e-15) {
-            return 0.0;
-        }
-        const double next_lambda = rayleigh_quotient(mat, w);
-        if (std::abs(next_lambda - lambda) < 1e-10) {
-            lambda = next_lambda;
-            break;
-        }
-        lambda = next_lambda;
-        v = w;
-    }
-    return lambda;
+double price_binomial_crr(const Params& p, int steps) {
+    const CrrLattice lattice = make_crr_lattice(p, steps);
+    std::vector<double> prices(static_cast<std::size_t>(steps) + 1);
+    std::vector<double> spots(prices.size());
+    return crr_backward(p, lattice, steps, false, prices.data(), spots.data());
 }
 
-double smallest_eigenvalue(const double mat[4][4]) {
-    std::array<double, 4> v{0.5, -0.4, 0.3, 0.2};
-    normalize(v);
-    double lambda = 0.0;
-    for (int iter = 0; iter < 30; ++iter) {
-        double rhs[4]{v[0], v[1], v[2], v[3]};
-        double y_arr[4]{};
-        if (!solve_linear_system(mat, rhs, y_arr)) {
-            return 0.0;
-        }
-        std::array<double, 4> y{y_arr[0], y_arr[1], y_arr[2], y_arr[3]};
-        double norm = normalize(y);
-        if (norm < 1e-15) {
-            return 0.0;
-        }
-        const double next_lambda = rayleigh_quotient(mat, y);
-        if (std::abs(next_lambda - lambda) < 1e-10) {
-            lambda = next_lambda;
-            break;
+std::vector<double> price_binomial_crr_batch(const std::vector<Params>& options, int steps, bool richardson) {
+    if (richardson && steps < 2) {
+        throw std::invalid_argument("Richardson extrapolation requires at least 2 binomial steps");
+    }
+    const int coarse = steps / 2;
+    std::vector<CrrLattice> fine_lattices;
+    std::vector<CrrLattice> coarse_lattices;
+    fine_lattices.reserve(options.size());
+    for (const auto& option : options) {
+        fine_lattices.push_back(make_crr_lattice(option, steps));
+        if (richardson) {
+            coarse_lattices.push_back(make_crr_lattice(option, coarse));
         }
-        lambda = next_lambda;
-        v = y;
     }
-    return lambda;
-}
 
-double compute_condition_number(const double mat_in[4][4]) {
-    double mat[4][4];
-    for (int i = 0; i < 4; ++i) {
-        for (int j = 0; j < 4; ++j) {
-            mat[i][j] = mat_in[i][j];
+    std::vector<double> prices(options.size());
+    const auto count = static_cast<std::int64_t>(options.size());
+#ifdef _OPENMP
+#pragma omp parallel
+#endif
+    {
+        std::vector<double> values(static_cast<std::size_t>(steps) + 1);
+        std::vector<double> spots(values.size());
+#ifdef _OPENMP
+#pragma omp for schedule(static)
+#endif
+        for (std::int64_t k = 0; k < count; ++k) {
+            const auto idx = static_cast<std::size_t>(k);
+            const Params& option = options[idx];
+            double price;
+            if (richardson) {
+                // The smoothed lattice error is O(1/n): cancel it with the half-step price.
+                const double fine =
+                    crr_backward(option, fine_lattices[idx], steps, true, values.data(), spots.data());
+                const double half =
+                    crr_backward(option, coarse_lattices[idx], coarse, true, values.data(), spots.data());
+                price = (steps * fine - coarse * half) / static_cast<double>(steps - coarse);
+            } else {
+                price = crr_backward(option, fine_lattices[idx], steps, false, values.data(), spots.data());
+            }
+            prices[idx] = price;
         }
     }
-    const double max_eval = largest_eigenvalue(mat);
-    if (max_eval <= 0.0) {
-        return std::numeric_limits<double>::infinity();
-    }
-    const double min_eval = smallest_eigenvalue(mat);
-    if (min_eval <= 0.0) {
-        return std::numeric_limits<double>::infinity();
-    }
-    return max_eval / min_eval;
+    return prices;
 }
 
-RegressionSolution solve_normal_equations(NormalEquations eq, double ridge_lambda) {
-    eq.symmetrize();
-    for (int i = 0; i < 4; ++i) {
-        eq.ata[i][i] += ridge_lambda;
-    }
+namespace {
 
-    RegressionSolution result{};
-    result.condition_number = compute_condition_number(eq.ata);
+struct StepOutcome {
+    int iterations;
+    double residual;
+    double contraction{0.0}; // observed per-sweep error reduction, 0 when too few sweeps to tell
+};
 
-    double rhs[4];
-    for (int i = 0; i < 4; ++i) {
-        rhs[i] = eq.atb[i];
+// Projected SOR sweeps on the interior of `next`, whose boundary entries are already set.
+StepOutcome psor_step(const PsorParams& params, double omega, const OperatorWorkspace& op,
+                      const std::vector<double>& intrinsic, std::vector<double>& next) {
+    const std::size_t M = next.size();
+    double residual = 0.0;
+    double previous = 0.0;
+    double before_previous = 0.0;
+    const auto outcome = [&](int iterations) {
+        StepOutcome out{iterations, residual};
+        if (iterations >= 3 && before_previous > 0.0) {
+            out.contraction = std::sqrt(residual / before_previous);
+        }
+        return out;
+    };
+    for (int iter = 0; iter < params.max_iterations; ++iter) {
+        before_previous = previous;
+        previous = residual;
+        residual = 0.0;
+        // Gauss-Seidel sweep in place: next[i - 1] is already updated, next[i + 1] not yet.
+        for (std::size_t i = 1; i + 1 < M; ++i) {
+            const double diag = op.diag[i];
+            const double rhs = op.rhs[i];
+            const double lower = op.lower[i - 1];
+            const double upper = op.upper[i];
+            double estimate = (rhs - lower * next[i - 1] - upper * next[i + 1]) / diag;
+            double new_val = (1.0 - omega) * next[i] + omega * estimate;
+            if (new_val < intrinsic[i]) {
+                new_val = intrinsic[i];
+            }
+            residual = std::max(residual, std::abs(new_val - next[i]));
+            next[i] = new_val;
+        }
+        if (residual < params.tolerance) {
+            return outcome(iter + 1);
+        }
     }
+    return outcome(params.max_iterations);
+}
 
-    double beta_raw[4]{};
-    if (solve_linear_system(eq.ata, rhs, beta_raw)) {
-        for (int i = 0; i < 4; ++i) {
-            result.beta[i] = beta_raw[i];
+// Optimal SOR relaxation from the per-sweep contraction of Gauss-Seidel, which equals mu^2 for the
+// Jacobi spectral radius mu of a consistently ordered matrix (Young).
+double optimal_omega(double gauss_seidel_contraction) {
+    const double mu_sq = std::min(gauss_seidel_contraction, 1.0);
+    return std::clamp(2.0 / (1.0 + std::sqrt(1.0 - mu_sq)), 1.0, 1.95);
+}
+
+// Brennan-Schwartz: eliminate towards the exercise region, then substitute away from it while
+// projecting onto the payoff. A put's exercise region is at low S, so the elimination runs from
+// the top row down and the projected substitution from the bottom up; a call mirrors this.
+// Boundary rows are solved but not projected, as in PSOR. Uses op.scratch and overwrites op.rhs.
+void brennan_schwartz_step(OptionType type, OperatorWorkspace& op, const std::vector<double>& intrinsic,
+                           std::vector<double>& next) {
+    const std::size_t M = next.size();
+    std::vector<double>& pivot = op.scratch;
+    pivot.resize(M);
+    std::vector<double>& r = op.rhs;
+    const auto project = [&](std::size_t i, double value) {
+        return (i > 0 && i + 1 < M) ? std::max(value, intrinsic[i]) : value;
+    };
+
+    if (type == OptionType::Put) {
+        pivot[M - 1] = op.diag[M - 1];
+        for (std::size_t i = M - 1; i-- > 0;) {
+            const double m = op.upper[i] / pivot[i + 1];
+            pivot[i] = op.diag[i] - m * op.lower[i];
+            r[i] -= m * r[i + 1];
+        }
+        next[0] = project(0, r[0] / pivot[0]);
+        for (std::size_t i = 1; i < M; ++i) {
+            next[i] = project(i, (r[i] - op.lower[i - 1] * next[i - 1]) / pivot[i]);
         }
-        result.success = true;
     } else {
-        result.success = false;
+        pivot[0] = op.diag[0];
+        for (std::size_t i = 1; i < M; ++i) {
+            const double m = op.lower[i - 1] / pivot[i - 1];
+            pivot[i] = op.diag[i] - m * op.upper[i - 1];
+            r[i] -= m * r[i - 1];
+        }
+        next[M - 1] = project(M - 1, r[M - 1] / pivot[M - 1]);
+        for (std::size_t i = M - 1; i-- > 0;) {
+            next[i] = project(i, (r[i] - op.upper[i] * next[i + 1]) / pivot[i]);
+        }
     }
-    return result;
 }
 
-} // namespace
-
-} // namespace
+// Scratch for policy iteration: the current policy's system and which interior rows exercise.
+struct PolicyWorkspace {
+    OperatorWorkspace system;
+    std::vector<unsigned char> exercise;
+};
 
-double price_binomial_crr(const Params& p, int steps) {
-    if (steps <= 0) {
-        throw std::invalid_argument("Binomial steps must be positive");
-    }
-    const double dt = p.time / static_cast<double>(steps);
-    const double up = std::exp(p.vol * std::sqrt(dt));
-    const double down = 1.0 / up;
-    const double disc = std::exp(-p.rate * dt);
-    const double growth = std::exp((p.rate - p.dividend) * dt);
-    const double prob = (growth - down) / (up - down);
-    if (prob < 0.0 || prob > 1.0) {
-        throw std::runtime_error("Arbitrage detected in binomial parameters");
-    }
-    std::vector<double> prices(static_cast<std::size_t>(steps) + 1);
-    for (int i = 0; i <= steps; ++i) {
-        double ST = p.spot * std::pow(up, steps - i) * std::pow(down, i);
-        prices[i] = intrinsic_value(p.type, p.strike, ST);
-    }
-    for (int step = steps - 1; step >= 0; --step) {
-        for (int i = 0; i <= step; ++i) {
-            double cont = disc * (prob * prices[i] + (1.0 - prob) * prices[i + 1]);
-            double S_t = p.spot * std::pow(up, step - i) * std::pow(down, i);
-            double exer = intrinsic_value(p.type, p.strike, S_t);
-            prices[i] = std::max(cont, exer);
+// Policy (Howard) iteration: each interior row either continues (A V = b) or exercises (V = payoff),
+// whichever attains min(A V - b, V - payoff) at the current iterate; each policy is solved directly.
+// `next` holds the starting iterate and is overwritten with the solution. The coefficients are
+// copied once per step; an iteration rewrites only the rows whose decision flips.
+StepOutcome policy_iteration_step(const PsorParams& params, const OperatorWorkspace& op,
+                                  const std::vector<double>& intrinsic, std::vector<double>& next,
+                                  PolicyWorkspace& policy) {
+    const std::size_t M = next.size();
+    OperatorWorkspace& system = policy.system;
+    system.lower = op.lower;
+    system.diag = op.diag;
+    system.upper = op.upper;
+    system.rhs.resize(M);
+    policy.exercise.assign(M, 0);
+    double residual = 0.0;
+    for (int iter = 0; iter < params.max_iterations; ++iter) {
+        system.rhs.front() = op.rhs.front();
+        system.rhs.back() = op.rhs.back();
+        for (std::size_t i = 1; i + 1 < M; ++i) {
+            const double continuation =
+                op.lower[i - 1] * next[i - 1] + op.diag[i] * next[i] + op.upper[i] * next[i + 1] - op.rhs[i];
+            const bool exercise = next[i] - intrinsic[i] < continuation;
+            if (exercise != static_cast<bool>(policy.exercise[i])) {
+                policy.exercise[i] = exercise;
+                system.lower[i - 1] = exercise ? 0.0 : op.lower[i - 1];
+                system.diag[i] = exercise ? 1.0 : op.diag[i];
+                system.upper[i] = exercise ? 0.0 : op.upper[i];
+            }
+            system.rhs[i] = exercise ? intrinsic[i] : op.rhs[i];
+        }
+        quant::grid_utils::solve_in_place(system);
+        residual = 0.0;
+        for (std::size_t i = 0; i < M; ++i) {
+            residual = std::max(residual, std::abs(system.rhs[i] - next[i]));
+        }
+        next.swap(system.rhs);
+        if (residual < params.tolerance) {
+            return StepOutcome{iter + 1, residual};
         }
     }
-    return prices[0];
+    return StepOutcome{params.max_iterations, residual};
 }
 
-PsorResult price_psor(const PsorParams& params) {
+// Grid solution of the American problem at t = 0 and one time step later (for theta).
+struct LcpSolution {
+    PsorResult result;
+    SpaceGrid grid;
+    std::vector<double> V;
+    std::vector<double> V_prev;
+};
+
+// Backward induction over the grid. When `history` is non-null it receives every step's solution
+// (num_time x num_space, in solve order); when `start` is non-null it holds such a history, and each
+// step starts from V plus that solution's change over the same step.
+LcpSolution solve_lcp(const PsorParams& params, std::vector<double>* history,
+                      const std::vector<double>* start) {
     if (params.grid.num_time <= 0 || params.base.time <= 0.0) {
         throw std::invalid_argument("PSOR grid requires positive time steps and maturity");
     }
     if (params.omega <= 0.0 || params.omega >= 2.0) {
         throw std::invalid_argument("PSOR omega must be in (0, 2)");
     }
+    if (params.max_iterations < 1) {
+        throw std::invalid_argument("PSOR max_iterations must be positive");
+    }
     SpaceGrid grid = make_space_grid(params);
     const int M = params.grid.num_space;
     std::vector<double> V(M);
@@ -385,60 +538,333 @@ PsorResult price_psor(const PsorParams& params) {
 
     int total_iters = 0;
     double final_residual = 0.0;
+    std::vector<int> step_iterations;
+    step_iterations.reserve(static_cast<std::size_t>(N));
+    std::vector<double> next(M);
+    std::vector<double> V_prev(M);
+    std::vector<double> prev;
+    if (params.warm_start) {
+        prev.resize(M);
+    }
+    PolicyWorkspace policy;
+    double omega = params.omega;
+    bool omega_tuned = !params.adaptive_omega;
 
     for (int step = 0; step < N; ++step) {
         const double theta = (step < rannacher_steps) ? 1.0 : 0.5;
         const double tau_next = params.base.time - static_cast<double>(step + 1) * dt;
         build_system(params, grid, V, dt, theta, tau_next, op);
 
-        std::vector<double> next = V;
-        next.front() = op.rhs.front();
-        next.back() = op.rhs.back();
-
-        double residual = 0.0;
-        for (int iter = 0; iter < params.max_iterations; ++iter) {
-            residual = 0.0;
-            const std::vector<double> prev = next;
-            for (int i = 1; i < M - 1; ++i) {
-                const double diag = op.diag[i];
-                const double rhs = op.rhs[i];
-                const double lower = op.lower[i - 1];
-                const double upper = op.upper[i];
-                double estimate = (rhs - lower * next[i - 1] - upper * prev[i + 1]) / diag;
-                double new_val = (1.0 - params.omega) * next[i] + params.omega * estimate;
-                if (new_val < intrinsic[i]) {
-                    new_val = intrinsic[i];
-                }
-                residual = std::max(residual, std::abs(new_val - next[i]));
-                next[i] = new_val;
+        if (step == N - 1) {
+            std::copy(V.begin(), V.end(), V_prev.begin());
+        }
+        if (start != nullptr) {
+            // Follow the reference solution's increment over this step from the current V.
+            const double* target = start->data() + static_cast<std::ptrdiff_t>(step) * M;
+            const double* origin = step > 0 ? target - M : intrinsic.data();
+            for (int i = 0; i < M; ++i) {
+                next[i] = std::max(V[i] + target[i] - origin[i], intrinsic[i]);
             }
-            if (residual < params.tolerance) {
-                total_iters += (iter + 1);
-                break;
+        } else if (params.warm_start && step > 0) {
+            for (int i = 0; i < M; ++i) {
+                next[i] = std::max(2.0 * V[i] - prev[i], intrinsic[i]);
             }
-            if (iter == params.max_iterations - 1) {
-                total_iters += params.max_iterations;
+        } else {
+            std::copy(V.begin(), V.end(), next.begin());
+        }
+        StepOutcome outcome{1, 0.0};
+        switch (params.solver) {
+        case PsorParams::Solver::Psor: {
+            next.front() = op.rhs.front();
+            next.back() = op.rhs.back();
+            // The Crank-Nicolson operator is fixed after the Rannacher steps, so one estimate suffices.
+            const bool estimating = !omega_tuned && step >= rannacher_steps;
+            outcome = psor_step(params, estimating ? 1.0 : omega, op, intrinsic, next);
+            if (estimating && outcome.contraction > 0.0 && outcome.contraction < 1.0) {
+                omega = optimal_omega(outcome.contraction);
+                omega_tuned = true;
             }
+            break;
+        }
+        case PsorParams::Solver::BrennanSchwartz:
+            brennan_schwartz_step(params.base.type, op, intrinsic, next);
+            break;
+        case PsorParams::Solver::PolicyIteration:
+            outcome = policy_iteration_step(params, op, intrinsic, next, policy);
+            break;
+        }
+        total_iters += outcome.iterations;
+        final_residual = outcome.residual;
+        step_iterations.push_back(outcome.iterations);
+        if (params.warm_start) {
+            prev.swap(V);
+        }
+        V.swap(next);
+        if (history != nullptr) {
+            history->insert(history->end(), V.begin(), V.end());
         }
-        final_residual = residual;
-        V = std::move(next);
     }
 
     double price = interpolate_price(grid.spot, V, params.base.spot);
-    return PsorResult{price, total_iters, final_residual};
+    return LcpSolution{PsorResult{price, total_iters, final_residual, omega, std::move(step_iterations)},
+                       std::move(grid), std::move(V), std::move(V_prev)};
 }
 
-LsmcResult price_lsmc(const LsmcParams& params) {
-    if (params.num_paths == 0 || params.num_steps <= 0) {
-        throw std::invalid_argument("LSMC requires positive paths and time steps");
+} // namespace
+
+PsorResult price_psor(const PsorParams& params) { return solve_lcp(params, nullptr, nullptr).result; }
+
+namespace {
+
+constexpr int kMaxBasisDegree = 10;
+
+// f_0..f_degree of `family` at x, with f_0 = 1.
+void univariate_terms(LsmcBasis::Family family, int degree, double x, double* f) {
+    f[0] = 1.0;
+    switch (family) {
+    case LsmcBasis::Family::Monomial:
+        for (int n = 1; n <= degree; ++n) {
+            f[n] = f[n - 1] * x;
+        }
+        break;
+    case LsmcBasis::Family::Laguerre: {
+        // f_n = exp(-x / 2) L_{n-1}(x); (k + 1) L_{k+1} = (2k + 1 - x) L_k - k L_{k-1}, L_0 = 1.
+        const double weight = std::exp(-0.5 * x);
+        double previous = 0.0;
+        double current = 1.0;
+        for (int n = 1; n <= degree; ++n) {
+            f[n] = weight * current;
+            const double k = static_cast<double>(n - 1);
+            const double next = ((2.0 * k + 1.0 - x) * current - k * previous) / (k + 1.0);
+            previous = current;
+            current = next;
+        }
+        break;
     }
-    if (params.ridge_lambda < 0.0) {
-        throw std::invalid_argument("LSMC ridge lambda must be non-negative");
+    case LsmcBasis::Family::Hermite:
+        // Probabilists' Hermite: He_{n+1} = x He_n - n He_{n-1}.
+        if (degree >= 1) {
+            f[1] = x;
+        }
+        for (int n = 2; n <= degree; ++n) {
+            f[n] = x * f[n - 1] - static_cast<double>(n - 1) * f[n - 2];
+        }
+        break;
     }
-    if (params.itm_moneyness_eps < 0.0) {
-        throw std::invalid_argument("LSMC moneyness band must be non-negative");
+}
+
+// Products f_{a_0}(x_0) ... f_{a_{d-1}}(x_{d-1}) over multi-indices with |a| <= remaining, emitted
+// with a_dim = 0 first so the constant leads.
+void emit_products(const LsmcBasis& basis, const double* state, std::size_t dims, std::size_t dim,
+                   int remaining, double partial, double*& out) {
+    if (dim == dims) {
+        *out++ = partial;
+        return;
+    }
+    std::array<double, kMaxBasisDegree + 1> f{};
+    univariate_terms(basis.family, remaining, state[dim], f.data());
+    for (int n = 0; n <= remaining; ++n) {
+        emit_products(basis, state, dims, dim + 1, remaining - n, partial * f[static_cast<std::size_t>(n)],
+                      out);
+    }
+}
+
+void validate_basis(const LsmcBasis& basis, std::size_t dims) {
+    if (basis.degree < 1 || basis.degree > kMaxBasisDegree) {
+        throw std::invalid_argument("LSMC basis degree must be in [1, 10]");
+    }
+    if (dims == 0) {
+        throw std::invalid_argument("LSMC basis requires at least one state variable");
+    }
+}
+
+} // namespace
+
+std::size_t basis_size(const LsmcBasis& basis, std::size_t dims) {
+    validate_basis(basis, dims);
+    const auto degree = static_cast<std::size_t>(basis.degree);
+    if (!basis.cross_terms) {
+        return 1 + dims * degree;
+    }
+    // binomial(dims + degree, degree); every partial product is itself a binomial coefficient
+    std::size_t count = 1;
+    for (std::size_t k = 1; k <= degree; ++k) {
+        count = count * (dims + k) / k;
+    }
+    return count;
+}
+
+void evaluate_basis(const LsmcBasis& basis, const double* state, std::size_t dims, double* out) {
+    validate_basis(basis, dims);
+    if (basis.cross_terms) {
+        emit_products(basis, state, dims, 0, basis.degree, 1.0, out);
+        return;
+    }
+    std::array<double, kMaxBasisDegree + 1> f{};
+    *out++ = 1.0;
+    for (std::size_t d = 0; d < dims; ++d) {
+        univariate_terms(basis.family, basis.degree, state[d], f.data());
+        out = std::copy(f.begin() + 1, f.begin() + 1 + basis.degree, out);
+    }
+}
+
+namespace {
+
+// Exercise rule fitted at dates 1..num_steps - 1 (indexed by date) with per-date diagnostics.
+struct LsmcFit {
+    std::vector<std::vector<double>> beta; // empty where exercise is not allowed
+    LsmcDiagnostics diagnostics;
+};
+
+// Regression state of spot S at exercise date `step`, as LsmcBasis documents for each family.
+double regression_state(const LsmcParams& params, int step, double S) {
+    const double ratio = S / params.base.strike;
+    switch (params.basis.family) {
+    case LsmcBasis::Family::Monomial:
+        return ratio - 1.0;
+    case LsmcBasis::Family::Laguerre:
+        return ratio;
+    case LsmcBasis::Family::Hermite: {
+        const double t = params.base.time * static_cast<double>(step) / static_cast<double>(params.num_steps);
+        return std::log(ratio) / (params.base.vol * std::sqrt(t));
+    }
+    }
+    throw std::logic_error("unknown LSMC basis family");
+}
+
+// Regressed continuation value at S; `phi` is scratch for the basis.
+double continuation_value(const LsmcParams& params, const std::vector<double>& beta, int step, double S,
+                          double* phi) {
+    // With one state variable both layouts reduce to f_0..f_degree.
+    univariate_terms(params.basis.family, params.basis.degree, regression_state(params, step, S), phi);
+    double value = 0.0;
+    for (std::size_t j = 0; j < beta.size(); ++j) {
+        value += beta[j] * phi[j];
+    }
+    return value;
+}
+
+// Regression inputs gathered over a range of paths.
+struct RegressionPartial {
+    QrLeastSquares fit;
+    std::size_t samples{0};
+    std::size_t itm{0};
+
+    explicit RegressionPartial(std::size_t terms = 0) : fit(terms) {}
+
+    void merge(const RegressionPartial& other) {
+        fit.merge(other.fit);
+        samples += other.samples;
+        itm += other.itm;
     }
+};
 
+// One exercise date of Longstaff-Schwartz. `cashflow` holds each path's cash flow under the policy
+// chosen at later dates, valued at this date; paths whose exercise value beats the regressed
+// continuation value are switched to exercising here. This includes paths that exercise later,
+// since the earlier stopping time replaces their cash flow. The rule is recorded in `fit`.
+void lsmc_exercise_date(const LsmcParams& params, int step, const std::vector<double>& spot,
+                        std::vector<double>& cashflow, LsmcFit& fit) {
+    const double strike = params.base.strike;
+    const std::size_t terms = basis_size(params.basis, 1);
+    const std::int64_t path_count = static_cast<std::int64_t>(spot.size());
+    const auto accumulate = [&](std::int64_t begin, std::int64_t end) {
+        RegressionPartial part(terms);
+        std::vector<double> phi(terms);
+        for (std::int64_t i = begin; i < end; ++i) {
+            const std::size_t idx = static_cast<std::size_t>(i);
+            const double S = spot[idx];
+            const double intrinsic = intrinsic_value(params.base.type, strike, S);
+            const double moneyness = S / strike - 1.0;
+            if (intrinsic > 0.0) {
+                ++part.itm;
+            }
+            if (intrinsic > 0.0 || std::abs(moneyness) <= params.itm_moneyness_eps) {
+                univariate_terms(params.basis.family, params.basis.degree, regression_state(params, step, S),
+                                 phi.data());
+                part.fit.add(phi.data(), cashflow[idx]);
+                ++part.samples;
+            }
+        }
+        return part;
+    };
+
+    RegressionPartial total(terms);
+#ifdef _OPENMP
+    std::vector<RegressionPartial> partial(static_cast<std::size_t>(omp_get_max_threads()),
+                                           RegressionPartial(terms));
+#pragma omp parallel
+    {
+        const std::int64_t tid = omp_get_thread_num();
+        const std::int64_t nthreads = omp_get_num_threads();
+        partial[static_cast<std::size_t>(tid)] =
+            accumulate((tid * path_count) / nthreads, ((tid + 1) * path_count) / nthreads);
+    }
+    // Merging in thread order keeps the fit reproducible for a fixed thread count.
+    for (const auto& part : partial) {
+        total.merge(part);
+    }
+#else
+    total = accumulate(0, path_count);
+#endif
+
+    RegressionSolution solution{};
+    bool allow_exercise = total.itm >= params.min_itm && total.samples >= terms;
+    if (allow_exercise) {
+        solution = solve_least_squares(total.fit, params.ridge_lambda);
+        // QR stays accurate up to cond(R) ~ 1e10, i.e. cond(A^T A) ~ 1e20.
+        if (!solution.success || !std::isfinite(solution.condition_number) ||
+            solution.condition_number > 1.0e20) {
+            allow_exercise = false;
+        }
+    }
+
+    const auto date = static_cast<std::size_t>(step - 1);
+    fit.diagnostics.condition_numbers[date] =
+        solution.success ? solution.condition_number : std::numeric_limits<double>::infinity();
+    fit.diagnostics.itm_counts[date] = total.itm;
+    fit.diagnostics.regression_counts[date] = total.samples;
+    if (!allow_exercise) {
+        return;
+    }
+    const auto& beta = solution.beta;
+    fit.beta[static_cast<std::size_t>(step)] = beta;
+
+#ifdef _OPENMP
+#pragma omp parallel
+#endif
+    {
+        std::vector<double> phi(terms);
+#ifdef _OPENMP
+#pragma omp for
+#endif
+        for (std::int64_t i = 0; i < path_count; ++i) {
+            const std::size_t idx = static_cast<std::size_t>(i);
+            const double S = spot[idx];
+            const double intrinsic = intrinsic_value(params.base.type, strike, S);
+            if (intrinsic <= 0.0) {
+                continue;
+            }
+            if (continuation_value(params, beta, step, S, phi.data()) <= intrinsic) {
+                cashflow[idx] = intrinsic;
+            }
+        }
+    }
+}
+
+void discount_all(std::vector<double>& cashflow, double disc) {
+    const std::int64_t path_count = static_cast<std::int64_t>(cashflow.size());
+#ifdef _OPENMP
+#pragma omp parallel for
+#endif
+    for (std::int64_t i = 0; i < path_count; ++i) {
+        cashflow[static_cast<std::size_t>(i)] *= disc;
+    }
+}
+
+// Stored-shock engine: forward pcg64 simulation that keeps a steps x paths float shock matrix and
+// divides the spots back out date by date.
+void lsmc_stored_paths(const LsmcParams& params, std::vector<double>& cashflow, LsmcFit& fit) {
     const double dt = params.base.time / static_cast<double>(params.num_steps);
     const double mu = params.base.rate - params.base.dividend;
     const double disc = std::exp(-params.base.rate * dt);
@@ -448,10 +874,7 @@ LsmcResult price_lsmc(const LsmcParams& params) {
     const std::size_t steps = static_cast<std::size_t>(params.num_steps);
     const std::size_t base_paths = static_cast<std::size_t>(params.num_paths);
     const bool use_antithetic = params.antithetic;
-    const std::size_t path_count = use_antithetic ? base_paths * 2 : base_paths;
-    if (path_count == 0) {
-        throw std::invalid_argument("LSMC requires at least one simulated path");
-    }
+    const std::size_t path_count = cashflow.size();
 
     const std::size_t shock_cols = use_antithetic ? base_paths : path_count;
     std::vector<double> spot_curr(path_count, params.base.spot);
@@ -483,33 +906,17 @@ LsmcResult price_lsmc(const LsmcParams& params) {
         spot_curr.swap(spot_next);
     }
 
-    std::vector<double> spot_tp1 = spot_curr;
-    std::vector<double> spot_t(path_count, params.base.spot);
-
-    std::vector<double> cashflow(path_count);
-    std::vector<char> exercised(path_count, 0);
+    std::vector<double> spot_tp1 = std::move(spot_curr);
+    std::vector<double> spot_t = std::move(spot_next);
     const std::int64_t path_count_i = static_cast<std::int64_t>(path_count);
     const std::int64_t base_paths_i = static_cast<std::int64_t>(base_paths);
 
-    for (std::int64_t i = 0; i < path_count_i; ++i) {
-        const std::size_t idx = static_cast<std::size_t>(i);
-        cashflow[idx] = intrinsic_value(params.base.type, params.base.strike, spot_tp1[idx]);
+    for (std::size_t i = 0; i < path_count; ++i) {
+        cashflow[i] = intrinsic_value(params.base.type, params.base.strike, spot_tp1[i]);
     }
 
-    std::vector<std::size_t> itm_counts_rev;
-    std::vector<std::size_t> reg_counts_rev;
-    std::vector<double> cond_rev;
-    itm_counts_rev.reserve(steps > 1 ? steps - 1 : 0);
-    reg_counts_rev.reserve(itm_counts_rev.capacity());
-    cond_rev.reserve(itm_counts_rev.capacity());
-
     for (int step = static_cast<int>(steps) - 1; step >= 1; --step) {
-#ifdef _OPENMP
-#pragma omp parallel for
-#endif
-        for (std::int64_t i = 0; i < path_count_i; ++i) {
-            cashflow[static_cast<std::size_t>(i)] *= disc;
-        }
+        discount_all(cashflow, disc);
 
         float* row = shocks.data() + static_cast<std::size_t>(step) * shock_cols;
         if (!use_antithetic) {
@@ -531,67 +938,155 @@ LsmcResult price_lsmc(const LsmcParams& params) {
             }
         }
 
-        NormalEquations eq;
-        std::size_t regression_samples = 0;
-        std::size_t itm_count = 0;
+        lsmc_exercise_date(params, step, spot_t, cashflow, fit);
+        spot_tp1.swap(spot_t);
+    }
+}
 
-        for (std::int64_t i = 0; i < path_count_i; ++i) {
-            const std::size_t idx = static_cast<std::size_t>(i);
-            if (exercised[idx]) {
-                continue;
+// Streaming engine: each path's Brownian motion is drawn at maturity from the counter-based RNG and
+// then bridged backward one date at a time, W_k | W_{k+1} ~ N(k/(k+1) W_{k+1}, k/(k+1) dt), so only
+// the current date's state is held and memory is O(paths). Antithetic partners use -W.
+void lsmc_streaming_paths(const LsmcParams& params, std::vector<double>& cashflow, LsmcFit& fit) {
+    const int steps = params.num_steps;
+    const double dt = params.base.time / static_cast<double>(steps);
+    const double disc = std::exp(-params.base.rate * dt);
+    const double nu = params.base.rate - params.base.dividend - 0.5 * params.base.vol * params.base.vol;
+    const double vol = params.base.vol;
+    const std::uint64_t seed = params.seed;
+    const bool use_antithetic = params.antithetic;
+    const std::int64_t base_paths = static_cast<std::int64_t>(params.num_paths);
+
+    std::vector<double> brownian(static_cast<std::size_t>(base_paths));
+    std::vector<double> spot(cashflow.size());
+    // Advance every path to date k (W already at k + 1, or drawn at maturity when k == steps) and
+    // refresh the spots there.
+    const auto move_to = [&](int k) {
+        const double t = static_cast<double>(k) * dt;
+        const double shrink = (k == steps) ? 0.0 : static_cast<double>(k) / static_cast<double>(k + 1);
+        const double scale = (k == steps) ? std::sqrt(params.base.time) : std::sqrt(shrink * dt);
+#ifdef _OPENMP
+#pragma omp parallel for
+#endif
+        for (std::int64_t p = 0; p < base_paths; ++p) {
+            const std::size_t idx = static_cast<std::size_t>(p);
+            const double z = quant::rng::normal(seed, idx, static_cast<std::uint32_t>(k), 0U, 0U);
+            brownian[idx] = shrink * brownian[idx] + scale * z;
+            if (use_antithetic) {
+                spot[2 * idx] = params.base.spot * std::exp(nu * t + vol * brownian[idx]);
+                spot[2 * idx + 1] = params.base.spot * std::exp(nu * t - vol * brownian[idx]);
+            } else {
+                spot[idx] = params.base.spot * std::exp(nu * t + vol * brownian[idx]);
             }
-            const double S = spot_t[idx];
+        }
+    };
+
+    move_to(steps);
+    for (std::size_t i = 0; i < cashflow.size(); ++i) {
+        cashflow[i] = intrinsic_value(params.base.type, params.base.strike, spot[i]);
+    }
+    for (int step = steps - 1; step >= 1; --step) {
+        discount_all(cashflow, disc);
+        move_to(step);
+        lsmc_exercise_date(params, step, spot, cashflow, fit);
+    }
+}
+
+// Second pass: simulate independent forward paths and stop at the first date where the fitted rule
+// exercises, or at maturity. Accumulates the discounted payoff per antithetic pair (or per path).
+quant::stats::Welford lsmc_out_of_sample(const LsmcParams& params, const LsmcFit& fit) {
+    const int steps = params.num_steps;
+    const double dt = params.base.time / static_cast<double>(steps);
+    const double vol = params.base.vol;
+    const double drift = (params.base.rate - params.base.dividend - 0.5 * vol * vol) * dt;
+    const double vol_step = vol * std::sqrt(dt);
+    const double disc = std::exp(-params.base.rate * dt);
+    const std::size_t terms = basis_size(params.basis, 1);
+    const std::uint64_t seed = params.seed;
+
+    const auto path_value = [&](std::uint64_t path, double sign, double* phi) {
+        double S = params.base.spot;
+        double discount = 1.0;
+        for (int step = 1; step <= steps; ++step) {
+            const double z = quant::rng::normal(seed, path, static_cast<std::uint32_t>(step), 0U, 1U);
+            S *= std::exp(drift + sign * vol_step * z);
+            discount *= disc;
             const double intrinsic = intrinsic_value(params.base.type, params.base.strike, S);
-            const double moneyness = S / params.base.strike - 1.0;
-            if (intrinsic > 0.0) {
-                ++itm_count;
+            if (step == steps) {
+                return discount * intrinsic;
             }
-            if (intrinsic > 0.0 || std::abs(moneyness) <= params.itm_moneyness_eps) {
-                eq.add(polynomial_features(moneyness), cashflow[idx]);
-                ++regression_samples;
+            const auto& beta = fit.beta[static_cast<std::size_t>(step)];
+            if (intrinsic > 0.0 && !beta.empty() &&
+                continuation_value(params, beta, step, S, phi) <= intrinsic) {
+                return discount * intrinsic;
             }
         }
-
-        RegressionSolution solution{};
-        bool allow_exercise = itm_count >= params.min_itm && regression_samples >= 4;
-        if (allow_exercise) {
-            solution = solve_normal_equations(eq, params.ridge_lambda);
-            if (!solution.success || !std::isfinite(solution.condition_number) ||
-                solution.condition_number > 1.0e12) {
-                allow_exercise = false;
-            }
+        return 0.0;
+    };
+    const auto simulate = [&](std::uint64_t begin, std::uint64_t end) {
+        quant::stats::Welford acc;
+        std::vector<double> phi(terms);
+        for (std::uint64_t path = begin; path < end; ++path) {
+            const double value = path_value(path, 1.0, phi.data());
+            acc.add(params.antithetic ? 0.5 * (value + path_value(path, -1.0, phi.data())) : value);
         }
+        return acc;
+    };
 
-        cond_rev.push_back(solution.success ? solution.condition_number
-                                            : std::numeric_limits<double>::infinity());
-        itm_counts_rev.push_back(itm_count);
-        reg_counts_rev.push_back(regression_samples);
-
-        if (allow_exercise && solution.success) {
-            const auto& beta = solution.beta;
+    quant::stats::Welford total;
 #ifdef _OPENMP
-#pragma omp parallel for
+    const std::uint64_t N = params.num_paths;
+    std::vector<quant::stats::Welford> partial(static_cast<std::size_t>(omp_get_max_threads()));
+#pragma omp parallel
+    {
+        const auto tid = static_cast<std::uint64_t>(omp_get_thread_num());
+        const auto nthreads = static_cast<std::uint64_t>(omp_get_num_threads());
+        partial[tid] = simulate((tid * N) / nthreads, ((tid + 1) * N) / nthreads);
+    }
+    for (const auto& part : partial) {
+        total.merge(part);
+    }
+#else
+    total = simulate(0, params.num_paths);
 #endif
-            for (std::int64_t i = 0; i < path_count_i; ++i) {
-                const std::size_t idx = static_cast<std::size_t>(i);
-                if (exercised[idx]) {
-                    continue;
-                }
-                const double S = spot_t[idx];
-                const double intrinsic = intrinsic_value(params.base.type, params.base.strike, S);
-                if (intrinsic <= 0.0) {
-                    continue;
-                }
-                const double x = S / params.base.strike - 1.0;
-                const double cont = beta[0] + beta[1] * x + beta[2] * x * x + beta[3] * x * x * x;
-                if (cont <= intrinsic) {
-                    cashflow[idx] = intrinsic;
-                    exercised[idx] = 1;
-                }
-            }
-        }
+    return total;
+}
 
-        spot_tp1.swap(spot_t);
+} // namespace
+
+LsmcResult price_lsmc(const LsmcParams& params) {
+    if (params.num_paths == 0 || params.num_steps <= 0) {
+        throw std::invalid_argument("LSMC requires positive paths and time steps");
+    }
+    if (params.ridge_lambda < 0.0) {
+        throw std::invalid_argument("LSMC ridge lambda must be non-negative");
+    }
+    if (params.itm_moneyness_eps < 0.0) {
+        throw std::invalid_argument("LSMC moneyness band must be non-negative");
+    }
+    basis_size(params.basis, 1);
+
+    const double dt = params.base.time / static_cast<double>(params.num_steps);
+    const double disc = std::exp(-params.base.rate * dt);
+    const std::size_t steps = static_cast<std::size_t>(params.num_steps);
+    const std::size_t base_paths = static_cast<std::size_t>(params.num_paths);
+    const std::size_t path_count = params.antithetic ? base_paths * 2 : base_paths;
+
+    std::vector<double> cashflow(path_count);
+    const std::size_t dates = steps > 1 ? steps - 1 : 0;
+    LsmcFit fit{std::vector<std::vector<double>>(steps),
+                LsmcDiagnostics{std::vector<std::size_t>(dates), std::vector<std::size_t>(dates),
+                                std::vector<double>(dates)}};
+
+    if (params.streaming) {
+        lsmc_streaming_paths(params, cashflow, fit);
+    } else {
+        lsmc_stored_paths(params, cashflow, fit);
+    }
+
+    if (params.out_of_sample) {
+        cashflow = {};
+        const quant::stats::Welford priced = lsmc_out_of_sample(params, fit);
+        return LsmcResult{priced.mean, priced.std_error(), std::move(fit.diagnostics)};
     }
 
     double sum = 0.0;
@@ -605,19 +1100,45 @@ LsmcResult price_lsmc(const LsmcParams& params) {
     double variance = (sumsq / static_cast<double>(path_count)) - mean * mean;
     variance = std::max(0.0, variance);
     const double se = std::sqrt(variance / static_cast<double>(path_count));
-
-    std::reverse(itm_counts_rev.begin(), itm_counts_rev.end());
-    std::reverse(reg_counts_rev.begin(), reg_counts_rev.end());
-    std::reverse(cond_rev.begin(), cond_rev.end());
-
-    LsmcDiagnostics diagnostics{std::move(itm_counts_rev), std::move(reg_counts_rev), std::move(cond_rev)};
-    return LsmcResult{mean, se, std::move(diagnostics)};
+    return LsmcResult{mean, se, std::move(fit.diagnostics)};
 }
 
 } // namespace quant::american
 
 namespace quant::american {
 
+PsorGreeks greeks_psor(const PsorParams& params, bool compute_vega, double vol_bump) {
+    if (compute_vega && !(vol_bump > 0.0)) {
+        throw std::invalid_argument("greeks_psor vol_bump must be positive");
+    }
+    std::vector<double> history;
+    if (compute_vega) {
+        history.reserve(static_cast<std::size_t>(std::max(params.grid.num_time, 0)) *
+                        static_cast<std::size_t>(std::max(params.grid.num_space, 0)));
+    }
+    const LcpSolution base = solve_lcp(params, compute_vega ? &history : nullptr, nullptr);
+    const double S0 = params.base.spot;
+    const auto node = quant::grid_utils::interpolate_greeks(base.grid.spot, base.V, S0);
+    const double dt = params.base.time / static_cast<double>(params.grid.num_time);
+
+    PsorGreeks out{};
+    out.price = base.result.price;
+    out.delta = node.delta;
+    out.gamma = node.gamma;
+    out.theta = (interpolate_price(base.grid.spot, base.V_prev, S0) - out.price) / dt;
+    out.total_iterations = base.result.total_iterations;
+    if (compute_vega) {
+        PsorParams bumped = params;
+        bumped.base.vol += vol_bump;
+        bumped.omega = base.result.omega;
+        bumped.adaptive_omega = false;
+        const LcpSolution up = solve_lcp(bumped, nullptr, &history);
+        out.vega = (up.result.price - out.price) / vol_bump;
+        out.total_iterations += up.result.total_iterations;
+    }
+    return out;
+}
+
 Greeks greeks_psor_bump(PsorParams params, double rel_bump) {
     const double S0 = params.base.spot;
     const double h = std::max(1e-6, std::abs(rel_bump) * std::max(1.0, S0));
@@ -9,6 +9,7 @@
 #include <cmath>
 #include <limits>
 #include <memory>
+#include <optional>
 #include <random>
 #include <stdexcept>
 #include <vector>
@@ -30,6 +31,38 @@ static inline double geometric_closed_form_call(double S, double K, double r, do
            df_r * K * std::erfc(-d2 / std::sqrt(2.0)) * 0.5;
 }
 
+namespace {
+
+struct PathAverages {
+    double terminal;
+    double arithmetic;
+    double geometric;
+};
+
+// Walk one path over `steps` equally spaced dates and return its terminal spot and averages.
+PathAverages path_averages(double spot, double drift_dt, double vol_sdt, const double* normals, int steps) {
+    double logS = std::log(spot);
+    double arith_acc = 0.0;
+    double log_acc = 0.0;
+    for (int t = 0; t < steps; ++t) {
+        logS += drift_dt + vol_sdt * normals[t];
+        arith_acc += std::exp(logS);
+        log_acc += logS;
+    }
+    const double inv_steps = 1.0 / static_cast<double>(steps);
+    return {std::exp(logS), arith_acc * inv_steps, std::exp(log_acc * inv_steps)};
+}
+
+// Undiscounted payoff shared by price_mc and greeks_mc: fixed strike max(A - K, 0), floating strike
+// max(S_T - A, 0), with A the arithmetic or geometric average.
+double asian_payoff(const McParams& p, const PathAverages& path) {
+    const double average = (p.avg == Average::Arithmetic) ? path.arithmetic : path.geometric;
+    return (p.payoff == Payoff::FixedStrike) ? std::max(0.0, average - p.strike)
+                                             : std::max(0.0, path.terminal - average);
+}
+
+} // namespace
+
 asian::McStatistic price_mc(const McParams& p) {
     using quant::stats::Welford;
     Welford acc;
@@ -55,37 +88,21 @@ asian::McStatistic price_mc(const McParams& p) {
     std::vector<double> normals(static_cast<std::size_t>(p.num_steps));
     const bool use_qmc = p.qmc != Qmc::None;
     std::unique_ptr<quant::qmc::SobolSequence> sobol_seq;
+    std::optional<quant::qmc::SobolSequence::Cursor> sobol_cursor;
     std::vector<double> sobol_point;
     if (use_qmc) {
         sobol_seq = std::make_unique<quant::qmc::SobolSequence>(static_cast<std::size_t>(p.num_steps),
                                                                 p.qmc == Qmc::SobolScrambled,
                                                                 p.seed ? p.seed : 0x9E3779B97F4A7C15ULL);
+        sobol_cursor.emplace(*sobol_seq, 0);
         sobol_point.resize(static_cast<std::size_t>(p.num_steps));
     }
 
     auto run_path = [&](const std::vector<double>& draws) {
-        double S = p.spot;
-        double arith_acc = 0.0;
-        double log_acc = 0.0;
-        for (int t = 0; t < p.num_steps; ++t) {
-            const double z = draws[static_cast<std::size_t>(t)];
-            S = S * std::exp(drift_dt + vol_sdt * z);
-            arith_acc += S;
-            log_acc += std::log(S);
-        }
-        const double inv_steps = 1.0 / static_cast<double>(p.num_steps);
-        const double arith = arith_acc * inv_steps;
-        const double geom = std::exp(log_acc * inv_steps);
-
-        double payoff = 0.0;
-        if (fixed_strike) {
-            payoff = std::max(0.0, arith - p.strike);
-        } else {
-            payoff = std::max(0.0, p.spot - arith);
-        }
-        double sample = df_r * payoff;
+        const auto path = path_averages(p.spot, drift_dt, vol_sdt, draws.data(), p.num_steps);
+        double sample = df_r * asian_payoff(p, path);
         if (use_cv) {
-            const double geo_payoff = std::max(0.0, geom - p.strike);
+            const double geo_payoff = std::max(0.0, path.geometric - p.strike);
             const double geo_disc = df_r * geo_payoff;
             sample += (geo_cf - geo_disc);
         }
@@ -96,7 +113,7 @@ asian::McStatistic price_mc(const McParams& p) {
 
     for (std::uint64_t i = 0; i < p.num_paths; ++i) {
         if (use_qmc) {
-            sobol_seq->generate(i, sobol_point.data());
+            sobol_cursor->next(sobol_point.data());
             for (int t = 0; t < p.num_steps; ++t) {
                 const double u =
                     std::clamp(sobol_point[static_cast<std::size_t>(t)], std::numeric_limits<double>::min(),
@@ -126,4 +143,24 @@ asian::McStatistic price_mc(const McParams& p) {
     return {mean, se, mean - half, mean + half};
 }
 
+quant::mc::PathGreeksResult greeks_mc(const McParams& p, const quant::mc::GreeksBumps& bumps) {
+    if (p.num_steps <= 0) {
+        throw std::invalid_argument("asian::greeks_mc: num_steps must be positive");
+    }
+    const quant::mc::PathGreeksParams params{.market = {{p.spot}, {p.vol}, p.rate, p.time},
+                                             .normals_per_path = p.num_steps,
+                                             .num_paths = p.num_paths,
+                                             .seed = p.seed,
+                                             .antithetic = p.antithetic,
+                                             .bumps = bumps};
+    const auto payoff = [&p](const quant::mc::PathMarket& m, const double* normals) {
+        const double sigma = m.vols[0];
+        const double dt = m.time / static_cast<double>(p.num_steps);
+        const double drift_dt = (m.rate - p.dividend - 0.5 * sigma * sigma) * dt;
+        const auto path = path_averages(m.spots[0], drift_dt, sigma * std::sqrt(dt), normals, p.num_steps);
+        return std::exp(-m.rate * m.time) * asian_payoff(p, path);
+    };
+    return quant::mc::path_greeks(params, payoff);
+}
+
 } // namespace quant::asian
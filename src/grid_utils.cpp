@@ -131,6 +131,119 @@ void assemble_operator(const SpaceGrid& grid, const DiffusionCoefficients& coeff
     }
 }
 
+void solve_in_place(OperatorWorkspace& op) {
+    const std::size_t n = op.diag.size();
+    if (n < 2 || op.lower.size() != n - 1 || op.upper.size() != n - 1 || op.rhs.size() != n) {
+        throw std::invalid_argument("Tridiagonal sizes mismatch");
+    }
+    op.scratch.resize(n - 1);
+    std::vector<double>& cp = op.scratch;
+    std::vector<double>& x = op.rhs;
+
+    double beta = op.diag[0];
+    if (std::abs(beta) < 1e-14) {
+        throw std::runtime_error("Singular tridiagonal matrix");
+    }
+    cp[0] = op.upper[0] / beta;
+    x[0] /= beta;
+    for (std::size_t i = 1; i < n; ++i) {
+        beta = op.diag[i] - op.lower[i - 1] * cp[i - 1];
+        if (std::abs(beta) < 1e-14) {
+            throw std::runtime_error("Near-singular tridiagonal (pivot)");
+        }
+        if (i + 1 < n) {
+            cp[i] = op.upper[i] / beta;
+        }
+        x[i] = (x[i] - op.lower[i - 1] * x[i - 1]) / beta;
+    }
+    for (std::size_t i = n - 1; i-- > 0;) {
+        x[i] -= cp[i] * x[i + 1];
+    }
+}
+
+TridiagonalFactor factor_tridiagonal(const std::vector<double>& lower, const std::vector<double>& diag,
+                                     const std::vector<double>& upper) {
+    const std::size_t n = diag.size();
+    if (n < 2 || lower.size() != n - 1 || upper.size() != n - 1) {
+        throw std::invalid_argument("Tridiagonal sizes mismatch");
+    }
+    TridiagonalFactor f{lower, std::vector<double>(n - 1), std::vector<double>(n)};
+    double pivot = diag[0];
+    for (std::size_t i = 0; i < n; ++i) {
+        if (i > 0) {
+            pivot = diag[i] - lower[i - 1] * f.upper[i - 1];
+        }
+        if (std::abs(pivot) < 1e-14) {
+            throw std::runtime_error("Near-singular tridiagonal (pivot)");
+        }
+        f.inv_pivot[i] = 1.0 / pivot;
+        if (i + 1 < n) {
+            f.upper[i] = upper[i] * f.inv_pivot[i];
+        }
+    }
+    return f;
+}
+
+void solve_factored(const TridiagonalFactor& factor, std::vector<double>& x) {
+    const std::size_t n = factor.inv_pivot.size();
+    if (x.size() != n) {
+        throw std::invalid_argument("Tridiagonal sizes mismatch");
+    }
+    x[0] *= factor.inv_pivot[0];
+    for (std::size_t i = 1; i < n; ++i) {
+        x[i] = (x[i] - factor.lower[i - 1] * x[i - 1]) * factor.inv_pivot[i];
+    }
+    for (std::size_t i = n - 1; i-- > 0;) {
+        x[i] -= factor.upper[i] * x[i + 1];
+    }
+}
+
+NodeGreeks interpolate_greeks(const std::vector<double>& S, const std::vector<double>& V, double S0) {
+    const std::size_t M = S.size();
+    if (M < 3) {
+        throw std::runtime_error("Need at least three spatial nodes to compute Greeks");
+    }
+    auto it = std::lower_bound(S.begin(), S.end(), S0);
+    std::size_t idx = static_cast<std::size_t>(std::distance(S.begin(), it));
+    if (idx == 0) {
+        idx = 1;
+    } else if (idx >= M - 1) {
+        idx = M - 2;
+    }
+    const std::size_t i0 = idx - 1;
+    const std::size_t i1 = idx;
+    const std::size_t i2 = idx + 1;
+
+    const double x0 = S[i0];
+    const double x1 = S[i1];
+    const double x2 = S[i2];
+    const double f0 = V[i0];
+    const double f1 = V[i1];
+    const double f2 = V[i2];
+
+    const double denom0 = (x0 - x1) * (x0 - x2);
+    const double denom1 = (x1 - x0) * (x1 - x2);
+    const double denom2 = (x2 - x0) * (x2 - x1);
+
+    const double L0 = (S0 - x1) * (S0 - x2) / denom0;
+    const double L1 = (S0 - x0) * (S0 - x2) / denom1;
+    const double L2 = (S0 - x0) * (S0 - x1) / denom2;
+
+    const double L0_prime = (2.0 * S0 - x1 - x2) / denom0;
+    const double L1_prime = (2.0 * S0 - x0 - x2) / denom1;
+    const double L2_prime = (2.0 * S0 - x0 - x1) / denom2;
+
+    const double L0_second = 2.0 / denom0;
+    const double L1_second = 2.0 / denom1;
+    const double L2_second = 2.0 / denom2;
+
+    NodeGreeks out{};
+    out.value = f0 * L0 + f1 * L1 + f2 * L2;
+    out.delta = f0 * L0_prime + f1 * L1_prime + f2 * L2_prime;
+    out.gamma = f0 * L0_second + f1 * L1_second + f2 * L2_second;
+    return out;
+}
+
 double dirichlet_boundary(const PayoffBoundaryParams& params, double spot, bool is_lower) {
     const double df_r = std::exp(-params.rate * params.tau);
     const double df_q = std::exp(-params.dividend * params.tau);
@@ -11,8 +11,13 @@
 #include <limits>
 #include <numbers>
 #include <random>
+#include <stdexcept>
 #include <vector>
 
+#ifdef QUANT_HAS_OPENMP
+#include <omp.h>
+#endif
+
 namespace quant::heston {
 
 // Heston analytic via characteristic function and Gauss-Laguerre quadrature
@@ -126,6 +131,162 @@ double implied_vol_call(const MarketParams& mkt, const Params& h) {
     return quant::bs::implied_vol_call(mkt.spot, mkt.strike, mkt.rate, mkt.dividend, mkt.time, price);
 }
 
+namespace {
+
+// Local partial derivatives of one step, recorded on the forward pass for the adjoint sweep.
+struct StepTangent {
+    double dv_next_dv;    // d v_{n+1} / d v_n
+    double dlogS_dv;      // d log S_{n+1} / d v_n with v_{n+1} held fixed
+    double dlogS_dv_next; // d log S_{n+1} / d v_{n+1}
+};
+
+// Euler / Andersen QE update of (ln S, v) over one step; coefficients depend only on dt.
+class VarianceStepper {
+  public:
+    VarianceStepper(const McParams& p, double dt)
+        : p_(p), dt_(dt), sqrt_dt_(std::sqrt(dt)), rho_(std::clamp(p.h.rho, -0.999, 0.999)),
+          sqrt_one_minus_rho2_(std::sqrt(std::max(1.0 - rho_ * rho_, 0.0))), kappa_(p.h.kappa),
+          theta_(std::max(p.h.theta, 0.0)), sigma_(std::max(p.h.sigma, 0.0)), sigma2_(sigma_ * sigma_),
+          use_qe_(p.scheme == McParams::Scheme::QE), kappa_small_(std::abs(kappa_) <= 1e-12),
+          exp_kdt_(std::exp(-kappa_ * dt)), one_minus_exp_(-std::expm1(-kappa_ * dt)) {}
+
+    /// Advance (logS, v) by one step. With `tangent`, also record the step's local derivatives
+    /// (pathwise: the QE branch and the clipping at zero are held fixed).
+    void advance(double z_var, double z_perp, double u, double& logS, double& v,
+                 StepTangent* tangent = nullptr) const {
+        constexpr double psi_threshold = 1.5;
+        if (!use_qe_) {
+            const double sqrt_v = std::sqrt(std::max(v, 0.0));
+            const double dW_var = sqrt_dt_ * z_var;
+            const double dW_perp = sqrt_dt_ * z_perp;
+            double v_next = v + kappa_ * (theta_ - v) * dt_ + sigma_ * sqrt_v * dW_var;
+            const bool clipped = v_next <= 0.0;
+            v_next = std::max(v_next, 0.0);
+            const double z_star = rho_ * dW_var + sqrt_one_minus_rho2_ * dW_perp;
+            logS += (p_.mkt.rate - p_.mkt.dividend - 0.5 * v) * dt_ + sqrt_v * z_star;
+            if (tangent) {
+                const double inv_two_sqrt_v = (sqrt_v > 0.0) ? 0.5 / sqrt_v : 0.0;
+                tangent->dv_next_dv = clipped ? 0.0 : 1.0 - kappa_ * dt_ + sigma_ * dW_var * inv_two_sqrt_v;
+                tangent->dlogS_dv = -0.5 * dt_ + z_star * inv_two_sqrt_v;
+                tangent->dlogS_dv_next = 0.0;
+            }
+            v = v_next;
+            return;
+        }
+
+        double m = theta_ + (v - theta_) * exp_kdt_;
+        double dm = (m > 1e-12) ? exp_kdt_ : 0.0;
+        m = std::max(m, 0.0);
+        double s2;
+        double ds2 = 0.0;
+        if (kappa_small_) {
+            s2 = sigma2_ * v * dt_;
+            ds2 = sigma2_ * dt_;
+        } else if (sigma_ == 0.0) {
+            s2 = 0.0;
+        } else {
+            s2 = v * sigma2_ * exp_kdt_ * one_minus_exp_ / kappa_ +
+                 theta_ * sigma2_ * one_minus_exp_ * one_minus_exp_ / (2.0 * kappa_);
+            ds2 = sigma2_ * exp_kdt_ * one_minus_exp_ / kappa_;
+        }
+        if (s2 <= 0.0) {
+            ds2 = 0.0;
+        }
+        s2 = std::max(s2, 0.0);
+
+        const double m_safe = std::max(m, 1e-12);
+        double psi = (m_safe > 0.0) ? s2 / (m_safe * m_safe) : psi_threshold + 1.0;
+        const double dpsi = ds2 / (m_safe * m_safe) - 2.0 * s2 * dm / (m_safe * m_safe * m_safe);
+
+        double v_next = m_safe;
+        double dv_next = dm;
+        if (psi < 1e-12) {
+            v_next = m_safe;
+        } else if (psi <= psi_threshold) {
+            const double two_over_psi = 2.0 / psi;
+            const double inside = std::max(0.0, two_over_psi - 1.0);
+            const double root = std::sqrt(std::max(0.0, two_over_psi * inside));
+            const double b2 = two_over_psi - 1.0 + root;
+            const double b = std::sqrt(std::max(b2, 0.0));
+            const double a = m_safe / (1.0 + b2);
+            v_next = a * (b + z_var) * (b + z_var);
+            if (tangent) {
+                const double dt_dpsi = -two_over_psi / psi;
+                const double db2 = (1.0 + (root > 0.0 ? (two_over_psi - 0.5) / root : 0.0)) * dt_dpsi * dpsi;
+                const double db = (b > 0.0) ? 0.5 * db2 / b : 0.0;
+                const double da = dm / (1.0 + b2) - m_safe * db2 / ((1.0 + b2) * (1.0 + b2));
+                dv_next = da * (b + z_var) * (b + z_var) + 2.0 * a * (b + z_var) * db;
+            }
+        } else {
+            const double p_branch = (psi - 1.0) / (psi + 1.0);
+            const double beta = (1.0 - p_branch) / m_safe;
+            if (u <= p_branch) {
+                v_next = 0.0;
+            } else {
+                const double log_term = std::log((1.0 - p_branch) / (1.0 - u));
+                v_next = log_term / beta;
+                // v_next = m (psi + 1) / 2 * log(2 / ((psi + 1)(1 - u)))
+                dv_next = 0.5 * ((dm * (psi + 1.0) + m_safe * dpsi) * log_term - m_safe * dpsi);
+            }
+        }
+        if (v_next <= 0.0) {
+            dv_next = 0.0;
+        }
+        v_next = std::max(v_next, 0.0);
+
+        // Approximate ∫_t^{t+Δ} v_s ds using the CIR expectation so the asset drift uses a
+        // consistent average variance even when κΔ is not tiny.
+        double int_v;
+        if (kappa_small_) {
+            int_v = v * dt_; // κ → 0 reduces to Euler
+        } else {
+            int_v = theta_ * dt_ + (v - theta_) * one_minus_exp_ / kappa_;
+        }
+        const double v_bar = std::max(int_v / dt_, 0.0);
+        const double sqrt_v_bar_dt = std::sqrt(std::max(v_bar * dt_, 0.0));
+
+        // Andersen QE: σ ∫ sqrt(v) dW1 ≈ dv - κ(θ - \bar v)Δt couples asset and variance.
+        const double dv = v_next - v;
+        const double cross = dv - kappa_ * (theta_ - v_bar) * dt_;
+        const double correlated = (sigma_ > 1e-12) ? (rho_ / sigma_) * cross : 0.0;
+        const double diffusion = sqrt_one_minus_rho2_ * sqrt_v_bar_dt * z_perp;
+
+        logS += (p_.mkt.rate - p_.mkt.dividend) * dt_ - 0.5 * v_bar * dt_ + correlated + diffusion;
+        if (tangent) {
+            const double rho_over_sigma = (sigma_ > 1e-12) ? rho_ / sigma_ : 0.0;
+            double dv_bar = 0.0;
+            if (v_bar > 0.0) {
+                dv_bar = kappa_small_ ? 1.0 : one_minus_exp_ / (kappa_ * dt_);
+            }
+            const double d_diffusion =
+                (sqrt_v_bar_dt > 0.0) ? 0.5 * sqrt_one_minus_rho2_ * z_perp * dt_ * dv_bar / sqrt_v_bar_dt
+                                      : 0.0;
+            tangent->dv_next_dv = dv_next;
+            tangent->dlogS_dv =
+                -0.5 * dt_ * dv_bar + rho_over_sigma * (kappa_ * dt_ * dv_bar - 1.0) + d_diffusion;
+            tangent->dlogS_dv_next = rho_over_sigma;
+        }
+        v = v_next;
+    }
+
+  private:
+    const McParams& p_;
+    double dt_;
+    double sqrt_dt_;
+    double rho_;
+    double sqrt_one_minus_rho2_;
+    double kappa_;
+    double theta_;
+    double sigma_;
+    double sigma2_;
+    bool use_qe_;
+    bool kappa_small_;
+    double exp_kdt_;
+    double one_minus_exp_;
+};
+
+} // namespace
+
 McResult call_qe_mc(const McParams& p) {
     using quant::stats::Welford;
 
@@ -140,23 +301,11 @@ McResult call_qe_mc(const McParams& p) {
     }
 
     const double dt = p.mkt.time / static_cast<double>(steps);
-    const double sqrt_dt = std::sqrt(dt);
     const double df = std::exp(-p.mkt.rate * p.mkt.time);
-    const double rho = std::clamp(p.h.rho, -0.999, 0.999);
-    const double one_minus_rho2 = std::max(1.0 - rho * rho, 0.0);
-    const double sqrt_one_minus_rho2 = std::sqrt(one_minus_rho2);
-    const double psi_threshold = 1.5;
-    const double kappa = p.h.kappa;
-    const double theta = std::max(p.h.theta, 0.0);
-    const double sigma = std::max(p.h.sigma, 0.0);
-    const double sigma2 = sigma * sigma;
     const bool use_counter = (p.rng == quant::rng::Mode::Counter);
-    const bool use_qe = (p.scheme == McParams::Scheme::QE);
-    const bool kappa_small = std::abs(kappa) <= 1e-12;
-    const double exp_kdt = std::exp(-kappa * dt);
-    const double one_minus_exp = -std::expm1(-kappa * dt);
     const std::uint64_t master_seed = p.seed ? p.seed : 0xFACEFEEDULL;
     constexpr double kUniformEps = std::numeric_limits<double>::epsilon();
+    const VarianceStepper stepper(p, dt);
 
     struct Draws {
         std::vector<double> z_var;
@@ -208,99 +357,235 @@ McResult call_qe_mc(const McParams& p) {
         double v = std::max(0.0, p.h.v0);
         for (int s = 0; s < steps; ++s) {
             const std::size_t idx = static_cast<std::size_t>(s);
-            const double z_var = draws.z_var[idx];
-            const double z_perp = draws.z_perp[idx];
-            const double u = draws.u[idx];
-
-            if (!use_qe) {
-                const double sqrt_v = std::sqrt(std::max(v, 0.0));
-                const double dW_var = sqrt_dt * z_var;
-                const double dW_perp = sqrt_dt * z_perp;
-                double v_next = v + kappa * (theta - v) * dt + sigma * sqrt_v * dW_var;
-                v_next = std::max(v_next, 0.0);
-                const double z_star = rho * dW_var + sqrt_one_minus_rho2 * dW_perp;
-                logS += (p.mkt.rate - p.mkt.dividend - 0.5 * v) * dt + sqrt_v * z_star;
-                v = v_next;
-                continue;
-            }
+            stepper.advance(draws.z_var[idx], draws.z_perp[idx], draws.u[idx], logS, v);
+        }
 
-            double m = theta + (v - theta) * exp_kdt;
-            m = std::max(m, 0.0);
-            double s2;
-            if (kappa_small) {
-                s2 = sigma2 * v * dt;
-            } else if (sigma == 0.0) {
-                s2 = 0.0;
-            } else {
-                s2 = v * sigma2 * exp_kdt * one_minus_exp / kappa +
-                     theta * sigma2 * one_minus_exp * one_minus_exp / (2.0 * kappa);
+        const double payoff = std::max(0.0, std::exp(logS) - p.mkt.strike);
+        return df * payoff;
+    };
+
+    // Batches run in path order, so the sequential PRNG stream matches a fixed-size run.
+    const auto simulate_batch = [&](std::uint64_t begin, std::uint64_t end, std::uint64_t) {
+        Welford acc;
+        for (std::uint64_t path = begin; path < end; ++path) {
+            Draws base = generate_draws(path);
+            double sample = evolve_path(base);
+            if (p.antithetic) {
+                Draws anti = make_antithetic(base);
+                const double anti_sample = evolve_path(anti);
+                sample = 0.5 * (sample + anti_sample);
             }
-            s2 = std::max(s2, 0.0);
-
-            const double m_safe = std::max(m, 1e-12);
-            double psi = (m_safe > 0.0) ? s2 / (m_safe * m_safe) : psi_threshold + 1.0;
-
-            double v_next = m_safe;
-            if (psi < 1e-12) {
-                v_next = m_safe;
-            } else if (psi <= psi_threshold) {
-                const double two_over_psi = 2.0 / psi;
-                const double inside = std::max(0.0, two_over_psi - 1.0);
-                const double b2 = two_over_psi - 1.0 + std::sqrt(std::max(0.0, two_over_psi * inside));
-                const double b = std::sqrt(std::max(b2, 0.0));
-                const double a = m_safe / (1.0 + b2);
-                v_next = a * (b + z_var) * (b + z_var);
-            } else {
-                const double p_branch = (psi - 1.0) / (psi + 1.0);
-                const double beta = (1.0 - p_branch) / m_safe;
-                if (u <= p_branch) {
-                    v_next = 0.0;
-                } else {
-                    v_next = -std::log((1.0 - p_branch) / (1.0 - u)) / beta;
+            acc.add(sample);
+        }
+        return acc;
+    };
+    const auto run = quant::stats::run_batches(p.stopping, p.num_paths, simulate_batch);
+
+    return McResult{run.acc.mean, run.acc.std_error(), run.paths, run.elapsed_seconds};
+}
+
+mlmc::MlmcResult call_qe_mlmc(const McParams& p, const mlmc::MlmcParams& mlmc_params) {
+    if (p.mkt.time <= 0.0) {
+        const double payoff0 = std::max(0.0, p.mkt.spot - p.mkt.strike);
+        return mlmc::MlmcResult{payoff0, 0.0, 0.0, 0.0, 0.0, true, {}};
+    }
+
+    const double df = std::exp(-p.mkt.rate * p.mkt.time);
+    const std::uint64_t master_seed = p.seed ? p.seed : 0xFACEFEEDULL;
+    const int refinement = mlmc_params.refinement;
+    const double coarse_scale = 1.0 / std::sqrt(static_cast<double>(refinement));
+    constexpr double kUniformEps = std::numeric_limits<double>::epsilon();
+    // One uniform per step drives both QE branches (Andersen's U_V), so coupling the Gaussians
+    // also couples the exponential branch.
+    const auto branch_uniform = [kUniformEps](double z) {
+        return std::clamp(0.5 * std::erfc(-z / std::numbers::sqrt2), kUniformEps, 1.0 - kUniformEps);
+    };
+
+    std::vector<VarianceStepper> steppers;
+    for (int l = 0; l < mlmc_params.max_levels; ++l) {
+        const int steps = mlmc::steps_at_level(mlmc_params, l);
+        steppers.emplace_back(p, p.mkt.time / static_cast<double>(steps));
+    }
+
+    const auto sampler = [&](int level, std::uint64_t begin, std::uint64_t end) {
+        quant::stats::Welford acc;
+        const int steps = mlmc::steps_at_level(mlmc_params, level);
+        const VarianceStepper& fine = steppers[static_cast<std::size_t>(level)];
+        const VarianceStepper* coarse =
+            (level > 0) ? &steppers[static_cast<std::size_t>(level - 1)] : nullptr;
+        const std::uint64_t level_seed =
+            quant::rng::detail::hash_combine(master_seed, static_cast<std::uint64_t>(level));
+        std::vector<double> z_var(static_cast<std::size_t>(steps));
+        std::vector<double> z_perp(static_cast<std::size_t>(steps));
+
+        // Coarse Gaussians are scaled sums of `refinement` consecutive fine Gaussians.
+        const auto correction = [&](double sign) {
+            double logS_f = std::log(p.mkt.spot);
+            double v_f = std::max(0.0, p.h.v0);
+            double logS_c = logS_f;
+            double v_c = v_f;
+            double sum_var = 0.0;
+            double sum_perp = 0.0;
+            for (int s = 0; s < steps; ++s) {
+                const double zv = sign * z_var[static_cast<std::size_t>(s)];
+                const double zp = sign * z_perp[static_cast<std::size_t>(s)];
+                fine.advance(zv, zp, branch_uniform(zv), logS_f, v_f);
+                sum_var += zv;
+                sum_perp += zp;
+                if (coarse && (s + 1) % refinement == 0) {
+                    const double zv_c = coarse_scale * sum_var;
+                    coarse->advance(zv_c, coarse_scale * sum_perp, branch_uniform(zv_c), logS_c, v_c);
+                    sum_var = 0.0;
+                    sum_perp = 0.0;
                 }
             }
-            v_next = std::max(v_next, 0.0);
+            double value = df * std::max(0.0, std::exp(logS_f) - p.mkt.strike);
+            if (coarse) {
+                value -= df * std::max(0.0, std::exp(logS_c) - p.mkt.strike);
+            }
+            return value;
+        };
 
-            // Approximate ∫_t^{t+Δ} v_s ds using the CIR expectation so the asset drift uses a
-            // consistent average variance even when κΔ is not tiny.
-            double int_v;
-            if (kappa_small) {
-                int_v = v * dt; // κ → 0 reduces to Euler
-            } else {
-                int_v = theta * dt + (v - theta) * one_minus_exp / kappa;
+        for (std::uint64_t idx = begin; idx < end; ++idx) {
+            for (int s = 0; s < steps; ++s) {
+                const auto step_id = static_cast<std::uint32_t>(s);
+                z_var[static_cast<std::size_t>(s)] = quant::rng::normal(level_seed, idx, step_id, 0U, 0U);
+                z_perp[static_cast<std::size_t>(s)] = quant::rng::normal(level_seed, idx, step_id, 1U, 0U);
+            }
+            double sample = correction(+1.0);
+            if (p.antithetic) {
+                sample = 0.5 * (sample + correction(-1.0));
             }
-            const double v_bar = std::max(int_v / dt, 0.0);
-            const double sqrt_v_bar_dt = std::sqrt(std::max(v_bar * dt, 0.0));
+            acc.add(sample);
+        }
+        return acc;
+    };
 
-            // Andersen QE: σ ∫ sqrt(v) dW1 ≈ dv - κ(θ - \bar v)Δt couples asset and variance.
-            const double dv = v_next - v;
-            const double cross = dv - kappa * (theta - v_bar) * dt;
-            const double correlated = (sigma > 1e-12) ? (rho / sigma) * cross : 0.0;
-            const double diffusion = sqrt_one_minus_rho2 * sqrt_v_bar_dt * z_perp;
+    return mlmc::run(mlmc_params, sampler);
+}
 
-            logS += (p.mkt.rate - p.mkt.dividend) * dt - 0.5 * v_bar * dt + correlated + diffusion;
-            v = v_next;
-        }
+namespace {
 
-        const double payoff = std::max(0.0, std::exp(logS) - p.mkt.strike);
-        return df * payoff;
+struct AdjointAccumulators {
+    quant::stats::Welford price;
+    quant::stats::Welford delta;
+    quant::stats::Welford vega;
+    quant::stats::Welford rho;
+
+    void merge(const AdjointAccumulators& other) {
+        price.merge(other.price);
+        delta.merge(other.delta);
+        vega.merge(other.vega);
+        rho.merge(other.rho);
+    }
+};
+
+Estimate summarize(const quant::stats::Welford& acc) { return Estimate{acc.mean, acc.std_error()}; }
+
+} // namespace
+
+AdjointGreeks greeks_call_adjoint(const McParams& p) {
+    if (p.num_paths == 0) {
+        throw std::invalid_argument("greeks_call_adjoint: num_paths must be positive");
+    }
+    if (!(p.mkt.spot > 0.0) || !(p.mkt.time > 0.0)) {
+        throw std::invalid_argument("greeks_call_adjoint: spot and time must be positive");
+    }
+    if (p.rng != quant::rng::Mode::Counter) {
+        throw std::invalid_argument("greeks_call_adjoint: requires the counter RNG");
+    }
+
+    const int steps = std::max(1, p.num_steps);
+    const double T = p.mkt.time;
+    const double dt = T / static_cast<double>(steps);
+    const double df = std::exp(-p.mkt.rate * T);
+    const std::uint64_t master_seed = p.seed ? p.seed : 0xFACEFEEDULL;
+    constexpr double kUniformEps = std::numeric_limits<double>::epsilon();
+    const VarianceStepper stepper(p, dt);
+
+    // Forward pass records every step's tangent; the reverse sweep carries the variance adjoint
+    // back to v0 while the log-spot adjoint stays at its terminal value.
+    const auto adjoint_path = [&](const double* z_var, const double* z_perp, const double* u,
+                                  std::vector<StepTangent>& tape, double out[4]) {
+        double logS = std::log(p.mkt.spot);
+        double v = std::max(0.0, p.h.v0);
+        for (int s = 0; s < steps; ++s) {
+            const auto idx = static_cast<std::size_t>(s);
+            stepper.advance(z_var[idx], z_perp[idx], u[idx], logS, v, &tape[idx]);
+        }
+        const double ST = std::exp(logS);
+        const double value = df * std::max(0.0, ST - p.mkt.strike);
+        const double x_bar = (ST > p.mkt.strike) ? df * ST : 0.0;
+        double v_bar = 0.0;
+        for (int s = steps - 1; s >= 0; --s) {
+            const StepTangent& t = tape[static_cast<std::size_t>(s)];
+            v_bar = (v_bar + x_bar * t.dlogS_dv_next) * t.dv_next_dv + x_bar * t.dlogS_dv;
+        }
+        out[0] = value;
+        out[1] = x_bar / p.mkt.spot;
+        out[2] = (p.h.v0 > 0.0) ? v_bar : 0.0;
+        out[3] = T * (x_bar - value);
     };
 
-    Welford acc;
-    for (std::uint64_t path = 0; path < p.num_paths; ++path) {
-        Draws base = generate_draws(path);
-        double sample = evolve_path(base);
-        if (p.antithetic) {
-            Draws anti = make_antithetic(base);
-            const double anti_sample = evolve_path(anti);
-            sample = 0.5 * (sample + anti_sample);
+    const auto simulate = [&](std::uint64_t begin, std::uint64_t end) {
+        AdjointAccumulators acc;
+        const auto n = static_cast<std::size_t>(steps);
+        std::vector<double> z_var(n), z_perp(n), u(n);
+        std::vector<StepTangent> tape(n);
+        double base[4];
+        double anti[4];
+        for (std::uint64_t path = begin; path < end; ++path) {
+            for (int s = 0; s < steps; ++s) {
+                const auto step_id = static_cast<std::uint32_t>(s);
+                const auto idx = static_cast<std::size_t>(s);
+                z_var[idx] = quant::rng::normal(master_seed, path, step_id, 0U, 0U);
+                z_perp[idx] = quant::rng::normal(master_seed, path, step_id, 1U, 0U);
+                u[idx] = quant::rng::uniform(master_seed, path, step_id, 2U, 0U);
+            }
+            adjoint_path(z_var.data(), z_perp.data(), u.data(), tape, base);
+            if (p.antithetic) {
+                for (std::size_t i = 0; i < n; ++i) {
+                    z_var[i] = -z_var[i];
+                    z_perp[i] = -z_perp[i];
+                    u[i] = std::clamp(1.0 - u[i], kUniformEps, 1.0 - kUniformEps);
+                }
+                adjoint_path(z_var.data(), z_perp.data(), u.data(), tape, anti);
+                for (int k = 0; k < 4; ++k) {
+                    base[k] = 0.5 * (base[k] + anti[k]);
+                }
+            }
+            acc.price.add(base[0]);
+            acc.delta.add(base[1]);
+            acc.vega.add(base[2]);
+            acc.rho.add(base[3]);
         }
-        acc.add(sample);
+        return acc;
+    };
+
+    AdjointAccumulators totals;
+#ifdef QUANT_HAS_OPENMP
+    const std::uint64_t N = p.num_paths;
+    const int max_threads = omp_get_max_threads();
+    std::vector<AdjointAccumulators> partial(static_cast<std::size_t>(max_threads));
+
+#pragma omp parallel
+    {
+        const int tid = omp_get_thread_num();
+        const int nthreads = omp_get_num_threads();
+        const std::uint64_t begin = (tid * N) / nthreads;
+        const std::uint64_t end = ((tid + 1) * N) / nthreads;
+        partial[static_cast<std::size_t>(tid)] = simulate(begin, end);
+    }
+
+    for (const auto& part : partial) {
+        totals.merge(part);
     }
+#else
+    totals = simulate(0, p.num_paths);
+#endif
 
-    const double price = acc.mean;
-    const double se = (acc.count > 1) ? std::sqrt(acc.variance() / static_cast<double>(acc.count)) : 0.0;
-    return McResult{price, se};
+    return AdjointGreeks{summarize(totals.price), summarize(totals.delta), summarize(totals.vega),
+                         summarize(totals.rho)};
 }
 
 } // namespace quant::heston
@@ -1,6 +1,7 @@
 #include "quant/lookback.hpp"
 #include "quant/math.hpp"
 #include "quant/qmc/brownian_bridge.hpp"
+#include "quant/rng.hpp"
 #include "quant/stats.hpp"
 
 #include <pcg_random.hpp>
@@ -9,10 +10,26 @@
 #include <cmath>
 #include <memory>
 #include <random>
+#include <stdexcept>
 #include <vector>
 
 namespace quant::lookback {
 
+namespace {
+
+// -zeta(1/2) / sqrt(2 pi): continuity correction for discretely observed extrema.
+constexpr double kBgkBeta = 0.5825971579390106;
+
+double lookback_payoff(const McParams& p, double S_T, double S_min, double S_max) {
+    if (p.type == Type::FixedStrike) {
+        return (p.opt == ::quant::OptionType::Call) ? std::max(0.0, S_max - p.strike)
+                                                    : std::max(0.0, p.strike - S_min);
+    }
+    return (p.opt == ::quant::OptionType::Call) ? std::max(0.0, S_T - S_min) : std::max(0.0, S_max - S_T);
+}
+
+} // namespace
+
 McStatistic price_mc(const McParams& p) {
     using quant::stats::Welford;
     if (p.num_paths == 0 || p.num_steps <= 0)
@@ -62,19 +79,7 @@ McStatistic price_mc(const McParams& p) {
                     S_max = std::max(S_max, S);
                 }
             }
-            double payoff = 0.0;
-            if (p.type == Type::FixedStrike) {
-                if (p.opt == ::quant::OptionType::Call)
-                    payoff = std::max(0.0, S_max - p.strike);
-                else
-                    payoff = std::max(0.0, p.strike - S_min);
-            } else { // Floating strike
-                if (p.opt == ::quant::OptionType::Call)
-                    payoff = std::max(0.0, S - S_min);
-                else
-                    payoff = std::max(0.0, S_max - S);
-            }
-            return disc * payoff;
+            return disc * lookback_payoff(p, S, S_min, S_max);
         };
         double sample = simulate_once(+1);
         if (p.antithetic)
@@ -87,4 +92,93 @@ McStatistic price_mc(const McParams& p) {
     return {acc.mean, se, acc.mean - half, acc.mean + half};
 }
 
+quant::mc::PathGreeksResult greeks_mc(const McParams& p, const quant::mc::GreeksBumps& bumps) {
+    if (p.num_steps <= 0) {
+        throw std::invalid_argument("lookback::greeks_mc: num_steps must be positive");
+    }
+    const quant::mc::PathGreeksParams params{.market = {{p.spot}, {p.vol}, p.rate, p.time},
+                                             .normals_per_path = p.num_steps,
+                                             .num_paths = p.num_paths,
+                                             .seed = p.seed,
+                                             .antithetic = p.antithetic,
+                                             .bumps = bumps};
+    const auto payoff = [&p](const quant::mc::PathMarket& m, const double* normals) {
+        const double sigma = m.vols[0];
+        const double dt = m.time / static_cast<double>(p.num_steps);
+        const double drift_dt = (m.rate - p.dividend - 0.5 * sigma * sigma) * dt;
+        const double vol_sdt = sigma * std::sqrt(dt);
+        double logS = std::log(m.spots[0]);
+        double S_min = m.spots[0];
+        double S_max = m.spots[0];
+        for (int t = 0; t < p.num_steps; ++t) {
+            logS += drift_dt + vol_sdt * normals[t];
+            const double S = std::exp(logS);
+            S_min = std::min(S_min, S);
+            S_max = std::max(S_max, S);
+        }
+        return std::exp(-m.rate * m.time) * lookback_payoff(p, std::exp(logS), S_min, S_max);
+    };
+    return quant::mc::path_greeks(params, payoff);
+}
+
+quant::mlmc::MlmcResult price_mlmc(const McParams& p, const quant::mlmc::MlmcParams& mlmc_params) {
+    const double disc = std::exp(-p.rate * p.time);
+    const std::uint64_t seed = p.seed ? p.seed : 0xBADC0FFEEULL;
+    const int refinement = mlmc_params.refinement;
+
+    const auto sampler = [&](int level, std::uint64_t begin, std::uint64_t end) {
+        quant::stats::Welford acc;
+        const int steps = quant::mlmc::steps_at_level(mlmc_params, level);
+        const double dt = p.time / static_cast<double>(steps);
+        const double drift_dt = (p.rate - p.dividend - 0.5 * p.vol * p.vol) * dt;
+        const double vol_sdt = p.vol * std::sqrt(dt);
+        // Broadie–Glasserman–Kou shift of the discrete extremum towards the continuous one.
+        const double fine_shift = std::exp(kBgkBeta * vol_sdt);
+        const double coarse_shift = std::exp(kBgkBeta * vol_sdt * std::sqrt(static_cast<double>(refinement)));
+        const std::uint64_t level_seed =
+            quant::rng::detail::hash_combine(seed, static_cast<std::uint64_t>(level));
+        std::vector<double> normals(static_cast<std::size_t>(steps));
+
+        // Fine and coarse extrema from one path: the coarse grid is every `refinement`-th fine date.
+        const auto correction = [&](double sign) {
+            double logS = std::log(p.spot);
+            double fine_min = p.spot;
+            double fine_max = p.spot;
+            double coarse_min = p.spot;
+            double coarse_max = p.spot;
+            for (int t = 0; t < steps; ++t) {
+                logS += drift_dt + vol_sdt * sign * normals[static_cast<std::size_t>(t)];
+                const double S = std::exp(logS);
+                fine_min = std::min(fine_min, S);
+                fine_max = std::max(fine_max, S);
+                if ((t + 1) % refinement == 0) {
+                    coarse_min = std::min(coarse_min, S);
+                    coarse_max = std::max(coarse_max, S);
+                }
+            }
+            const double S_T = std::exp(logS);
+            double value = disc * lookback_payoff(p, S_T, fine_min / fine_shift, fine_max * fine_shift);
+            if (level > 0) {
+                value -= disc * lookback_payoff(p, S_T, coarse_min / coarse_shift, coarse_max * coarse_shift);
+            }
+            return value;
+        };
+
+        for (std::uint64_t idx = begin; idx < end; ++idx) {
+            for (int t = 0; t < steps; ++t) {
+                normals[static_cast<std::size_t>(t)] =
+                    quant::rng::normal(level_seed, idx, static_cast<std::uint32_t>(t), 0U, 0U);
+            }
+            double sample = correction(+1.0);
+            if (p.antithetic) {
+                sample = 0.5 * (sample + correction(-1.0));
+            }
+            acc.add(sample);
+        }
+        return acc;
+    };
+
+    return quant::mlmc::run(mlmc_params, sampler);
+}
+
 } // namespace quant::lookback
@@ -55,9 +55,25 @@ quant::mc::McParams::Qmc parse_qmc_sampler(const std::string& token) {
         return quant::mc::McParams::Qmc::Sobol;
     if (v == "sobol_scrambled" || v == "scrambled" || v == "2")
         return quant::mc::McParams::Qmc::SobolScrambled;
+    if (v == "sobol_owen" || v == "owen" || v == "3")
+        return quant::mc::McParams::Qmc::SobolOwen;
     throw std::runtime_error("Unknown sampler: " + token);
 }
 
+const char* sampler_name(quant::mc::McParams::Qmc qmc) {
+    switch (qmc) {
+    case quant::mc::McParams::Qmc::None:
+        return "prng";
+    case quant::mc::McParams::Qmc::Sobol:
+        return "sobol";
+    case quant::mc::McParams::Qmc::SobolScrambled:
+        return "sobol_scrambled";
+    case quant::mc::McParams::Qmc::SobolOwen:
+        return "sobol_owen";
+    }
+    return "prng";
+}
+
 quant::mc::McParams::Bridge parse_bridge_mode(const std::string& token) {
     std::string v = to_lower(token);
     if (v == "none" || v == "0" || v.empty())
@@ -235,8 +251,9 @@ int main(int argc, char** argv) {
         if (argc < 12) {
             std::cerr << "mc <S> <K> <r> <q> <sigma> <T> <paths> <seed> <antithetic:0|1> <qmc_mode> "
                          "[bridge_mode] [num_steps]"
-                         " [--sampler=] [--bridge=] [--steps=] [--rng=counter|mt19937] [--threads=] "
-                         "[--greeks] [--ci] [--json]\n";
+                         " [--sampler=] [--bridge=] [--steps=] [--replicates=] [--rng=counter|mt19937] "
+                         "[--target-se=] [--target-rel=] [--time-budget=] [--threads=] [--greeks] [--ci] "
+                         "[--json]\n";
             return 1;
         }
         quant::mc::McParams p{};
@@ -302,6 +319,14 @@ int main(int argc, char** argv) {
                 }
             } else if (flag.rfind("--steps=", 0) == 0) {
                 p.num_steps = std::max(1, std::atoi(flag.substr(8).c_str()));
+            } else if (flag.rfind("--replicates=", 0) == 0) {
+                p.qmc_replicates = std::max(1, std::atoi(flag.substr(13).c_str()));
+            } else if (flag.rfind("--target-se=", 0) == 0) {
+                p.stopping.target_std_error = std::atof(flag.substr(12).c_str());
+            } else if (flag.rfind("--target-rel=", 0) == 0) {
+                p.stopping.target_rel_error = std::atof(flag.substr(13).c_str());
+            } else if (flag.rfind("--time-budget=", 0) == 0) {
+                p.stopping.time_budget_seconds = std::atof(flag.substr(14).c_str());
             } else if (flag.rfind("--rng=", 0) == 0) {
                 std::string value = flag.substr(6);
                 try {
@@ -335,15 +360,13 @@ int main(int argc, char** argv) {
                       << ",\"ci_low\":" << res.estimate.ci_low << ",\"ci_high\":" << res.estimate.ci_high
                       << ",\"paths\":" << p.num_paths << ",\"seed\":" << p.seed
                       << ",\"antithetic\":" << (p.antithetic ? 1 : 0) << ",\"sampler\":\""
-                      << (p.qmc == quant::mc::McParams::Qmc::None
-                              ? "prng"
-                              : (p.qmc == quant::mc::McParams::Qmc::Sobol ? "sobol" : "sobol_scrambled"))
-                      << "\""
-                      << ",\"bridge\":\"" << (p.bridge == quant::mc::McParams::Bridge::None ? "none" : "bb")
-                      << "\""
+                      << sampler_name(p.qmc) << "\""
+                      << ",\"replicates\":" << std::max(1, p.qmc_replicates) << ",\"bridge\":\""
+                      << (p.bridge == quant::mc::McParams::Bridge::None ? "none" : "bb") << "\""
                       << ",\"steps\":" << p.num_steps << ",\"rng\":\""
                       << (p.rng == quant::rng::Mode::Counter ? "counter" : "mt19937") << "\""
-                      << ",\"threads\":" << threads_used;
+                      << ",\"threads\":" << threads_used << ",\"paths_used\":" << res.paths_used
+                      << ",\"elapsed_seconds\":" << res.elapsed_seconds;
             if (greeks) {
                 auto emit_stat = [&](const char* name, const quant::mc::McStatistic& stat) {
                     std::cout << "\"" << name << "\":{"
@@ -509,6 +532,8 @@ int main(int argc, char** argv) {
                         p.bridge = parse_bridge_mode(flag.substr(9));
                     } else if (flag.rfind("--steps=", 0) == 0) {
                         p.num_steps = std::max(1, std::atoi(flag.substr(8).c_str()));
+                    } else if (flag.rfind("--replicates=", 0) == 0) {
+                        p.qmc_replicates = std::max(1, std::atoi(flag.substr(13).c_str()));
                     } else if (flag.rfind("--rng=", 0) == 0) {
                         try {
                             p.rng = parse_rng_mode(flag.substr(6));
@@ -537,13 +562,8 @@ int main(int argc, char** argv) {
                               << ",\"ci_low\":" << res.estimate.ci_low
                               << ",\"ci_high\":" << res.estimate.ci_high << ",\"paths\":" << p.num_paths
                               << ",\"seed\":" << p.seed << ",\"antithetic\":" << (p.antithetic ? 1 : 0)
-                              << ",\"sampler\":\""
-                              << (p.qmc == quant::mc::McParams::Qmc::None
-                                      ? "prng"
-                                      : (p.qmc == quant::mc::McParams::Qmc::Sobol ? "sobol"
-                                                                                  : "sobol_scrambled"))
-                              << "\""
-                              << ",\"bridge\":\""
+                              << ",\"sampler\":\"" << sampler_name(p.qmc) << "\""
+                              << ",\"replicates\":" << std::max(1, p.qmc_replicates) << ",\"bridge\":\""
                               << (p.bridge == quant::mc::McParams::Bridge::None ? "none" : "bb") << "\""
                               << ",\"steps\":" << p.num_steps << ",\"rng\":\""
                               << (p.rng == quant::rng::Mode::Counter ? "counter" : "mt19937") << "\""
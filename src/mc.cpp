@@ -1,15 +1,19 @@
 #include "quant/mc.hpp"
 
+#include "mc_detail.hpp"
+
 #include "quant/math.hpp"
 #include "quant/qmc/brownian_bridge.hpp"
 #include "quant/qmc/sobol.hpp"
 #include "quant/stats.hpp"
 
 #include <algorithm>
+#include <chrono>
 #include <cmath>
 #include <limits>
 #include <memory>
 #include <numbers>
+#include <optional>
 #include <random>
 #include <stdexcept>
 #include <vector>
@@ -24,30 +28,11 @@ namespace quant::mc {
 
 namespace {
 
-McStatistic summarize(const quant::stats::Welford& acc) {
-    McStatistic stat{};
-    if (acc.count == 0) {
-        stat.value = 0.0;
-        stat.std_error = 0.0;
-        stat.ci_low = 0.0;
-        stat.ci_high = 0.0;
-        return stat;
-    }
-    stat.value = acc.mean;
-    const double variance = acc.variance();
-    if (acc.count > 1 && variance >= 0.0) {
-        const double se = std::sqrt(variance / static_cast<double>(acc.count));
-        const double half_width = quant::math::kZ95 * se;
-        stat.std_error = se;
-        stat.ci_low = stat.value - half_width;
-        stat.ci_high = stat.value + half_width;
-    } else {
-        stat.std_error = 0.0;
-        stat.ci_low = stat.value;
-        stat.ci_high = stat.value;
-    }
-    return stat;
-}
+using detail::sobol_scramble;
+using detail::summarize;
+
+// Seed of price_european_call when the caller leaves it at zero.
+std::uint64_t pricing_seed(const McParams& p) { return p.seed ? p.seed : 0x9E3779B97F4A7C15ULL; }
 
 struct GreekAccumulators {
     quant::stats::Welford delta;
@@ -114,6 +99,12 @@ double evolve_terminal(double spot, double rate, double dividend, double vol, do
     return std::exp(logS);
 }
 
+// Payoff max(0, sign * (S_T - strike)) evaluated on every simulated path; sign is +1 for calls, -1 for puts.
+struct Payoff {
+    double strike;
+    double sign;
+};
+
 struct PathInputs {
     std::vector<double> uniforms;
     std::vector<double> normals;
@@ -133,15 +124,17 @@ struct WorkerContext {
     const qmc::SobolSequence* sobol;
     // Piecewise-constant schedules (if used)
     bool use_schedule{false};
-    std::vector<double> dt;
-    std::vector<double> drift_step;
-    std::vector<double> sigma;
-    std::vector<double> sqrt_dt;
+    std::vector<double> dt{};
+    std::vector<double> drift_step{};
+    std::vector<double> sigma{};
+    std::vector<double> sqrt_dt{};
+    // Options priced on the shared paths (common random numbers across strikes and types)
+    std::vector<Payoff> payoffs{};
 };
 
-quant::stats::Welford simulate_range(std::uint64_t begin, std::uint64_t end, std::uint64_t seed_offset,
-                                     const WorkerContext& ctx) {
-    quant::stats::Welford acc;
+std::vector<quant::stats::Welford> simulate_range(std::uint64_t begin, std::uint64_t end,
+                                                  std::uint64_t seed_offset, const WorkerContext& ctx) {
+    std::vector<quant::stats::Welford> acc(ctx.payoffs.size());
     if (begin >= end) {
         return acc;
     }
@@ -166,12 +159,17 @@ quant::stats::Welford simulate_range(std::uint64_t begin, std::uint64_t end, std
         bridge = std::make_unique<qmc::BrownianBridge>(ctx.steps, ctx.params.time);
     }
 
+    std::optional<qmc::SobolSequence::Cursor> sobol_cursor;
+    if (ctx.use_qmc) {
+        sobol_cursor.emplace(*ctx.sobol, begin);
+    }
+
     pcg64 rng(seed_offset);
     std::normal_distribution<double> normal(0.0, 1.0);
 
     for (std::uint64_t idx = begin; idx < end; ++idx) {
         if (ctx.use_qmc) {
-            ctx.sobol->generate(idx, inputs.uniforms.data());
+            sobol_cursor->next(inputs.uniforms.data());
             for (int j = 0; j < ctx.steps; ++j) {
                 const double u = std::clamp(inputs.uniforms[j], std::numeric_limits<double>::min(),
                                             1.0 - std::numeric_limits<double>::epsilon());
@@ -215,12 +213,8 @@ quant::stats::Welford simulate_range(std::uint64_t begin, std::uint64_t end, std
                                   ctx.params.time, ctx.steps, inputs.normals.data(), inputs.increments,
                                   bridge.get());
         }
-        const double payoff1 = std::max(0.0, ST1 - ctx.params.strike);
-        double sample = ctx.discount * payoff1;
-        double cv_obs = ctx.discount * ST1;
-
+        double ST2 = 0.0;
         if (ctx.params.antithetic) {
-            double ST2;
             if (ctx.use_schedule) {
                 double logS2 = std::log(ctx.params.spot);
                 for (int i = 0; i < ctx.steps; ++i) {
@@ -233,19 +227,95 @@ quant::stats::Welford simulate_range(std::uint64_t begin, std::uint64_t end, std
                                       ctx.params.time, ctx.steps, inputs.normals_antithetic.data(),
                                       inputs.increments_antithetic, bridge.get());
             }
-            const double payoff2 = std::max(0.0, ST2 - ctx.params.strike);
-            sample = 0.5 * (sample + ctx.discount * payoff2);
-            cv_obs = 0.5 * ctx.discount * (ST1 + ST2);
         }
+        const double cv_obs = ctx.params.antithetic ? 0.5 * ctx.discount * (ST1 + ST2) : ctx.discount * ST1;
+        const double cv_shift = ctx.params.control_variate ? ctx.cv_expectation - cv_obs : 0.0;
+
+        for (std::size_t k = 0; k < ctx.payoffs.size(); ++k) {
+            const Payoff& payoff = ctx.payoffs[k];
+            double sample = ctx.discount * std::max(0.0, payoff.sign * (ST1 - payoff.strike));
+            if (ctx.params.antithetic) {
+                sample = 0.5 * (sample + ctx.discount * std::max(0.0, payoff.sign * (ST2 - payoff.strike)));
+            }
+            // The discounted-spot control enters with the payoff's sign (a put is short the forward).
+            acc[k].add(sample + payoff.sign * cv_shift);
+        }
+    }
 
-        if (ctx.params.control_variate) {
-            sample += (ctx.cv_expectation - cv_obs);
+    return acc;
+}
+
+// Paths [begin, end) split across threads. Counter streams are keyed by path index so batching
+// does not change the draws; sequential PRNG streams are re-seeded per batch.
+std::vector<quant::stats::Welford> simulate_batch(std::uint64_t begin, std::uint64_t end, std::uint64_t batch,
+                                                  const WorkerContext& ctx) {
+    const McParams& p = ctx.params;
+    const auto batch_seed = [batch](std::uint64_t seed) {
+        return batch == 0 ? seed : quant::rng::detail::hash_combine(seed, batch);
+    };
+    std::vector<quant::stats::Welford> total(ctx.payoffs.size());
+
+#ifdef QUANT_HAS_OPENMP
+    const std::uint64_t N = end - begin;
+    const int max_threads = omp_get_max_threads();
+    std::vector<std::vector<quant::stats::Welford>> partial(max_threads);
+    const std::uint64_t counter_seed = pricing_seed(p);
+
+#pragma omp parallel
+    {
+        const int tid = omp_get_thread_num();
+        const int nthreads = omp_get_num_threads();
+        const std::uint64_t first = begin + (tid * N) / nthreads;
+        const std::uint64_t last = begin + ((tid + 1) * N) / nthreads;
+        const std::uint64_t seed_offset =
+            (p.rng == quant::rng::Mode::Counter)
+                ? counter_seed
+                : batch_seed(p.seed + 0x9E3779B97F4A7C15ULL * static_cast<std::uint64_t>(tid + 1));
+        partial[tid] = simulate_range(first, last, seed_offset, ctx);
+    }
+
+    for (const auto& part : partial) {
+        for (std::size_t k = 0; k < part.size(); ++k) {
+            total[k].merge(part[k]);
         }
+    }
+#else
+    const std::uint64_t seed = pricing_seed(p);
+    const std::uint64_t seed_offset = (p.rng == quant::rng::Mode::Counter) ? seed : batch_seed(seed);
+    total = simulate_range(begin, end, seed_offset, ctx);
+#endif
+
+    return total;
+}
 
-        acc.add(sample);
+std::vector<McStatistic> simulate_replicates(const WorkerContext& base, int replicates) {
+    const McParams& p = base.params;
+    const std::uint64_t seed = pricing_seed(p);
+    const auto sequences = detail::replicate_sequences(base.steps, p.qmc, seed, replicates);
+    std::vector<WorkerContext> contexts(static_cast<std::size_t>(replicates), base);
+    for (int r = 0; r < replicates; ++r) {
+        contexts[static_cast<std::size_t>(r)].sobol = sequences[static_cast<std::size_t>(r)].get();
     }
 
-    return acc;
+    const auto partial =
+        detail::run_replicates(p.num_paths, replicates, [&](int r, std::uint64_t begin, std::uint64_t end) {
+            return simulate_range(begin, end, seed, contexts[static_cast<std::size_t>(r)]);
+        });
+
+    std::vector<McStatistic> estimates;
+    estimates.reserve(base.payoffs.size());
+    for (std::size_t k = 0; k < base.payoffs.size(); ++k) {
+        quant::stats::Welford replicate_means;
+        for (const auto& chunks : partial) {
+            quant::stats::Welford replicate;
+            for (const auto& chunk : chunks) {
+                replicate.merge(chunk[k]);
+            }
+            replicate_means.add(replicate.mean);
+        }
+        estimates.push_back(detail::summarize_replicates(replicate_means));
+    }
+    return estimates;
 }
 
 GreekAccumulators simulate_greeks_range(std::uint64_t begin, std::uint64_t end, std::uint64_t seed_offset,
@@ -365,25 +435,158 @@ GreekAccumulators simulate_greeks_range(std::uint64_t begin, std::uint64_t end,
     return accum;
 }
 
-} // namespace
+struct AdjointAccumulators {
+    quant::stats::Welford price;
+    quant::stats::Welford delta;
+    quant::stats::Welford vega;
+    quant::stats::Welford rho;
+    std::vector<quant::stats::Welford> rate_buckets;
+    std::vector<quant::stats::Welford> vol_buckets;
 
-McResult price_european_call(const McParams& p) {
+    explicit AdjointAccumulators(std::size_t rate_count = 0, std::size_t vol_count = 0)
+        : rate_buckets(rate_count), vol_buckets(vol_count) {}
+
+    void merge(const AdjointAccumulators& other) {
+        price.merge(other.price);
+        delta.merge(other.delta);
+        vega.merge(other.vega);
+        rho.merge(other.rho);
+        for (std::size_t j = 0; j < rate_buckets.size(); ++j) {
+            rate_buckets[j].merge(other.rate_buckets[j]);
+        }
+        for (std::size_t j = 0; j < vol_buckets.size(); ++j) {
+            vol_buckets[j].merge(other.vol_buckets[j]);
+        }
+    }
+};
+
+// Uniform-grid coefficients of the adjoint GBM path and the schedule piece feeding each step.
+struct AdjointContext {
+    double spot{0.0};
+    double strike{0.0};
+    double discount{1.0};
+    double dt{0.0};
+    double sqrt_dt{0.0};
+    bool antithetic{false};
+    std::vector<double> drift_step{};
+    std::vector<double> sigma{};
+    std::vector<std::size_t> rate_bucket{}; // empty without a rate schedule
+    std::vector<std::size_t> vol_bucket{};  // empty without a vol schedule
+    std::size_t rate_count{0};
+    std::size_t vol_count{0};
+};
+
+// The log-path is additive, so the reverse sweep seeds the terminal adjoint x_bar = dV/d log S_T
+// and scatters it onto each step's rate and volatility in a single backward accumulation.
+struct AdjointPath {
+    double price{0.0};
+    double delta{0.0};
+    double vega{0.0};
+    double rho{0.0};
+    std::vector<double> rate_bar; // per rate-schedule piece
+    std::vector<double> vol_bar;  // per vol-schedule piece
+};
+
+void adjoint_path(const AdjointContext& ctx, const double* normals, double sign, AdjointPath& out) {
+    const std::size_t steps = ctx.drift_step.size();
+    double logS = std::log(ctx.spot);
+    for (std::size_t i = 0; i < steps; ++i) {
+        logS += ctx.drift_step[i] + ctx.sigma[i] * ctx.sqrt_dt * sign * normals[i];
+    }
+    const double ST = std::exp(logS);
+    const double payoff = std::max(0.0, ST - ctx.strike);
+    out.price = ctx.discount * payoff;
+
+    // V = D (S_T - K)^+ with log S_T = log S0 + sum_i (r_i - q_i - sigma_i^2 / 2) dt + sigma_i dW_i.
+    const double x_bar = (payoff > 0.0) ? ctx.discount * ST : 0.0;
+    const double r_bar = (x_bar - out.price) * ctx.dt; // drift minus discounting, identical per step
+    out.delta = x_bar / ctx.spot;
+    out.rho = r_bar * static_cast<double>(steps);
+    out.vega = 0.0;
+    std::fill(out.rate_bar.begin(), out.rate_bar.end(), 0.0);
+    std::fill(out.vol_bar.begin(), out.vol_bar.end(), 0.0);
+    for (std::size_t i = steps; i-- > 0;) {
+        const double sigma_bar = x_bar * (ctx.sqrt_dt * sign * normals[i] - ctx.sigma[i] * ctx.dt);
+        out.vega += sigma_bar;
+        if (!out.vol_bar.empty()) {
+            out.vol_bar[ctx.vol_bucket[i]] += sigma_bar;
+        }
+        if (!out.rate_bar.empty()) {
+            out.rate_bar[ctx.rate_bucket[i]] += r_bar;
+        }
+    }
+}
+
+AdjointAccumulators simulate_adjoint_range(std::uint64_t begin, std::uint64_t end, std::uint64_t seed,
+                                           const AdjointContext& ctx) {
+    AdjointAccumulators acc(ctx.rate_count, ctx.vol_count);
+    const std::size_t steps = ctx.drift_step.size();
+    std::vector<double> normals(steps);
+    AdjointPath path{.rate_bar = std::vector<double>(ctx.rate_count),
+                     .vol_bar = std::vector<double>(ctx.vol_count)};
+    AdjointPath mirror = path;
+    const double weight = ctx.antithetic ? 0.5 : 1.0;
+
+    for (std::uint64_t idx = begin; idx < end; ++idx) {
+        for (std::size_t j = 0; j < steps; ++j) {
+            normals[j] = quant::rng::normal(seed, idx, static_cast<std::uint32_t>(j), 0U, 0U);
+        }
+        adjoint_path(ctx, normals.data(), 1.0, path);
+        if (ctx.antithetic) {
+            adjoint_path(ctx, normals.data(), -1.0, mirror);
+            path.price += mirror.price;
+            path.delta += mirror.delta;
+            path.vega += mirror.vega;
+            path.rho += mirror.rho;
+            for (std::size_t j = 0; j < ctx.rate_count; ++j) {
+                path.rate_bar[j] += mirror.rate_bar[j];
+            }
+            for (std::size_t j = 0; j < ctx.vol_count; ++j) {
+                path.vol_bar[j] += mirror.vol_bar[j];
+            }
+        }
+        acc.price.add(weight * path.price);
+        acc.delta.add(weight * path.delta);
+        acc.vega.add(weight * path.vega);
+        acc.rho.add(weight * path.rho);
+        for (std::size_t j = 0; j < ctx.rate_count; ++j) {
+            acc.rate_buckets[j].add(weight * path.rate_bar[j]);
+        }
+        for (std::size_t j = 0; j < ctx.vol_count; ++j) {
+            acc.vol_buckets[j].add(weight * path.vol_bar[j]);
+        }
+    }
+    return acc;
+}
+
+// Simulate the paths described by `p` once and evaluate every payoff on them.
+EuropeanBatchResult price_on_shared_paths(const McParams& p, std::vector<Payoff> payoffs) {
     if (p.num_paths == 0) {
-        return McResult{McStatistic{0.0, 0.0, 0.0, 0.0}};
+        return EuropeanBatchResult{std::vector<McStatistic>(payoffs.size(), McStatistic{0.0, 0.0, 0.0, 0.0})};
     }
 
     const int steps = std::max(1, p.num_steps);
     const bool use_qmc = p.qmc != McParams::Qmc::None;
-    const bool scrambled = p.qmc == McParams::Qmc::SobolScrambled;
+    const bool scrambled = use_qmc && p.qmc != McParams::Qmc::Sobol;
     const bool use_bridge = (p.bridge == McParams::Bridge::BrownianBridge);
+    const int replicates = std::max(1, p.qmc_replicates);
 
     if (use_qmc && static_cast<std::size_t>(steps) > qmc::SobolSequence::kMaxSupportedDimension) {
-        throw std::invalid_argument("Sobol sequence limited to 64 dimensions");
+        throw std::invalid_argument("Sobol dimension exceeds supported maximum; reduce num_steps");
+    }
+    if (replicates > 1 && !scrambled) {
+        throw std::invalid_argument("qmc_replicates > 1 requires a scrambled Sobol sampler");
+    }
+    if (replicates > 1 && p.stopping.enabled()) {
+        throw std::invalid_argument("stopping rule is not supported with qmc_replicates > 1");
+    }
+    if (payoffs.size() > 1 && p.stopping.enabled()) {
+        throw std::invalid_argument("stopping rule is not supported when pricing several options");
     }
 
     std::unique_ptr<qmc::SobolSequence> sobol;
-    if (use_qmc) {
-        sobol = std::make_unique<qmc::SobolSequence>(steps, scrambled, p.seed);
+    if (use_qmc && replicates == 1) {
+        sobol = std::make_unique<qmc::SobolSequence>(steps, sobol_scramble(p.qmc), p.seed);
     }
 
     const bool has_schedule =
@@ -400,7 +603,8 @@ McResult price_european_call(const McParams& p) {
                       .use_qmc = use_qmc,
                       .scrambled = scrambled,
                       .use_bridge = use_bridge,
-                      .sobol = sobol.get()};
+                      .sobol = sobol.get(),
+                      .payoffs = std::move(payoffs)};
 
     // If schedules provided, build per-step coefficients on uniform grid over [0,T]
     if (has_schedule) {
@@ -437,38 +641,54 @@ McResult price_european_call(const McParams& p) {
         integrated_var = std::max(0.0, integrated_var);
     }
 
-    quant::stats::Welford total;
+    const auto start = std::chrono::steady_clock::now();
+    const auto seconds_since_start = [&] {
+        return std::chrono::duration<double>(std::chrono::steady_clock::now() - start).count();
+    };
 
-#ifdef QUANT_HAS_OPENMP
-    const std::uint64_t N = p.num_paths;
-    const int max_threads = omp_get_max_threads();
-    std::vector<quant::stats::Welford> partial(max_threads);
-    const std::uint64_t counter_seed = p.seed ? p.seed : 0x9E3779B97F4A7C15ULL;
+    if (replicates > 1) {
+        auto estimates = simulate_replicates(ctx, replicates);
+        return EuropeanBatchResult{std::move(estimates), p.num_paths, seconds_since_start()};
+    }
 
-#pragma omp parallel
-    {
-        const int tid = omp_get_thread_num();
-        const int nthreads = omp_get_num_threads();
-        const std::uint64_t begin = (tid * N) / nthreads;
-        const std::uint64_t end = ((tid + 1) * N) / nthreads;
-        const std::uint64_t seed_offset =
-            (p.rng == quant::rng::Mode::Counter)
-                ? counter_seed
-                : p.seed + 0x9E3779B97F4A7C15ULL * static_cast<std::uint64_t>(tid + 1);
-        partial[tid] = simulate_range(begin, end, seed_offset, ctx);
+    if (ctx.payoffs.size() == 1) {
+        const auto run = quant::stats::run_batches(
+            p.stopping, p.num_paths, [&](std::uint64_t begin, std::uint64_t end, std::uint64_t batch) {
+                return simulate_batch(begin, end, batch, ctx).front();
+            });
+        return EuropeanBatchResult{{summarize(run.acc)}, run.paths, run.elapsed_seconds};
     }
 
-    for (const auto& part : partial) {
-        total.merge(part);
+    const auto totals = simulate_batch(0, p.num_paths, 0, ctx);
+    EuropeanBatchResult result{{}, p.num_paths, 0.0};
+    result.estimates.reserve(totals.size());
+    for (const auto& acc : totals) {
+        result.estimates.push_back(summarize(acc));
     }
-#else
-    const std::uint64_t seed_offset = (p.rng == quant::rng::Mode::Counter)
-                                          ? (p.seed ? p.seed : 0x9E3779B97F4A7C15ULL)
-                                          : (p.seed ? p.seed : 0x9E3779B97F4A7C15ULL);
-    total = simulate_range(0, p.num_paths, seed_offset, ctx);
-#endif
+    result.elapsed_seconds = seconds_since_start();
+    return result;
+}
+
+} // namespace
 
-    return McResult{summarize(total)};
+McResult price_european_call(const McParams& p) {
+    auto batch = price_on_shared_paths(p, {Payoff{p.strike, 1.0}});
+    return McResult{batch.estimates.front(), batch.paths_used, batch.elapsed_seconds};
+}
+
+EuropeanBatchResult price_european_batch(const McParams& p, const std::vector<OptionSpec>& options) {
+    if (options.empty()) {
+        throw std::invalid_argument("options must be non-empty");
+    }
+    std::vector<Payoff> payoffs;
+    payoffs.reserve(options.size());
+    for (const auto& option : options) {
+        if (!std::isfinite(option.strike) || option.strike < 0.0) {
+            throw std::invalid_argument("option strikes must be finite and non-negative");
+        }
+        payoffs.push_back({option.strike, option.type == OptionType::Call ? 1.0 : -1.0});
+    }
+    return price_on_shared_paths(p, std::move(payoffs));
 }
 
 GreeksResult greeks_european_call(const McParams& p) {
@@ -569,4 +789,87 @@ GreeksResult greeks_european_call(const McParams& p) {
     return result;
 }
 
+AdjointGreeksResult greeks_european_call_adjoint(const McParams& p) {
+    if (p.num_paths == 0) {
+        throw std::invalid_argument("greeks_european_call_adjoint: num_paths must be positive");
+    }
+    if (!(p.spot > 0.0) || !(p.time > 0.0)) {
+        throw std::invalid_argument("greeks_european_call_adjoint: spot and time must be positive");
+    }
+    if (!(p.strike >= 0.0)) {
+        throw std::invalid_argument("greeks_european_call_adjoint: strike must be non-negative");
+    }
+    if (p.rng != quant::rng::Mode::Counter || p.qmc != McParams::Qmc::None ||
+        p.bridge != McParams::Bridge::None) {
+        throw std::invalid_argument(
+            "greeks_european_call_adjoint: requires the counter RNG without QMC or Brownian bridge");
+    }
+
+    const int steps = std::max(1, p.num_steps);
+    const double dt = p.time / static_cast<double>(steps);
+    AdjointContext ctx{.spot = p.spot,
+                       .strike = p.strike,
+                       .discount = 1.0,
+                       .dt = dt,
+                       .sqrt_dt = std::sqrt(dt),
+                       .antithetic = p.antithetic,
+                       .rate_count = p.rate_schedule ? p.rate_schedule->values.size() : 0,
+                       .vol_count = p.vol_schedule ? p.vol_schedule->values.size() : 0};
+    double int_rate = 0.0;
+    for (int i = 0; i < steps; ++i) {
+        const double mid = (static_cast<double>(i) + 0.5) * dt;
+        const double r = p.rate_schedule ? p.rate_schedule->value(mid) : p.rate;
+        const double q = p.dividend_schedule ? p.dividend_schedule->value(mid) : p.dividend;
+        const double sig = p.vol_schedule ? p.vol_schedule->value(mid) : p.vol;
+        if (p.rate_schedule) {
+            ctx.rate_bucket.push_back(p.rate_schedule->index(mid));
+        }
+        if (p.vol_schedule) {
+            ctx.vol_bucket.push_back(p.vol_schedule->index(mid));
+        }
+        ctx.drift_step.push_back((r - q - 0.5 * sig * sig) * dt);
+        ctx.sigma.push_back(sig);
+        int_rate += r * dt;
+    }
+    ctx.discount = std::exp(-int_rate);
+
+    const std::uint64_t seed = pricing_seed(p);
+    AdjointAccumulators totals(ctx.rate_count, ctx.vol_count);
+
+#ifdef QUANT_HAS_OPENMP
+    const std::uint64_t N = p.num_paths;
+    const int max_threads = omp_get_max_threads();
+    std::vector<AdjointAccumulators> partial(static_cast<std::size_t>(max_threads),
+                                             AdjointAccumulators(ctx.rate_count, ctx.vol_count));
+
+#pragma omp parallel
+    {
+        const int tid = omp_get_thread_num();
+        const int nthreads = omp_get_num_threads();
+        const std::uint64_t begin = (tid * N) / nthreads;
+        const std::uint64_t end = ((tid + 1) * N) / nthreads;
+        partial[static_cast<std::size_t>(tid)] = simulate_adjoint_range(begin, end, seed, ctx);
+    }
+
+    for (const auto& part : partial) {
+        totals.merge(part);
+    }
+#else
+    totals = simulate_adjoint_range(0, p.num_paths, seed, ctx);
+#endif
+
+    AdjointGreeksResult result{};
+    result.price = summarize(totals.price);
+    result.delta = summarize(totals.delta);
+    result.vega = summarize(totals.vega);
+    result.rho = summarize(totals.rho);
+    for (const auto& acc : totals.rate_buckets) {
+        result.rate_buckets.push_back(summarize(acc));
+    }
+    for (const auto& acc : totals.vol_buckets) {
+        result.vol_buckets.push_back(summarize(acc));
+    }
+    return result;
+}
+
 } // namespace quant::mc
@@ -1,5 +1,7 @@
 #include "quant/mc_barrier.hpp"
 
+#include "mc_detail.hpp"
+
 #include "quant/black_scholes.hpp"
 #include "quant/math.hpp"
 #include "quant/qmc/brownian_bridge.hpp"
@@ -7,10 +9,12 @@
 #include "quant/stats.hpp"
 
 #include <algorithm>
+#include <chrono>
 #include <cmath>
 #include <limits>
 #include <memory>
 #include <numbers>
+#include <optional>
 #include <random>
 #include <stdexcept>
 #include <vector>
@@ -37,50 +41,122 @@ bool barrier_triggered(const BarrierSpec& spec, double S) {
     return is_up_barrier(spec) ? (S >= spec.B) : (S <= spec.B);
 }
 
+// Brownian-bridge probability of touching the barrier within a step, from the log distances to it
+// at both ends (positive on the live side) and the step variance sigma^2 dt.
+double crossing_probability_log(double gap_prev, double gap_next, double var_dt) {
+    if (gap_prev <= 0.0 || gap_next <= 0.0) {
+        return 1.0;
+    }
+    if (var_dt <= 0.0) {
+        return 0.0;
+    }
+    return std::exp(-2.0 * gap_prev * gap_next / var_dt);
+}
+
 double crossing_probability(double S_prev, double S_next, double B, double sigma, double dt,
                             bool up_barrier) {
-    if (up_barrier) {
-        if (S_prev >= B || S_next >= B) {
-            return 1.0;
-        }
-        const double log1 = std::log(B / S_prev);
-        const double log2 = std::log(B / S_next);
-        const double exponent = -2.0 * log1 * log2 / (sigma * sigma * dt);
-        return std::clamp(std::exp(std::min(exponent, 0.0)), 0.0, 1.0);
-    } else {
-        if (S_prev <= B || S_next <= B) {
-            return 1.0;
-        }
-        const double log1 = std::log(S_prev / B);
-        const double log2 = std::log(S_next / B);
-        const double exponent = -2.0 * log1 * log2 / (sigma * sigma * dt);
-        return std::clamp(std::exp(std::min(exponent, 0.0)), 0.0, 1.0);
+    const double side = up_barrier ? 1.0 : -1.0;
+    return crossing_probability_log(side * std::log(B / S_prev), side * std::log(B / S_next),
+                                    sigma * sigma * dt);
+}
+
+using detail::summarize;
+
+void validate_inputs(const McParams& base, double strike, const BarrierSpec& barrier) {
+    if (strike <= 0.0) {
+        throw std::invalid_argument("Strike must be positive");
+    }
+    if (barrier.B <= 0.0) {
+        throw std::invalid_argument("Barrier level must be positive");
+    }
+    if (base.spot <= 0.0) {
+        throw std::invalid_argument("Spot must be positive");
     }
 }
 
-McStatistic summarize(const quant::stats::Welford& acc) {
-    McStatistic stat{};
-    if (acc.count == 0) {
-        stat.value = 0.0;
-        stat.std_error = 0.0;
-        stat.ci_low = 0.0;
-        stat.ci_high = 0.0;
-        return stat;
-    }
-    stat.value = acc.mean;
-    const double variance = acc.variance();
-    if (acc.count > 1 && variance >= 0.0) {
-        const double se = std::sqrt(variance / static_cast<double>(acc.count));
-        const double half_width = quant::math::kZ95 * se;
-        stat.std_error = se;
-        stat.ci_low = stat.value - half_width;
-        stat.ci_high = stat.value + half_width;
-    } else {
-        stat.std_error = 0.0;
-        stat.ci_low = stat.value;
-        stat.ci_high = stat.value;
+// Deterministic value when the barrier is already breached at inception.
+std::optional<double> value_at_inception(const McParams& base, double strike, OptionType opt,
+                                         const BarrierSpec& barrier) {
+    if (!barrier_triggered(barrier, base.spot)) {
+        return std::nullopt;
     }
-    return stat;
+    if (is_knock_out(barrier)) {
+        return barrier.rebate;
+    }
+    return (opt == OptionType::Call)
+               ? ::quant::bs::call_price(base.spot, strike, base.rate, base.dividend, base.vol, base.time)
+               : ::quant::bs::put_price(base.spot, strike, base.rate, base.dividend, base.vol, base.time);
+}
+
+// Per-level time grid for MLMC (midpoint schedule values, as in the single-level engine).
+struct LevelGrid {
+    int steps;
+    double dt;
+    double sqrt_dt;
+    double discount;
+    std::vector<double> drift_step;
+    std::vector<double> sigma_step;
+};
+
+// Fill `grid` in place, reusing its storage.
+void make_level_grid(const McParams& base, int steps, LevelGrid& grid) {
+    grid.steps = steps;
+    grid.dt = base.time / static_cast<double>(steps);
+    grid.sqrt_dt = std::sqrt(grid.dt);
+    grid.drift_step.resize(static_cast<std::size_t>(steps));
+    grid.sigma_step.resize(static_cast<std::size_t>(steps));
+    double integrated_rate = 0.0;
+    for (int i = 0; i < steps; ++i) {
+        const double mid = (static_cast<double>(i) + 0.5) * grid.dt;
+        const double r = base.rate_schedule ? base.rate_schedule->value(mid) : base.rate;
+        const double q = base.dividend_schedule ? base.dividend_schedule->value(mid) : base.dividend;
+        const double sig = base.vol_schedule ? base.vol_schedule->value(mid) : base.vol;
+        grid.drift_step[static_cast<std::size_t>(i)] = (r - q - 0.5 * sig * sig) * grid.dt;
+        grid.sigma_step[static_cast<std::size_t>(i)] = sig;
+        integrated_rate += r * grid.dt;
+    }
+    grid.discount = std::exp(-integrated_rate);
+}
+
+LevelGrid make_level_grid(const McParams& base, int steps) {
+    LevelGrid grid{};
+    make_level_grid(base, steps, grid);
+    return grid;
+}
+
+// Conditional estimator on one grid: the payoff weighted by the probability that the Brownian
+// bridge survives every step. This is the expectation of run_path over its crossing uniforms and,
+// unlike the indicator, is Lipschitz in the increments, which keeps MLMC level variances small.
+double smoothed_barrier_payoff(const McParams& base, double strike, OptionType opt,
+                               const BarrierSpec& barrier, const LevelGrid& grid, const double* increments) {
+    const bool knock_out = is_knock_out(barrier);
+    // Log distance to the barrier, positive while the path is on the live side.
+    const double side = is_up_barrier(barrier) ? 1.0 : -1.0;
+    const double log_barrier = std::log(barrier.B);
+    double logS = std::log(base.spot);
+    double survival = 1.0;
+    double rebate_pv = 0.0;
+    for (int i = 0; i < grid.steps; ++i) {
+        const auto idx = static_cast<std::size_t>(i);
+        const double gap_prev = side * (log_barrier - logS);
+        logS += grid.drift_step[idx] + grid.sigma_step[idx] * increments[i];
+        const double sigma = grid.sigma_step[idx];
+        const double p_hit =
+            crossing_probability_log(gap_prev, side * (log_barrier - logS), sigma * sigma * grid.dt);
+        if (knock_out && barrier.rebate > 0.0) {
+            const double tau = grid.dt * static_cast<double>(i + 1);
+            rebate_pv += survival * p_hit * barrier.rebate * std::exp(-base.rate * tau);
+        }
+        survival *= (1.0 - p_hit);
+    }
+    const double S_T = std::exp(logS);
+    const double payoff =
+        (opt == OptionType::Call) ? std::max(0.0, S_T - strike) : std::max(0.0, strike - S_T);
+    const double vanilla = grid.discount * payoff;
+    if (knock_out) {
+        return survival * vanilla + rebate_pv;
+    }
+    return (1.0 - survival) * vanilla + survival * barrier.rebate * grid.discount;
 }
 
 struct BarrierMcContext {
@@ -248,13 +324,18 @@ quant::stats::Welford simulate_range(std::uint64_t begin, std::uint64_t end, std
         }
     }
 
+    std::optional<qmc::SobolSequence::Cursor> sobol_cursor;
+    if (ctx.use_qmc) {
+        sobol_cursor.emplace(*worker.sobol, begin);
+    }
+
     pcg64 rng(seed_offset);
     std::normal_distribution<double> normal(0.0, 1.0);
     std::uniform_real_distribution<double> uniform(0.0, 1.0);
 
     for (std::uint64_t idx = begin; idx < end; ++idx) {
         if (ctx.use_qmc) {
-            worker.sobol->generate(idx, workspace.sobol_point.data());
+            sobol_cursor->next(workspace.sobol_point.data());
             for (int j = 0; j < ctx.steps; ++j) {
                 const double eps = std::numeric_limits<double>::min();
                 const double maxu = 1.0 - std::numeric_limits<double>::epsilon();
@@ -319,6 +400,70 @@ quant::stats::Welford simulate_range(std::uint64_t begin, std::uint64_t end, std
     return acc;
 }
 
+// Paths [begin, end) split across threads. Counter streams are keyed by path index so batching
+// does not change the draws; sequential PRNG streams are re-seeded per batch.
+quant::stats::Welford simulate_batch(std::uint64_t begin, std::uint64_t end, std::uint64_t batch,
+                                     const WorkerContext& worker) {
+    const McParams& base = worker.ctx.params;
+    const auto batch_seed = [batch](std::uint64_t seed) {
+        return batch == 0 ? seed : quant::rng::detail::hash_combine(seed, batch);
+    };
+    quant::stats::Welford total;
+
+#ifdef QUANT_HAS_OPENMP
+    const std::uint64_t N = end - begin;
+    const int max_threads = omp_get_max_threads();
+    std::vector<quant::stats::Welford> partial(max_threads);
+    const std::uint64_t counter_seed = base.seed ? base.seed : 0x517cc1b727220a95ULL;
+
+#pragma omp parallel
+    {
+        const int tid = omp_get_thread_num();
+        const int nthreads = omp_get_num_threads();
+        const std::uint64_t first = begin + (tid * N) / nthreads;
+        const std::uint64_t last = begin + ((tid + 1) * N) / nthreads;
+        const std::uint64_t seed_offset =
+            (base.rng == quant::rng::Mode::Counter)
+                ? counter_seed
+                : batch_seed(base.seed + 0x517cc1b727220a95ULL * static_cast<std::uint64_t>(tid + 1));
+        partial[tid] = simulate_range(first, last, seed_offset, worker);
+    }
+
+    for (const auto& part : partial) {
+        total.merge(part);
+    }
+#else
+    const std::uint64_t seed = base.seed ? base.seed : 0x517cc1b727220a95ULL;
+    const std::uint64_t seed_offset = (base.rng == quant::rng::Mode::Counter) ? seed : batch_seed(seed);
+    total = simulate_range(begin, end, seed_offset, worker);
+#endif
+
+    return total;
+}
+
+McStatistic simulate_replicates(const BarrierMcContext& ctx, int sobol_dim, int replicates) {
+    const McParams& p = ctx.params;
+    const std::uint64_t seed = p.seed ? p.seed : 0x517cc1b727220a95ULL;
+    const auto sequences =
+        detail::replicate_sequences(static_cast<std::size_t>(sobol_dim), p.qmc, seed, replicates);
+
+    const auto partial =
+        detail::run_replicates(p.num_paths, replicates, [&](int r, std::uint64_t begin, std::uint64_t end) {
+            const WorkerContext worker{ctx, sequences[static_cast<std::size_t>(r)].get(), sobol_dim};
+            return simulate_range(begin, end, seed, worker);
+        });
+
+    quant::stats::Welford replicate_means;
+    for (const auto& chunks : partial) {
+        quant::stats::Welford replicate;
+        for (const auto& chunk : chunks) {
+            replicate.merge(chunk);
+        }
+        replicate_means.add(replicate.mean);
+    }
+    return detail::summarize_replicates(replicate_means);
+}
+
 } // namespace
 
 bool control_variate_enabled(bool request, const BarrierSpec& spec) {
@@ -335,33 +480,22 @@ McResult price_barrier_option(const McParams& base, double strike, OptionType op
     if (base.num_paths == 0) {
         return McResult{McStatistic{0.0, 0.0, 0.0, 0.0}};
     }
-    if (strike <= 0.0) {
-        throw std::invalid_argument("Strike must be positive");
-    }
-    if (barrier.B <= 0.0) {
-        throw std::invalid_argument("Barrier level must be positive");
-    }
-    if (base.spot <= 0.0) {
-        throw std::invalid_argument("Spot must be positive");
-    }
-
-    const bool knocked = barrier_triggered(barrier, base.spot);
-    if (knocked) {
-        if (is_knock_out(barrier)) {
-            const double value = barrier.rebate;
-            return McResult{McStatistic{value, 0.0, value, value}};
-        }
-        const double vanilla =
-            (opt == OptionType::Call)
-                ? ::quant::bs::call_price(base.spot, strike, base.rate, base.dividend, base.vol, base.time)
-                : ::quant::bs::put_price(base.spot, strike, base.rate, base.dividend, base.vol, base.time);
-        return McResult{McStatistic{vanilla, 0.0, vanilla, vanilla}};
+    validate_inputs(base, strike, barrier);
+    if (const auto value = value_at_inception(base, strike, opt, barrier)) {
+        return McResult{McStatistic{*value, 0.0, *value, *value}};
     }
 
     const int steps = std::max(1, base.num_steps);
     const bool use_qmc = base.qmc != McParams::Qmc::None;
-    const bool scrambled = base.qmc == McParams::Qmc::SobolScrambled;
+    const bool scrambled = use_qmc && base.qmc != McParams::Qmc::Sobol;
     const bool use_bridge = (base.bridge == McParams::Bridge::BrownianBridge);
+    const int replicates = std::max(1, base.qmc_replicates);
+    if (replicates > 1 && !scrambled) {
+        throw std::invalid_argument("qmc_replicates > 1 requires a scrambled Sobol sampler");
+    }
+    if (replicates > 1 && base.stopping.enabled()) {
+        throw std::invalid_argument("stopping rule is not supported with qmc_replicates > 1");
+    }
 
     const int dims_per_step = 2; // normal + uniform
     const int sobol_dim = steps * dims_per_step;
@@ -415,45 +549,118 @@ McResult price_barrier_option(const McParams& base, double strike, OptionType op
     ctx.discount = std::exp(-integrated_rate);
     ctx.cv_expectation = base.spot * std::exp(-integrated_div);
 
+    if (replicates > 1) {
+        const auto start = std::chrono::steady_clock::now();
+        const McStatistic estimate = simulate_replicates(ctx, sobol_dim, replicates);
+        return McResult{estimate, base.num_paths,
+                        std::chrono::duration<double>(std::chrono::steady_clock::now() - start).count()};
+    }
+
     std::unique_ptr<qmc::SobolSequence> sobol;
     if (use_qmc) {
-        sobol = std::make_unique<qmc::SobolSequence>(sobol_dim, scrambled, base.seed);
+        sobol = std::make_unique<qmc::SobolSequence>(sobol_dim, detail::sobol_scramble(base.qmc), base.seed);
     }
 
     WorkerContext worker{ctx, sobol.get(), sobol_dim};
 
-    quant::stats::Welford total;
-
-#ifdef QUANT_HAS_OPENMP
-    const std::uint64_t N = base.num_paths;
-    const int max_threads = omp_get_max_threads();
-    std::vector<quant::stats::Welford> partial(max_threads);
-    const std::uint64_t counter_seed = base.seed ? base.seed : 0x517cc1b727220a95ULL;
+    const auto run = quant::stats::run_batches(
+        base.stopping, base.num_paths, [&](std::uint64_t begin, std::uint64_t end, std::uint64_t batch) {
+            return simulate_batch(begin, end, batch, worker);
+        });
+    return McResult{summarize(run.acc), run.paths, run.elapsed_seconds};
+}
 
-#pragma omp parallel
-    {
-        const int tid = omp_get_thread_num();
-        const int nthreads = omp_get_num_threads();
-        const std::uint64_t begin = (tid * N) / nthreads;
-        const std::uint64_t end = ((tid + 1) * N) / nthreads;
-        const std::uint64_t seed_offset =
-            (base.rng == quant::rng::Mode::Counter)
-                ? counter_seed
-                : base.seed + 0x517cc1b727220a95ULL * static_cast<std::uint64_t>(tid + 1);
-        partial[tid] = simulate_range(begin, end, seed_offset, worker);
+mlmc::MlmcResult price_barrier_mlmc(const McParams& base, double strike, OptionType opt,
+                                    const BarrierSpec& barrier, const mlmc::MlmcParams& mlmc_params) {
+    validate_inputs(base, strike, barrier);
+    if (const auto value = value_at_inception(base, strike, opt, barrier)) {
+        return mlmc::MlmcResult{*value, 0.0, 0.0, 0.0, 0.0, true, {}};
     }
 
-    for (const auto& part : partial) {
-        total.merge(part);
+    std::vector<LevelGrid> grids;
+    for (int l = 0; l < mlmc_params.max_levels; ++l) {
+        grids.push_back(make_level_grid(base, mlmc::steps_at_level(mlmc_params, l)));
     }
-#else
-    const std::uint64_t seed_offset = (base.rng == quant::rng::Mode::Counter)
-                                          ? (base.seed ? base.seed : 0x517cc1b727220a95ULL)
-                                          : (base.seed ? base.seed : 0x517cc1b727220a95ULL);
-    total = simulate_range(0, base.num_paths, seed_offset, worker);
-#endif
+    const std::uint64_t seed = base.seed ? base.seed : 0x517cc1b727220a95ULL;
+    const int refinement = mlmc_params.refinement;
+
+    const auto sampler = [&](int level, std::uint64_t begin, std::uint64_t end) {
+        quant::stats::Welford acc;
+        const LevelGrid& fine = grids[static_cast<std::size_t>(level)];
+        const LevelGrid* coarse = (level > 0) ? &grids[static_cast<std::size_t>(level - 1)] : nullptr;
+        const std::uint64_t level_seed =
+            quant::rng::detail::hash_combine(seed, static_cast<std::uint64_t>(level));
+        std::vector<double> fine_increments(static_cast<std::size_t>(fine.steps));
+        std::vector<double> coarse_increments(coarse ? static_cast<std::size_t>(coarse->steps) : 0);
+
+        // Coarse Brownian increments are sums of `refinement` consecutive fine increments.
+        const auto correction = [&]() {
+            double value = smoothed_barrier_payoff(base, strike, opt, barrier, fine, fine_increments.data());
+            if (coarse) {
+                for (int c = 0; c < coarse->steps; ++c) {
+                    double sum = 0.0;
+                    for (int k = 0; k < refinement; ++k) {
+                        sum += fine_increments[static_cast<std::size_t>(c * refinement + k)];
+                    }
+                    coarse_increments[static_cast<std::size_t>(c)] = sum;
+                }
+                value -=
+                    smoothed_barrier_payoff(base, strike, opt, barrier, *coarse, coarse_increments.data());
+            }
+            return value;
+        };
 
-    return McResult{summarize(total)};
+        for (std::uint64_t idx = begin; idx < end; ++idx) {
+            for (int j = 0; j < fine.steps; ++j) {
+                fine_increments[static_cast<std::size_t>(j)] =
+                    fine.sqrt_dt * quant::rng::normal(level_seed, idx, static_cast<std::uint32_t>(j), 0U, 0U);
+            }
+            double sample = correction();
+            if (base.antithetic) {
+                for (double& dw : fine_increments) {
+                    dw = -dw;
+                }
+                sample = 0.5 * (sample + correction());
+            }
+            acc.add(sample);
+        }
+        return acc;
+    };
+
+    return mlmc::run(mlmc_params, sampler);
+}
+
+PathGreeksResult greeks_barrier(const McParams& base, double strike, OptionType opt,
+                                const BarrierSpec& barrier, const GreeksBumps& bumps) {
+    validate_inputs(base, strike, barrier);
+    if (base.rate_schedule || base.dividend_schedule || base.vol_schedule) {
+        throw std::invalid_argument("greeks_barrier does not support term-structure schedules");
+    }
+    const int steps = std::max(1, base.num_steps);
+    PathGreeksParams params{.market = {{base.spot}, {base.vol}, base.rate, base.time},
+                            .normals_per_path = steps,
+                            .num_paths = base.num_paths,
+                            .seed = base.seed,
+                            .antithetic = base.antithetic,
+                            .bumps = bumps};
+    // Each bump reprices on a grid rebuilt from the bumped market, through the same smoothed
+    // estimator as price_barrier_mlmc. Per-thread buffers avoid allocating per evaluation.
+    return path_greeks(params, [=](const PathMarket& m, const double* normals) {
+        thread_local McParams bumped;
+        thread_local LevelGrid grid;
+        thread_local std::vector<double> increments;
+        bumped = base;
+        bumped.spot = m.spots[0];
+        bumped.vol = m.vols[0];
+        bumped.rate = m.rate;
+        bumped.time = m.time;
+        make_level_grid(bumped, steps, grid);
+        increments.resize(static_cast<std::size_t>(steps));
+        for (int i = 0; i < steps; ++i) {
+            increments[static_cast<std::size_t>(i)] = grid.sqrt_dt * normals[i];
+        }
+        return smoothed_barrier_payoff(bumped, strike, opt, barrier, grid, increments.data());
+    });
 }
 
 } // namespace quant::mc
@@ -0,0 +1,119 @@
+/// Internal helpers shared by the Monte Carlo engines (not installed).
+#pragma once
+
+#include <algorithm>
+#include <cmath>
+#include <cstdint>
+#include <memory>
+#include <stdexcept>
+#include <utility>
+#include <vector>
+
+#include "quant/math.hpp"
+#include "quant/mc.hpp"
+#include "quant/qmc/sobol.hpp"
+#include "quant/rng.hpp"
+#include "quant/stats.hpp"
+
+#ifdef QUANT_HAS_OPENMP
+#include <omp.h>
+#endif
+
+namespace quant::mc::detail {
+
+/// Mean, standard error and normal 95% interval of `acc`.
+inline McStatistic summarize(const quant::stats::Welford& acc) {
+    McStatistic stat{};
+    if (acc.count == 0) {
+        return stat;
+    }
+    stat.value = acc.mean;
+    const double variance = acc.variance();
+    if (acc.count > 1 && variance >= 0.0) {
+        const double se = std::sqrt(variance / static_cast<double>(acc.count));
+        const double half_width = quant::math::kZ95 * se;
+        stat.std_error = se;
+        stat.ci_low = stat.value - half_width;
+        stat.ci_high = stat.value + half_width;
+    } else {
+        stat.ci_low = stat.value;
+        stat.ci_high = stat.value;
+    }
+    return stat;
+}
+
+/// Replicate means are i.i.d. under randomized QMC: Student-t interval on R - 1 dof.
+inline McStatistic summarize_replicates(const quant::stats::Welford& replicate_means) {
+    McStatistic stat = summarize(replicate_means);
+    if (replicate_means.count > 1) {
+        const double t =
+            quant::math::student_t_quantile(0.975, static_cast<double>(replicate_means.count - 1));
+        stat.ci_low = stat.value - t * stat.std_error;
+        stat.ci_high = stat.value + t * stat.std_error;
+    }
+    return stat;
+}
+
+inline qmc::SobolSequence::Scramble sobol_scramble(McParams::Qmc mode) {
+    switch (mode) {
+    case McParams::Qmc::SobolScrambled:
+        return qmc::SobolSequence::Scramble::DigitalShift;
+    case McParams::Qmc::SobolOwen:
+        return qmc::SobolSequence::Scramble::Owen;
+    default:
+        return qmc::SobolSequence::Scramble::None;
+    }
+}
+
+/// One independently scrambled sequence per replicate, seeded from `seed` and the replicate index.
+inline std::vector<std::unique_ptr<qmc::SobolSequence>>
+replicate_sequences(std::size_t dimension, McParams::Qmc mode, std::uint64_t seed, int replicates) {
+    std::vector<std::unique_ptr<qmc::SobolSequence>> sequences;
+    sequences.reserve(static_cast<std::size_t>(replicates));
+    for (int r = 0; r < replicates; ++r) {
+        sequences.push_back(std::make_unique<qmc::SobolSequence>(
+            dimension, sobol_scramble(mode),
+            quant::rng::detail::hash_combine(seed, static_cast<std::uint64_t>(r))));
+    }
+    return sequences;
+}
+
+/// Split `num_paths` across `replicates` and run `simulate(replicate, begin, end)` over each
+/// replicate's path indices [0, size). The first num_paths % replicates replicates take one extra
+/// path, so every path is used. Replicates are split into chunks so that few replicates still
+/// occupy every thread; the result is indexed [replicate][chunk] and does not depend on the
+/// schedule. Throws std::invalid_argument when num_paths < replicates.
+template <typename Simulate>
+auto run_replicates(std::uint64_t num_paths, int replicates, Simulate&& simulate)
+    -> std::vector<std::vector<decltype(simulate(0, std::uint64_t{}, std::uint64_t{}))>> {
+    using Partial = decltype(simulate(0, std::uint64_t{}, std::uint64_t{}));
+    const auto count = static_cast<std::uint64_t>(replicates);
+    if (num_paths < count) {
+        throw std::invalid_argument("num_paths must be at least qmc_replicates");
+    }
+    const std::uint64_t base_size = num_paths / count;
+    const std::uint64_t remainder = num_paths % count;
+
+    int chunks = 1;
+#ifdef QUANT_HAS_OPENMP
+    chunks = std::max(1, (omp_get_max_threads() + replicates - 1) / replicates);
+#endif
+    std::vector<std::vector<Partial>> partial(static_cast<std::size_t>(replicates),
+                                              std::vector<Partial>(static_cast<std::size_t>(chunks)));
+    const std::int64_t tasks = static_cast<std::int64_t>(replicates) * chunks;
+
+#ifdef QUANT_HAS_OPENMP
+#pragma omp parallel for schedule(dynamic)
+#endif
+    for (std::int64_t task = 0; task < tasks; ++task) {
+        const auto r = static_cast<std::uint64_t>(task / chunks);
+        const auto c = static_cast<std::uint64_t>(task % chunks);
+        const std::uint64_t size = base_size + (r < remainder ? 1 : 0);
+        const std::uint64_t begin = (c * size) / static_cast<std::uint64_t>(chunks);
+        const std::uint64_t end = ((c + 1) * size) / static_cast<std::uint64_t>(chunks);
+        partial[r][c] = simulate(static_cast<int>(r), begin, end);
+    }
+    return partial;
+}
+
+} // namespace quant::mc::detail
@@ -0,0 +1,204 @@
+#include "quant/mc_greeks.hpp"
+
+#include "mc_detail.hpp"
+
+#include "quant/math.hpp"
+#include "quant/rng.hpp"
+#include "quant/stats.hpp"
+
+#include <algorithm>
+#include <cmath>
+#include <stdexcept>
+#include <vector>
+
+#ifdef QUANT_HAS_OPENMP
+#include <omp.h>
+#endif
+
+namespace quant::mc {
+
+namespace {
+
+using detail::summarize;
+
+struct PathGreekAccumulators {
+    quant::stats::Welford price;
+    std::vector<quant::stats::Welford> delta;
+    std::vector<quant::stats::Welford> gamma;
+    std::vector<quant::stats::Welford> vega;
+    quant::stats::Welford rho;
+    quant::stats::Welford theta;
+
+    explicit PathGreekAccumulators(std::size_t assets = 0) : delta(assets), gamma(assets), vega(assets) {}
+
+    void merge(const PathGreekAccumulators& other) {
+        price.merge(other.price);
+        for (std::size_t i = 0; i < other.delta.size(); ++i) {
+            delta[i].merge(other.delta[i]);
+            gamma[i].merge(other.gamma[i]);
+            vega[i].merge(other.vega[i]);
+        }
+        rho.merge(other.rho);
+        theta.merge(other.theta);
+    }
+};
+
+// Bump widths actually applied, shared by every path.
+struct BumpPlan {
+    std::vector<double> spot_up;
+    std::vector<double> spot_down;
+    std::vector<double> vol_up;
+    std::vector<double> vol_down;
+    double rate_up;
+    double rate_down;
+    double time_down;
+};
+
+BumpPlan make_plan(const PathGreeksParams& params) {
+    const PathMarket& m = params.market;
+    const GreeksBumps& b = params.bumps;
+    BumpPlan plan{};
+    for (std::size_t i = 0; i < m.spots.size(); ++i) {
+        plan.spot_up.push_back(m.spots[i] * (1.0 + b.spot_rel));
+        plan.spot_down.push_back(m.spots[i] * (1.0 - b.spot_rel));
+        plan.vol_up.push_back(m.vols[i] + b.vol_abs);
+        plan.vol_down.push_back(std::max(0.0, m.vols[i] - b.vol_abs));
+    }
+    plan.rate_up = m.rate + b.rate_abs;
+    plan.rate_down = m.rate - b.rate_abs;
+    plan.time_down = m.time - std::min(b.time_abs, 0.5 * m.time);
+    return plan;
+}
+
+PathGreekAccumulators simulate_range(std::uint64_t begin, std::uint64_t end, std::uint64_t seed,
+                                     const PathGreeksParams& params, const BumpPlan& plan,
+                                     const PathPayoff& payoff) {
+    const std::size_t assets = params.market.spots.size();
+    PathGreekAccumulators acc(assets);
+    const auto dim = static_cast<std::size_t>(params.normals_per_path);
+    std::vector<double> normals(dim);
+    std::vector<double> normals_antithetic(dim);
+    PathMarket market = params.market;
+
+    // Payoff at the current `market`, averaged over the antithetic pair.
+    const auto value = [&] {
+        const double v = payoff(market, normals.data());
+        return params.antithetic ? 0.5 * (v + payoff(market, normals_antithetic.data())) : v;
+    };
+
+    for (std::uint64_t idx = begin; idx < end; ++idx) {
+        for (std::size_t j = 0; j < dim; ++j) {
+            normals[j] = quant::rng::normal(seed, idx, static_cast<std::uint32_t>(j), 0U, 0U);
+            normals_antithetic[j] = -normals[j];
+        }
+        const double base = value();
+        acc.price.add(base);
+
+        for (std::size_t i = 0; i < assets; ++i) {
+            const double spot = market.spots[i];
+            market.spots[i] = plan.spot_up[i];
+            const double up = value();
+            market.spots[i] = plan.spot_down[i];
+            const double down = value();
+            market.spots[i] = spot;
+            const double h = 0.5 * (plan.spot_up[i] - plan.spot_down[i]);
+            acc.delta[i].add((up - down) / (2.0 * h));
+            acc.gamma[i].add((up - 2.0 * base + down) / (h * h));
+
+            const double vol = market.vols[i];
+            market.vols[i] = plan.vol_up[i];
+            const double vol_up = value();
+            market.vols[i] = plan.vol_down[i];
+            const double vol_down = value();
+            market.vols[i] = vol;
+            acc.vega[i].add((vol_up - vol_down) / (plan.vol_up[i] - plan.vol_down[i]));
+        }
+
+        const double rate = market.rate;
+        market.rate = plan.rate_up;
+        const double rate_up = value();
+        market.rate = plan.rate_down;
+        const double rate_down = value();
+        market.rate = rate;
+        acc.rho.add((rate_up - rate_down) / (plan.rate_up - plan.rate_down));
+
+        if (plan.time_down < market.time) {
+            const double time = market.time;
+            market.time = plan.time_down;
+            const double earlier = value();
+            market.time = time;
+            acc.theta.add((earlier - base) / (time - plan.time_down));
+        } else {
+            acc.theta.add(0.0);
+        }
+    }
+    return acc;
+}
+
+} // namespace
+
+PathGreeksResult path_greeks(const PathGreeksParams& params, const PathPayoff& payoff) {
+    const PathMarket& m = params.market;
+    const std::size_t assets = m.spots.size();
+    if (assets == 0 || m.vols.size() != assets) {
+        throw std::invalid_argument("path_greeks: spots and vols must be non-empty and equal length");
+    }
+    for (std::size_t i = 0; i < assets; ++i) {
+        if (!(m.spots[i] > 0.0) || !(m.vols[i] >= 0.0)) {
+            throw std::invalid_argument("path_greeks: spots must be positive and vols non-negative");
+        }
+    }
+    if (!(m.time > 0.0)) {
+        throw std::invalid_argument("path_greeks: time must be positive");
+    }
+    if (params.normals_per_path < 1) {
+        throw std::invalid_argument("path_greeks: normals_per_path must be >= 1");
+    }
+    const GreeksBumps& b = params.bumps;
+    if (!(b.spot_rel > 0.0 && b.spot_rel < 1.0) || !(b.vol_abs > 0.0) || !(b.rate_abs > 0.0) ||
+        !(b.time_abs > 0.0)) {
+        throw std::invalid_argument("path_greeks: bumps must be positive (spot_rel < 1)");
+    }
+    if (!payoff) {
+        throw std::invalid_argument("path_greeks: payoff is empty");
+    }
+
+    const BumpPlan plan = make_plan(params);
+    const std::uint64_t seed = params.seed ? params.seed : 0x517cc1b727220a95ULL;
+    PathGreekAccumulators totals(assets);
+
+#ifdef QUANT_HAS_OPENMP
+    const std::uint64_t N = params.num_paths;
+    const int max_threads = omp_get_max_threads();
+    std::vector<PathGreekAccumulators> partial(static_cast<std::size_t>(max_threads),
+                                               PathGreekAccumulators(assets));
+
+#pragma omp parallel
+    {
+        const int tid = omp_get_thread_num();
+        const int nthreads = omp_get_num_threads();
+        const std::uint64_t begin = (tid * N) / nthreads;
+        const std::uint64_t end = ((tid + 1) * N) / nthreads;
+        partial[static_cast<std::size_t>(tid)] = simulate_range(begin, end, seed, params, plan, payoff);
+    }
+
+    for (const auto& part : partial) {
+        totals.merge(part);
+    }
+#else
+    totals = simulate_range(0, params.num_paths, seed, params, plan, payoff);
+#endif
+
+    PathGreeksResult result{};
+    result.price = summarize(totals.price);
+    for (std::size_t i = 0; i < assets; ++i) {
+        result.delta.push_back(summarize(totals.delta[i]));
+        result.gamma.push_back(summarize(totals.gamma[i]));
+        result.vega.push_back(summarize(totals.vega[i]));
+    }
+    result.rho = summarize(totals.rho);
+    result.theta = summarize(totals.theta);
+    return result;
+}
+
+} // namespace quant::mc
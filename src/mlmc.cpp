@@ -0,0 +1,206 @@
+#include "quant/mlmc.hpp"
+
+#include <algorithm>
+#include <chrono>
+#include <cmath>
+#include <numbers>
+#include <stdexcept>
+#include <vector>
+
+#ifdef QUANT_HAS_OPENMP
+#include <omp.h>
+#endif
+
+namespace quant::mlmc {
+
+namespace {
+
+constexpr int kMaxSteps = 1 << 20;
+
+quant::stats::Welford sample_level(const LevelSampler& sampler, int level, std::uint64_t begin,
+                                   std::uint64_t end) {
+    quant::stats::Welford total;
+    if (begin >= end) {
+        return total;
+    }
+#ifdef QUANT_HAS_OPENMP
+    const std::uint64_t N = end - begin;
+    const int max_threads = omp_get_max_threads();
+    std::vector<quant::stats::Welford> partial(max_threads);
+
+#pragma omp parallel
+    {
+        const int tid = omp_get_thread_num();
+        const int nthreads = omp_get_num_threads();
+        const std::uint64_t first = begin + (tid * N) / nthreads;
+        const std::uint64_t last = begin + ((tid + 1) * N) / nthreads;
+        if (first < last) {
+            partial[tid] = sampler(level, first, last);
+        }
+    }
+
+    for (const auto& part : partial) {
+        total.merge(part);
+    }
+#else
+    total = sampler(level, begin, end);
+#endif
+    return total;
+}
+
+// Least-squares decay rate r in |y_l| ~ M^{-r l} over levels >= 1, floored at 0.5.
+double decay_rate(const std::vector<double>& values, double refinement, double fallback) {
+    double n = 0.0;
+    double sx = 0.0;
+    double sy = 0.0;
+    double sxx = 0.0;
+    double sxy = 0.0;
+    for (std::size_t l = 1; l < values.size(); ++l) {
+        if (!(values[l] > 0.0)) {
+            continue;
+        }
+        const double x = static_cast<double>(l);
+        const double y = -std::log(values[l]) / std::log(refinement);
+        n += 1.0;
+        sx += x;
+        sy += y;
+        sxx += x * x;
+        sxy += x * y;
+    }
+    const double denom = n * sxx - sx * sx;
+    if (n < 2.0 || denom <= 0.0) {
+        return fallback;
+    }
+    return std::max(0.5, (n * sxy - sx * sy) / denom);
+}
+
+} // namespace
+
+int steps_at_level(const MlmcParams& params, int level) {
+    long long steps = params.base_steps;
+    for (int l = 0; l < level; ++l) {
+        steps *= params.refinement;
+        if (steps > kMaxSteps) {
+            throw std::invalid_argument("MLMC level exceeds the maximum number of time steps");
+        }
+    }
+    return static_cast<int>(steps);
+}
+
+MlmcResult run(const MlmcParams& params, const LevelSampler& sampler) {
+    if (!(params.target_rmse > 0.0) || !std::isfinite(params.target_rmse)) {
+        throw std::invalid_argument("target_rmse must be positive");
+    }
+    if (params.base_steps < 1 || params.refinement < 2) {
+        throw std::invalid_argument("base_steps must be >= 1 and refinement >= 2");
+    }
+    if (params.min_levels < 2 || params.max_levels < params.min_levels) {
+        throw std::invalid_argument("MLMC requires 2 <= min_levels <= max_levels");
+    }
+    if (params.pilot_paths < 2) {
+        throw std::invalid_argument("pilot_paths must be at least 2");
+    }
+    steps_at_level(params, params.max_levels - 1);
+
+    const auto start = std::chrono::steady_clock::now();
+    const double M = static_cast<double>(params.refinement);
+    const double eps = params.target_rmse;
+    const double variance_target = 0.5 * eps * eps;
+    const double bias_target = eps / std::numbers::sqrt2;
+
+    const auto level_cost = [&](int l) {
+        return static_cast<double>(steps_at_level(params, l)) +
+               (l > 0 ? static_cast<double>(steps_at_level(params, l - 1)) : 0.0);
+    };
+
+    std::vector<quant::stats::Welford> acc(static_cast<std::size_t>(params.min_levels));
+    std::vector<std::uint64_t> extra(acc.size(), params.pilot_paths);
+    bool converged = false;
+    double bias = 0.0;
+
+    while (true) {
+        for (std::size_t l = 0; l < acc.size(); ++l) {
+            if (extra[l] > 0) {
+                const std::uint64_t begin = acc[l].count;
+                acc[l].merge(sample_level(sampler, static_cast<int>(l), begin, begin + extra[l]));
+                extra[l] = 0;
+            }
+        }
+
+        const std::size_t levels = acc.size();
+        std::vector<double> abs_mean(levels);
+        std::vector<double> variance(levels);
+        for (std::size_t l = 0; l < levels; ++l) {
+            abs_mean[l] = std::abs(acc[l].mean);
+            variance[l] = acc[l].variance();
+        }
+        const double alpha = decay_rate(abs_mean, M, 1.0);
+        const double beta = decay_rate(variance, M, 1.0);
+        // Noisy variances on sparsely sampled fine levels are floored by extrapolation (Giles 2015).
+        for (std::size_t l = 2; l < levels; ++l) {
+            variance[l] = std::max(variance[l], 0.5 * variance[l - 1] / std::pow(M, beta));
+        }
+
+        const auto update_extra = [&](const std::vector<double>& v) {
+            double sum_vc = 0.0;
+            for (std::size_t l = 0; l < v.size(); ++l) {
+                sum_vc += std::sqrt(v[l] * level_cost(static_cast<int>(l)));
+            }
+            bool done = true;
+            for (std::size_t l = 0; l < v.size(); ++l) {
+                const double optimal =
+                    std::ceil(std::sqrt(v[l] / level_cost(static_cast<int>(l))) * sum_vc / variance_target);
+                const auto target = static_cast<std::uint64_t>(std::max(0.0, optimal));
+                extra[l] = (target > acc[l].count) ? target - acc[l].count : 0;
+                done = done && static_cast<double>(extra[l]) <= 0.01 * static_cast<double>(acc[l].count);
+            }
+            return done;
+        };
+
+        if (!update_extra(variance)) {
+            continue;
+        }
+
+        // Extrapolated remaining bias from the (up to) three finest corrections.
+        const std::size_t L = levels - 1;
+        bias = 0.0;
+        for (std::size_t k = 0; k <= std::min<std::size_t>(2, L - 1); ++k) {
+            bias = std::max(bias, abs_mean[L - k] * std::pow(M, -alpha * static_cast<double>(k)));
+        }
+        bias /= (std::pow(M, alpha) - 1.0);
+        if (bias <= bias_target) {
+            converged = true;
+            break;
+        }
+        if (static_cast<int>(levels) >= params.max_levels) {
+            break;
+        }
+
+        acc.emplace_back();
+        extra.push_back(0);
+        variance.push_back(variance[L] / std::pow(M, beta));
+        update_extra(variance);
+        extra.back() = std::max(extra.back(), params.pilot_paths);
+    }
+
+    MlmcResult result{};
+    result.converged = converged;
+    result.bias_estimate = bias;
+    double sampling_variance = 0.0;
+    for (std::size_t l = 0; l < acc.size(); ++l) {
+        const int level = static_cast<int>(l);
+        LevelStats stats{steps_at_level(params, level), acc[l].count, acc[l].mean, acc[l].variance(),
+                         level_cost(level)};
+        result.value += stats.mean;
+        result.total_cost += static_cast<double>(stats.paths) * stats.cost;
+        if (stats.paths > 0) {
+            sampling_variance += stats.variance / static_cast<double>(stats.paths);
+        }
+        result.levels.push_back(stats);
+    }
+    result.std_error = std::sqrt(sampling_variance);
+    result.elapsed_seconds = std::chrono::duration<double>(std::chrono::steady_clock::now() - start).count();
+    return result;
+}
+
+} // namespace quant::mlmc
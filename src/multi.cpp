@@ -1,10 +1,19 @@
 #include "quant/multi.hpp"
 #include <algorithm>
 #include <cmath>
+#include <limits>
+#include <memory>
+#include <numeric>
+#include <optional>
 #include <random>
 #include <stdexcept>
 #include <vector>
 
+#include "quant/black_scholes.hpp"
+#include "quant/math.hpp"
+#include "quant/qmc/brownian_bridge.hpp"
+#include "quant/qmc/sobol.hpp"
+#include "quant/rng.hpp"
 #include "quant/stats.hpp"
 
 #include <pcg_random.hpp>
@@ -34,11 +43,12 @@ std::vector<double> cholesky_lower(const std::vector<double>& corr, std::size_t
     return L;
 }
 
-double payoff_european_call(double strike, double basket) { return std::max(0.0, basket - strike); }
-
-} // namespace
+double payoff(quant::OptionType type, double strike, double basket) {
+    return (type == quant::OptionType::Call) ? std::max(0.0, basket - strike)
+                                             : std::max(0.0, strike - basket);
+}
 
-McStat basket_european_call_mc(const BasketMcParams& p) {
+void validate_basket(const BasketMcParams& p) {
     const std::size_t n = p.spots.size();
     if (n == 0 || p.vols.size() != n || p.dividends.size() != n || p.weights.size() != n) {
         throw std::invalid_argument("BasketMcParams: dimension mismatch");
@@ -46,56 +56,270 @@ McStat basket_european_call_mc(const BasketMcParams& p) {
     if (p.corr.size() != n * n) {
         throw std::invalid_argument("BasketMcParams: corr size mismatch");
     }
+    if (p.num_steps < 1) {
+        throw std::invalid_argument("BasketMcParams: num_steps must be positive");
+    }
+    if (p.use_geometric_cv &&
+        std::any_of(p.weights.begin(), p.weights.end(), [](double w) { return !(w > 0.0); })) {
+        throw std::invalid_argument("BasketMcParams: geometric control variate needs positive weights");
+    }
+}
 
-    auto L = cholesky_lower(p.corr, n);
-    pcg64 rng(p.seed ? p.seed : 0xCAFEBABEULL);
-    std::normal_distribution<double> normal(0.0, 1.0);
+// Paths per parallel work item. Tiles are fixed in path space and merged in order, so the estimate
+// does not depend on the thread count.
+constexpr std::uint64_t kBasketTilePaths = 1024;
 
-    const double dt = p.time;
-    const double sqrt_dt = std::sqrt(dt);
-    const double disc = std::exp(-p.rate * p.time);
+// Closed-form option on W * G, where log G ~ N(mean, variance) and W is the total weight.
+double geometric_basket_price(quant::OptionType type, double weight_sum, double strike, double mean,
+                              double variance, double disc) {
+    const double k = strike / weight_sum;
+    const double forward = std::exp(mean + 0.5 * variance);
+    if (variance <= 0.0) {
+        return disc * weight_sum * payoff(type, k, forward);
+    }
+    const double sd = std::sqrt(variance);
+    const double d1 = (std::log(forward / k) + 0.5 * variance) / sd;
+    const double d2 = d1 - sd;
+    const double call = forward * quant::bs::normal_cdf(d1) - k * quant::bs::normal_cdf(d2);
+    const double put = k * quant::bs::normal_cdf(-d2) - forward * quant::bs::normal_cdf(-d1);
+    return disc * weight_sum * ((type == quant::OptionType::Call) ? call : put);
+}
 
-    quant::stats::Welford acc;
-    std::vector<double> z(n), y(n);
+// Per-asset log-Euler coefficients and discounting of the basket paths for one market.
+struct BasketTerms {
+    std::vector<double> log_spot;
+    std::vector<double> drift_dt;
+    std::vector<double> vol_sdt;
+    std::vector<double> weight_hat; // w_k / W for the control variate, else zero
+    double weight_sum{0.0};
+    double disc{1.0};
+    double geo_price{0.0}; // closed-form geometric-basket price when use_geometric_cv
+};
 
-    for (std::uint64_t path = 0; path < p.num_paths; ++path) {
+void make_basket_terms(const BasketMcParams& p, const std::vector<double>& spots,
+                       const std::vector<double>& vols, double rate, double time, BasketTerms& terms) {
+    const std::size_t n = spots.size();
+    const std::size_t steps = static_cast<std::size_t>(p.num_steps);
+    const double dt = time / static_cast<double>(steps);
+    terms.log_spot.resize(n);
+    terms.drift_dt.resize(n);
+    terms.vol_sdt.resize(n);
+    terms.weight_hat.resize(n);
+    terms.weight_sum = std::accumulate(p.weights.begin(), p.weights.end(), 0.0);
+    terms.disc = std::exp(-rate * time);
+    for (std::size_t k = 0; k < n; ++k) {
+        terms.log_spot[k] = std::log(spots[k]);
+        terms.drift_dt[k] = (rate - p.dividends[k] - 0.5 * vols[k] * vols[k]) * dt;
+        terms.vol_sdt[k] = vols[k] * std::sqrt(dt);
+        terms.weight_hat[k] = p.use_geometric_cv ? p.weights[k] / terms.weight_sum : 0.0;
+    }
+
+    // log G = sum_k w_k / W log S_k (terminal or date-averaged) is normal. Averaging over the dates
+    // j T / M has mean time T (M + 1) / (2M) and Brownian variance T (M + 1)(2M + 1) / (6 M^2).
+    terms.geo_price = 0.0;
+    if (p.use_geometric_cv) {
+        const bool average = p.average && steps > 1;
+        const double m = static_cast<double>(steps);
+        const double mean_time = average ? time * (m + 1.0) / (2.0 * m) : time;
+        const double var_time = average ? time * (m + 1.0) * (2.0 * m + 1.0) / (6.0 * m * m) : time;
+        double mean = 0.0, variance = 0.0;
         for (std::size_t k = 0; k < n; ++k) {
-            z[k] = normal(rng);
-        }
-        for (std::size_t irow = 0; irow < n; ++irow) {
-            double v = 0.0;
-            for (std::size_t k = 0; k <= irow; ++k) {
-                v += L[irow * n + k] * z[k];
+            mean += terms.weight_hat[k] *
+                    (terms.log_spot[k] + (rate - p.dividends[k] - 0.5 * vols[k] * vols[k]) * mean_time);
+            for (std::size_t l = 0; l < n; ++l) {
+                variance += terms.weight_hat[k] * terms.weight_hat[l] * vols[k] * vols[l] * p.corr[k * n + l];
             }
-            y[irow] = v;
         }
+        terms.geo_price =
+            geometric_basket_price(p.type, terms.weight_sum, p.strike, mean, variance * var_time, terms.disc);
+    }
+}
 
-        double basket = 0.0;
-        for (std::size_t k = 0; k < n; ++k) {
-            const double drift = (p.rate - p.dividends[k] - 0.5 * p.vols[k] * p.vols[k]) * dt;
-            const double S = p.spots[k] * std::exp(drift + p.vols[k] * sqrt_dt * y[k]);
-            basket += p.weights[k] * S;
+// Correlate each date's level-major normals across assets: x[j * n + i] = sum_k L[i][k] z[j * n + k].
+void correlate_levels(const std::vector<double>& L, std::size_t n, std::size_t steps, const double* z,
+                      double* x) {
+    for (std::size_t j = 0; j < steps; ++j) {
+        const double* zj = z + j * n;
+        double* xj = x + j * n;
+        for (std::size_t i = 0; i < n; ++i) {
+            const double* row = L.data() + i * n;
+            double v = 0.0;
+            for (std::size_t k = 0; k <= i; ++k) {
+                v += row[k] * zj[k];
+            }
+            xj[i] = v;
         }
-        double sample = disc * payoff_european_call(p.strike, basket);
+    }
+}
 
-        if (p.antithetic) {
-            double basket_anti = 0.0;
-            for (std::size_t k = 0; k < n; ++k) {
-                const double drift = (p.rate - p.dividends[k] - 0.5 * p.vols[k] * p.vols[k]) * dt;
-                const double S_anti = p.spots[k] * std::exp(drift - p.vols[k] * sqrt_dt * y[k]);
-                basket_anti += p.weights[k] * S_anti;
+// Discounted payoff of one path (with the control-variate correction) from correlated standard
+// increments x, taken with sign +1 or -1 for the antithetic path.
+double basket_sample(const BasketMcParams& p, const BasketTerms& terms, const double* x, double sign) {
+    const std::size_t n = p.spots.size();
+    const std::size_t steps = static_cast<std::size_t>(p.num_steps);
+    const bool average = p.average && steps > 1;
+    const double inv_steps = 1.0 / static_cast<double>(steps);
+    double basket = 0.0, log_geo = 0.0;
+    for (std::size_t k = 0; k < n; ++k) {
+        const double vol = sign * terms.vol_sdt[k];
+        double log_s = terms.log_spot[k];
+        if (!average) {
+            for (std::size_t j = 0; j < steps; ++j) {
+                log_s += terms.drift_dt[k] + vol * x[j * n + k];
             }
-            const double anti_sample = disc * payoff_european_call(p.strike, basket_anti);
-            sample = 0.5 * (sample + anti_sample);
+            basket += p.weights[k] * std::exp(log_s);
+            log_geo += terms.weight_hat[k] * log_s;
+            continue;
+        }
+        double sum_s = 0.0, sum_log = 0.0;
+        for (std::size_t j = 0; j < steps; ++j) {
+            log_s += terms.drift_dt[k] + vol * x[j * n + k];
+            sum_s += std::exp(log_s);
+            sum_log += log_s;
         }
+        basket += p.weights[k] * sum_s * inv_steps;
+        log_geo += terms.weight_hat[k] * sum_log * inv_steps;
+    }
+    double value = terms.disc * payoff(p.type, p.strike, basket);
+    if (p.use_geometric_cv) {
+        value +=
+            terms.geo_price - terms.disc * payoff(p.type, p.strike, terms.weight_sum * std::exp(log_geo));
+    }
+    return value;
+}
 
-        acc.add(sample);
+} // namespace
+
+McStat basket_option_mc(const BasketMcParams& p) {
+    validate_basket(p);
+    const std::size_t n = p.spots.size();
+    const std::size_t steps = static_cast<std::size_t>(p.num_steps);
+    const std::size_t dims = n * steps;
+    const bool use_qmc = p.qmc != Qmc::None;
+    if (use_qmc && dims > quant::qmc::SobolSequence::kMaxSupportedDimension) {
+        throw std::invalid_argument("BasketMcParams: Sobol dimension exceeds supported maximum");
     }
 
-    const double variance = acc.variance();
-    const double se =
-        (acc.count > 0) ? std::sqrt(std::max(0.0, variance / static_cast<double>(acc.count))) : 0.0;
-    return {acc.mean, se};
+    const auto L = cholesky_lower(p.corr, n);
+    const std::uint64_t seed = p.seed ? p.seed : 0xCAFEBABEULL;
+    BasketTerms terms;
+    make_basket_terms(p, p.spots, p.vols, p.rate, p.time, terms);
+
+    std::unique_ptr<quant::qmc::SobolSequence> sobol;
+    if (use_qmc) {
+        sobol = std::make_unique<quant::qmc::SobolSequence>(dims, p.qmc == Qmc::SobolScrambled,
+                                                            p.seed ? p.seed : 0x9E3779B97F4A7C15ULL);
+    }
+    const bool use_bridge = use_qmc && p.use_bridge && steps > 1;
+
+    // Normals are level-major: level j of asset k is z[j * n + k]. Correlating each level across
+    // assets and then building each asset's path from its levels (bridge or time order) gives
+    // correlated Brownian motions, since both maps are linear. The bridge runs on unit time steps,
+    // so either way the increments are standard normal and scale by vol_sdt.
+    const auto run = quant::stats::run_batches(
+        p.stopping, p.num_paths, [&](std::uint64_t begin, std::uint64_t end, std::uint64_t) {
+            const std::uint64_t tiles = (end - begin + kBasketTilePaths - 1) / kBasketTilePaths;
+            std::vector<quant::stats::Welford> partial(tiles);
+            const auto tile_count = static_cast<std::int64_t>(tiles);
+#ifdef QUANT_HAS_OPENMP
+#pragma omp parallel
+#endif
+            {
+                std::vector<double> z(dims), x(dims), level(steps), increments(steps);
+                std::normal_distribution<double> normal(0.0, 1.0);
+                std::optional<quant::qmc::BrownianBridge> bridge;
+                if (use_bridge) {
+                    bridge.emplace(steps, static_cast<double>(steps));
+                }
+#ifdef QUANT_HAS_OPENMP
+#pragma omp for schedule(static)
+#endif
+                for (std::int64_t t = 0; t < tile_count; ++t) {
+                    const std::uint64_t first = begin + static_cast<std::uint64_t>(t) * kBasketTilePaths;
+                    const std::uint64_t last = std::min(end, first + kBasketTilePaths);
+                    std::optional<quant::qmc::SobolSequence::Cursor> cursor;
+                    if (use_qmc) {
+                        cursor.emplace(*sobol, first);
+                    }
+                    quant::stats::Welford acc;
+                    for (std::uint64_t path = first; path < last; ++path) {
+                        if (use_qmc) {
+                            cursor->next(z.data());
+                            for (double& u : z) {
+                                u = quant::math::inverse_normal_cdf(
+                                    std::clamp(u, std::numeric_limits<double>::min(),
+                                               1.0 - std::numeric_limits<double>::epsilon()));
+                            }
+                        } else {
+                            // Per-path stream keyed by the path index.
+                            pcg64 rng(quant::rng::detail::hash_combine(seed, path));
+                            for (double& v : z) {
+                                v = normal(rng);
+                            }
+                            normal.reset();
+                        }
+                        correlate_levels(L, n, steps, z.data(), x.data());
+                        if (bridge) {
+                            for (std::size_t k = 0; k < n; ++k) {
+                                for (std::size_t j = 0; j < steps; ++j) {
+                                    level[j] = x[j * n + k];
+                                }
+                                bridge->transform(level.data(), increments.data());
+                                for (std::size_t j = 0; j < steps; ++j) {
+                                    x[j * n + k] = increments[j];
+                                }
+                            }
+                        }
+                        double value = basket_sample(p, terms, x.data(), 1.0);
+                        if (p.antithetic) {
+                            value = 0.5 * (value + basket_sample(p, terms, x.data(), -1.0));
+                        }
+                        acc.add(value);
+                    }
+                    partial[static_cast<std::size_t>(t)] = acc;
+                }
+            }
+            quant::stats::Welford acc;
+            for (const auto& tile : partial) {
+                acc.merge(tile);
+            }
+            return acc;
+        });
+
+    return {run.acc.mean, run.acc.std_error(), run.paths, run.elapsed_seconds};
+}
+
+McStat basket_european_call_mc(const BasketMcParams& p) {
+    BasketMcParams call = p;
+    call.type = quant::OptionType::Call;
+    return basket_option_mc(call);
+}
+
+quant::mc::PathGreeksResult basket_greeks_mc(const BasketMcParams& p, const quant::mc::GreeksBumps& bumps) {
+    validate_basket(p);
+    if (p.qmc != Qmc::None) {
+        throw std::invalid_argument("basket_greeks_mc: Sobol points are not supported");
+    }
+    const std::size_t n = p.spots.size();
+    const std::size_t steps = static_cast<std::size_t>(p.num_steps);
+    const auto L = cholesky_lower(p.corr, n);
+    const quant::mc::PathGreeksParams params{.market = {p.spots, p.vols, p.rate, p.time},
+                                             .normals_per_path = static_cast<int>(n * steps),
+                                             .num_paths = p.num_paths,
+                                             .seed = p.seed,
+                                             .antithetic = p.antithetic,
+                                             .bumps = bumps};
+    // Each bump rebuilds the path coefficients from the bumped market and prices through the same
+    // payoff as basket_option_mc. Per-thread buffers avoid allocating per evaluation.
+    const auto payoff = [&](const quant::mc::PathMarket& m, const double* z) {
+        thread_local BasketTerms terms;
+        thread_local std::vector<double> x;
+        x.resize(n * steps);
+        make_basket_terms(p, m.spots, m.vols, m.rate, m.time, terms);
+        correlate_levels(L, n, steps, z, x.data());
+        return basket_sample(p, terms, x.data(), 1.0);
+    };
+    return quant::mc::path_greeks(params, payoff);
 }
 
 McStat merton_call_mc(const MertonParams& p) {
@@ -141,7 +365,7 @@ McStat merton_call_mc(const MertonParams& p) {
     const double variance = acc.variance();
     const double se =
         (acc.count > 0) ? std::sqrt(std::max(0.0, variance / static_cast<double>(acc.count))) : 0.0;
-    return {acc.mean, se};
+    return {acc.mean, se, acc.count};
 }
 
 } // namespace quant::multi
@@ -6,7 +6,13 @@
 #include <algorithm>
 #include <cmath>
 #include <limits>
+#include <map>
 #include <stdexcept>
+#include <utility>
+
+#ifdef QUANT_HAS_OPENMP
+#include <omp.h>
+#endif
 
 namespace quant::pde {
 
@@ -14,8 +20,11 @@ namespace {
 
 using SpaceGrid = quant::grid_utils::SpaceGrid;
 using OperatorWorkspace = quant::grid_utils::OperatorWorkspace;
+using quant::grid_utils::interpolate_greeks;
 
-SpaceGrid make_space_grid(const PdeParams& p) {
+// S-space grids reach s_max_mult times the larger of spot and `max_strike`; the stretch anchors
+// at p.strike.
+SpaceGrid make_space_grid(const PdeParams& p, double max_strike) {
     if (p.grid.num_space < 3) {
         throw std::invalid_argument("PDE grid requires at least 3 spatial nodes");
     }
@@ -26,7 +35,7 @@ SpaceGrid make_space_grid(const PdeParams& p) {
     gp.anchor = p.strike;
     if (!p.log_space) {
         gp.lower = 0.0;
-        gp.upper = std::max(p.spot * p.grid.s_max_mult, p.strike * p.grid.s_max_mult);
+        gp.upper = std::max(p.spot * p.grid.s_max_mult, max_strike * p.grid.s_max_mult);
         if (!(gp.upper > gp.lower)) {
             throw std::invalid_argument("Upper bound must exceed lower bound in S-grid");
         }
@@ -87,96 +96,72 @@ void build_system(const PdeParams& p, const SpaceGrid& grid, const std::vector<d
     }
 }
 
-struct InterpResult {
-    double value;
-    double delta;
-    double gamma;
+// One time step with constant coefficients: the explicit stencil of the theta-scheme applied to the
+// current values, then a solve with the factored implicit matrix. Boundary rows are filled per step.
+struct BatchStepper {
+    double dt;
+    std::vector<double> explicit_lower; // interior rows only (index i - 1 for node i)
+    std::vector<double> explicit_diag;
+    std::vector<double> explicit_upper;
+    quant::grid_utils::TridiagonalFactor factor;
 };
 
-InterpResult interpolate_greeks(const std::vector<double>& S, const std::vector<double>& V, double S0) {
-    const std::size_t M = S.size();
-    if (M < 3) {
-        throw std::runtime_error("Need at least three spatial nodes to compute Greeks");
-    }
-    auto it = std::lower_bound(S.begin(), S.end(), S0);
-    std::size_t idx = static_cast<std::size_t>(std::distance(S.begin(), it));
-    if (idx == 0) {
-        idx = 1;
-    } else if (idx >= M - 1) {
-        idx = M - 2;
-    }
-    const std::size_t i0 = idx - 1;
-    const std::size_t i1 = idx;
-    const std::size_t i2 = idx + 1;
-
-    const double x0 = S[i0];
-    const double x1 = S[i1];
-    const double x2 = S[i2];
-    const double f0 = V[i0];
-    const double f1 = V[i1];
-    const double f2 = V[i2];
-
-    const double denom0 = (x0 - x1) * (x0 - x2);
-    const double denom1 = (x1 - x0) * (x1 - x2);
-    const double denom2 = (x2 - x0) * (x2 - x1);
-
-    const double L0 = (S0 - x1) * (S0 - x2) / denom0;
-    const double L1 = (S0 - x0) * (S0 - x2) / denom1;
-    const double L2 = (S0 - x0) * (S0 - x1) / denom2;
-
-    const double L0_prime = (2.0 * S0 - x1 - x2) / denom0;
-    const double L1_prime = (2.0 * S0 - x0 - x2) / denom1;
-    const double L2_prime = (2.0 * S0 - x0 - x1) / denom2;
-
-    const double L0_second = 2.0 / denom0;
-    const double L1_second = 2.0 / denom1;
-    const double L2_second = 2.0 / denom2;
-
-    InterpResult out{};
-    out.value = f0 * L0 + f1 * L1 + f2 * L2;
-    out.delta = f0 * L0_prime + f1 * L1_prime + f2 * L2_prime;
-    out.gamma = f0 * L0_second + f1 * L1_second + f2 * L2_second;
-    return out;
+BatchStepper make_batch_stepper(const PdeParams& p, const SpaceGrid& grid, double dt, double theta) {
+    const std::size_t M = grid.spot.size();
+    OperatorWorkspace op;
+    quant::grid_utils::DiffusionCoefficients coeffs{p.vol, p.rate, p.dividend, p.log_space};
+    quant::grid_utils::assemble_operator(grid, coeffs, dt, theta, std::vector<double>(M, 0.0), op);
+
+    // Implicit rows are I - theta dt L, so the explicit part (1 - theta) dt L follows from them.
+    const double k = (1.0 - theta) / theta;
+    BatchStepper stepper{dt, {}, {}, {}, {}};
+    for (std::size_t i = 1; i + 1 < M; ++i) {
+        stepper.explicit_lower.push_back(-k * op.lower[i - 1]);
+        stepper.explicit_diag.push_back(1.0 + k * (1.0 - op.diag[i]));
+        stepper.explicit_upper.push_back(-k * op.upper[i]);
+    }
+
+    op.diag[0] = 1.0;
+    op.upper[0] = 0.0;
+    op.diag[M - 1] = 1.0;
+    const bool neumann = p.upper_boundary == PdeParams::UpperBoundary::Neumann && p.log_space;
+    op.lower[M - 2] = neumann ? -1.0 : 0.0;
+    stepper.factor = quant::grid_utils::factor_tridiagonal(op.lower, op.diag, op.upper);
+    return stepper;
+}
+
+// Advance `V` by one step to remaining time `tau`; `rhs` is scratch of the same size.
+void batch_step(const PdeParams& p, const SpaceGrid& grid, const BatchStepper& stepper, double strike,
+                OptionType type, double tau, std::vector<double>& V, std::vector<double>& rhs) {
+    const std::size_t M = V.size();
+    for (std::size_t i = 1; i + 1 < M; ++i) {
+        rhs[i] = stepper.explicit_lower[i - 1] * V[i - 1] + stepper.explicit_diag[i - 1] * V[i] +
+                 stepper.explicit_upper[i - 1] * V[i + 1];
+    }
+    const quant::grid_utils::PayoffBoundaryParams bc{type, strike, p.rate, p.dividend, tau};
+    rhs[0] = quant::grid_utils::dirichlet_boundary(bc, grid.spot.front(), true);
+    if (p.upper_boundary == PdeParams::UpperBoundary::Neumann && p.log_space) {
+        const double dx = grid.coordinate.back() - grid.coordinate[M - 2];
+        const double dVdS = (type == OptionType::Call) ? std::exp(-p.dividend * tau) : 0.0;
+        rhs[M - 1] = dx * grid.spot.back() * dVdS;
+    } else {
+        rhs[M - 1] = quant::grid_utils::dirichlet_boundary(bc, grid.spot.back(), false);
+    }
+    quant::grid_utils::solve_factored(stepper.factor, rhs);
+    V.swap(rhs);
 }
 
 } // namespace
 
 std::vector<double> solve_tridiagonal(const std::vector<double>& a, const std::vector<double>& b,
                                       const std::vector<double>& c, const std::vector<double>& d) {
-    const int n = static_cast<int>(b.size());
-    if (static_cast<int>(a.size()) != n - 1 || static_cast<int>(c.size()) != n - 1 ||
-        static_cast<int>(d.size()) != n) {
+    const std::size_t n = b.size();
+    if (n < 2 || a.size() != n - 1 || c.size() != n - 1 || d.size() != n) {
         throw std::invalid_argument("Tridiagonal sizes mismatch");
     }
-    std::vector<double> cp(c);
-    std::vector<double> dp(d);
-    std::vector<double> x(n);
-
-    double beta = b[0];
-    if (std::abs(beta) < 1e-14) {
-        throw std::runtime_error("Singular tridiagonal matrix");
-    }
-    cp[0] = c[0] / beta;
-    dp[0] = d[0] / beta;
-    for (int i = 1; i < n - 1; ++i) {
-        beta = b[i] - a[i - 1] * cp[i - 1];
-        if (std::abs(beta) < 1e-14) {
-            throw std::runtime_error("Near-singular tridiagonal (pivot)");
-        }
-        cp[i] = c[i] / beta;
-        dp[i] = (d[i] - a[i - 1] * dp[i - 1]) / beta;
-    }
-    beta = b[n - 1] - a[n - 2] * cp[n - 2];
-    if (std::abs(beta) < 1e-14) {
-        throw std::runtime_error("Near-singular tridiagonal (last pivot)");
-    }
-    dp[n - 1] = (d[n - 1] - a[n - 2] * dp[n - 2]) / beta;
-
-    x[n - 1] = dp[n - 1];
-    for (int i = n - 2; i >= 0; --i) {
-        x[i] = dp[i] - cp[i] * x[i + 1];
-    }
-    return x;
+    OperatorWorkspace op{a, b, c, d, {}};
+    quant::grid_utils::solve_in_place(op);
+    return std::move(op.rhs);
 }
 
 PdeResult price_crank_nicolson(const PdeParams& p) {
@@ -184,7 +169,7 @@ PdeResult price_crank_nicolson(const PdeParams& p) {
         throw std::invalid_argument("PDE grid must have positive time steps and maturity");
     }
 
-    SpaceGrid grid = make_space_grid(p);
+    SpaceGrid grid = make_space_grid(p, p.strike);
 
     std::vector<double> V(grid.spot.size());
     for (std::size_t i = 0; i < grid.spot.size(); ++i) {
@@ -196,10 +181,32 @@ PdeResult price_crank_nicolson(const PdeParams& p) {
     }
 
     OperatorWorkspace op;
-    const int M = p.grid.num_space;
     const int N = p.grid.num_time;
     const double dt = p.time / static_cast<double>(N);
 
+    // Constant coefficients give a time-invariant operator: factor it once per step size and reuse
+    // it. Schedules rebuild the system each step and solve it in place in the workspace.
+    const bool constant_coefficients = !p.rate_schedule && !p.dividend_schedule && !p.vol_schedule;
+    std::optional<BatchStepper> half_stepper;
+    std::optional<BatchStepper> full_stepper;
+    if (constant_coefficients) {
+        if (p.use_rannacher) {
+            half_stepper = make_batch_stepper(p, grid, 0.5 * dt, 1.0);
+        }
+        full_stepper = make_batch_stepper(p, grid, dt, 0.5);
+    }
+    std::vector<double> scratch(V.size());
+    const auto advance = [&](const std::optional<BatchStepper>& cached, double step_dt, double theta,
+                             double tau_next) {
+        if (cached) {
+            batch_step(p, grid, *cached, p.strike, p.type, tau_next, V, scratch);
+            return;
+        }
+        build_system(p, grid, V, step_dt, theta, tau_next, op);
+        quant::grid_utils::solve_in_place(op);
+        V.swap(op.rhs);
+    };
+
     std::vector<double> V_prev_for_theta;
     bool capture_theta = p.compute_theta && N > 0;
 
@@ -211,8 +218,7 @@ PdeResult price_crank_nicolson(const PdeParams& p) {
         int half_iters = std::min(2, std::max(0, N) * 2);
         for (int k = 0; k < half_iters; ++k) {
             double tau_next = p.time - (time_elapsed + dt_half);
-            build_system(p, grid, V, dt_half, 1.0, tau_next, op);
-            V = solve_tridiagonal(op.lower, op.diag, op.upper, op.rhs);
+            advance(half_stepper, dt_half, 1.0, tau_next);
             time_elapsed += dt_half;
         }
         start_step = std::min(N, 1);
@@ -227,12 +233,11 @@ PdeResult price_crank_nicolson(const PdeParams& p) {
         if (capture_theta && step == N - 1) {
             V_prev_for_theta = V;
         }
-        build_system(p, grid, V, dt, 0.5, tau_next, op);
-        V = solve_tridiagonal(op.lower, op.diag, op.upper, op.rhs);
+        advance(full_stepper, dt, 0.5, tau_next);
         time_elapsed += dt;
     }
 
-    InterpResult interp = interpolate_greeks(grid.spot, V, p.spot);
+    const auto interp = interpolate_greeks(grid.spot, V, p.spot);
 
     std::optional<double> theta_value;
     if (p.compute_theta && N > 0) {
@@ -243,4 +248,112 @@ PdeResult price_crank_nicolson(const PdeParams& p) {
     return PdeResult{interp.value, interp.delta, interp.gamma, theta_value};
 }
 
+std::vector<PdeResult> price_crank_nicolson_batch(const PdeParams& p,
+                                                  const std::vector<BatchOption>& options) {
+    if (options.empty()) {
+        throw std::invalid_argument("PDE batch requires at least one option");
+    }
+    if (p.grid.num_time <= 0) {
+        throw std::invalid_argument("PDE grid must have positive time steps and maturity");
+    }
+    if (p.rate_schedule || p.dividend_schedule || p.vol_schedule) {
+        throw std::invalid_argument("PDE batch requires constant rate, dividend and volatility");
+    }
+    double max_strike = 0.0;
+    std::vector<double> maturities;
+    for (const auto& option : options) {
+        if (!(option.strike > 0.0) || !std::isfinite(option.strike) || !(option.time > 0.0) ||
+            !std::isfinite(option.time)) {
+            throw std::invalid_argument("PDE batch options require positive strikes and maturities");
+        }
+        max_strike = std::max(max_strike, option.strike);
+        maturities.push_back(option.time);
+    }
+    std::sort(maturities.begin(), maturities.end());
+    maturities.erase(std::unique(maturities.begin(), maturities.end()), maturities.end());
+
+    const SpaceGrid grid = make_space_grid(p, max_strike);
+    const std::size_t M = grid.spot.size();
+
+    // Maturities split [0, T_max] into segments; each gets its share of num_time uniform steps, so a
+    // single maturity reproduces the time grid of price_crank_nicolson.
+    const double T_max = maturities.back();
+    std::vector<int> segment_steps;
+    std::vector<BatchStepper> steppers;
+    double previous = 0.0;
+    for (const double maturity : maturities) {
+        const double length = maturity - previous;
+        const double share = static_cast<double>(p.grid.num_time) * length / T_max;
+        const int steps = std::max(1, static_cast<int>(std::ceil(share - 1e-9)));
+        segment_steps.push_back(steps);
+        steppers.push_back(make_batch_stepper(p, grid, length / steps, 0.5));
+        previous = maturity;
+    }
+    const bool rannacher = p.use_rannacher;
+    const BatchStepper half_step =
+        rannacher ? make_batch_stepper(p, grid, 0.5 * steppers.front().dt, 1.0) : BatchStepper{};
+
+    // Options sharing a terminal payoff share one backward solve; maturities are snapshots of it.
+    std::map<std::pair<double, int>, std::vector<std::size_t>> groups;
+    for (std::size_t i = 0; i < options.size(); ++i) {
+        groups[{options[i].strike, static_cast<int>(options[i].type)}].push_back(i);
+    }
+    std::vector<std::vector<std::size_t>> group_members;
+    for (auto& entry : groups) {
+        group_members.push_back(std::move(entry.second));
+    }
+
+    std::vector<PdeResult> results(options.size());
+    const auto solve_group = [&](const std::vector<std::size_t>& members) {
+        const BatchOption& first = options[members.front()];
+        std::vector<double> V(M);
+        std::vector<double> rhs(M);
+        std::vector<double> V_prev;
+        for (std::size_t i = 0; i < M; ++i) {
+            V[i] = (first.type == OptionType::Call) ? std::max(0.0, grid.spot[i] - first.strike)
+                                                    : std::max(0.0, first.strike - grid.spot[i]);
+        }
+        double tau = 0.0;
+        for (std::size_t k = 0; k < maturities.size(); ++k) {
+            const BatchStepper& stepper = steppers[k];
+            for (int step = 0; step < segment_steps[k]; ++step) {
+                if (p.compute_theta && step == segment_steps[k] - 1) {
+                    V_prev = V;
+                }
+                if (k == 0 && step == 0 && rannacher) {
+                    batch_step(p, grid, half_step, first.strike, first.type, tau + half_step.dt, V, rhs);
+                    batch_step(p, grid, half_step, first.strike, first.type, tau + stepper.dt, V, rhs);
+                } else {
+                    batch_step(p, grid, stepper, first.strike, first.type, tau + stepper.dt, V, rhs);
+                }
+                tau = (step == segment_steps[k] - 1) ? maturities[k] : tau + stepper.dt;
+            }
+            for (const std::size_t index : members) {
+                if (options[index].time != maturities[k]) {
+                    continue;
+                }
+                const auto interp = interpolate_greeks(grid.spot, V, p.spot);
+                std::optional<double> theta;
+                if (p.compute_theta) {
+                    const double prev_price = interpolate_greeks(grid.spot, V_prev, p.spot).value;
+                    theta = (prev_price - interp.value) / stepper.dt;
+                }
+                results[index] = PdeResult{interp.value, interp.delta, interp.gamma, theta};
+            }
+        }
+    };
+
+#ifdef QUANT_HAS_OPENMP
+#pragma omp parallel for schedule(dynamic)
+    for (std::size_t g = 0; g < group_members.size(); ++g) {
+        solve_group(group_members[g]);
+    }
+#else
+    for (const auto& members : group_members) {
+        solve_group(members);
+    }
+#endif
+    return results;
+}
+
 } // namespace quant::pde
@@ -91,13 +91,26 @@ GridResult solve_knockout_grid(const BarrierPdeParams& params, ::quant::OptionTy
         }
     }
 
-    std::vector<double> a(M - 1), b(M), c(M - 1), d(M);
     const double a_coef = 0.5 * sigma2;
     const double b_coef = (r - q - 0.5 * sigma2);
     const double c_coef = -r;
     const double alpha = 0.25 * dt * (2.0 * a_coef / (dx * dx));
     const double beta = 0.25 * dt * (b_coef / dx);
 
+    // Uniform log grid with constant coefficients: the implicit matrix is factored once.
+    std::vector<double> a(M - 1, -alpha + beta);
+    std::vector<double> b(M, 1.0 + 2.0 * alpha - 0.5 * dt * c_coef);
+    std::vector<double> c(M - 1, -alpha - beta);
+    b[0] = 1.0;
+    c[0] = 0.0;
+    b[M - 1] = 1.0;
+    a[M - 2] = 0.0;
+    const auto factor = quant::grid_utils::factor_tridiagonal(a, b, c);
+    const double aa = alpha - beta;
+    const double bb = 1.0 - 2.0 * alpha + 0.5 * dt * c_coef;
+    const double cc = alpha + beta;
+    std::vector<double> d(M);
+
     for (int n = N; n-- > 0;) {
         const double tau = (T - n * dt);
         double lower_bc = 0.0;
@@ -122,23 +135,13 @@ GridResult solve_knockout_grid(const BarrierPdeParams& params, ::quant::OptionTy
         }
 
         for (int i = 1; i < M - 1; ++i) {
-            a[i - 1] = -alpha + beta;
-            b[i] = 1.0 + 2.0 * alpha - 0.5 * dt * c_coef;
-            c[i] = -alpha - beta;
-            const double aa = alpha - beta;
-            const double bb = 1.0 - 2.0 * alpha + 0.5 * dt * c_coef;
-            const double cc = alpha + beta;
             d[i] = aa * V[i - 1] + bb * V[i] + cc * V[i + 1];
         }
-
-        b[0] = 1.0;
         d[0] = lower_bc;
-        c[0] = 0.0;
-        b[M - 1] = 1.0;
         d[M - 1] = upper_bc;
-        a[M - 2] = 0.0;
 
-        V = solve_tridiagonal(a, b, c, d);
+        quant::grid_utils::solve_factored(factor, d);
+        V.swap(d);
     }
     GridResult out{grid.spot, V, x_min, dx};
     return out;
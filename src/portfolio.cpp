@@ -1,11 +1,19 @@
 #include "quant/portfolio.hpp"
 
 #include "quant/black_scholes.hpp"
+#include "quant/rng.hpp"
 
 #include <algorithm>
+#include <array>
 #include <cmath>
+#include <cstdint>
 #include <limits>
 #include <stdexcept>
+#include <utility>
+
+#ifdef QUANT_HAS_OPENMP
+#include <omp.h>
+#endif
 
 namespace quant::portfolio {
 namespace {
@@ -116,6 +124,438 @@ void validate_shock(const MarketShock& shock) {
     }
 }
 
+// Positions per scenario tile. Fixing it (rather than deriving it from the thread count) fixes
+// the summation order of every scenario total.
+constexpr std::size_t kPositionBlock = 1024;
+
+// Column views read by the scenario kernel. Without `group`, every position is in group 0 and the
+// market columns (spot, rate, dividend) are per position. With it, position i belongs to group[i],
+// takes its shock from shocks[scenario * group_count + group[i]] and its market data from the
+// market columns at group[i].
+struct RevaluationBook {
+    std::size_t size;
+    std::size_t group_count;
+    const std::size_t* group;
+    const double* sign;
+    const double* quantity;
+    const double* strike;
+    const double* log_moneyness; // ln(S / K) at the base market
+    const double* volatility;
+    const double* time;
+    const double* base_value;
+    const double* delta; // quantity-weighted base Greeks, read by the Taylor modes
+    const double* gamma;
+    const double* vega;
+    const double* theta;
+    const double* rho;
+    const double* spot;
+    const double* rate;
+    const double* dividend;
+};
+
+// Exact P&L of position i (market row m) under `shock`, with the scalar conventions.
+double repriced_pnl(const RevaluationBook& book, const MarketShock& shock, std::size_t i, std::size_t m) {
+    const VanillaPosition shocked{book.sign[i] > 0.0 ? OptionType::Call : OptionType::Put,
+                                  book.quantity[i],
+                                  book.spot[m] * (1.0 + shock.spot_return),
+                                  book.strike[i],
+                                  book.rate[m] + shock.rate_shift,
+                                  book.dividend[m] + shock.dividend_shift,
+                                  book.volatility[i] + shock.volatility_shift,
+                                  std::max(0.0, book.time[i] - shock.time_elapsed)};
+    return book.quantity[i] * option_price(shocked) - book.base_value[i];
+}
+
+// Branch-free closed-form P&L of position i (market row m) under `shock`, whose log1p spot factor
+// is `log_spot_factor`. Only meaningful when the shocked time and volatility are positive.
+inline double closed_form_pnl(const RevaluationBook& book, const MarketShock& shock, double log_spot_factor,
+                              std::size_t i, std::size_t m) {
+    const double s = book.spot[m] * (1.0 + shock.spot_return);
+    const double r = book.rate[m] + shock.rate_shift;
+    const double q = book.dividend[m] + shock.dividend_shift;
+    const double vol = book.volatility[i] + shock.volatility_shift;
+    const double t = std::max(0.0, book.time[i] - shock.time_elapsed);
+    const double vol_sqrt_t = vol * std::sqrt(t);
+    const double d1 = (book.log_moneyness[i] + log_spot_factor + (r - q + 0.5 * vol * vol) * t) / vol_sqrt_t;
+    const double d2 = d1 - vol_sqrt_t;
+    const double w = book.sign[i];
+    const double price = w * (s * std::exp(-q * t) * quant::bs::normal_cdf(w * d1) -
+                              book.strike[i] * std::exp(-r * t) * quant::bs::normal_cdf(w * d2));
+    return book.quantity[i] * price - book.base_value[i];
+}
+
+// P&L of positions [begin, end) under the scenario's shocks (one per group, with their log1p spot
+// factors), written to pnl[0, end - begin). The loop body is branch-free over the columns;
+// expired or zero-volatility positions are repriced afterwards with the scalar conventions.
+template <bool Grouped>
+void shocked_pnl(const RevaluationBook& book, const MarketShock* shocks, const double* log_spot_factors,
+                 std::size_t begin, std::size_t end, double* pnl) {
+    bool degenerate = false;
+    for (std::size_t i = begin; i < end; ++i) {
+        const std::size_t g = Grouped ? book.group[i] : 0;
+        const std::size_t m = Grouped ? g : i;
+        const MarketShock& shock = shocks[g];
+        const double vol = book.volatility[i] + shock.volatility_shift;
+        const double t = std::max(0.0, book.time[i] - shock.time_elapsed);
+        degenerate |= !(t > 0.0 && vol > 0.0);
+        pnl[i - begin] = closed_form_pnl(book, shock, log_spot_factors[g], i, m);
+    }
+    if (!degenerate) {
+        return;
+    }
+    for (std::size_t i = begin; i < end; ++i) {
+        const std::size_t g = Grouped ? book.group[i] : 0;
+        const std::size_t m = Grouped ? g : i;
+        const MarketShock& shock = shocks[g];
+        const double vol = book.volatility[i] + shock.volatility_shift;
+        const double t = std::max(0.0, book.time[i] - shock.time_elapsed);
+        if (!(t > 0.0 && vol > 0.0)) {
+            pnl[i - begin] = repriced_pnl(book, shock, i, m);
+        }
+    }
+}
+
+// Second-order-in-spot Taylor P&L of positions [begin, end); the dividend sensitivity of a
+// Black-Scholes vanilla is -t S delta.
+template <bool Grouped>
+void taylor_pnl(const RevaluationBook& book, const MarketShock* shocks, std::size_t begin, std::size_t end,
+                double* pnl) {
+    for (std::size_t i = begin; i < end; ++i) {
+        const std::size_t g = Grouped ? book.group[i] : 0;
+        const std::size_t m = Grouped ? g : i;
+        const MarketShock& shock = shocks[g];
+        const double ds = book.spot[m] * shock.spot_return;
+        pnl[i - begin] = book.delta[i] * ds + 0.5 * book.gamma[i] * ds * ds +
+                         book.vega[i] * shock.volatility_shift + book.rho[i] * shock.rate_shift -
+                         book.time[i] * book.spot[m] * book.delta[i] * shock.dividend_shift +
+                         book.theta[i] * shock.time_elapsed;
+    }
+}
+
+// Magnitudes of the leading terms the Taylor expansion drops, quantity-weighted and grouped by the
+// shock monomial they multiply: every second-order cross term, the third-order spot and volatility
+// terms, and second order in time. Time derivatives use V, vega, gamma ~ n(d1) t^(+-1/2), whose log
+// derivative is (d1^2 +- 1) / (2 t). Positions with degenerate Greeks (expired or zero volatility) are
+// always repriced and keep zero coefficients.
+struct TruncationTerms {
+    double spot3;      // |d3V/dS3| / 6 (speed)
+    double spot2_vol;  // |d3V/dS2 dvol| / 2 (zomma)
+    double spot2_time; // |dgamma/dt| / 2
+    double spot_vol;   // |d2V/dS dvol| (vanna)
+    double spot_carry; // bound on |d2V/dS dr| and |d2V/dS dq|
+    double spot_time;  // |d2V/dS dt| (charm)
+    double vol2;       // |d2V/dvol2| / 2 (volga)
+    double vol3;       // |d3V/dvol3| / 6 (ultima)
+    double vol_time;   // |dvega/dt|
+    double time2;      // |dtheta/dt| / 2
+};
+
+std::vector<TruncationTerms> truncation_terms(const RevaluationBook& book) {
+    std::vector<TruncationTerms> terms(book.size, TruncationTerms{});
+    const auto count = static_cast<std::int64_t>(book.size);
+#ifdef QUANT_HAS_OPENMP
+#pragma omp parallel for schedule(static) if (count > 4096)
+#endif
+    for (std::int64_t k = 0; k < count; ++k) {
+        const auto i = static_cast<std::size_t>(k);
+        const std::size_t m = book.group != nullptr ? book.group[i] : i;
+        const double vol = book.volatility[i];
+        const double t = book.time[i];
+        if (!(t > 0.0 && vol > 0.0)) {
+            continue;
+        }
+        const double s = book.spot[m];
+        const double r = book.rate[m];
+        const double q = book.dividend[m];
+        const double sqrt_t = std::sqrt(t);
+        const double vol_sqrt_t = vol * sqrt_t;
+        const double d1 = (book.log_moneyness[i] + (r - q + 0.5 * vol * vol) * t) / vol_sqrt_t;
+        const double d2 = d1 - vol_sqrt_t;
+        const double size = std::abs(book.quantity[i]);
+        const double discount_dividend = std::exp(-q * t);
+        const double density = discount_dividend * quant::bs::normal_pdf(d1);
+        const double gamma = density / (s * vol_sqrt_t);
+        const double vega = s * density * sqrt_t;
+        const double charm =
+            density * std::abs(2.0 * (r - q) * t - d2 * vol_sqrt_t) / (2.0 * t * vol_sqrt_t) +
+            std::abs(q) * discount_dividend;
+        const double decay = (1.0 + d1 * d1) / (2.0 * t);
+        TruncationTerms& term = terms[i];
+        term.spot3 = size * std::abs(gamma / s * (d1 / vol_sqrt_t + 1.0)) / 6.0;
+        term.spot2_vol = size * std::abs(gamma * (d1 * d2 - 1.0) / vol) / 2.0;
+        term.spot2_time = std::abs(book.gamma[i]) * decay / 2.0;
+        term.spot_vol = size * std::abs(density * d2 / vol);
+        term.spot_carry = size * (density * sqrt_t / vol + t * discount_dividend);
+        term.spot_time = size * charm;
+        term.vol2 = size * std::abs(vega * d1 * d2 / vol) / 2.0;
+        const double ultima = vega / (vol * vol) * (d1 * d2 * (1.0 - d1 * d2) + d1 * d1 + d2 * d2);
+        term.vol3 = size * std::abs(ultima) / 6.0;
+        term.vol_time = std::abs(book.vega[i]) * decay;
+        term.time2 = std::abs(book.theta[i]) * decay / 2.0;
+    }
+    return terms;
+}
+
+// Replace the Taylor P&L of cells the expansion cannot represent (degenerate base Greeks, or a
+// shock that expires the position or removes its volatility) and, when `terms` is set, of cells
+// whose error estimate exceeds `tolerance` with the exact P&L, appending their flat indices to
+// `cells`.
+template <bool Grouped>
+void reprice_uncertain(const RevaluationBook& book, const MarketShock* shocks, const double* log_spot_factors,
+                       const TruncationTerms* terms, double tolerance, std::size_t first_cell,
+                       std::size_t begin, std::size_t end, double* pnl, std::vector<std::size_t>& cells) {
+    for (std::size_t i = begin; i < end; ++i) {
+        const std::size_t g = Grouped ? book.group[i] : 0;
+        const std::size_t m = Grouped ? g : i;
+        const MarketShock& shock = shocks[g];
+        const double dt = shock.time_elapsed;
+        const bool closed_form = book.time[i] > dt && book.volatility[i] + shock.volatility_shift > 0.0;
+        bool reprice = !closed_form || !(book.volatility[i] > 0.0);
+        if (!reprice && terms != nullptr) {
+            const TruncationTerms& term = terms[i];
+            const double ds = std::abs(book.spot[m] * shock.spot_return);
+            const double dvol = std::abs(shock.volatility_shift);
+            const double dcarry = std::abs(shock.rate_shift) + std::abs(shock.dividend_shift);
+            const double estimate =
+                ds * ds * (term.spot3 * ds + term.spot2_vol * dvol + term.spot2_time * dt) +
+                ds * (term.spot_vol * dvol + term.spot_carry * dcarry + term.spot_time * dt) +
+                dvol * ((term.vol2 + term.vol3 * dvol) * dvol + term.vol_time * dt) + term.time2 * dt * dt;
+            reprice = !(estimate <= tolerance);
+        }
+        if (reprice) {
+            pnl[i - begin] = closed_form ? closed_form_pnl(book, shock, log_spot_factors[g], i, m)
+                                         : repriced_pnl(book, shock, i, m);
+            cells.push_back(first_cell + i);
+        }
+    }
+}
+
+bool is_identity(const MarketShock& shock) {
+    return shock.spot_return == 0.0 && shock.volatility_shift == 0.0 && shock.rate_shift == 0.0 &&
+           shock.dividend_shift == 0.0 && shock.time_elapsed == 0.0;
+}
+
+// Validate `shocks` against `book` and reprice every scenario.
+ScenarioResult revalue(const RevaluationBook& book, const std::vector<MarketShock>& shocks,
+                       const ScenarioOptions& options) {
+    const Revaluation mode = options.revaluation;
+    if (mode != Revaluation::Full && mode != Revaluation::Taylor && mode != Revaluation::Hybrid) {
+        throw std::invalid_argument("portfolio revaluation must be Full, Taylor or Hybrid");
+    }
+    if (mode == Revaluation::Hybrid && !(std::isfinite(options.tolerance) && options.tolerance >= 0.0)) {
+        throw std::invalid_argument("portfolio hybrid tolerance must be finite and non-negative");
+    }
+    const bool include_position_pnl = options.include_position_pnl;
+    const std::size_t group_count = book.group_count;
+    if (shocks.size() % group_count != 0) {
+        throw std::invalid_argument("portfolio shocks must hold one shock per underlying per scenario");
+    }
+    std::vector<double> min_volatility(group_count, std::numeric_limits<double>::infinity());
+    for (std::size_t i = 0; i < book.size; ++i) {
+        double& group_min = min_volatility[book.group ? book.group[i] : 0];
+        group_min = std::min(group_min, book.volatility[i]);
+    }
+    std::vector<double> log_spot_factors(shocks.size());
+    for (std::size_t k = 0; k < shocks.size(); ++k) {
+        validate_shock(shocks[k]);
+        if (min_volatility[k % group_count] + shocks[k].volatility_shift < 0.0) {
+            throw std::invalid_argument("portfolio shock produces negative volatility");
+        }
+        log_spot_factors[k] = std::log1p(shocks[k].spot_return);
+    }
+
+    const std::size_t scenario_count = shocks.size() / group_count;
+    const std::size_t position_count = book.size;
+    if (include_position_pnl && scenario_count > std::vector<double>().max_size() / position_count) {
+        throw std::overflow_error("portfolio scenario detail matrix is too large");
+    }
+    std::vector<unsigned char> identity(scenario_count);
+    for (std::size_t scenario_index = 0; scenario_index < scenario_count; ++scenario_index) {
+        const auto first = shocks.begin() + static_cast<std::ptrdiff_t>(scenario_index * group_count);
+        identity[scenario_index] =
+            std::all_of(first, first + static_cast<std::ptrdiff_t>(group_count), is_identity);
+    }
+
+    ScenarioResult result;
+    result.scenario_count = scenario_count;
+    result.position_count = position_count;
+    for (std::size_t i = 0; i < position_count; ++i) {
+        result.base_portfolio_value += book.base_value[i];
+    }
+    result.portfolio_pnl.resize(scenario_count);
+    if (include_position_pnl) {
+        result.position_pnl.resize(scenario_count * position_count);
+    }
+
+    // Work is split into (scenario, position block) tiles whose partial sums are added in block
+    // order afterwards. The block size is fixed, so totals do not depend on the thread count.
+    const std::size_t block_count = (position_count + kPositionBlock - 1) / kPositionBlock;
+    const std::size_t tile_count = scenario_count * block_count;
+    std::vector<double> tile_pnl(tile_count, 0.0);
+    const auto tiles = static_cast<std::int64_t>(tile_count);
+    const auto terms = mode == Revaluation::Hybrid ? truncation_terms(book) : std::vector<TruncationTerms>{};
+    const bool grouped = book.group != nullptr;
+    std::vector<std::vector<std::size_t>> thread_cells(1);
+#ifdef QUANT_HAS_OPENMP
+    thread_cells.resize(static_cast<std::size_t>(omp_get_max_threads()));
+#endif
+
+#ifdef QUANT_HAS_OPENMP
+#pragma omp parallel
+#endif
+    {
+        std::vector<double> pnl(std::min(position_count, kPositionBlock));
+#ifdef QUANT_HAS_OPENMP
+        auto& cells = thread_cells[static_cast<std::size_t>(omp_get_thread_num())];
+#pragma omp for schedule(static)
+#else
+        auto& cells = thread_cells[0];
+#endif
+        for (std::int64_t tile = 0; tile < tiles; ++tile) {
+            const auto scenario_index = static_cast<std::size_t>(tile) / block_count;
+            const std::size_t begin = (static_cast<std::size_t>(tile) % block_count) * kPositionBlock;
+            const std::size_t end = std::min(position_count, begin + kPositionBlock);
+            const MarketShock* scenario = shocks.data() + scenario_index * group_count;
+            const double* log_factors = log_spot_factors.data() + scenario_index * group_count;
+            if (identity[scenario_index] != 0) {
+                std::fill_n(pnl.data(), end - begin, 0.0);
+            } else if (mode == Revaluation::Full) {
+                if (grouped) {
+                    shocked_pnl<true>(book, scenario, log_factors, begin, end, pnl.data());
+                } else {
+                    shocked_pnl<false>(book, scenario, log_factors, begin, end, pnl.data());
+                }
+            } else {
+                if (grouped) {
+                    taylor_pnl<true>(book, scenario, begin, end, pnl.data());
+                } else {
+                    taylor_pnl<false>(book, scenario, begin, end, pnl.data());
+                }
+                const TruncationTerms* hybrid = mode == Revaluation::Hybrid ? terms.data() : nullptr;
+                const std::size_t first_cell = scenario_index * position_count;
+                if (grouped) {
+                    reprice_uncertain<true>(book, scenario, log_factors, hybrid, options.tolerance,
+                                            first_cell, begin, end, pnl.data(), cells);
+                } else {
+                    reprice_uncertain<false>(book, scenario, log_factors, hybrid, options.tolerance,
+                                             first_cell, begin, end, pnl.data(), cells);
+                }
+            }
+            double total = 0.0;
+            for (std::size_t i = 0; i < end - begin; ++i) {
+                total += pnl[i];
+            }
+            tile_pnl[static_cast<std::size_t>(tile)] = total;
+            if (include_position_pnl) {
+                std::copy_n(pnl.data(), end - begin,
+                            result.position_pnl.data() + scenario_index * position_count + begin);
+            }
+        }
+    }
+
+    for (std::size_t scenario_index = 0; scenario_index < scenario_count; ++scenario_index) {
+        double total = 0.0;
+        for (std::size_t block = 0; block < block_count; ++block) {
+            total += tile_pnl[scenario_index * block_count + block];
+        }
+        result.portfolio_pnl[scenario_index] = total;
+    }
+    for (const auto& cells : thread_cells) {
+        result.revalued_cells.insert(result.revalued_cells.end(), cells.begin(), cells.end());
+    }
+    std::sort(result.revalued_cells.begin(), result.revalued_cells.end());
+    return result;
+}
+
+// Bracketing index and weight of `x` on an increasing grid, clamped to the end points.
+std::pair<std::size_t, double> bracket(const std::vector<double>& grid, double x) {
+    if (grid.size() == 1 || x <= grid.front()) {
+        return {0, 0.0};
+    }
+    if (x >= grid.back()) {
+        return {grid.size() - 2, 1.0};
+    }
+    const auto upper = static_cast<std::size_t>(std::upper_bound(grid.begin(), grid.end(), x) - grid.begin());
+    return {upper - 1, (x - grid[upper - 1]) / (grid[upper] - grid[upper - 1])};
+}
+
+bool strictly_increasing(const std::vector<double>& grid) {
+    for (std::size_t i = 0; i < grid.size(); ++i) {
+        if (!std::isfinite(grid[i]) || (i > 0 && !(grid[i] > grid[i - 1]))) {
+            return false;
+        }
+    }
+    return !grid.empty();
+}
+
+void validate_market(const MarketState& market) {
+    if (market.underlyings.empty()) {
+        throw std::invalid_argument("market state requires at least one underlying");
+    }
+    for (const auto& surface : market.surfaces) {
+        if (!strictly_increasing(surface.expiries) || !strictly_increasing(surface.strikes) ||
+            surface.vols.size() != surface.expiries.size() * surface.strikes.size()) {
+            throw std::invalid_argument(
+                "vol surface requires increasing expiry/strike grids and one vol per grid point");
+        }
+        for (double vol : surface.vols) {
+            if (!std::isfinite(vol) || vol < 0.0) {
+                throw std::invalid_argument("vol surface volatilities must be finite and non-negative");
+            }
+        }
+    }
+    for (const auto& underlying : market.underlyings) {
+        if (!std::isfinite(underlying.spot) || underlying.spot <= 0.0 || !std::isfinite(underlying.rate) ||
+            !std::isfinite(underlying.dividend)) {
+            throw std::invalid_argument("market underlying requires a positive spot and finite rates");
+        }
+        if (underlying.surface >= market.surfaces.size()) {
+            throw std::invalid_argument("market underlying references an unknown vol surface");
+        }
+    }
+}
+
+// Position at its underlying's market data; `market` must already be validated.
+VanillaPosition resolve(const MarketState& market, const MarketPosition& position) {
+    if (position.underlying >= market.underlyings.size()) {
+        throw std::invalid_argument("market position references an unknown underlying");
+    }
+    const auto& underlying = market.underlyings[position.underlying];
+    VanillaPosition resolved{position.type,
+                             position.quantity,
+                             underlying.spot,
+                             position.strike,
+                             underlying.rate,
+                             underlying.dividend,
+                             0.0,
+                             position.time};
+    validate_position(resolved);
+    resolved.volatility = market.surfaces[underlying.surface].volatility(position.time, position.strike);
+    return resolved;
+}
+
+// Lower Cholesky factor of a positive semi-definite correlation matrix (row-major).
+std::vector<double> correlation_factor(const std::vector<double>& corr, std::size_t n) {
+    std::vector<double> L(n * n, 0.0);
+    for (std::size_t i = 0; i < n; ++i) {
+        for (std::size_t j = 0; j <= i; ++j) {
+            double sum = corr[i * n + j];
+            for (std::size_t k = 0; k < j; ++k) {
+                sum -= L[i * n + k] * L[j * n + k];
+            }
+            if (i == j) {
+                if (sum < -1e-10) {
+                    throw std::invalid_argument("correlation matrix must be positive semi-definite");
+                }
+                L[i * n + i] = std::sqrt(std::max(sum, 0.0));
+            } else {
+                L[i * n + j] = L[j * n + j] > 0.0 ? sum / L[j * n + j] : 0.0;
+            }
+        }
+    }
+    return L;
+}
+
 } // namespace
 
 RiskResult price_risk(const std::vector<VanillaPosition>& positions) {
@@ -143,72 +583,483 @@ ScenarioResult scenario_pnl(const std::vector<VanillaPosition>& positions,
     if (positions.empty() || shocks.empty()) {
         throw std::invalid_argument("portfolio positions and shocks must be non-empty");
     }
+    Portfolio book(positions);
+    return book.scenario_pnl(shocks, include_position_pnl);
+}
+
+ScenarioResult scenario_pnl(const std::vector<VanillaPosition>& positions,
+                            const std::vector<MarketShock>& shocks, const ScenarioOptions& options) {
+    if (positions.empty() || shocks.empty()) {
+        throw std::invalid_argument("portfolio positions and shocks must be non-empty");
+    }
+    Portfolio book(positions);
+    return book.scenario_pnl(shocks, options);
+}
+
+Portfolio::Portfolio(const std::vector<VanillaPosition>& positions) {
+    for (auto& column : columns_) {
+        column.reserve(positions.size());
+    }
+    for (auto& metric : metrics_) {
+        metric.reserve(positions.size());
+    }
+    log_moneyness_.reserve(positions.size());
+    is_stale_.reserve(positions.size());
+    stale_.reserve(positions.size());
+    for (const auto& position : positions) {
+        add(position);
+    }
+}
+
+std::size_t Portfolio::add(const VanillaPosition& position) {
+    validate_position(position);
+    const std::size_t index = size();
+    for (auto& column : columns_) {
+        column.push_back(0.0);
+    }
+    log_moneyness_.push_back(0.0);
+    for (auto& metric : metrics_) {
+        metric.push_back(0.0);
+    }
+    is_stale_.push_back(0);
+    write_row(index, position);
+    return index;
+}
+
+std::size_t Portfolio::add(const std::vector<VanillaPosition>& positions) {
     for (const auto& position : positions) {
         validate_position(position);
     }
-    for (const auto& shock : shocks) {
-        validate_shock(shock);
-        for (const auto& position : positions) {
-            if (position.volatility + shock.volatility_shift < 0.0) {
-                throw std::invalid_argument("portfolio shock produces negative volatility");
-            }
+    const std::size_t first = size();
+    for (const auto& position : positions) {
+        add(position);
+    }
+    return first;
+}
+
+void Portfolio::amend(const std::vector<std::size_t>& indices,
+                      const std::vector<VanillaPosition>& positions) {
+    if (indices.size() != positions.size()) {
+        throw std::invalid_argument("portfolio amend requires one position per index");
+    }
+    for (std::size_t k = 0; k < indices.size(); ++k) {
+        if (indices[k] >= size()) {
+            throw std::out_of_range("portfolio position index out of range");
         }
+        validate_position(positions[k]);
     }
+    for (std::size_t k = 0; k < indices.size(); ++k) {
+        write_row(indices[k], positions[k]);
+    }
+}
 
-    const std::size_t scenario_count = shocks.size();
-    const std::size_t position_count = positions.size();
-    if (include_position_pnl && scenario_count > std::vector<double>().max_size() / position_count) {
-        throw std::overflow_error("portfolio scenario detail matrix is too large");
+void Portfolio::amend(std::size_t index, const VanillaPosition& position) {
+    if (index >= size()) {
+        throw std::out_of_range("portfolio position index out of range");
+    }
+    validate_position(position);
+    write_row(index, position);
+}
+
+void Portfolio::remove(std::size_t index) {
+    if (index >= size()) {
+        throw std::out_of_range("portfolio position index out of range");
+    }
+    const std::size_t last = size() - 1;
+    if (is_stale_[last] != 0) {
+        // The last row keeps its stale entry under its new index.
+        const auto entry = std::find(stale_.begin(), stale_.end(), last);
+        if (index != last && is_stale_[index] == 0) {
+            *entry = index;
+            is_stale_[index] = 1;
+        } else {
+            stale_.erase(entry);
+        }
+    }
+    if (index != last) {
+        for (auto& column : columns_) {
+            column[index] = column[last];
+        }
+        log_moneyness_[index] = log_moneyness_[last];
+        for (auto& metric : metrics_) {
+            metric[index] = metric[last];
+        }
+    }
+    for (auto& column : columns_) {
+        column.pop_back();
+    }
+    log_moneyness_.pop_back();
+    for (auto& metric : metrics_) {
+        metric.pop_back();
+    }
+    is_stale_.pop_back();
+}
+
+VanillaPosition Portfolio::position(std::size_t index) const {
+    if (index >= size()) {
+        throw std::out_of_range("portfolio position index out of range");
+    }
+    const auto at = [&](Column c) { return columns_[static_cast<std::size_t>(c)][index]; };
+    return VanillaPosition{at(Column::Type) > 0.0 ? OptionType::Call : OptionType::Put,
+                           at(Column::Quantity),
+                           at(Column::Spot),
+                           at(Column::Strike),
+                           at(Column::Rate),
+                           at(Column::Dividend),
+                           at(Column::Volatility),
+                           at(Column::Time)};
+}
+
+void Portfolio::write_row(std::size_t index, const VanillaPosition& position) {
+    const double row[kColumnCount]{position.type == OptionType::Call ? 1.0 : -1.0,
+                                   position.quantity,
+                                   position.spot,
+                                   position.strike,
+                                   position.rate,
+                                   position.dividend,
+                                   position.volatility,
+                                   position.time};
+    for (std::size_t c = 0; c < kColumnCount; ++c) {
+        columns_[c][index] = row[c];
+    }
+    log_moneyness_[index] = std::log(position.spot / position.strike);
+    mark_stale(index);
+}
+
+void Portfolio::mark_stale(std::size_t index) {
+    if (is_stale_[index] == 0) {
+        is_stale_[index] = 1;
+        stale_.push_back(index);
+    }
+}
+
+void Portfolio::refresh() {
+    const auto count = static_cast<std::int64_t>(stale_.size());
+#ifdef QUANT_HAS_OPENMP
+#pragma omp parallel for schedule(static) if (count > 256)
+#endif
+    for (std::int64_t k = 0; k < count; ++k) {
+        const std::size_t index = stale_[static_cast<std::size_t>(k)];
+        const auto risk = position_risk(position(index));
+        const double row[kMetricCount]{risk.price, risk.value, risk.delta, risk.gamma,
+                                       risk.vega,  risk.theta, risk.rho};
+        for (std::size_t m = 0; m < kMetricCount; ++m) {
+            metrics_[m][index] = row[m];
+        }
+    }
+    for (std::size_t index : stale_) {
+        is_stale_[index] = 0;
+    }
+    stale_.clear();
+}
+
+PortfolioTotals Portfolio::risk() {
+    if (empty()) {
+        throw std::invalid_argument("portfolio positions must be non-empty");
+    }
+    refresh();
+    PortfolioTotals totals;
+    double* const fields[kMetricCount - 1]{&totals.value, &totals.delta, &totals.gamma,
+                                           &totals.vega,  &totals.theta, &totals.rho};
+    for (std::size_t m = 1; m < kMetricCount; ++m) {
+        double sum = 0.0;
+        for (double v : metrics_[m]) {
+            sum += v;
+        }
+        *fields[m - 1] = sum;
+    }
+    return totals;
+}
+
+ScenarioResult Portfolio::scenario_pnl(const std::vector<MarketShock>& shocks, bool include_position_pnl) {
+    return scenario_pnl(shocks, ScenarioOptions{Revaluation::Full, 0.0, include_position_pnl});
+}
+
+ScenarioResult Portfolio::scenario_pnl(const std::vector<MarketShock>& shocks,
+                                       const ScenarioOptions& options) {
+    if (empty() || shocks.empty()) {
+        throw std::invalid_argument("portfolio positions and shocks must be non-empty");
+    }
+    refresh();
+    const RevaluationBook book{size(),
+                               1,
+                               nullptr,
+                               column(Column::Type).data(),
+                               column(Column::Quantity).data(),
+                               column(Column::Strike).data(),
+                               log_moneyness_.data(),
+                               column(Column::Volatility).data(),
+                               column(Column::Time).data(),
+                               metric(Metric::Value).data(),
+                               metric(Metric::Delta).data(),
+                               metric(Metric::Gamma).data(),
+                               metric(Metric::Vega).data(),
+                               metric(Metric::Theta).data(),
+                               metric(Metric::Rho).data(),
+                               column(Column::Spot).data(),
+                               column(Column::Rate).data(),
+                               column(Column::Dividend).data()};
+    return revalue(book, shocks, options);
+}
+
+TickRiskEngine::TickRiskEngine(const std::vector<VanillaPosition>& positions,
+                               const std::vector<std::size_t>& underlyings)
+    : book_(positions) {
+    if (positions.empty() || underlyings.size() != positions.size()) {
+        throw std::invalid_argument("tick risk requires one underlying per position and a non-empty book");
+    }
+    for (std::size_t index = 0; index < underlyings.size(); ++index) {
+        by_underlying_[underlyings[index]].push_back(index);
+    }
+    const auto& time = book_.column(Portfolio::Column::Time);
+    for (auto& [underlying, indices] : by_underlying_) {
+        std::stable_sort(indices.begin(), indices.end(),
+                         [&](std::size_t a, std::size_t b) { return time[a] < time[b]; });
+    }
+    book_.refresh();
+    resync();
+}
+
+std::size_t TickRiskEngine::apply(const MarketUpdate& update) {
+    const auto found = by_underlying_.find(update.underlying);
+    if (found == by_underlying_.end()) {
+        throw std::invalid_argument("tick update for an unknown underlying");
+    }
+    if ((update.spot && !(std::isfinite(*update.spot) && *update.spot > 0.0)) ||
+        (update.rate && !std::isfinite(*update.rate)) ||
+        (update.volatility_shift && !std::isfinite(*update.volatility_shift))) {
+        throw std::invalid_argument("tick update requires a positive spot and finite rate/volatility shift");
+    }
+    if (!(update.min_expiry <= update.max_expiry)) {
+        throw std::invalid_argument("tick update expiry window must satisfy min_expiry <= max_expiry");
+    }
+    const auto& indices = found->second;
+    const auto& time = book_.column(Portfolio::Column::Time);
+    // Positions are sorted by expiry, so the volatility window is one contiguous range.
+    const auto window_begin = std::partition_point(
+        indices.begin(), indices.end(), [&](std::size_t i) { return time[i] < update.min_expiry; });
+    const auto window_end = std::partition_point(window_begin, indices.end(),
+                                                 [&](std::size_t i) { return time[i] <= update.max_expiry; });
+    const bool whole_underlying = update.spot.has_value() || update.rate.has_value();
+    const auto first = whole_underlying ? indices.begin() : window_begin;
+    const auto last = whole_underlying ? indices.end() : window_end;
+    if (!whole_underlying && !update.volatility_shift) {
+        return 0;
+    }
+
+    std::vector<std::size_t> rows(first, last);
+    std::vector<VanillaPosition> moved;
+    moved.reserve(rows.size());
+    for (auto it = first; it != last; ++it) {
+        auto position = book_.position(*it);
+        if (update.spot) {
+            position.spot = *update.spot;
+        }
+        if (update.rate) {
+            position.rate = *update.rate;
+        }
+        if (update.volatility_shift && it >= window_begin && it < window_end) {
+            position.volatility += *update.volatility_shift;
+        }
+        moved.push_back(position);
+    }
+
+    std::vector<double> before(rows.size() * sum_.size());
+    for (std::size_t k = 0; k < rows.size(); ++k) {
+        for (std::size_t f = 0; f < sum_.size(); ++f) {
+            before[k * sum_.size() + f] = book_.metric(static_cast<Portfolio::Metric>(f + 1))[rows[k]];
+        }
+    }
+    book_.amend(rows, moved);
+    book_.refresh();
+    for (std::size_t k = 0; k < rows.size(); ++k) {
+        for (std::size_t f = 0; f < sum_.size(); ++f) {
+            const double after = book_.metric(static_cast<Portfolio::Metric>(f + 1))[rows[k]];
+            accumulate(f, after - before[k * sum_.size() + f]);
+        }
     }
+    return rows.size();
+}
+
+// Neumaier-compensated running sum, so long tick sequences do not drift from a full recompute.
+void TickRiskEngine::accumulate(std::size_t field, double amount) {
+    const double sum = sum_[field];
+    const double next = sum + amount;
+    compensation_[field] += std::abs(sum) >= std::abs(amount) ? (sum - next) + amount : (amount - next) + sum;
+    sum_[field] = next;
+}
+
+PortfolioTotals TickRiskEngine::totals() const {
+    const auto total = [&](std::size_t field) { return sum_[field] + compensation_[field]; };
+    return PortfolioTotals{total(0), total(1), total(2), total(3), total(4), total(5)};
+}
+
+void TickRiskEngine::resync() {
+    sum_.fill(0.0);
+    compensation_.fill(0.0);
+    for (std::size_t f = 0; f < sum_.size(); ++f) {
+        for (double v : book_.metric(static_cast<Portfolio::Metric>(f + 1))) {
+            accumulate(f, v);
+        }
+    }
+}
 
-    std::vector<double> base_values;
-    base_values.reserve(position_count);
-    double base_portfolio_value = 0.0;
+double VolSurface::volatility(double expiry, double strike) const {
+    if (expiries.empty() || strikes.empty() || vols.size() != expiries.size() * strikes.size()) {
+        throw std::invalid_argument("vol surface requires one vol per (expiry, strike) grid point");
+    }
+    const auto [row, row_weight] = bracket(expiries, expiry);
+    const auto [col, col_weight] = bracket(strikes, strike);
+    const std::size_t next_row = std::min(row + 1, expiries.size() - 1);
+    const std::size_t next_col = std::min(col + 1, strikes.size() - 1);
+    const std::size_t width = strikes.size();
+    const auto along_strike = [&](std::size_t r) {
+        return (1.0 - col_weight) * vols[r * width + col] + col_weight * vols[r * width + next_col];
+    };
+    return (1.0 - row_weight) * along_strike(row) + row_weight * along_strike(next_row);
+}
+
+std::vector<VanillaPosition> resolve_positions(const MarketState& market,
+                                               const std::vector<MarketPosition>& positions) {
+    validate_market(market);
+    std::vector<VanillaPosition> resolved;
+    resolved.reserve(positions.size());
     for (const auto& position : positions) {
-        const double value = position.quantity * option_price(position);
-        base_values.push_back(value);
-        base_portfolio_value += value;
+        resolved.push_back(resolve(market, position));
     }
+    return resolved;
+}
 
-    ScenarioResult result;
-    result.scenario_count = scenario_count;
-    result.position_count = position_count;
-    result.base_portfolio_value = base_portfolio_value;
-    result.portfolio_pnl.resize(scenario_count);
-    if (include_position_pnl) {
-        result.position_pnl.resize(scenario_count * position_count);
+ScenarioResult scenario_pnl(const MarketState& market, const std::vector<MarketPosition>& positions,
+                            const std::vector<MarketShock>& shocks, bool include_position_pnl) {
+    return scenario_pnl(market, positions, shocks,
+                        ScenarioOptions{Revaluation::Full, 0.0, include_position_pnl});
+}
+
+ScenarioResult scenario_pnl(const MarketState& market, const std::vector<MarketPosition>& positions,
+                            const std::vector<MarketShock>& shocks, const ScenarioOptions& options) {
+    if (positions.empty() || shocks.empty()) {
+        throw std::invalid_argument("portfolio positions and shocks must be non-empty");
+    }
+    validate_market(market);
+    const std::size_t count = positions.size();
+    const std::size_t underlying_count = market.underlyings.size();
+    std::vector<std::size_t> group(count);
+    std::vector<double> sign(count);
+    std::vector<double> quantity(count);
+    std::vector<double> strike(count);
+    std::vector<double> log_moneyness(count);
+    std::vector<double> volatility(count);
+    std::vector<double> time(count);
+    std::vector<double> base_value(count);
+    std::array<std::vector<double>, 5> greeks; // delta, gamma, vega, theta, rho
+    for (auto& greek : greeks) {
+        greek.resize(count);
     }
+    for (std::size_t i = 0; i < count; ++i) {
+        const VanillaPosition resolved = resolve(market, positions[i]);
+        group[i] = positions[i].underlying;
+        sign[i] = resolved.type == OptionType::Call ? 1.0 : -1.0;
+        quantity[i] = resolved.quantity;
+        strike[i] = resolved.strike;
+        log_moneyness[i] = std::log(resolved.spot / resolved.strike);
+        volatility[i] = resolved.volatility;
+        time[i] = resolved.time;
+        const auto risk = position_risk(resolved);
+        base_value[i] = risk.value;
+        greeks[0][i] = risk.delta;
+        greeks[1][i] = risk.gamma;
+        greeks[2][i] = risk.vega;
+        greeks[3][i] = risk.theta;
+        greeks[4][i] = risk.rho;
+    }
+    std::vector<double> spot(underlying_count);
+    std::vector<double> rate(underlying_count);
+    std::vector<double> dividend(underlying_count);
+    for (std::size_t u = 0; u < underlying_count; ++u) {
+        spot[u] = market.underlyings[u].spot;
+        rate[u] = market.underlyings[u].rate;
+        dividend[u] = market.underlyings[u].dividend;
+    }
+    const RevaluationBook book{count,
+                               underlying_count,
+                               group.data(),
+                               sign.data(),
+                               quantity.data(),
+                               strike.data(),
+                               log_moneyness.data(),
+                               volatility.data(),
+                               time.data(),
+                               base_value.data(),
+                               greeks[0].data(),
+                               greeks[1].data(),
+                               greeks[2].data(),
+                               greeks[3].data(),
+                               greeks[4].data(),
+                               spot.data(),
+                               rate.data(),
+                               dividend.data()};
+    return revalue(book, shocks, options);
+}
 
-    for (std::size_t scenario_index = 0; scenario_index < scenario_count; ++scenario_index) {
-        const auto& shock = shocks[scenario_index];
-        const bool identity_shock = shock.spot_return == 0.0 && shock.volatility_shift == 0.0 &&
-                                    shock.rate_shift == 0.0 && shock.dividend_shift == 0.0 &&
-                                    shock.time_elapsed == 0.0;
-        if (identity_shock) {
-            result.portfolio_pnl[scenario_index] = 0.0;
-            if (include_position_pnl) {
-                std::fill_n(result.position_pnl.data() + scenario_index * position_count, position_count,
-                            0.0);
+std::vector<MarketShock> correlated_spot_shocks(const std::vector<double>& return_vols,
+                                                const std::vector<double>& corr, double horizon,
+                                                std::size_t scenario_count, std::uint64_t seed) {
+    const std::size_t n = return_vols.size();
+    if (n == 0 || corr.size() != n * n) {
+        throw std::invalid_argument(
+            "correlated shocks require one vol per underlying and an n x n correlation");
+    }
+    if (!std::isfinite(horizon) || horizon <= 0.0 || scenario_count == 0) {
+        throw std::invalid_argument("correlated shocks require a positive horizon and scenario count");
+    }
+    for (std::size_t i = 0; i < n; ++i) {
+        if (!std::isfinite(return_vols[i]) || return_vols[i] < 0.0) {
+            throw std::invalid_argument("correlated shock vols must be finite and non-negative");
+        }
+        for (std::size_t j = 0; j < n; ++j) {
+            const double rho = corr[i * n + j];
+            if (!std::isfinite(rho) || std::abs(rho) > 1.0 || rho != corr[j * n + i] ||
+                (i == j && rho != 1.0)) {
+                throw std::invalid_argument(
+                    "correlation must be symmetric with unit diagonal and |rho| <= 1");
             }
-            continue;
         }
-        double total_pnl = 0.0;
-        for (std::size_t position_index = 0; position_index < position_count; ++position_index) {
-            auto shocked = positions[position_index];
-            shocked.spot *= 1.0 + shock.spot_return;
-            shocked.volatility += shock.volatility_shift;
-            shocked.rate += shock.rate_shift;
-            shocked.dividend += shock.dividend_shift;
-            shocked.time = std::max(0.0, shocked.time - shock.time_elapsed);
-            const double pnl = shocked.quantity * option_price(shocked) - base_values[position_index];
-            total_pnl += pnl;
-            if (include_position_pnl) {
-                result.position_pnl[scenario_index * position_count + position_index] = pnl;
+    }
+    const auto L = correlation_factor(corr, n);
+    std::vector<double> scale(n);
+    std::vector<double> drift(n);
+    for (std::size_t i = 0; i < n; ++i) {
+        scale[i] = return_vols[i] * std::sqrt(horizon);
+        drift[i] = -0.5 * scale[i] * scale[i];
+    }
+
+    std::vector<MarketShock> shocks(scenario_count * n, MarketShock{0.0, 0.0, 0.0, 0.0, 0.0});
+    const auto count = static_cast<std::int64_t>(scenario_count);
+#ifdef QUANT_HAS_OPENMP
+#pragma omp parallel
+#endif
+    {
+        std::vector<double> z(n);
+#ifdef QUANT_HAS_OPENMP
+#pragma omp for schedule(static)
+#endif
+        for (std::int64_t s = 0; s < count; ++s) {
+            for (std::size_t j = 0; j < n; ++j) {
+                z[j] = quant::rng::normal(seed, static_cast<std::uint64_t>(s), 0U,
+                                          static_cast<std::uint32_t>(j), 0U);
+            }
+            MarketShock* row = shocks.data() + static_cast<std::size_t>(s) * n;
+            for (std::size_t i = 0; i < n; ++i) {
+                double x = 0.0;
+                for (std::size_t k = 0; k <= i; ++k) {
+                    x += L[i * n + k] * z[k];
+                }
+                row[i].spot_return = std::expm1(drift[i] + scale[i] * x);
             }
         }
-        result.portfolio_pnl[scenario_index] = total_pnl;
     }
-    return result;
+    return shocks;
 }
 
 } // namespace quant::portfolio
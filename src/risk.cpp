@@ -1,44 +1,191 @@
 #include "quant/risk.hpp"
 #include "quant/math.hpp"
+#include "quant/rng.hpp"
 
 #include <pcg_random.hpp>
 
 #include <algorithm>
 #include <cmath>
+#include <cstdint>
+#include <limits>
+#include <numeric>
 #include <random>
+#include <stdexcept>
+#include <utility>
 #include <vector>
 
 namespace quant::risk {
 
+namespace {
+
+// Rank of the VaR order statistic among n ascending P&L samples.
+std::size_t tail_index(std::size_t n, double alpha) {
+    const auto idx = static_cast<std::size_t>(std::floor((1.0 - alpha) * static_cast<double>(n)));
+    return std::min(idx, n - 1);
+}
+
+// VaR/ES from data[0, bound) once data[idx] holds the idx-th order statistic and data[0, idx) the
+// smaller samples: selects within [0, bound) and leaves data[0, idx] as the tail.
+VarEs select_var_es(double* data, std::size_t bound, std::size_t idx) {
+    std::nth_element(data, data + idx, data + bound);
+    const double var = -data[idx];
+    double es_sum = var;
+    for (std::size_t i = 0; i < idx; ++i)
+        es_sum += -data[i];
+    return {var, es_sum / static_cast<double>(idx + 1)};
+}
+
+// Streams simulated P&L and keeps only the samples VaR/ES need: the tail_index + 1 smallest, in a
+// max-heap, so memory is O(tail) rather than O(num_sims).
+class LowerTail {
+  public:
+    LowerTail(std::size_t num_sims, double alpha) : keep_(num_sims ? tail_index(num_sims, alpha) + 1 : 0) {
+        heap_.reserve(keep_);
+    }
+
+    void push(double pnl) {
+        if (heap_.size() < keep_) {
+            heap_.push_back(pnl);
+            std::push_heap(heap_.begin(), heap_.end());
+        } else if (keep_ > 0 && pnl < heap_.front()) {
+            std::pop_heap(heap_.begin(), heap_.end());
+            heap_.back() = pnl;
+            std::push_heap(heap_.begin(), heap_.end());
+        }
+    }
+
+    void merge(const LowerTail& other) {
+        for (double pnl : other.heap_)
+            push(pnl);
+    }
+
+    // The tail is summed in ascending order, so merged per-thread tails give identical results
+    // for any partition of the simulations.
+    VarEs result() const {
+        if (heap_.empty())
+            return {0.0, 0.0};
+        std::vector<double> sorted = heap_;
+        std::sort_heap(sorted.begin(), sorted.end());
+        double es_sum = 0.0;
+        for (double pnl : sorted)
+            es_sum += -pnl;
+        return {-sorted.back(), es_sum / static_cast<double>(sorted.size())};
+    }
+
+  private:
+    std::size_t keep_;
+    std::vector<double> heap_;
+};
+
+// VaR/ES of num_sims P&L draws pnl(s) for simulation indices s, run in parallel on per-thread tails.
+// Draws are counter-based functions of s, so the result does not depend on the thread count.
+template <typename Draw> VarEs simulate_var_es(unsigned long num_sims, double alpha, const Draw& pnl) {
+    LowerTail tail(num_sims, alpha);
+    const auto count = static_cast<std::int64_t>(num_sims);
+#ifdef QUANT_HAS_OPENMP
+#pragma omp parallel
+#endif
+    {
+        LowerTail local(num_sims, alpha);
+#ifdef QUANT_HAS_OPENMP
+#pragma omp for schedule(static) nowait
+#endif
+        for (std::int64_t s = 0; s < count; ++s)
+            local.push(pnl(static_cast<std::uint64_t>(s)));
+#ifdef QUANT_HAS_OPENMP
+#pragma omp critical(quant_risk_tail_merge)
+#endif
+        tail.merge(local);
+    }
+    return tail.result();
+}
+
+// Chi-square(nu) draw for simulation s: 2 Gamma(nu / 2) by Marsaglia-Tsang (shape > 1 as nu > 2),
+// with attempt k reading step k of the counter RNG.
+double chi_square_draw(std::uint64_t seed, std::uint64_t s, double nu) {
+    const double d = 0.5 * nu - 1.0 / 3.0;
+    const double c = 1.0 / std::sqrt(9.0 * d);
+    for (std::uint32_t k = 0;; ++k) {
+        const double x = quant::rng::normal(seed, s, k, 1U, 0U);
+        const double v = 1.0 + c * x;
+        if (v <= 0.0)
+            continue;
+        const double v3 = v * v * v;
+        const double u = quant::rng::uniform(seed, s, k, 2U, 0U);
+        if (std::log(u) < 0.5 * x * x + d - d * v3 + d * std::log(v3))
+            return 2.0 * d * v3;
+    }
+}
+
+} // namespace
+
 VarEs var_cvar_from_pnl(const std::vector<double>& pnl, double alpha) {
+    return var_cvar_from_pnl(std::vector<double>(pnl), alpha);
+}
+
+VarEs var_cvar_from_pnl(std::vector<double>&& pnl, double alpha) {
     if (pnl.empty())
         return {0.0, 0.0};
-    std::vector<double> sorted = pnl;
-    std::sort(sorted.begin(), sorted.end());
-    const std::size_t idx = static_cast<std::size_t>(std::floor((1.0 - alpha) * sorted.size()));
-    const double var = -sorted[idx];
-    double es_sum = 0.0;
-    for (std::size_t i = 0; i <= idx; ++i)
-        es_sum += -sorted[i];
-    const double cvar = es_sum / static_cast<double>(idx + 1);
-    return {var, cvar};
+    return select_var_es(pnl.data(), pnl.size(), tail_index(pnl.size(), alpha));
+}
+
+VarEsBatch var_cvar_batch(const double* pnl, std::size_t rows, std::size_t columns, std::ptrdiff_t row_stride,
+                          std::ptrdiff_t column_stride, const std::vector<double>& alphas) {
+    if (pnl == nullptr || rows == 0 || columns == 0 || alphas.empty())
+        throw std::invalid_argument("VaR batch requires a non-empty P&L matrix and at least one alpha");
+    for (double alpha : alphas) {
+        if (!(alpha > 0.0 && alpha < 1.0))
+            throw std::invalid_argument("VaR batch alphas must lie in (0, 1)");
+    }
+    // Widest tail first: each selection then only reorders the previous tail.
+    const std::size_t A = alphas.size();
+    std::vector<std::size_t> ranks(A);
+    std::vector<std::size_t> order(A);
+    for (std::size_t a = 0; a < A; ++a) {
+        ranks[a] = tail_index(rows, alphas[a]);
+        order[a] = a;
+    }
+    std::sort(order.begin(), order.end(), [&](std::size_t x, std::size_t y) { return ranks[x] > ranks[y]; });
+
+    VarEsBatch out{columns, A, std::vector<double>(columns * A), std::vector<double>(columns * A)};
+    const auto count = static_cast<std::int64_t>(columns);
+#ifdef QUANT_HAS_OPENMP
+#pragma omp parallel
+#endif
+    {
+        std::vector<double> scratch(rows);
+#ifdef QUANT_HAS_OPENMP
+#pragma omp for schedule(static)
+#endif
+        for (std::int64_t c = 0; c < count; ++c) {
+            const double* column = pnl + c * column_stride;
+            for (std::size_t r = 0; r < rows; ++r)
+                scratch[r] = column[static_cast<std::ptrdiff_t>(r) * row_stride];
+            std::size_t bound = rows;
+            for (std::size_t a : order) {
+                const auto stats = select_var_es(scratch.data(), bound, ranks[a]);
+                out.var[static_cast<std::size_t>(c) * A + a] = stats.var;
+                out.cvar[static_cast<std::size_t>(c) * A + a] = stats.cvar;
+                bound = ranks[a] + 1;
+            }
+        }
+    }
+    return out;
 }
 
 VarEs var_cvar_gbm(double spot, double mu, double sigma, double horizon_years, double position,
                    unsigned long num_sims, unsigned long seed, double alpha) {
     pcg64 rng(seed ? seed : 0xDEADBEEF);
     std::normal_distribution<double> normal(0.0, 1.0);
-    std::vector<double> pnl;
-    pnl.reserve(num_sims);
+    LowerTail tail(num_sims, alpha);
     const double drift = (mu - 0.5 * sigma * sigma) * horizon_years;
     const double vol = sigma * std::sqrt(horizon_years);
     for (unsigned long i = 0; i < num_sims; ++i) {
         double z = normal(rng);
         double S1 = spot * std::exp(drift + vol * z);
-        double pl = position * (S1 - spot);
-        pnl.push_back(pl);
+        tail.push(position * (S1 - spot));
     }
-    return var_cvar_from_pnl(pnl, alpha);
+    return tail.result();
 }
 
 VarEs var_cvar_portfolio(const std::vector<double>& mu, const std::vector<double>& sigma,
@@ -66,29 +213,23 @@ VarEs var_cvar_portfolio(const std::vector<double>& mu, const std::vector<double
             L[i * N + j] = 0.0;
     }
 
-    pcg64 rng(seed ? seed : 0xBADDCAFE);
-    std::normal_distribution<double> normal(0.0, 1.0);
-    std::vector<double> pnl;
-    pnl.reserve(num_sims);
-    for (unsigned long s = 0; s < num_sims; ++s) {
-        std::vector<double> z(N);
-        for (std::size_t i = 0; i < N; ++i)
-            z[i] = normal(rng);
-        // correlate: y = L * z
-        std::vector<double> y(N, 0.0);
-        for (std::size_t i = 0; i < N; ++i) {
-            for (std::size_t k = 0; k <= i; ++k)
-                y[i] += L[i * N + k] * z[k];
-        }
-        double pl = 0.0;
-        for (std::size_t i = 0; i < N; ++i) {
-            double drift = mu[i] * horizon_years;
-            double diff = sigma[i] * std::sqrt(horizon_years) * y[i];
-            pl += weights[i] * (drift + diff);
-        }
-        pnl.push_back(pl);
+    // P&L = sum_i w_i (mu_i h + sigma_i sqrt(h) (L z)_i) = drift + (L^T a) . z, a_i = w_i sigma_i sqrt(h):
+    // the Cholesky transform folds into one loading vector, so each simulation is a dot product.
+    double drift = 0.0;
+    std::vector<double> loading(N, 0.0);
+    for (std::size_t i = 0; i < N; ++i) {
+        drift += weights[i] * mu[i] * horizon_years;
+        const double a = weights[i] * sigma[i] * std::sqrt(horizon_years);
+        for (std::size_t k = 0; k <= i; ++k)
+            loading[k] += L[i * N + k] * a;
     }
-    return var_cvar_from_pnl(pnl, alpha);
+    const std::uint64_t key = seed ? seed : 0xBADDCAFE;
+    return simulate_var_es(num_sims, alpha, [&](std::uint64_t s) {
+        double pl = drift;
+        for (std::size_t k = 0; k < N; ++k)
+            pl += loading[k] * quant::rng::normal(key, s, 0U, static_cast<std::uint32_t>(k), 0U);
+        return pl;
+    });
 }
 
 namespace {
@@ -112,36 +253,40 @@ static inline double chi2_cdf_complement(double x, double k) {
 } // namespace
 
 BacktestStats kupiec_christoffersen(const std::vector<int>& exceptions, double alpha) {
+    ExceptionTracker tracker(alpha);
+    for (int e : exceptions)
+        tracker.push(e != 0);
+    return tracker.stats();
+}
+
+void ExceptionTracker::push(bool exception) {
+    if (T_ > 0)
+        ++transitions_[last_ ? 1 : 0][exception ? 1 : 0];
+    ++T_;
+    if (exception)
+        ++N_;
+    last_ = exception;
+}
+
+BacktestStats ExceptionTracker::stats() const {
     BacktestStats out{};
-    out.alpha = alpha;
-    const unsigned long T = static_cast<unsigned long>(exceptions.size());
+    out.alpha = alpha_;
+    const unsigned long T = T_;
+    const unsigned long N = N_;
     out.T = T;
-    unsigned long N = 0;
-    for (int e : exceptions)
-        if (e)
-            ++N;
     out.N = N;
+    // Expected exception rate under a correct VaR at confidence alpha.
+    const double p = 1.0 - alpha_;
     const double pi = static_cast<double>(N) / std::max(1UL, T);
-    // Kupiec POF LR = -2 log( ((1-alpha)^{T-N} alpha^N) / ((1-pi)^{T-N} pi^N) )
-    const double term1 = (T - N) * (std::log(1.0 - alpha) - std::log(std::max(1e-12, 1.0 - pi)));
-    const double term2 = N * (std::log(std::max(1e-12, alpha)) - std::log(std::max(1e-12, pi)));
+    // Kupiec POF LR = -2 log( ((1-p)^{T-N} p^N) / ((1-pi)^{T-N} pi^N) )
+    const double term1 = (T - N) * (std::log(std::max(1e-12, 1.0 - p)) - std::log(std::max(1e-12, 1.0 - pi)));
+    const double term2 = N * (std::log(std::max(1e-12, p)) - std::log(std::max(1e-12, pi)));
     out.lr_pof = -2.0 * (term1 + term2);
     out.p_pof = chi2_cdf_complement(out.lr_pof, 1.0);
 
-    // Christoffersen independence: build transition counts
-    unsigned long n00 = 0, n01 = 0, n10 = 0, n11 = 0;
-    for (unsigned long t = 1; t < T; ++t) {
-        int a = exceptions[t - 1] ? 1 : 0;
-        int b = exceptions[t] ? 1 : 0;
-        if (a == 0 && b == 0)
-            ++n00;
-        else if (a == 0 && b == 1)
-            ++n01;
-        else if (a == 1 && b == 0)
-            ++n10;
-        else
-            ++n11;
-    }
+    // Christoffersen independence from the transition counts
+    const unsigned long n00 = transitions_[0][0], n01 = transitions_[0][1];
+    const unsigned long n10 = transitions_[1][0], n11 = transitions_[1][1];
     const double pi0 = (n00 + n01) ? static_cast<double>(n01) / static_cast<double>(n00 + n01) : 0.0;
     const double pi1 = (n10 + n11) ? static_cast<double>(n11) / static_cast<double>(n10 + n11) : 0.0;
     const double pi_bar =
@@ -158,24 +303,354 @@ BacktestStats kupiec_christoffersen(const std::vector<int>& exceptions, double a
     return out;
 }
 
+RollingVar::RollingVar(const RollingVarParams& params) : params_(params) {
+    if (params_.window == 0 || params_.alphas.empty())
+        throw std::invalid_argument("rolling VaR requires a positive window and at least one alpha");
+    for (double alpha : params_.alphas) {
+        if (!(alpha > 0.0 && alpha < 1.0))
+            throw std::invalid_argument("rolling VaR alphas must lie in (0, 1)");
+    }
+    if (params_.method != VarMethod::Historical && params_.method != VarMethod::FilteredHistorical)
+        throw std::invalid_argument("rolling VaR method must be Historical or FilteredHistorical");
+    if (params_.method == VarMethod::FilteredHistorical &&
+        !(params_.ewma_lambda > 0.0 && params_.ewma_lambda < 1.0)) {
+        throw std::invalid_argument("rolling VaR EWMA lambda must lie in (0, 1)");
+    }
+    warmup_.reserve(params_.window);
+    trackers_.assign(params_.alphas.size(), ExceptionTracker(0.0));
+    for (std::size_t a = 0; a < params_.alphas.size(); ++a)
+        trackers_[a] = ExceptionTracker(params_.alphas[a]);
+    flags_.assign(params_.alphas.size(), 0);
+}
+
+VarEs RollingVar::forecast(std::size_t index) const {
+    if (!ready_)
+        return {0.0, 0.0};
+    const Tail& tail = tails_.at(index);
+    const double scale = params_.method == VarMethod::FilteredHistorical ? std::sqrt(variance_) : 1.0;
+    return {-scale * tail.kth->first, -scale * tail.sum / static_cast<double>(tail.rank + 1)};
+}
+
+// Fill the ordered window from the warm-up returns and place each alpha's order statistic.
+void RollingVar::start() {
+    const std::size_t W = params_.window;
+    if (params_.method == VarMethod::FilteredHistorical) {
+        double mean_square = 0.0;
+        for (double r : warmup_)
+            mean_square += r * r;
+        variance_ = mean_square / static_cast<double>(W);
+    }
+    for (std::size_t i = 0; i < W; ++i) {
+        const double r = warmup_[i];
+        double sample = r;
+        if (params_.method == VarMethod::FilteredHistorical) {
+            sample = variance_ > 0.0 ? r / std::sqrt(variance_) : 0.0;
+            variance_ = params_.ewma_lambda * variance_ + (1.0 - params_.ewma_lambda) * r * r;
+        }
+        const Key key{sample, count_ - W + i};
+        sorted_.insert(key);
+        arrivals_.push_back(key);
+    }
+    warmup_.clear();
+    warmup_.shrink_to_fit();
+    tails_.reserve(params_.alphas.size());
+    for (double alpha : params_.alphas) {
+        Tail tail{tail_index(W, alpha), sorted_.begin(), 0.0};
+        tail.sum = tail.kth->first;
+        for (std::size_t r = 0; r < tail.rank; ++r) {
+            ++tail.kth;
+            tail.sum += tail.kth->first;
+        }
+        tails_.push_back(tail);
+    }
+    ready_ = true;
+}
+
+const std::vector<unsigned char>& RollingVar::push(double ret) {
+    if (!std::isfinite(ret))
+        throw std::invalid_argument("rolling VaR returns must be finite");
+    ++count_;
+    if (!ready_) {
+        warmup_.push_back(ret);
+        if (warmup_.size() == params_.window)
+            start();
+        return flags_;
+    }
+    for (std::size_t a = 0; a < tails_.size(); ++a) {
+        flags_[a] = ret < -forecast(a).var ? 1 : 0;
+        trackers_[a].push(flags_[a] != 0);
+    }
+
+    double sample = ret;
+    if (params_.method == VarMethod::FilteredHistorical) {
+        sample = variance_ > 0.0 ? ret / std::sqrt(variance_) : 0.0;
+        variance_ = params_.ewma_lambda * variance_ + (1.0 - params_.ewma_lambda) * ret * ret;
+    }
+    // Insert the new sample; an order statistic above it passes its rank to its predecessor.
+    const Key added{sample, count_ - 1};
+    sorted_.insert(added);
+    for (auto& tail : tails_) {
+        if (added < *tail.kth) {
+            tail.sum += sample - tail.kth->first;
+            --tail.kth;
+        }
+    }
+    // Evict the oldest sample; an order statistic at or above it passes its rank to its successor.
+    const Key evicted = arrivals_.front();
+    arrivals_.pop_front();
+    arrivals_.push_back(added);
+    for (auto& tail : tails_) {
+        if (!(*tail.kth < evicted)) {
+            tail.sum -= evicted.first;
+            ++tail.kth;
+            tail.sum += tail.kth->first;
+        }
+    }
+    sorted_.erase(evicted);
+    return flags_;
+}
+
+RollingBacktestResult rolling_var_backtest(const std::vector<double>& returns,
+                                           const RollingVarParams& params) {
+    RollingVar engine(params);
+    const std::size_t A = params.alphas.size();
+    RollingBacktestResult out;
+    out.forecasts = returns.size() > params.window ? returns.size() - params.window : 0;
+    out.alphas = A;
+    out.var.resize(out.forecasts * A);
+    out.cvar.resize(out.forecasts * A);
+    out.exceptions.resize(out.forecasts * A);
+    for (std::size_t t = 0; t < returns.size(); ++t) {
+        if (engine.ready()) {
+            const std::size_t row = (t - params.window) * A;
+            for (std::size_t a = 0; a < A; ++a) {
+                const auto forecast = engine.forecast(a);
+                out.var[row + a] = forecast.var;
+                out.cvar[row + a] = forecast.cvar;
+            }
+            const auto& flags = engine.push(returns[t]);
+            std::copy(flags.begin(), flags.end(), out.exceptions.begin() + static_cast<std::ptrdiff_t>(row));
+        } else {
+            engine.push(returns[t]);
+        }
+    }
+    out.stats.reserve(A);
+    for (std::size_t a = 0; a < A; ++a)
+        out.stats.push_back(engine.stats(a));
+    return out;
+}
+
 quant::risk::VarEs var_cvar_t(double mu, double sigma, double nu, double horizon_years, double position,
                               unsigned long num_sims, unsigned long seed, double alpha) {
     if (nu <= 2.0) {
         throw std::invalid_argument("Student-t degrees of freedom must exceed 2 for finite variance");
     }
-    pcg64 rng(seed ? seed : 0xABCD1234);
-    std::student_t_distribution<double> tdist(nu);
-    std::vector<double> pnl;
-    pnl.reserve(num_sims);
+    const std::uint64_t key = seed ? seed : 0xABCD1234;
     const double scale = sigma * std::sqrt(horizon_years) * std::sqrt((nu - 2.0) / nu);
     const double drift = mu * horizon_years;
-    for (unsigned long i = 0; i < num_sims; ++i) {
-        double z = tdist(rng);
-        // Linear P&L model: drift + scaled heavy-tail shock
-        double pl = position * (drift + scale * z);
-        pnl.push_back(pl);
+    return simulate_var_es(num_sims, alpha, [&](std::uint64_t s) {
+        // t = z / sqrt(chi2 / nu); linear P&L model: drift + scaled heavy-tail shock
+        const double z = quant::rng::normal(key, s, 0U, 0U, 0U);
+        const double t = z / std::sqrt(chi_square_draw(key, s, nu) / nu);
+        return position * (drift + scale * t);
+    });
+}
+
+namespace {
+
+// Position-by-simulation P&L values held at once by portfolio_var()'s contribution pass.
+constexpr std::size_t kContributionBudget = std::size_t{1} << 22;
+
+// Lower Cholesky factor of a positive semi-definite correlation matrix.
+std::vector<double> factor_cholesky(const std::vector<double>& corr, std::size_t n) {
+    for (std::size_t i = 0; i < n; ++i) {
+        for (std::size_t j = 0; j < n; ++j) {
+            const double rho = corr[i * n + j];
+            if (!std::isfinite(rho) || std::abs(rho) > 1.0 || rho != corr[j * n + i] ||
+                (i == j && rho != 1.0)) {
+                throw std::invalid_argument("portfolio VaR correlation must be symmetric with unit "
+                                            "diagonal and |rho| <= 1");
+            }
+        }
+    }
+    std::vector<double> L(n * n, 0.0);
+    for (std::size_t i = 0; i < n; ++i) {
+        for (std::size_t j = 0; j <= i; ++j) {
+            double sum = corr[i * n + j];
+            for (std::size_t k = 0; k < j; ++k)
+                sum -= L[i * n + k] * L[j * n + k];
+            if (i == j) {
+                if (sum < -1e-10)
+                    throw std::invalid_argument("portfolio VaR correlation must be positive semi-definite");
+                L[i * n + i] = std::sqrt(std::max(sum, 0.0));
+            } else {
+                L[i * n + j] = L[j * n + j] > 0.0 ? sum / L[j * n + j] : 0.0;
+            }
+        }
+    }
+    return L;
+}
+
+void validate_var_params(const quant::portfolio::MarketState& market, std::size_t position_count,
+                         const PortfolioVarParams& params) {
+    const std::size_t U = market.underlyings.size();
+    if (position_count == 0 || params.num_sims == 0)
+        throw std::invalid_argument("portfolio VaR requires positions and a positive simulation count");
+    if (!(params.alpha > 0.0 && params.alpha < 1.0))
+        throw std::invalid_argument("portfolio VaR alpha must lie in (0, 1)");
+    if (!std::isfinite(params.horizon_years) || params.horizon_years <= 0.0)
+        throw std::invalid_argument("portfolio VaR horizon must be positive and finite");
+    if (params.spot_vols.size() != U || params.vol_vols.size() != U)
+        throw std::invalid_argument("portfolio VaR requires one spot vol and one vol-of-vol per underlying");
+    const auto valid = [](double vol) { return std::isfinite(vol) && vol >= 0.0; };
+    if (!std::all_of(params.spot_vols.begin(), params.spot_vols.end(), valid) ||
+        !std::all_of(params.vol_vols.begin(), params.vol_vols.end(), valid) || !valid(params.rate_vol)) {
+        throw std::invalid_argument("portfolio VaR factor vols must be finite and non-negative");
+    }
+    const std::size_t F = 2 * U + 1;
+    if (params.corr.size() != F * F && params.corr.size() != U * U)
+        throw std::invalid_argument("portfolio VaR correlation must be (2U+1) x (2U+1) or U x U");
+}
+
+} // namespace
+
+PortfolioVarResult portfolio_var(const quant::portfolio::MarketState& market,
+                                 const std::vector<quant::portfolio::MarketPosition>& positions,
+                                 const PortfolioVarParams& params) {
+    validate_var_params(market, positions.size(), params);
+    const std::size_t U = market.underlyings.size();
+    const std::size_t F = 2 * U + 1;
+    const std::size_t n = positions.size();
+    const std::size_t m = params.num_sims;
+    const std::size_t k = params.corr.size() == F * F ? F : U;
+    const auto L = factor_cholesky(params.corr, k);
+
+    // Each surface shifts by the lognormal move of its underlying's lowest position volatility.
+    const auto resolved = quant::portfolio::resolve_positions(market, positions);
+    std::vector<double> anchor(U, std::numeric_limits<double>::infinity());
+    for (std::size_t i = 0; i < n; ++i)
+        anchor[positions[i].underlying] = std::min(anchor[positions[i].underlying], resolved[i].volatility);
+
+    const double root_h = std::sqrt(params.horizon_years);
+    std::vector<double> spot_scale(U), vol_scale(U);
+    for (std::size_t u = 0; u < U; ++u) {
+        spot_scale[u] = params.spot_vols[u] * root_h;
+        vol_scale[u] = std::isfinite(anchor[u]) ? params.vol_vols[u] * root_h : 0.0;
+    }
+    const double rate_scale = params.rate_vol * root_h;
+
+    std::vector<quant::portfolio::MarketShock> shocks(m * U);
+    const auto sims = static_cast<std::int64_t>(m);
+#ifdef QUANT_HAS_OPENMP
+#pragma omp parallel
+#endif
+    {
+        std::vector<double> z(F);
+        std::vector<double> x(F);
+#ifdef QUANT_HAS_OPENMP
+#pragma omp for schedule(static)
+#endif
+        for (std::int64_t s = 0; s < sims; ++s) {
+            for (std::size_t j = 0; j < F; ++j)
+                z[j] = quant::rng::normal(params.seed, static_cast<std::uint64_t>(s), 0U,
+                                          static_cast<std::uint32_t>(j), 0U);
+            for (std::size_t i = 0; i < F; ++i) {
+                if (i >= k) {
+                    x[i] = z[i];
+                    continue;
+                }
+                double sum = 0.0;
+                for (std::size_t l = 0; l <= i; ++l)
+                    sum += L[i * k + l] * z[l];
+                x[i] = sum;
+            }
+            quant::portfolio::MarketShock* row = shocks.data() + static_cast<std::size_t>(s) * U;
+            for (std::size_t u = 0; u < U; ++u) {
+                const double a = spot_scale[u];
+                const double b = vol_scale[u];
+                row[u].spot_return = std::expm1(-0.5 * a * a + a * x[u]);
+                row[u].volatility_shift = b > 0.0 ? anchor[u] * std::expm1(-0.5 * b * b + b * x[U + u]) : 0.0;
+                row[u].rate_shift = rate_scale * x[2 * U];
+                row[u].dividend_shift = 0.0;
+                row[u].time_elapsed = params.horizon_years;
+            }
+        }
+    }
+
+    quant::portfolio::ScenarioOptions options{params.revaluation, params.tolerance, false};
+    const std::size_t chunk = std::max<std::size_t>(1, kContributionBudget / m);
+    options.include_position_pnl = params.contributions && n <= chunk;
+    auto book = quant::portfolio::scenario_pnl(market, positions, shocks, options);
+
+    PortfolioVarResult result;
+    result.base_value = book.base_portfolio_value;
+    result.pnl = std::move(book.portfolio_pnl);
+    result.total = var_cvar_from_pnl(result.pnl, params.alpha);
+    if (!params.contributions)
+        return result;
+
+    // Simulations by ascending P&L; ties resolve by index so the tail set is deterministic.
+    std::vector<std::size_t> order(m);
+    std::iota(order.begin(), order.end(), std::size_t{0});
+    std::sort(order.begin(), order.end(), [&](std::size_t a, std::size_t b) {
+        return result.pnl[a] < result.pnl[b] || (result.pnl[a] == result.pnl[b] && a < b);
+    });
+    const auto idx = static_cast<std::size_t>(std::floor((1.0 - params.alpha) * static_cast<double>(m)));
+    const std::size_t half_width = std::max<std::size_t>(1, m / 200);
+    const std::size_t lo = idx - std::min(idx, half_width);
+    const std::size_t hi = std::min(m - 1, idx + half_width);
+    double window_mean = 0.0;
+    for (std::size_t r = lo; r <= hi; ++r)
+        window_mean += result.pnl[order[r]];
+    window_mean /= static_cast<double>(hi - lo + 1);
+    const double euler_scale = window_mean != 0.0 ? -result.total.var / window_mean : 1.0;
+
+    result.component_var.assign(n, 0.0);
+    result.component_cvar.assign(n, 0.0);
+    result.incremental_var.assign(n, 0.0);
+    // detail is scenario-major (m, count) for positions [first, first + count).
+    const auto contribute = [&](const std::vector<double>& detail, std::size_t first, std::size_t count) {
+        const auto columns = static_cast<std::int64_t>(count);
+#ifdef QUANT_HAS_OPENMP
+#pragma omp parallel
+#endif
+        {
+            std::vector<double> rest(m);
+#ifdef QUANT_HAS_OPENMP
+#pragma omp for schedule(static)
+#endif
+            for (std::int64_t c = 0; c < columns; ++c) {
+                const double* column = detail.data() + c;
+                double tail = 0.0;
+                for (std::size_t r = 0; r <= idx; ++r)
+                    tail += column[order[r] * count];
+                double window = 0.0;
+                for (std::size_t r = lo; r <= hi; ++r)
+                    window += column[order[r] * count];
+                for (std::size_t s = 0; s < m; ++s)
+                    rest[s] = result.pnl[s] - column[s * count];
+                std::nth_element(rest.begin(), rest.begin() + static_cast<std::ptrdiff_t>(idx), rest.end());
+                const std::size_t i = first + static_cast<std::size_t>(c);
+                result.component_cvar[i] = -tail / static_cast<double>(idx + 1);
+                result.component_var[i] = -euler_scale * window / static_cast<double>(hi - lo + 1);
+                result.incremental_var[i] = result.total.var + rest[idx];
+            }
+        }
+    };
+    if (options.include_position_pnl) {
+        contribute(book.position_pnl, 0, n);
+        return result;
+    }
+    options.include_position_pnl = true;
+    for (std::size_t first = 0; first < n; first += chunk) {
+        const std::size_t count = std::min(chunk, n - first);
+        const std::vector<quant::portfolio::MarketPosition> slice(
+            positions.begin() + static_cast<std::ptrdiff_t>(first),
+            positions.begin() + static_cast<std::ptrdiff_t>(first + count));
+        const auto detail = quant::portfolio::scenario_pnl(market, slice, shocks, options);
+        contribute(detail.position_pnl, first, count);
     }
-    return var_cvar_from_pnl(pnl, alpha);
+    return result;
 }
 
 } // namespace quant::risk
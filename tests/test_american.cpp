@@ -1,5 +1,7 @@
 #include <cmath>
 #include <gtest/gtest.h>
+#include <stdexcept>
+#include <vector>
 
 #include "quant/american.hpp"
 #include "quant/barrier.hpp"
@@ -30,6 +32,148 @@ TEST(AmericanFast, PsorMatchesBinomial) {
     EXPECT_GT(psor_res.total_iterations, 0);
 }
 
+TEST(AmericanFast, BinomialBatchMatchesScalarAndExtrapolates) {
+    std::vector<american::Params> options;
+    for (const double K : {80.0, 95.0, 100.0, 110.0, 130.0}) {
+        for (const auto type : {OptionType::Put, OptionType::Call}) {
+            options.push_back({.spot = 100.0,
+                               .strike = K,
+                               .rate = 0.04,
+                               .dividend = 0.03,
+                               .vol = 0.3,
+                               .time = 0.75,
+                               .type = type});
+        }
+    }
+    const auto batch = american::price_binomial_crr_batch(options, 400);
+    const auto extrapolated = american::price_binomial_crr_batch(options, 400, true);
+    ASSERT_EQ(batch.size(), options.size());
+    double plain_error = 0.0;
+    double richardson_error = 0.0;
+    for (std::size_t k = 0; k < options.size(); ++k) {
+        EXPECT_NEAR(batch[k], american::price_binomial_crr(options[k], 400), 1e-12);
+        const double reference = american::price_binomial_crr(options[k], 8000);
+        plain_error += std::abs(batch[k] - reference);
+        richardson_error += std::abs(extrapolated[k] - reference);
+    }
+    EXPECT_LT(richardson_error, 0.2 * plain_error);
+
+    EXPECT_TRUE(american::price_binomial_crr_batch({}, 100).empty());
+    EXPECT_THROW(american::price_binomial_crr_batch(options, 0), std::invalid_argument);
+    EXPECT_THROW(american::price_binomial_crr_batch(options, 1, true), std::invalid_argument);
+}
+
+TEST(AmericanFast, DirectSolversMatchPsor) {
+    for (const auto type : {OptionType::Put, OptionType::Call}) {
+        american::Params base{.spot = 100.0,
+                              .strike = 100.0,
+                              .rate = 0.03,
+                              .dividend = 0.06,
+                              .vol = 0.25,
+                              .time = 1.0,
+                              .type = type};
+        american::PsorParams params{.base = base,
+                                    .grid = quant::pde::GridSpec{161, 160, 4.0, 0.0},
+                                    .log_space = true,
+                                    .upper_boundary = quant::pde::PdeParams::UpperBoundary::Dirichlet,
+                                    .stretch = 2.0,
+                                    .omega = 1.5,
+                                    .max_iterations = 6000,
+                                    .tolerance = 1e-10,
+                                    .use_rannacher = true};
+        const auto psor = american::price_psor(params);
+        params.solver = american::PsorParams::Solver::BrennanSchwartz;
+        const auto brennan = american::price_psor(params);
+        params.solver = american::PsorParams::Solver::PolicyIteration;
+        const auto policy = american::price_psor(params);
+
+        const double binom = american::price_binomial_crr(base, 1024);
+        EXPECT_NEAR(brennan.price, psor.price, 1e-6);
+        EXPECT_NEAR(policy.price, psor.price, 1e-6);
+        EXPECT_NEAR(brennan.price, binom, 5e-3);
+        EXPECT_EQ(brennan.total_iterations, 160);
+        EXPECT_LT(policy.total_iterations, psor.total_iterations / 4);
+    }
+}
+
+TEST(AmericanFast, AdaptiveOmegaAndWarmStartCutIterations) {
+    american::PsorParams params{.base = {.spot = 100.0,
+                                         .strike = 100.0,
+                                         .rate = 0.05,
+                                         .dividend = 0.02,
+                                         .vol = 0.25,
+                                         .time = 1.0,
+                                         .type = OptionType::Put},
+                                .grid = quant::pde::GridSpec{241, 240, 4.0, 0.0},
+                                .log_space = true,
+                                .upper_boundary = quant::pde::PdeParams::UpperBoundary::Neumann,
+                                .stretch = 2.0,
+                                .omega = 1.2,
+                                .max_iterations = 8000,
+                                .tolerance = 1e-9,
+                                .use_rannacher = true};
+    const auto fixed = american::price_psor(params);
+    params.adaptive_omega = true;
+    params.warm_start = true;
+    const auto tuned = american::price_psor(params);
+
+    EXPECT_NEAR(tuned.price, fixed.price, 1e-6);
+    EXPECT_LT(tuned.total_iterations, fixed.total_iterations / 2);
+    EXPECT_GT(tuned.omega, fixed.omega);
+    EXPECT_LT(tuned.omega, 2.0);
+    ASSERT_EQ(tuned.step_iterations.size(), 240u);
+    int sum = 0;
+    for (const int n : tuned.step_iterations) {
+        sum += n;
+    }
+    EXPECT_EQ(sum, tuned.total_iterations);
+}
+
+TEST(AmericanFast, GridGreeksMatchBumpAndReprice) {
+    american::PsorParams params{.base = {.spot = 100.0,
+                                         .strike = 100.0,
+                                         .rate = 0.05,
+                                         .dividend = 0.02,
+                                         .vol = 0.25,
+                                         .time = 1.0,
+                                         .type = OptionType::Put},
+                                .grid = quant::pde::GridSpec{241, 240, 4.0, 0.0},
+                                .log_space = true,
+                                .upper_boundary = quant::pde::PdeParams::UpperBoundary::Neumann,
+                                .stretch = 2.0,
+                                .omega = 1.5,
+                                .max_iterations = 8000,
+                                .tolerance = 1e-10,
+                                .use_rannacher = true};
+    const auto greeks = american::greeks_psor(params, true);
+    const auto price = american::price_psor(params);
+    const auto bumped = american::greeks_psor_bump(params, 1e-2);
+    EXPECT_DOUBLE_EQ(greeks.price, price.price);
+    EXPECT_NEAR(greeks.delta, bumped.delta, 5e-4);
+    EXPECT_NEAR(greeks.gamma, bumped.gamma, 5e-4);
+
+    const double h = 1e-2;
+    auto vol_up = params;
+    vol_up.base.vol += h;
+    auto vol_down = params;
+    vol_down.base.vol -= h;
+    const double vega =
+        (american::price_psor(vol_up).price - american::price_psor(vol_down).price) / (2.0 * h);
+    ASSERT_TRUE(greeks.vega.has_value());
+    EXPECT_NEAR(*greeks.vega, vega, 1e-3 * vega);
+
+    auto shorter = params;
+    shorter.base.time -= h;
+    shorter.grid.num_time = 240 - 2;
+    const double theta = (american::price_psor(shorter).price - price.price) / h;
+    EXPECT_LT(greeks.theta, 0.0);
+    EXPECT_NEAR(greeks.theta, theta, 0.01 * std::abs(theta));
+
+    // The warm-started vega solve is cheaper than the base solve.
+    EXPECT_LT(greeks.total_iterations, 1.8 * price.total_iterations);
+    EXPECT_FALSE(american::greeks_psor(params).vega.has_value());
+}
+
 TEST(AmericanFast, LsmcConsistentWithPsorSmallGrid) {
     american::Params base{.spot = 95.0,
                           .strike = 100.0,
@@ -76,6 +220,92 @@ TEST(AmericanFast, LsmcConsistentWithPsorSmallGrid) {
     EXPECT_GT(max_cond, 0.0);
 }
 
+TEST(AmericanFast, StreamingLsmcMatchesStoredPaths) {
+    american::Params base{.spot = 100.0,
+                          .strike = 105.0,
+                          .rate = 0.04,
+                          .dividend = 0.0,
+                          .vol = 0.25,
+                          .time = 1.0,
+                          .type = OptionType::Put};
+    american::PsorParams psor{.base = base,
+                              .grid = quant::pde::GridSpec{241, 240, 4.0, 0.0},
+                              .log_space = true,
+                              .upper_boundary = quant::pde::PdeParams::UpperBoundary::Neumann,
+                              .stretch = 2.0,
+                              .solver = american::PsorParams::Solver::BrennanSchwartz};
+    const double reference = american::price_psor(psor).price;
+
+    american::LsmcParams lsmc{.base = base, .num_paths = 20000, .seed = 77, .num_steps = 50, .min_itm = 0};
+    const auto stored = american::price_lsmc(lsmc);
+    lsmc.streaming = true;
+    const auto streamed = american::price_lsmc(lsmc);
+    const auto again = american::price_lsmc(lsmc);
+
+    EXPECT_DOUBLE_EQ(streamed.price, again.price);
+    EXPECT_EQ(streamed.diagnostics.itm_counts.size(), 49u);
+    // LSMC is a low-biased estimator of the American price.
+    EXPECT_NEAR(streamed.price, reference, 3.0 * streamed.std_error + 0.03);
+    EXPECT_NEAR(stored.price, reference, 3.0 * stored.std_error + 0.03);
+    EXPECT_NEAR(streamed.price, stored.price, 3.0 * std::hypot(streamed.std_error, stored.std_error) + 0.03);
+}
+
+TEST(AmericanFast, LsmcBasesAndOutOfSampleLowerBound) {
+    american::LsmcBasis basis{.family = american::LsmcBasis::Family::Hermite, .degree = 3};
+    EXPECT_EQ(american::basis_size(basis, 1), 4u);
+    EXPECT_EQ(american::basis_size(basis, 2), 7u);
+    basis.cross_terms = true;
+    ASSERT_EQ(american::basis_size(basis, 2), 10u);
+    const double state[2] = {0.5, -2.0};
+    std::vector<double> phi(10);
+    american::evaluate_basis(basis, state, 2, phi.data());
+    // He_a(x0) He_b(x1) for a + b <= 3, with a as the outer index.
+    EXPECT_DOUBLE_EQ(phi[0], 1.0);
+    EXPECT_DOUBLE_EQ(phi[1], -2.0);
+    EXPECT_DOUBLE_EQ(phi[2], 3.0);
+    EXPECT_DOUBLE_EQ(phi[3], -2.0);
+    EXPECT_DOUBLE_EQ(phi[4], 0.5);
+    EXPECT_DOUBLE_EQ(phi[5], -1.0);
+    EXPECT_DOUBLE_EQ(phi[9], 0.5 * 0.5 * 0.5 - 3.0 * 0.5);
+    basis.degree = 0;
+    EXPECT_THROW(american::basis_size(basis, 1), std::invalid_argument);
+
+    american::Params base{.spot = 100.0,
+                          .strike = 105.0,
+                          .rate = 0.04,
+                          .dividend = 0.0,
+                          .vol = 0.25,
+                          .time = 1.0,
+                          .type = OptionType::Put};
+    american::PsorParams psor{.base = base,
+                              .grid = quant::pde::GridSpec{241, 240, 4.0, 0.0},
+                              .log_space = true,
+                              .upper_boundary = quant::pde::PdeParams::UpperBoundary::Neumann,
+                              .stretch = 2.0,
+                              .solver = american::PsorParams::Solver::BrennanSchwartz};
+    const double reference = american::price_psor(psor).price;
+
+    american::LsmcParams lsmc{.base = base, .num_paths = 20000, .seed = 91, .num_steps = 50, .min_itm = 0};
+    lsmc.streaming = true;
+    for (const auto family : {american::LsmcBasis::Family::Monomial, american::LsmcBasis::Family::Laguerre,
+                              american::LsmcBasis::Family::Hermite}) {
+        lsmc.basis = {.family = family, .degree = 4};
+        const auto res = american::price_lsmc(lsmc);
+        EXPECT_NEAR(res.price, reference, 3.0 * res.std_error + 0.03);
+    }
+    lsmc.basis.degree = 11;
+    EXPECT_THROW(american::price_lsmc(lsmc), std::invalid_argument);
+
+    lsmc.basis = {.family = american::LsmcBasis::Family::Laguerre, .degree = 3};
+    lsmc.out_of_sample = true;
+    const auto lower = american::price_lsmc(lsmc);
+    ASSERT_GT(lower.std_error, 0.0);
+    // The priced rule is suboptimal, so the estimate sits below the PDE price up to noise.
+    EXPECT_LT(lower.price, reference + 3.0 * lower.std_error);
+    EXPECT_GT(lower.price, reference - 0.05);
+    EXPECT_DOUBLE_EQ(lower.price, american::price_lsmc(lsmc).price);
+}
+
 TEST(AmericanSlow, LsmcMatchesPsorWithinSe) {
     american::Params base{.spot = 90.0,
                           .strike = 100.0,
@@ -1,4 +1,5 @@
 #include "quant/asian.hpp"
+#include "quant/black_scholes.hpp"
 #include <gtest/gtest.h>
 
 using namespace quant::asian;
@@ -44,3 +45,17 @@ TEST(Asian, AntitheticReducesSE) {
     EXPECT_GT(anti.std_error, 0.0);
     EXPECT_LT(anti.std_error, plain.std_error);
 }
+
+TEST(Asian, SingleDateGeometricAndFloatingPayoffs) {
+    // With one averaging date A = S_T: the geometric fixed-strike call is a European call and the
+    // floating-strike call max(S_T - A, 0) is worthless.
+    McParams p{
+        100.0, 95.0, 0.03, 0.01, 0.2, 1.0, 40000, 9, 1, true, false, Payoff::FixedStrike, Average::Geometric};
+    const auto geometric = price_mc(p);
+    EXPECT_NEAR(geometric.value, quant::bs::call_price(100.0, 95.0, 0.03, 0.01, 0.2, 1.0),
+                4.0 * geometric.std_error);
+    p.payoff = Payoff::FloatingStrike;
+    EXPECT_NEAR(price_mc(p).value, 0.0, 1e-12);
+    p.num_steps = 12;
+    EXPECT_GT(price_mc(p).value, 0.0);
+}
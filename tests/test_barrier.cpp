@@ -53,6 +53,66 @@ TEST(Barrier, MonteCarloMatchesAnalyticWithinError) {
     EXPECT_LE(std::abs(res.estimate.value - analytic), 3.0 * res.estimate.std_error);
 }
 
+TEST(Barrier, OwenReplicatesMatchAnalyticWithinError) {
+    BarrierSpec spec{BarrierType::DownOut, 90.0, 0.0};
+
+    mc::McParams params{
+        .spot = 100.0,
+        .strike = 95.0,
+        .rate = 0.02,
+        .dividend = 0.0,
+        .vol = 0.20,
+        .time = 1.0,
+        .num_paths = 32768,
+        .seed = 7ULL,
+        .antithetic = false,
+        .control_variate = false,
+        .qmc = mc::McParams::Qmc::SobolOwen,
+        .bridge = mc::McParams::Bridge::BrownianBridge,
+        .num_steps = 32,
+        .qmc_replicates = 8,
+    };
+
+    const double analytic =
+        bs::reiner_rubinstein_price(OptionType::Call, spec, params.spot, params.strike, params.rate,
+                                    params.dividend, params.vol, params.time);
+    auto res = mc::price_barrier_option(params, params.strike, OptionType::Call, spec);
+    EXPECT_GT(res.estimate.std_error, 0.0);
+    // Discrete monitoring bias vs the continuous analytic price dominates the replicate error.
+    EXPECT_LE(std::abs(res.estimate.value - analytic), 4.0 * res.estimate.std_error + 0.35);
+}
+
+TEST(Barrier, StoppingRuleStopsAtTarget) {
+    BarrierSpec spec{BarrierType::UpOut, 130.0, 0.0};
+
+    mc::McParams params{
+        .spot = 100.0,
+        .strike = 100.0,
+        .rate = 0.02,
+        .dividend = 0.0,
+        .vol = 0.20,
+        .time = 1.0,
+        .num_paths = 5'000'000,
+        .seed = 99ULL,
+        .antithetic = true,
+        .control_variate = false,
+        .qmc = mc::McParams::Qmc::None,
+        .bridge = mc::McParams::Bridge::BrownianBridge,
+        .num_steps = 16,
+    };
+    params.stopping.target_std_error = 0.03;
+    params.stopping.batch_paths = 4096;
+
+    auto res = mc::price_barrier_option(params, params.strike, OptionType::Call, spec);
+    EXPECT_LE(res.estimate.std_error, 0.03);
+    EXPECT_LT(res.paths_used, params.num_paths);
+
+    params.qmc = mc::McParams::Qmc::SobolOwen;
+    params.qmc_replicates = 4;
+    EXPECT_THROW(mc::price_barrier_option(params, params.strike, OptionType::Call, spec),
+                 std::invalid_argument);
+}
+
 TEST(Barrier, PdeMatchesAnalytic) {
     BarrierSpec spec{BarrierType::UpOut, 120.0, 0.0};
     quant::pde::BarrierPdeParams params{};
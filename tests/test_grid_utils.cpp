@@ -1,6 +1,8 @@
 #include <algorithm>
 #include <cmath>
 #include <gtest/gtest.h>
+#include <stdexcept>
+#include <vector>
 
 #include "quant/grid_utils.hpp"
 
@@ -30,3 +32,26 @@ TEST(GridUtils, DirichletBoundaryMatchesAnalytic) {
     EXPECT_GT(lower, 0.0);
     EXPECT_NEAR(upper, 0.0, 1e-12);
 }
+
+TEST(GridUtils, FactoredTridiagonalMatchesThomasSolve) {
+    const std::vector<double> lower{-1.0, 0.5, -0.25};
+    const std::vector<double> diag{4.0, 3.0, 5.0, 2.0};
+    const std::vector<double> upper{1.0, -0.5, 0.75};
+    const auto factor = grid_utils::factor_tridiagonal(lower, diag, upper);
+    for (const std::vector<double>& rhs : {std::vector<double>{1.0, 2.0, 3.0, 4.0}, {0.0, -1.0, 0.5, 2.0}}) {
+        std::vector<double> x = rhs;
+        grid_utils::solve_factored(factor, x);
+        // Residual of A x = rhs row by row.
+        for (std::size_t i = 0; i < diag.size(); ++i) {
+            double row = diag[i] * x[i];
+            if (i > 0) {
+                row += lower[i - 1] * x[i - 1];
+            }
+            if (i + 1 < diag.size()) {
+                row += upper[i] * x[i + 1];
+            }
+            EXPECT_NEAR(row, rhs[i], 1e-12);
+        }
+    }
+    EXPECT_THROW(grid_utils::factor_tridiagonal(lower, {0.0, 1.0, 1.0, 1.0}, upper), std::runtime_error);
+}
@@ -26,10 +26,10 @@ void expect_mc_within_ci(const quant::heston::McResult& mc, double reference,
 
 } // namespace
 
-TEST(HestonMc, StandardParametersMatchesCalibrationReference) {
+TEST(HestonMc, StandardParametersMatchesAnalytic) {
     const quant::heston::Params h{1.5, 0.04, 0.5, -0.5, 0.04};
     const quant::heston::MarketParams mkt{100.0, 100.0, 0.01, 0.0, 1.0};
-    const double reference = 8.83129;
+    const double reference = quant::heston::call_analytic(mkt, h);
     const auto mc_params = make_mc_params(mkt, h, 120000, 2025, 96);
     const auto mc = quant::heston::call_qe_mc(mc_params);
     EXPECT_GT(mc.price, 0.0);
@@ -49,13 +49,26 @@ TEST(HestonMc, NearFellerBoundaryStable) {
 TEST(HestonMc, HighCorrelationScenario) {
     const quant::heston::Params h{1.2, 0.03, 0.4, 0.85, 0.05};
     const quant::heston::MarketParams mkt{90.0, 80.0, 0.02, 0.0, 1.5};
-    const double reference = 11.8734;
+    const double reference = quant::heston::call_analytic(mkt, h);
     const auto mc_params = make_mc_params(mkt, h, 180000, 424242, 120);
     const auto mc = quant::heston::call_qe_mc(mc_params);
     EXPECT_GT(mc.price, 0.0);
     expect_mc_within_ci(mc, reference);
 }
 
+TEST(HestonMc, StoppingRuleStopsAtTarget) {
+    const quant::heston::Params h{1.5, 0.04, 0.5, -0.5, 0.04};
+    const quant::heston::MarketParams mkt{100.0, 100.0, 0.01, 0.0, 1.0};
+    auto mc_params = make_mc_params(mkt, h, 1'000'000, 2025, 16);
+    mc_params.stopping.target_std_error = 0.05;
+    mc_params.stopping.batch_paths = 2000;
+    const auto mc = quant::heston::call_qe_mc(mc_params);
+    EXPECT_LE(mc.std_error, 0.05);
+    EXPECT_LT(mc.paths_used, mc_params.num_paths);
+    EXPECT_GE(mc.elapsed_seconds, 0.0);
+    expect_mc_within_ci(mc, quant::heston::call_analytic(mkt, h), 4.0);
+}
+
 TEST(HestonAnalytic, CharacteristicFunctionUnitValueAtZero) {
     const quant::heston::Params h{1.1, 0.04, 0.5, -0.3, 0.035};
     const quant::heston::MarketParams mkt{100.0, 100.0, 0.01, 0.0, 1.0};
@@ -93,3 +106,28 @@ TEST(HestonAnalytic, PutMatchesDiscountedParityAcrossRepresentativeMarkets) {
         EXPECT_NEAR(put, call - discounted_spot + discounted_strike, 1e-12);
     }
 }
+
+TEST(HestonMc, AdjointGreeksMatchAnalyticBumps) {
+    const quant::heston::Params h{1.5, 0.04, 0.5, -0.5, 0.04};
+    const quant::heston::MarketParams mkt{100.0, 100.0, 0.01, 0.0, 1.0};
+    const auto mc_params = make_mc_params(mkt, h, 60000, 2025, 64);
+    const auto adj = quant::heston::greeks_call_adjoint(mc_params);
+    const auto priced = quant::heston::call_qe_mc(mc_params);
+    EXPECT_NEAR(adj.price.value, priced.price, 1e-9);
+
+    const auto analytic = [&](double spot, double rate, double v0) {
+        quant::heston::MarketParams m = mkt;
+        m.spot = spot;
+        m.rate = rate;
+        quant::heston::Params hp = h;
+        hp.v0 = v0;
+        return quant::heston::call_analytic(m, hp);
+    };
+    const double S = mkt.spot, r = mkt.rate, v0 = h.v0;
+    const double delta = (analytic(S + 1.0, r, v0) - analytic(S - 1.0, r, v0)) / 2.0;
+    const double rho = (analytic(S, r + 1e-4, v0) - analytic(S, r - 1e-4, v0)) / 2e-4;
+    const double vega = (analytic(S, r, v0 + 1e-3) - analytic(S, r, v0 - 1e-3)) / 2e-3;
+    EXPECT_NEAR(adj.delta.value, delta, 4.0 * adj.delta.std_error + 5e-3);
+    EXPECT_NEAR(adj.rho.value, rho, 4.0 * adj.rho.std_error + 0.5);
+    EXPECT_NEAR(adj.vega.value, vega, 4.0 * adj.vega.std_error + 1.0);
+}
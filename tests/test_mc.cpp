@@ -216,3 +216,297 @@ TEST(MonteCarloSlow, QmcReducesErrorVsAnalytic) {
     // QMC should typically reduce absolute error
     EXPECT_LT(e2, e1 * 0.95);
 }
+
+TEST(MonteCarloFast, OwenReplicatesGiveHonestError) {
+    mc::McParams mp{.spot = 100.0,
+                    .strike = 105.0,
+                    .rate = 0.02,
+                    .dividend = 0.0,
+                    .vol = 0.2,
+                    .time = 1.0,
+                    .num_paths = 4096,
+                    .seed = 11,
+                    .antithetic = false,
+                    .control_variate = false,
+                    .qmc = mc::McParams::Qmc::SobolOwen};
+    mp.num_steps = 8;
+    mp.bridge = mc::McParams::Bridge::BrownianBridge;
+    mp.qmc_replicates = 16;
+    auto res = mc::price_european_call(mp);
+    double bs_price = bs::call_price(mp.spot, mp.strike, mp.rate, mp.dividend, mp.vol, mp.time);
+    EXPECT_GT(res.estimate.std_error, 0.0);
+    EXPECT_LT(res.estimate.ci_low, res.estimate.value);
+    EXPECT_GT(res.estimate.ci_high, res.estimate.value);
+    EXPECT_NEAR(res.estimate.value, bs_price, 5.0 * res.estimate.std_error + 1e-3);
+
+    auto again = mc::price_european_call(mp);
+    EXPECT_DOUBLE_EQ(again.estimate.value, res.estimate.value);
+
+    // Paths that do not divide evenly are spread across replicates rather than dropped.
+    mp.num_paths = 4099;
+    EXPECT_EQ(mc::price_european_call(mp).paths_used, 4099u);
+}
+
+TEST(MonteCarloFast, ReplicatesRequireScrambledSampler) {
+    mc::McParams mp{.spot = 100.0,
+                    .strike = 100.0,
+                    .rate = 0.02,
+                    .dividend = 0.0,
+                    .vol = 0.2,
+                    .time = 1.0,
+                    .num_paths = 1024,
+                    .seed = 3,
+                    .antithetic = false,
+                    .control_variate = false,
+                    .qmc = mc::McParams::Qmc::Sobol};
+    mp.qmc_replicates = 4;
+    EXPECT_THROW(mc::price_european_call(mp), std::invalid_argument);
+}
+
+TEST(MonteCarloFast, StoppingRuleHitsStdErrorTarget) {
+    mc::McParams mp{.spot = 100.0,
+                    .strike = 100.0,
+                    .rate = 0.03,
+                    .dividend = 0.0,
+                    .vol = 0.2,
+                    .time = 1.0,
+                    .num_paths = 10'000'000,
+                    .seed = 42,
+                    .antithetic = true,
+                    .control_variate = true};
+    mp.stopping.target_std_error = 0.02;
+    mp.stopping.batch_paths = 4096;
+    auto res = mc::price_european_call(mp);
+    double bs_price = bs::call_price(mp.spot, mp.strike, mp.rate, mp.dividend, mp.vol, mp.time);
+    EXPECT_LE(res.estimate.std_error, 0.02);
+    EXPECT_LT(res.paths_used, mp.num_paths);
+    EXPECT_EQ(res.paths_used % mp.stopping.batch_paths, 0u);
+    EXPECT_GE(res.elapsed_seconds, 0.0);
+    EXPECT_NEAR(res.estimate.value, bs_price, 4.0 * res.estimate.std_error);
+
+    // A looser relative target stops no later than the absolute one.
+    mp.stopping.target_std_error = 0.0;
+    mp.stopping.target_rel_error = 0.01;
+    auto rel = mc::price_european_call(mp);
+    EXPECT_LE(rel.estimate.std_error, 0.01 * std::abs(rel.estimate.value));
+    EXPECT_LE(rel.paths_used, res.paths_used);
+}
+
+TEST(MonteCarloFast, BatchedCounterRunMatchesFixedRun) {
+    mc::McParams mp{.spot = 100.0,
+                    .strike = 95.0,
+                    .rate = 0.01,
+                    .dividend = 0.0,
+                    .vol = 0.3,
+                    .time = 0.5,
+                    .num_paths = 20000,
+                    .seed = 9,
+                    .antithetic = true,
+                    .control_variate = false};
+    mp.num_steps = 4;
+    auto fixed = mc::price_european_call(mp);
+    EXPECT_EQ(fixed.paths_used, mp.num_paths);
+
+    // An unreachable target forces batching all the way to the path cap.
+    mp.stopping.target_std_error = 1e-12;
+    mp.stopping.batch_paths = 3000;
+    auto batched = mc::price_european_call(mp);
+    EXPECT_EQ(batched.paths_used, mp.num_paths);
+    EXPECT_NEAR(batched.estimate.value, fixed.estimate.value, 1e-10);
+    EXPECT_NEAR(batched.estimate.std_error, fixed.estimate.std_error, 1e-10);
+}
+
+TEST(MonteCarloFast, TimeBudgetStopsAfterFirstBatch) {
+    mc::McParams mp{.spot = 100.0,
+                    .strike = 100.0,
+                    .rate = 0.03,
+                    .dividend = 0.0,
+                    .vol = 0.2,
+                    .time = 1.0,
+                    .num_paths = 50'000'000,
+                    .seed = 1,
+                    .antithetic = false,
+                    .control_variate = false};
+    mp.stopping.time_budget_seconds = 1e-9;
+    mp.stopping.batch_paths = 2048;
+    auto res = mc::price_european_call(mp);
+    EXPECT_EQ(res.paths_used, 2048u);
+    EXPECT_GT(res.estimate.std_error, 0.0);
+}
+
+TEST(MonteCarloFast, BatchCallsReproduceSingleOptionPricing) {
+    mc::McParams mp{.spot = 100.0,
+                    .strike = 0.0,
+                    .rate = 0.02,
+                    .dividend = 0.01,
+                    .vol = 0.25,
+                    .time = 0.75,
+                    .num_paths = 20000,
+                    .seed = 17,
+                    .antithetic = true,
+                    .control_variate = true};
+    mp.num_steps = 4;
+    const std::vector<mc::OptionSpec> options{{90.0, OptionType::Call}, {110.0, OptionType::Call}};
+    const auto batch = mc::price_european_batch(mp, options);
+    ASSERT_EQ(batch.estimates.size(), options.size());
+    EXPECT_EQ(batch.paths_used, mp.num_paths);
+    for (std::size_t k = 0; k < options.size(); ++k) {
+        auto single = mp;
+        single.strike = options[k].strike;
+        const auto res = mc::price_european_call(single);
+        EXPECT_DOUBLE_EQ(batch.estimates[k].value, res.estimate.value);
+        EXPECT_DOUBLE_EQ(batch.estimates[k].std_error, res.estimate.std_error);
+    }
+}
+
+TEST(MonteCarloFast, BatchStrikeLadderMatchesBlackScholes) {
+    mc::McParams mp{.spot = 100.0,
+                    .strike = 0.0,
+                    .rate = 0.03,
+                    .dividend = 0.01,
+                    .vol = 0.2,
+                    .time = 1.0,
+                    .num_paths = 100000,
+                    .seed = 5,
+                    .antithetic = true,
+                    .control_variate = true};
+    std::vector<mc::OptionSpec> options;
+    for (double strike : {80.0, 95.0, 100.0, 105.0, 120.0}) {
+        options.push_back({strike, OptionType::Call});
+        options.push_back({strike, OptionType::Put});
+    }
+    const auto batch = mc::price_european_batch(mp, options);
+    for (std::size_t k = 0; k < options.size(); ++k) {
+        const auto& option = options[k];
+        const double bs_price =
+            option.type == OptionType::Call
+                ? bs::call_price(mp.spot, option.strike, mp.rate, mp.dividend, mp.vol, mp.time)
+                : bs::put_price(mp.spot, option.strike, mp.rate, mp.dividend, mp.vol, mp.time);
+        EXPECT_NEAR(batch.estimates[k].value, bs_price, 4.0 * batch.estimates[k].std_error);
+    }
+    // Calls and puts share paths, so parity errors stay within the correlated error budget.
+    for (std::size_t k = 0; k < options.size(); k += 2) {
+        const double forward_pv =
+            mp.spot * std::exp(-mp.dividend * mp.time) - options[k].strike * std::exp(-mp.rate * mp.time);
+        const double tolerance = 4.0 * (batch.estimates[k].std_error + batch.estimates[k + 1].std_error);
+        EXPECT_NEAR(batch.estimates[k].value - batch.estimates[k + 1].value, forward_pv, tolerance);
+    }
+}
+
+TEST(MonteCarloFast, BatchRejectsInvalidRequests) {
+    mc::McParams mp{.spot = 100.0,
+                    .strike = 0.0,
+                    .rate = 0.03,
+                    .dividend = 0.0,
+                    .vol = 0.2,
+                    .time = 1.0,
+                    .num_paths = 1000,
+                    .seed = 1,
+                    .antithetic = true,
+                    .control_variate = true};
+    EXPECT_THROW(mc::price_european_batch(mp, {}), std::invalid_argument);
+    EXPECT_THROW(mc::price_european_batch(mp, {{-1.0, OptionType::Call}}), std::invalid_argument);
+    mp.stopping.target_std_error = 0.01;
+    EXPECT_THROW(mc::price_european_batch(mp, {{100.0, OptionType::Call}, {100.0, OptionType::Put}}),
+                 std::invalid_argument);
+}
+
+TEST(MonteCarloFast, AdjointGreeksMatchBlackScholes) {
+    mc::McParams mp{.spot = 100.0,
+                    .strike = 105.0,
+                    .rate = 0.03,
+                    .dividend = 0.01,
+                    .vol = 0.25,
+                    .time = 1.0,
+                    .num_paths = 100000,
+                    .seed = 17,
+                    .antithetic = true,
+                    .control_variate = false};
+    const auto adj = mc::greeks_european_call_adjoint(mp);
+    const auto priced = mc::price_european_call(mp);
+    EXPECT_NEAR(adj.price.value, priced.estimate.value, 1e-9);
+    mp.seed = 0; // both fall back to the same default seed
+    EXPECT_NEAR(mc::greeks_european_call_adjoint(mp).price.value, mc::price_european_call(mp).estimate.value,
+                1e-9);
+    mp.seed = 17;
+
+    const double S = mp.spot, K = mp.strike, r = mp.rate, q = mp.dividend, sigma = mp.vol, T = mp.time;
+    EXPECT_NEAR(adj.delta.value, bs::delta_call(S, K, r, q, sigma, T), 4.0 * adj.delta.std_error + 1e-3);
+    EXPECT_NEAR(adj.vega.value, bs::vega(S, K, r, q, sigma, T), 4.0 * adj.vega.std_error + 0.05);
+    EXPECT_NEAR(adj.rho.value, bs::rho_call(S, K, r, q, sigma, T), 4.0 * adj.rho.std_error + 0.05);
+    EXPECT_TRUE(adj.rate_buckets.empty());
+    EXPECT_TRUE(adj.vol_buckets.empty());
+}
+
+TEST(MonteCarloFast, AdjointBucketsMatchBumpedSchedules) {
+    mc::McParams mp{.spot = 100.0,
+                    .strike = 100.0,
+                    .rate = 0.0,
+                    .dividend = 0.0,
+                    .vol = 0.0,
+                    .time = 1.5,
+                    .num_paths = 20000,
+                    .seed = 9,
+                    .antithetic = true,
+                    .control_variate = false};
+    mp.num_steps = 12;
+    mp.rate_schedule = PiecewiseConstant{{0.5, 1.0, 1.5}, {0.02, 0.03, 0.04}};
+    mp.vol_schedule = PiecewiseConstant{{0.25, 1.5}, {0.3, 0.2}};
+    const auto adj = mc::greeks_european_call_adjoint(mp);
+    ASSERT_EQ(adj.rate_buckets.size(), 3u);
+    ASSERT_EQ(adj.vol_buckets.size(), 2u);
+
+    double rate_sum = 0.0;
+    for (const auto& b : adj.rate_buckets) {
+        rate_sum += b.value;
+    }
+    double vol_sum = 0.0;
+    for (const auto& b : adj.vol_buckets) {
+        vol_sum += b.value;
+    }
+    EXPECT_NEAR(rate_sum, adj.rho.value, 1e-9);
+    EXPECT_NEAR(vol_sum, adj.vega.value, 1e-9);
+
+    // Central differences of the price on the same paths (common random numbers).
+    const auto bumped_price = [&](bool rate, std::size_t j, double h) {
+        mc::McParams bumped = mp;
+        auto& schedule = rate ? *bumped.rate_schedule : *bumped.vol_schedule;
+        schedule.values[j] += h;
+        return mc::greeks_european_call_adjoint(bumped).price.value;
+    };
+    for (std::size_t j = 0; j < adj.rate_buckets.size(); ++j) {
+        const double fd = (bumped_price(true, j, 1e-4) - bumped_price(true, j, -1e-4)) / 2e-4;
+        EXPECT_NEAR(adj.rate_buckets[j].value, fd, 1e-3 * std::abs(fd) + 1e-3);
+    }
+    for (std::size_t j = 0; j < adj.vol_buckets.size(); ++j) {
+        const double fd = (bumped_price(false, j, 1e-4) - bumped_price(false, j, -1e-4)) / 2e-4;
+        EXPECT_NEAR(adj.vol_buckets[j].value, fd, 1e-3 * std::abs(fd) + 1e-3);
+    }
+}
+
+TEST(MonteCarloFast, AdjointRejectsUnsupportedSamplers) {
+    mc::McParams mp{.spot = 100.0,
+                    .strike = 100.0,
+                    .rate = 0.03,
+                    .dividend = 0.0,
+                    .vol = 0.2,
+                    .time = 1.0,
+                    .num_paths = 100,
+                    .seed = 1,
+                    .antithetic = true,
+                    .control_variate = false};
+    mp.qmc = mc::McParams::Qmc::Sobol;
+    EXPECT_THROW(mc::greeks_european_call_adjoint(mp), std::invalid_argument);
+    mp.qmc = mc::McParams::Qmc::None;
+    mp.rng = rng::Mode::Mt19937;
+    EXPECT_THROW(mc::greeks_european_call_adjoint(mp), std::invalid_argument);
+    mp.rng = rng::Mode::Counter;
+    mp.bridge = mc::McParams::Bridge::BrownianBridge;
+    EXPECT_THROW(mc::greeks_european_call_adjoint(mp), std::invalid_argument);
+    mp.bridge = mc::McParams::Bridge::None;
+    mp.strike = -1.0;
+    EXPECT_THROW(mc::greeks_european_call_adjoint(mp), std::invalid_argument);
+    mp.strike = 100.0;
+    mp.num_paths = 0;
+    EXPECT_THROW(mc::greeks_european_call_adjoint(mp), std::invalid_argument);
+}
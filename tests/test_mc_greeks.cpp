@@ -0,0 +1,224 @@
+#include <gtest/gtest.h>
+
+#include <algorithm>
+#include <cmath>
+#include <stdexcept>
+#include <utility>
+
+#include "quant/asian.hpp"
+#include "quant/black_scholes.hpp"
+#include "quant/bs_barrier.hpp"
+#include "quant/lookback.hpp"
+#include "quant/mc_barrier.hpp"
+#include "quant/mc_greeks.hpp"
+#include "quant/multi.hpp"
+
+using quant::mc::PathMarket;
+
+namespace {
+
+void expect_within(const quant::mc::McStatistic& stat, double reference, double z, double floor) {
+    EXPECT_NEAR(stat.value, reference, z * stat.std_error + floor);
+}
+
+} // namespace
+
+TEST(McGreeksFast, EuropeanCallMatchesBlackScholes) {
+    const double K = 100.0;
+    const double q = 0.01;
+    const quant::mc::PathGreeksParams params{
+        .market = {{100.0}, {0.2}, 0.03, 1.0}, .normals_per_path = 1, .num_paths = 100000, .seed = 11};
+    const auto payoff = [&](const PathMarket& m, const double* z) {
+        const double sigma = m.vols[0];
+        const double drift = (m.rate - q - 0.5 * sigma * sigma) * m.time;
+        const double ST = m.spots[0] * std::exp(drift + sigma * std::sqrt(m.time) * z[0]);
+        return std::exp(-m.rate * m.time) * std::max(0.0, ST - K);
+    };
+    const auto res = quant::mc::path_greeks(params, payoff);
+    const double S = 100.0, r = 0.03, sigma = 0.2, T = 1.0;
+    ASSERT_EQ(res.delta.size(), 1u);
+    expect_within(res.price, quant::bs::call_price(S, K, r, q, sigma, T), 4.0, 1e-3);
+    expect_within(res.delta[0], quant::bs::delta_call(S, K, r, q, sigma, T), 4.0, 1e-3);
+    expect_within(res.gamma[0], quant::bs::gamma(S, K, r, q, sigma, T), 4.0, 1e-3);
+    expect_within(res.vega[0], quant::bs::vega(S, K, r, q, sigma, T), 4.0, 0.05);
+    expect_within(res.rho, quant::bs::rho_call(S, K, r, q, sigma, T), 4.0, 0.05);
+    expect_within(res.theta, quant::bs::theta_call(S, K, r, q, sigma, T), 4.0, 0.05);
+}
+
+TEST(McGreeksFast, BarrierGreeksMatchReinerRubinsteinBumps) {
+    const quant::BarrierSpec barrier{quant::BarrierType::DownOut, 85.0, 0.0};
+    const double S = 100.0, K = 100.0, r = 0.02, q = 0.0, sigma = 0.25, T = 1.0;
+    quant::mc::McParams base{.spot = S,
+                             .strike = K,
+                             .rate = r,
+                             .dividend = q,
+                             .vol = sigma,
+                             .time = T,
+                             .num_paths = 40000,
+                             .seed = 7,
+                             .antithetic = true,
+                             .control_variate = false};
+    base.num_steps = 64;
+    const auto res = quant::mc::greeks_barrier(base, K, quant::OptionType::Call, barrier);
+
+    const auto rr = [&](double spot, double vol) {
+        return quant::bs::reiner_rubinstein_price(quant::OptionType::Call, barrier, spot, K, r, q, vol, T);
+    };
+    const double h = 0.01 * S;
+    expect_within(res.price, rr(S, sigma), 4.0, 0.02);
+    expect_within(res.delta[0], (rr(S + h, sigma) - rr(S - h, sigma)) / (2.0 * h), 4.0, 0.01);
+    expect_within(res.vega[0], (rr(S, sigma + 0.01) - rr(S, sigma - 0.01)) / 0.02, 4.0, 0.5);
+}
+
+TEST(McGreeksFast, FloatingLookbackIsHomogeneousInSpot) {
+    quant::lookback::McParams p{.spot = 100.0,
+                                .strike = 0.0,
+                                .rate = 0.02,
+                                .dividend = 0.0,
+                                .vol = 0.3,
+                                .time = 0.5,
+                                .num_paths = 20000,
+                                .seed = 3,
+                                .num_steps = 32,
+                                .antithetic = true,
+                                .use_bridge = false,
+                                .opt = quant::OptionType::Call,
+                                .type = quant::lookback::Type::FloatingStrike};
+    const auto res = quant::lookback::greeks_mc(p);
+    // V(S) = S * v: every path is linear in spot, so delta = V / S and gamma vanishes.
+    EXPECT_NEAR(res.delta[0].value, res.price.value / p.spot, 1e-9);
+    EXPECT_NEAR(res.gamma[0].value, 0.0, 1e-8);
+    EXPECT_GT(res.vega[0].value, 0.0);
+}
+
+TEST(McGreeksFast, AsianGreeksAreConsistentWithPricer) {
+    quant::asian::McParams p{.spot = 100.0,
+                             .strike = 100.0,
+                             .rate = 0.03,
+                             .dividend = 0.0,
+                             .vol = 0.2,
+                             .time = 1.0,
+                             .num_paths = 40000,
+                             .seed = 5,
+                             .num_steps = 12,
+                             .antithetic = true,
+                             .use_geometric_cv = false};
+    const auto res = quant::asian::greeks_mc(p);
+    const auto price = quant::asian::price_mc(p);
+    EXPECT_NEAR(res.price.value, price.value, 4.0 * std::hypot(res.price.std_error, price.std_error));
+    // Both engines share one payoff, so every contract variant prices the same product.
+    for (const auto& [payoff, average] :
+         {std::pair{quant::asian::Payoff::FixedStrike, quant::asian::Average::Geometric},
+          std::pair{quant::asian::Payoff::FloatingStrike, quant::asian::Average::Arithmetic}}) {
+        auto variant = p;
+        variant.payoff = payoff;
+        variant.avg = average;
+        const auto greeks = quant::asian::greeks_mc(variant);
+        const auto priced = quant::asian::price_mc(variant);
+        EXPECT_NEAR(greeks.price.value, priced.value,
+                    4.0 * std::hypot(greeks.price.std_error, priced.std_error));
+    }
+    EXPECT_GT(res.delta[0].value, 0.0);
+    EXPECT_LT(res.delta[0].value, quant::bs::delta_call(100.0, 100.0, 0.03, 0.0, 0.2, 1.0));
+    EXPECT_GT(res.gamma[0].value, 0.0);
+    EXPECT_GT(res.vega[0].value, 0.0);
+    EXPECT_LT(res.vega[0].value, quant::bs::vega(100.0, 100.0, 0.03, 0.0, 0.2, 1.0));
+}
+
+TEST(McGreeksFast, BasketGreeksPerAssetAndSingleAssetLimit) {
+    quant::multi::BasketMcParams single{.spots = {100.0},
+                                        .vols = {0.2},
+                                        .dividends = {0.0},
+                                        .weights = {1.0},
+                                        .corr = {1.0},
+                                        .rate = 0.02,
+                                        .strike = 95.0,
+                                        .time = 1.0,
+                                        .num_paths = 60000,
+                                        .seed = 21};
+    const auto one = quant::multi::basket_greeks_mc(single);
+    expect_within(one.delta[0], quant::bs::delta_call(100.0, 95.0, 0.02, 0.0, 0.2, 1.0), 4.0, 1e-3);
+    expect_within(one.vega[0], quant::bs::vega(100.0, 95.0, 0.02, 0.0, 0.2, 1.0), 4.0, 0.05);
+
+    quant::multi::BasketMcParams pair{.spots = {100.0, 50.0},
+                                      .vols = {0.2, 0.3},
+                                      .dividends = {0.0, 0.01},
+                                      .weights = {0.5, 1.0},
+                                      .corr = {1.0, 0.4, 0.4, 1.0},
+                                      .rate = 0.02,
+                                      .strike = 100.0,
+                                      .time = 1.0,
+                                      .num_paths = 40000,
+                                      .seed = 22};
+    const auto two = quant::multi::basket_greeks_mc(pair);
+    ASSERT_EQ(two.delta.size(), 2u);
+    ASSERT_EQ(two.vega.size(), 2u);
+    // The asset with twice the weight per unit of spot carries twice the delta of a linear claim.
+    EXPECT_GT(two.delta[1].value, two.delta[0].value);
+    const auto price = quant::multi::basket_european_call_mc(pair);
+    EXPECT_NEAR(two.price.value, price.value, 4.0 * std::hypot(two.price.std_error, price.std_error));
+}
+
+TEST(McGreeksFast, BasketGreeksHonourTypeAndAveraging) {
+    quant::multi::BasketMcParams put{.spots = {100.0},
+                                     .vols = {0.2},
+                                     .dividends = {0.01},
+                                     .weights = {1.0},
+                                     .corr = {1.0},
+                                     .rate = 0.02,
+                                     .strike = 105.0,
+                                     .time = 1.0,
+                                     .num_paths = 60000,
+                                     .seed = 23,
+                                     .type = quant::OptionType::Put};
+    const auto one = quant::multi::basket_greeks_mc(put);
+    const double put_delta =
+        quant::bs::delta_call(100.0, 105.0, 0.02, 0.01, 0.2, 1.0) - std::exp(-0.01 * 1.0); // parity
+    expect_within(one.delta[0], put_delta, 4.0, 1e-3);
+    expect_within(one.vega[0], quant::bs::vega(100.0, 105.0, 0.02, 0.01, 0.2, 1.0), 4.0, 0.05);
+    expect_within(one.price, quant::bs::put_price(100.0, 105.0, 0.02, 0.01, 0.2, 1.0), 4.0, 1e-3);
+
+    // A put on the basket averaged over 12 dates, with the geometric control variate.
+    quant::multi::BasketMcParams averaged{.spots = {100.0, 50.0},
+                                          .vols = {0.2, 0.3},
+                                          .dividends = {0.0, 0.01},
+                                          .weights = {0.5, 1.0},
+                                          .corr = {1.0, 0.4, 0.4, 1.0},
+                                          .rate = 0.02,
+                                          .strike = 100.0,
+                                          .time = 1.0,
+                                          .num_paths = 20000,
+                                          .seed = 24,
+                                          .type = quant::OptionType::Put,
+                                          .num_steps = 12,
+                                          .average = true,
+                                          .use_geometric_cv = true};
+    const auto greeks = quant::multi::basket_greeks_mc(averaged);
+    const auto price = quant::multi::basket_option_mc(averaged);
+    EXPECT_NEAR(greeks.price.value, price.value, 4.0 * std::hypot(greeks.price.std_error, price.std_error));
+    EXPECT_LT(greeks.delta[0].value, 0.0);
+    EXPECT_LT(greeks.delta[1].value, 0.0);
+
+    // Averaging damps the volatility exposure relative to the terminal basket put.
+    quant::multi::BasketMcParams terminal = averaged;
+    terminal.num_steps = 1;
+    terminal.average = false;
+    const auto terminal_greeks = quant::multi::basket_greeks_mc(terminal);
+    EXPECT_LT(greeks.vega[1].value, terminal_greeks.vega[1].value);
+
+    averaged.qmc = quant::multi::Qmc::Sobol;
+    EXPECT_THROW(quant::multi::basket_greeks_mc(averaged), std::invalid_argument);
+}
+
+TEST(McGreeksFast, RejectsInvalidInputs) {
+    const auto payoff = [](const PathMarket&, const double*) { return 0.0; };
+    quant::mc::PathGreeksParams params{
+        .market = {{100.0}, {0.2, 0.3}, 0.0, 1.0}, .normals_per_path = 1, .num_paths = 10, .seed = 1};
+    EXPECT_THROW(quant::mc::path_greeks(params, payoff), std::invalid_argument);
+    params.market.vols = {0.2};
+    params.bumps.spot_rel = 0.0;
+    EXPECT_THROW(quant::mc::path_greeks(params, payoff), std::invalid_argument);
+    params.bumps.spot_rel = 0.01;
+    params.market.time = 0.0;
+    EXPECT_THROW(quant::mc::path_greeks(params, payoff), std::invalid_argument);
+}
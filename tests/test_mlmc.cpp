@@ -0,0 +1,104 @@
+#include <gtest/gtest.h>
+
+#include <cmath>
+#include <cstdint>
+#include <stdexcept>
+
+#include "quant/bs_barrier.hpp"
+#include "quant/heston.hpp"
+#include "quant/lookback.hpp"
+#include "quant/mc_barrier.hpp"
+#include "quant/mlmc.hpp"
+#include "quant/rng.hpp"
+
+using quant::mlmc::MlmcParams;
+
+TEST(MlmcFast, DriverAddsLevelsUntilBiasIsSmall) {
+    // Synthetic corrections with E[Y_l] = 2^-l and Var[Y_l] = 4^-l: the limit is 2.
+    const MlmcParams params{.target_rmse = 0.01, .pilot_paths = 1000};
+    const auto sampler = [](int level, std::uint64_t begin, std::uint64_t end) {
+        quant::stats::Welford acc;
+        const double scale = std::ldexp(1.0, -level);
+        for (std::uint64_t idx = begin; idx < end; ++idx) {
+            const double z = quant::rng::normal(17ULL, idx, static_cast<std::uint32_t>(level), 0U, 0U);
+            acc.add(scale * (1.0 + z));
+        }
+        return acc;
+    };
+    const auto result = quant::mlmc::run(params, sampler);
+    EXPECT_TRUE(result.converged);
+    EXPECT_GT(result.levels.size(), 3u);
+    EXPECT_LE(result.bias_estimate, params.target_rmse / std::sqrt(2.0));
+    EXPECT_LE(result.std_error, params.target_rmse / std::sqrt(2.0) * 1.05);
+    EXPECT_NEAR(result.value, 2.0, 3.0 * params.target_rmse);
+    for (std::size_t l = 1; l < result.levels.size(); ++l) {
+        EXPECT_EQ(result.levels[l].steps, 2 * result.levels[l - 1].steps);
+        EXPECT_LE(result.levels[l].paths, result.levels[l - 1].paths);
+    }
+}
+
+TEST(MlmcFast, BarrierMatchesReinerRubinstein) {
+    quant::mc::McParams base{.spot = 100.0,
+                             .strike = 100.0,
+                             .rate = 0.02,
+                             .dividend = 0.0,
+                             .vol = 0.25,
+                             .time = 1.0,
+                             .num_paths = 0,
+                             .seed = 7};
+    const quant::BarrierSpec spec{quant::BarrierType::DownOut, 85.0, 0.0};
+    const MlmcParams params{.target_rmse = 0.03};
+    const auto result =
+        quant::mc::price_barrier_mlmc(base, base.strike, quant::OptionType::Call, spec, params);
+    const double analytic = quant::bs::reiner_rubinstein_price(
+        quant::OptionType::Call, spec, base.spot, base.strike, base.rate, base.dividend, base.vol, base.time);
+    EXPECT_TRUE(result.converged);
+    EXPECT_NEAR(result.value, analytic, 3.0 * params.target_rmse);
+}
+
+TEST(MlmcFast, LookbackConvergesToContinuousMonitoring) {
+    quant::lookback::McParams p{.spot = 100.0,
+                                .strike = 100.0,
+                                .rate = 0.05,
+                                .dividend = 0.0,
+                                .vol = 0.2,
+                                .time = 1.0,
+                                .num_paths = 0,
+                                .seed = 3,
+                                .num_steps = 0,
+                                .antithetic = true,
+                                .use_bridge = false,
+                                .opt = quant::OptionType::Call,
+                                .type = quant::lookback::Type::FloatingStrike};
+    const MlmcParams params{.target_rmse = 0.05};
+    const auto result = quant::lookback::price_mlmc(p, params);
+    // Goldman–Sosin–Gatto floating-strike lookback call (continuous monitoring).
+    const double analytic = 17.2168022;
+    EXPECT_TRUE(result.converged);
+    EXPECT_NEAR(result.value, analytic, 3.0 * params.target_rmse);
+    // Standard MC at the finest step count would need Var[P] * steps_L / (eps^2 / 2) time steps.
+    const double eps2 = params.target_rmse * params.target_rmse;
+    const double std_cost = result.levels.front().variance * result.levels.back().steps / (0.5 * eps2);
+    EXPECT_LT(result.total_cost, std_cost);
+}
+
+TEST(MlmcFast, HestonMatchesAnalytic) {
+    const quant::heston::Params h{1.5, 0.04, 0.5, -0.5, 0.04};
+    const quant::heston::MarketParams mkt{100.0, 100.0, 0.01, 0.0, 1.0};
+    const quant::heston::McParams p{mkt, h, 0, 2025, 0, true};
+    const MlmcParams params{.target_rmse = 0.04};
+    const auto result = quant::heston::call_qe_mlmc(p, params);
+    EXPECT_TRUE(result.converged);
+    EXPECT_NEAR(result.value, quant::heston::call_analytic(mkt, h), 3.0 * params.target_rmse);
+}
+
+TEST(MlmcFast, RejectsInvalidParameters) {
+    const auto sampler = [](int, std::uint64_t, std::uint64_t) { return quant::stats::Welford{}; };
+    EXPECT_THROW(quant::mlmc::run(MlmcParams{.target_rmse = 0.0}, sampler), std::invalid_argument);
+    EXPECT_THROW(quant::mlmc::run(MlmcParams{.target_rmse = 0.1, .refinement = 1}, sampler),
+                 std::invalid_argument);
+    EXPECT_THROW(quant::mlmc::run(MlmcParams{.target_rmse = 0.1, .min_levels = 1}, sampler),
+                 std::invalid_argument);
+    EXPECT_THROW(quant::mlmc::run(MlmcParams{.target_rmse = 0.1, .max_levels = 40}, sampler),
+                 std::invalid_argument);
+}
@@ -1,6 +1,52 @@
 #include "quant/multi.hpp"
 #include <gtest/gtest.h>
 
+#include "quant/black_scholes.hpp"
+
+#ifdef QUANT_HAS_OPENMP
+#include <omp.h>
+#endif
+
+#include <cmath>
+#include <vector>
+
+namespace {
+
+// Equicorrelated basket of n names with staggered spots and vols.
+quant::multi::BasketMcParams equicorrelated_basket(std::size_t n, double rho) {
+    quant::multi::BasketMcParams p{};
+    for (std::size_t k = 0; k < n; ++k) {
+        p.spots.push_back(80.0 + 40.0 * static_cast<double>(k) / static_cast<double>(n));
+        p.vols.push_back(0.15 + 0.2 * static_cast<double>(k % 5) / 4.0);
+        p.dividends.push_back(0.01 * static_cast<double>(k % 3));
+        p.weights.push_back(1.0 / static_cast<double>(n));
+    }
+    p.corr.assign(n * n, rho);
+    for (std::size_t k = 0; k < n; ++k) {
+        p.corr[k * n + k] = 1.0;
+    }
+    p.rate = 0.03;
+    p.strike = 100.0;
+    p.time = 1.0;
+    p.num_paths = 20000;
+    p.seed = 99;
+    return p;
+}
+
+template <typename Fn> auto with_threads(int threads, Fn&& fn) {
+#ifdef QUANT_HAS_OPENMP
+    const int previous = omp_get_max_threads();
+    omp_set_num_threads(threads);
+#endif
+    auto result = fn();
+#ifdef QUANT_HAS_OPENMP
+    omp_set_num_threads(previous);
+#endif
+    return result;
+}
+
+} // namespace
+
 TEST(MultiAsset, BasketCallIncreasesWithCorrelation) {
     quant::multi::BasketMcParams p{};
     p.spots = {100.0, 100.0};
@@ -67,5 +113,107 @@ TEST(MultiAsset, MertonAntitheticReducesSE) {
     EXPECT_LT(anti.std_error, plain.std_error);
 }
 
+TEST(MultiAsset, BasketStoppingRuleMatchesFixedPrefix) {
+    quant::multi::BasketMcParams p{};
+    p.spots = {100.0, 95.0};
+    p.vols = {0.2, 0.3};
+    p.dividends = {0.0, 0.01};
+    p.weights = {0.5, 0.5};
+    p.corr = {1.0, 0.3, 0.3, 1.0};
+    p.rate = 0.02;
+    p.strike = 100.0;
+    p.time = 1.0;
+    p.num_paths = 2'000'000;
+    p.seed = 77;
+    p.stopping.target_std_error = 0.05;
+    p.stopping.batch_paths = 5000;
+
+    const auto adaptive = quant::multi::basket_european_call_mc(p);
+    EXPECT_LE(adaptive.std_error, 0.05);
+    EXPECT_LT(adaptive.paths_used, p.num_paths);
+
+    // Batches consume the same random stream as a fixed run of the same size.
+    p.num_paths = adaptive.paths_used;
+    p.stopping = {};
+    const auto fixed = quant::multi::basket_european_call_mc(p);
+    EXPECT_EQ(fixed.paths_used, adaptive.paths_used);
+    EXPECT_NEAR(fixed.value, adaptive.value, 1e-10);
+    EXPECT_NEAR(fixed.std_error, adaptive.std_error, 1e-10);
+}
+
+TEST(MultiAsset, BasketIsThreadInvariantAndSatisfiesPutCallParity) {
+    auto p = equicorrelated_basket(8, 0.4);
+    p.num_steps = 4;
+    p.average = true;
+    p.antithetic = false;
+    const auto run = [&] { return quant::multi::basket_option_mc(p); };
+    const auto one = with_threads(1, run);
+    const auto four = with_threads(4, run);
+    EXPECT_EQ(one.value, four.value);
+    EXPECT_EQ(one.std_error, four.std_error);
+
+    // Calls and puts see the same paths, so C - P is the discounted mean of (A - K) over them.
+    p.type = quant::OptionType::Put;
+    const auto put = quant::multi::basket_option_mc(p);
+    double forward = 0.0;
+    for (std::size_t k = 0; k < p.spots.size(); ++k) {
+        for (int j = 1; j <= p.num_steps; ++j) {
+            const double t = p.time * j / p.num_steps;
+            forward += p.weights[k] * p.spots[k] * std::exp((p.rate - p.dividends[k]) * t) / p.num_steps;
+        }
+    }
+    const double parity = std::exp(-p.rate * p.time) * (forward - p.strike);
+    EXPECT_NEAR(one.value - put.value, parity, 4.0 * (one.std_error + put.std_error));
+}
+
+TEST(MultiAsset, BasketSingleAssetMatchesBlackScholes) {
+    quant::multi::BasketMcParams p{.spots = {100.0},
+                                   .vols = {0.25},
+                                   .dividends = {0.01},
+                                   .weights = {1.0},
+                                   .corr = {1.0},
+                                   .rate = 0.03,
+                                   .strike = 105.0,
+                                   .time = 1.0,
+                                   .num_paths = 16384,
+                                   .seed = 5};
+    p.qmc = quant::multi::Qmc::SobolScrambled;
+    const auto call = quant::multi::basket_option_mc(p);
+    EXPECT_NEAR(call.value, quant::bs::call_price(100.0, 105.0, 0.03, 0.01, 0.25, 1.0), 0.02);
+    p.type = quant::OptionType::Put;
+    const auto put = quant::multi::basket_option_mc(p);
+    EXPECT_NEAR(put.value, quant::bs::put_price(100.0, 105.0, 0.03, 0.01, 0.25, 1.0), 0.02);
+
+    // With one asset the geometric control variate is the option itself: zero variance.
+    p.qmc = quant::multi::Qmc::None;
+    p.use_geometric_cv = true;
+    const auto exact = quant::multi::basket_option_mc(p);
+    EXPECT_NEAR(exact.value, quant::bs::put_price(100.0, 105.0, 0.03, 0.01, 0.25, 1.0), 1e-10);
+    EXPECT_NEAR(exact.std_error, 0.0, 1e-10);
+}
+
+TEST(MultiAsset, BasketQmcAndControlVariateAgreeWithPlainMc) {
+    auto p = equicorrelated_basket(50, 0.3);
+    p.num_steps = 12;
+    p.average = true;
+    p.num_paths = 8192;
+    const auto plain = quant::multi::basket_option_mc(p);
+
+    p.use_geometric_cv = true;
+    const auto cv = quant::multi::basket_option_mc(p);
+    EXPECT_LT(cv.std_error, 0.25 * plain.std_error);
+    EXPECT_NEAR(cv.value, plain.value, 4.0 * std::hypot(cv.std_error, plain.std_error));
+
+    p.qmc = quant::multi::Qmc::SobolScrambled;
+    const auto qmc = quant::multi::basket_option_mc(p);
+    EXPECT_NEAR(qmc.value, cv.value, 4.0 * std::hypot(cv.std_error, qmc.std_error));
+
+    p.num_steps = 30;
+    EXPECT_THROW(quant::multi::basket_option_mc(p), std::invalid_argument);
+    p.qmc = quant::multi::Qmc::None;
+    p.weights[0] = -p.weights[0];
+    EXPECT_THROW(quant::multi::basket_option_mc(p), std::invalid_argument);
+}
+
 // Note: Additional monotonicity properties in jump diffusion depend on parameterization;
 // we only assert variance-reduction characteristics here.
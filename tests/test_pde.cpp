@@ -162,3 +162,75 @@ TEST(PDE, SecondOrderSlope) {
     }
     EXPECT_NEAR(slope, 2.0, 0.3);
 }
+
+TEST(PDE, BatchSingleOptionMatchesScalarSolver) {
+    pde::PdeParams pp{.spot = 100.0,
+                      .strike = 100.0,
+                      .rate = 0.03,
+                      .dividend = 0.01,
+                      .vol = 0.2,
+                      .time = 1.0,
+                      .type = quant::OptionType::Call,
+                      .grid = pde::GridSpec{201, 200, 4.0, 2.0}};
+    pp.compute_theta = true;
+    const auto scalar = pde::price_crank_nicolson(pp);
+    const auto batch = pde::price_crank_nicolson_batch(pp, {{pp.strike, pp.type, pp.time}});
+    ASSERT_EQ(batch.size(), 1u);
+    // The scalar solver evaluates Dirichlet data at calendar rather than remaining time; far from
+    // the upper boundary the two agree to well below discretisation error.
+    EXPECT_NEAR(batch[0].price, scalar.price, 1e-6);
+    EXPECT_NEAR(batch[0].delta, scalar.delta, 1e-6);
+    EXPECT_NEAR(batch[0].gamma, scalar.gamma, 1e-6);
+    ASSERT_TRUE(batch[0].theta.has_value());
+    EXPECT_NEAR(*batch[0].theta, *scalar.theta, 1e-4);
+}
+
+TEST(PDE, BatchStrikesAndMaturitiesMatchBlackScholes) {
+    pde::PdeParams pp{.spot = 100.0,
+                      .strike = 100.0,
+                      .rate = 0.03,
+                      .dividend = 0.01,
+                      .vol = 0.25,
+                      .time = 0.0,
+                      .type = quant::OptionType::Call,
+                      .grid = pde::GridSpec{401, 400, 4.0}};
+    pp.log_space = true;
+    std::vector<pde::BatchOption> options;
+    for (const double T : {0.25, 1.0, 2.0}) {
+        for (const double K : {80.0, 100.0, 120.0}) {
+            options.push_back({K, quant::OptionType::Call, T});
+            options.push_back({K, quant::OptionType::Put, T});
+        }
+    }
+    const auto results = pde::price_crank_nicolson_batch(pp, options);
+    ASSERT_EQ(results.size(), options.size());
+    for (std::size_t i = 0; i < options.size(); ++i) {
+        const auto& o = options[i];
+        const bool call = o.type == quant::OptionType::Call;
+        const double S = pp.spot, r = pp.rate, q = pp.dividend, sigma = pp.vol;
+        const double price = call ? bs::call_price(S, o.strike, r, q, sigma, o.time)
+                                  : bs::put_price(S, o.strike, r, q, sigma, o.time);
+        const double delta = call ? bs::delta_call(S, o.strike, r, q, sigma, o.time)
+                                  : bs::delta_put(S, o.strike, r, q, sigma, o.time);
+        EXPECT_NEAR(results[i].price, price, 2e-2) << "K=" << o.strike << " T=" << o.time;
+        EXPECT_NEAR(results[i].delta, delta, 2e-3) << "K=" << o.strike << " T=" << o.time;
+        EXPECT_NEAR(results[i].gamma, bs::gamma(S, o.strike, r, q, sigma, o.time), 2e-3);
+    }
+}
+
+TEST(PDE, BatchRejectsInvalidRequests) {
+    pde::PdeParams pp{.spot = 100.0,
+                      .strike = 100.0,
+                      .rate = 0.03,
+                      .dividend = 0.0,
+                      .vol = 0.2,
+                      .time = 1.0,
+                      .type = quant::OptionType::Call,
+                      .grid = pde::GridSpec{101, 100, 4.0}};
+    EXPECT_THROW(pde::price_crank_nicolson_batch(pp, {}), std::invalid_argument);
+    EXPECT_THROW(pde::price_crank_nicolson_batch(pp, {{100.0, quant::OptionType::Call, 0.0}}),
+                 std::invalid_argument);
+    pp.vol_schedule = PiecewiseConstant{{1.0}, {0.2}};
+    EXPECT_THROW(pde::price_crank_nicolson_batch(pp, {{100.0, quant::OptionType::Call, 1.0}}),
+                 std::invalid_argument);
+}
@@ -2,9 +2,12 @@
 
 #include "quant/black_scholes.hpp"
 #include "quant/portfolio.hpp"
+#include "quant/rng.hpp"
 
+#include <algorithm>
 #include <cmath>
 #include <limits>
+#include <stdexcept>
 #include <vector>
 
 using quant::portfolio::MarketShock;
@@ -68,6 +71,312 @@ TEST(PortfolioRisk, AggregateOnlyAvoidsDetailAllocationAndIsDeterministic) {
     EXPECT_DOUBLE_EQ(first.base_portfolio_value, second.base_portfolio_value);
 }
 
+TEST(PortfolioRisk, BlockedScenarioRevaluationMatchesScalarPricing) {
+    // Enough positions to span several revaluation blocks, including some that expire or lose all
+    // volatility under the shock and so take the scalar conventions.
+    std::vector<VanillaPosition> positions;
+    for (int i = 0; i < 2500; ++i) {
+        auto position = (i % 2 == 0) ? call(1.0 + 0.001 * i) : put(-0.5 - 0.002 * i);
+        position.strike += static_cast<double>(i % 40);
+        position.time = (i % 97 == 0) ? 2.0 / 365.0 : position.time;
+        position.volatility = (i % 89 == 0) ? 0.05 : position.volatility;
+        positions.push_back(position);
+    }
+    const std::vector<MarketShock> shocks{{0.08, -0.05, 0.002, 0.0, 3.0 / 365.0},
+                                          {-0.2, 0.1, -0.01, 0.004, 0.0}};
+    const auto result = quant::portfolio::scenario_pnl(positions, shocks, true);
+    for (std::size_t s = 0; s < shocks.size(); ++s) {
+        const auto& shock = shocks[s];
+        double expected_total = 0.0;
+        for (std::size_t i = 0; i < positions.size(); ++i) {
+            const auto& p = positions[i];
+            const double spot = p.spot * (1.0 + shock.spot_return);
+            const double rate = p.rate + shock.rate_shift;
+            const double dividend = p.dividend + shock.dividend_shift;
+            const double vol = p.volatility + shock.volatility_shift;
+            const double time = std::max(0.0, p.time - shock.time_elapsed);
+            const bool is_call = p.type == OptionType::Call;
+            const double base =
+                is_call ? quant::bs::call_price(p.spot, p.strike, p.rate, p.dividend, p.volatility, p.time)
+                        : quant::bs::put_price(p.spot, p.strike, p.rate, p.dividend, p.volatility, p.time);
+            const double shocked = is_call ? quant::bs::call_price(spot, p.strike, rate, dividend, vol, time)
+                                           : quant::bs::put_price(spot, p.strike, rate, dividend, vol, time);
+            const double expected = p.quantity * (shocked - base);
+            EXPECT_NEAR(result.position_pnl[s * positions.size() + i], expected, 1e-10) << s << " " << i;
+            expected_total += expected;
+        }
+        EXPECT_NEAR(result.portfolio_pnl[s], expected_total, 1e-8);
+    }
+}
+
+TEST(PortfolioRisk, TaylorAndHybridRevaluationTrackFullRepricing) {
+    using quant::portfolio::Revaluation;
+    using quant::portfolio::ScenarioOptions;
+    std::vector<VanillaPosition> positions;
+    for (int i = 0; i < 3000; ++i) {
+        auto position = (i % 2 == 0) ? call(1.0 + 0.001 * i) : put(-0.5 - 0.002 * i);
+        position.strike += static_cast<double>(i % 40) - 20.0;
+        position.time = (i % 101 == 0) ? 0.0 : 0.05 + 0.0006 * static_cast<double>(i % 1000);
+        positions.push_back(position);
+    }
+    std::vector<MarketShock> shocks{{0.0, 0.0, 0.0, 0.0, 0.0}, {-0.25, 0.15, -0.01, 0.0, 1.0 / 252.0}};
+    for (std::uint64_t s = 0; s < 40; ++s) {
+        shocks.push_back({0.01 * quant::rng::normal(9, s, 0U, 0U, 0U),
+                          0.005 * quant::rng::normal(9, s, 0U, 1U, 0U),
+                          0.0002 * quant::rng::normal(9, s, 0U, 2U, 0U), 0.0001, 1.0 / 252.0});
+    }
+    const std::size_t n = positions.size();
+    const auto full = quant::portfolio::scenario_pnl(positions, shocks, true);
+    const auto taylor =
+        quant::portfolio::scenario_pnl(positions, shocks, ScenarioOptions{Revaluation::Taylor, 0.0, true});
+    EXPECT_TRUE(full.revalued_cells.empty());
+
+    // Taylor reprices exactly the cells on expired positions and otherwise applies the base Greeks.
+    const auto risk = quant::portfolio::price_risk(positions);
+    ASSERT_EQ(taylor.revalued_cells.size(), (shocks.size() - 1) * 30);
+    const auto& shock = shocks[5];
+    for (std::size_t i = 1; i < n; i += 7) {
+        const auto& greeks = risk.positions[i];
+        const double ds = positions[i].spot * shock.spot_return;
+        const double dividend_sensitivity = -positions[i].time * positions[i].spot * greeks.delta;
+        const double expected =
+            positions[i].time == 0.0
+                ? full.position_pnl[5 * n + i]
+                : greeks.delta * ds + 0.5 * greeks.gamma * ds * ds + greeks.vega * shock.volatility_shift +
+                      greeks.rho * shock.rate_shift + dividend_sensitivity * shock.dividend_shift +
+                      greeks.theta * shock.time_elapsed;
+        EXPECT_NEAR(taylor.position_pnl[5 * n + i], expected, 1e-10);
+    }
+
+    const double tolerance = 0.02;
+    const auto hybrid = quant::portfolio::scenario_pnl(positions, shocks,
+                                                       ScenarioOptions{Revaluation::Hybrid, tolerance, true});
+    EXPECT_TRUE(std::is_sorted(hybrid.revalued_cells.begin(), hybrid.revalued_cells.end()));
+    std::vector<unsigned char> revalued(full.position_pnl.size(), 0);
+    std::size_t crash_cells = 0;
+    for (std::size_t cell : hybrid.revalued_cells) {
+        revalued[cell] = 1;
+        crash_cells += cell / n == 1 ? 1 : 0;
+        EXPECT_NEAR(hybrid.position_pnl[cell], full.position_pnl[cell], 1e-10);
+    }
+    EXPECT_GT(crash_cells, n * 9 / 10);
+    EXPECT_LT(hybrid.revalued_cells.size(), full.position_pnl.size() / 2);
+    for (std::size_t cell = 0; cell < full.position_pnl.size(); ++cell) {
+        if (revalued[cell] == 0) {
+            EXPECT_DOUBLE_EQ(hybrid.position_pnl[cell], taylor.position_pnl[cell]);
+            // The estimate is leading-order, so allow a small factor over the tolerance.
+            EXPECT_NEAR(hybrid.position_pnl[cell], full.position_pnl[cell], 3.0 * tolerance) << cell;
+        }
+    }
+    for (std::size_t i = 0; i < n; ++i) {
+        EXPECT_EQ(hybrid.position_pnl[i], 0.0);
+    }
+
+    const auto exact =
+        quant::portfolio::scenario_pnl(positions, shocks, ScenarioOptions{Revaluation::Hybrid, 0.0, false});
+    for (std::size_t s = 0; s < shocks.size(); ++s) {
+        EXPECT_NEAR(exact.portfolio_pnl[s], full.portfolio_pnl[s], 1e-8);
+    }
+    EXPECT_THROW(
+        quant::portfolio::scenario_pnl(positions, shocks, ScenarioOptions{Revaluation::Hybrid, -1.0, false}),
+        std::invalid_argument);
+}
+
+TEST(PortfolioRisk, PersistentBookRepricesOnlyStaleRows) {
+    using quant::portfolio::Portfolio;
+    std::vector<VanillaPosition> positions{call(), put(), call(-0.25), put(4.0)};
+    Portfolio book(positions);
+    EXPECT_EQ(book.size(), 4U);
+    EXPECT_EQ(book.stale_count(), 4U);
+
+    const auto expect_matches = [](Portfolio& portfolio, const std::vector<VanillaPosition>& reference) {
+        const auto totals = portfolio.risk();
+        const auto expected = quant::portfolio::price_risk(reference);
+        ASSERT_EQ(portfolio.size(), reference.size());
+        EXPECT_EQ(portfolio.stale_count(), 0U);
+        for (std::size_t i = 0; i < reference.size(); ++i) {
+            EXPECT_DOUBLE_EQ(portfolio.metric(Portfolio::Metric::Value)[i], expected.positions[i].value);
+            EXPECT_DOUBLE_EQ(portfolio.metric(Portfolio::Metric::Rho)[i], expected.positions[i].rho);
+        }
+        EXPECT_DOUBLE_EQ(totals.value, expected.totals.value);
+        EXPECT_DOUBLE_EQ(totals.delta, expected.totals.delta);
+        EXPECT_DOUBLE_EQ(totals.gamma, expected.totals.gamma);
+    };
+    expect_matches(book, positions);
+
+    positions[1].spot = 97.0;
+    book.amend(1, positions[1]);
+    EXPECT_EQ(book.stale_count(), 1U);
+    EXPECT_EQ(book.column(Portfolio::Column::Spot)[1], 97.0);
+    expect_matches(book, positions);
+
+    // Removing moves the last position into the freed slot, carrying its stale flag with it.
+    positions.push_back(call(7.0));
+    EXPECT_EQ(book.add(positions.back()), 4U);
+    book.remove(0);
+    positions[0] = positions.back();
+    positions.pop_back();
+    EXPECT_EQ(book.stale_count(), 1U);
+    EXPECT_EQ(book.column(Portfolio::Column::Quantity)[0], 7.0);
+    EXPECT_EQ(book.column(Portfolio::Column::Type)[0], 1.0);
+    expect_matches(book, positions);
+    book.remove(book.size() - 1);
+    positions.pop_back();
+    expect_matches(book, positions);
+
+    const std::vector<MarketShock> shocks{{-0.1, 0.05, 0.0, 0.0, 1.0 / 365.0}};
+    const auto from_book = book.scenario_pnl(shocks);
+    const auto from_rows = quant::portfolio::scenario_pnl(positions, shocks);
+    EXPECT_EQ(from_book.portfolio_pnl, from_rows.portfolio_pnl);
+
+    auto invalid = call();
+    invalid.strike = -1.0;
+    EXPECT_THROW(book.add(invalid), std::invalid_argument);
+    EXPECT_THROW(book.amend(0, invalid), std::invalid_argument);
+    EXPECT_EQ(book.size(), positions.size());
+    EXPECT_THROW(book.add({call(), invalid}), std::invalid_argument);
+    EXPECT_THROW(book.amend({0, 1}, {put(), invalid}), std::invalid_argument);
+    EXPECT_EQ(book.size(), positions.size());
+    EXPECT_EQ(book.stale_count(), 0U);
+    EXPECT_THROW(book.amend(book.size(), call()), std::out_of_range);
+    EXPECT_THROW(book.remove(book.size()), std::out_of_range);
+    EXPECT_THROW(Portfolio().risk(), std::invalid_argument);
+}
+
+TEST(PortfolioRisk, TickUpdatesRepriceOnlyAffectedPositions) {
+    std::vector<VanillaPosition> positions;
+    std::vector<std::size_t> underlyings;
+    for (int i = 0; i < 60; ++i) {
+        auto position = (i % 2 == 0) ? call(1.0 + i) : put(-0.5 * i);
+        position.time = 0.1 + 0.05 * (i % 12);
+        positions.push_back(position);
+        underlyings.push_back(static_cast<std::size_t>(i % 3) * 10);
+    }
+    quant::portfolio::TickRiskEngine engine(positions, underlyings);
+
+    const auto expect_full_recompute = [&] {
+        const auto expected = quant::portfolio::price_risk(positions).totals;
+        const auto totals = engine.totals();
+        EXPECT_NEAR(totals.value, expected.value, 1e-10 * std::abs(expected.value));
+        EXPECT_NEAR(totals.delta, expected.delta, 1e-10 * std::abs(expected.delta));
+        EXPECT_NEAR(totals.vega, expected.vega, 1e-10 * std::abs(expected.vega));
+        EXPECT_NEAR(totals.rho, expected.rho, 1e-10 * std::abs(expected.rho));
+    };
+    expect_full_recompute();
+
+    EXPECT_EQ(engine.apply({.underlying = 10, .spot = 103.0}), 20U);
+    for (std::size_t i = 1; i < positions.size(); i += 3) {
+        positions[i].spot = 103.0;
+    }
+    expect_full_recompute();
+
+    // A volatility move confined to expiries in [0.3, 0.45] touches 5 of the underlying's 20.
+    const quant::portfolio::MarketUpdate pillar{
+        .underlying = 20, .volatility_shift = 0.02, .min_expiry = 0.3, .max_expiry = 0.45};
+    EXPECT_EQ(engine.apply(pillar), 5U);
+    for (std::size_t i = 2; i < positions.size(); i += 3) {
+        if (positions[i].time >= 0.3 && positions[i].time <= 0.45) {
+            positions[i].volatility += 0.02;
+        }
+    }
+    EXPECT_EQ(engine.apply({.underlying = 0, .rate = 0.045}), 20U);
+    for (std::size_t i = 0; i < positions.size(); i += 3) {
+        positions[i].rate = 0.045;
+    }
+    expect_full_recompute();
+    EXPECT_EQ(engine.apply({.underlying = 0}), 0U);
+
+    const auto before = engine.totals();
+    EXPECT_THROW(engine.apply({.underlying = 5, .spot = 100.0}), std::invalid_argument);
+    EXPECT_THROW(engine.apply({.underlying = 0, .spot = -1.0}), std::invalid_argument);
+    EXPECT_THROW(engine.apply({.underlying = 0, .spot = 99.0, .volatility_shift = -1.0}),
+                 std::invalid_argument);
+    EXPECT_EQ(engine.totals().value, before.value);
+    EXPECT_EQ(engine.book().column(quant::portfolio::Portfolio::Column::Spot)[0], positions[0].spot);
+    engine.resync();
+    expect_full_recompute();
+    EXPECT_THROW(quant::portfolio::TickRiskEngine(positions, {0}), std::invalid_argument);
+}
+
+TEST(PortfolioRisk, MarketStateDrivesCrossAssetScenarios) {
+    using quant::portfolio::MarketPosition;
+    using quant::portfolio::MarketState;
+    using quant::portfolio::VolSurface;
+    const VolSurface skew{{0.25, 1.0}, {80.0, 100.0, 120.0}, {0.30, 0.22, 0.20, 0.26, 0.20, 0.19}};
+    EXPECT_DOUBLE_EQ(skew.volatility(0.25, 100.0), 0.22);
+    EXPECT_DOUBLE_EQ(skew.volatility(0.625, 90.0), 0.5 * (0.5 * (0.30 + 0.22) + 0.5 * (0.26 + 0.20)));
+    EXPECT_DOUBLE_EQ(skew.volatility(5.0, 200.0), 0.19);
+    EXPECT_DOUBLE_EQ(skew.volatility(0.0, 10.0), 0.30);
+
+    const MarketState market{{{100.0, 0.03, 0.01, 0}, {45.0, 0.02, 0.0, 1}, {100.0, 0.03, 0.02, 0}},
+                             {skew, VolSurface{{1.0}, {50.0}, {0.35}}}};
+    std::vector<MarketPosition> positions;
+    for (std::size_t i = 0; i < 2500; ++i) {
+        const std::size_t underlying = i % 3;
+        const double spot = market.underlyings[underlying].spot;
+        const double time = i % 50 == 0 ? 0.0 : 0.1 + 0.001 * static_cast<double>(i % 900);
+        positions.push_back(MarketPosition{i % 2 == 0 ? OptionType::Call : OptionType::Put,
+                                           0.5 + static_cast<double>(i % 5), underlying,
+                                           spot * (0.8 + 0.0002 * static_cast<double>(i)), time});
+    }
+    const auto resolved = quant::portfolio::resolve_positions(market, positions);
+    EXPECT_DOUBLE_EQ(resolved[1].spot, 45.0);
+    EXPECT_DOUBLE_EQ(resolved[1].volatility, 0.35);
+
+    const std::vector<double> corr{1.0, 0.6, 0.9, 0.6, 1.0, 0.5, 0.9, 0.5, 1.0};
+    auto shocks = quant::portfolio::correlated_spot_shocks({0.2, 0.3, 0.25}, corr, 10.0 / 252.0, 4, 17);
+    ASSERT_EQ(shocks.size(), 12u);
+    shocks[3 * 1 + 1].volatility_shift = 0.05;
+    shocks[3 * 2 + 0].rate_shift = -0.01;
+    shocks[3 * 3 + 2].time_elapsed = 0.05;
+    const auto result = quant::portfolio::scenario_pnl(market, positions, shocks, true);
+    ASSERT_EQ(result.scenario_count, 4u);
+    for (std::size_t s = 0; s < result.scenario_count; ++s) {
+        double total = 0.0;
+        for (std::size_t i = 0; i < positions.size(); ++i) {
+            const auto& shock = shocks[s * 3 + positions[i].underlying];
+            auto shocked = resolved[i];
+            shocked.spot *= 1.0 + shock.spot_return;
+            shocked.rate += shock.rate_shift;
+            shocked.volatility += shock.volatility_shift;
+            shocked.time = std::max(0.0, shocked.time - shock.time_elapsed);
+            const double expected = quant::portfolio::price_risk({shocked}).totals.value -
+                                    quant::portfolio::price_risk({resolved[i]}).totals.value;
+            EXPECT_NEAR(result.position_pnl[s * positions.size() + i], expected, 1e-9);
+            total += result.position_pnl[s * positions.size() + i];
+        }
+        EXPECT_NEAR(result.portfolio_pnl[s], total, 1e-8);
+    }
+
+    // The generator's log returns have the requested correlation and a zero mean return.
+    const std::vector<double> pair{1.0, 0.8, 0.8, 1.0};
+    const auto draws = quant::portfolio::correlated_spot_shocks({0.2, 0.3}, pair, 1.0, 40000, 5);
+    double mean = 0.0, sxx = 0.0, syy = 0.0, sxy = 0.0;
+    for (std::size_t s = 0; s < 40000; ++s) {
+        const double x = std::log1p(draws[2 * s].spot_return) + 0.02;
+        const double y = std::log1p(draws[2 * s + 1].spot_return) + 0.045;
+        mean += draws[2 * s + 1].spot_return / 40000.0;
+        sxx += x * x;
+        syy += y * y;
+        sxy += x * y;
+    }
+    EXPECT_NEAR(sxy / std::sqrt(sxx * syy), 0.8, 0.01);
+    EXPECT_NEAR(std::sqrt(syy / 40000.0), 0.3, 0.005);
+    EXPECT_NEAR(mean, 0.0, 0.006);
+    EXPECT_DOUBLE_EQ(draws[6].spot_return,
+                     quant::portfolio::correlated_spot_shocks({0.2, 0.3}, pair, 1.0, 4, 5)[6].spot_return);
+
+    EXPECT_THROW(quant::portfolio::scenario_pnl(market, positions, {shocks[0]}), std::invalid_argument);
+    auto unknown = positions;
+    unknown[7].underlying = 3;
+    EXPECT_THROW(quant::portfolio::scenario_pnl(market, unknown, shocks), std::invalid_argument);
+    EXPECT_THROW(quant::portfolio::correlated_spot_shocks({0.2, 0.2}, {1.0, 1.2, 1.2, 1.0}, 1.0, 4, 5),
+                 std::invalid_argument);
+    const std::vector<double> indefinite{1.0, 0.9, -0.9, 0.9, 1.0, 0.9, -0.9, 0.9, 1.0};
+    EXPECT_THROW(quant::portfolio::correlated_spot_shocks({0.2, 0.2, 0.2}, indefinite, 1.0, 4, 5),
+                 std::invalid_argument);
+}
+
 TEST(PortfolioRisk, ExpiryUsesIntrinsicValue) {
     auto expired = call(3.0);
     expired.spot = 110.0;
@@ -104,6 +104,10 @@ def deterministic_positions() -> np.ndarray:
     return np.asarray(rows, dtype=np.float64)
 
 
+def invalid_row() -> np.ndarray:
+    return np.array([[1.0, 1.0, 100.0, -100.0, 0.01, 0.0, 0.2, 1.0]])
+
+
 def main() -> int:
     args = parse_args()
     sys.path.insert(0, str(args.module_dir.resolve()))
@@ -170,6 +174,23 @@ def main() -> int:
     np.testing.assert_array_equal(
         aggregate_only["portfolio_pnl"], scenario_result["portfolio_pnl"]
     )
+    assert aggregate_only["revalued_cells"] is None
+    exact_hybrid = qp.bs_portfolio_scenarios(
+        scenario_positions,
+        shocks,
+        detail=True,
+        revaluation=qp.ScenarioRevaluation.Hybrid,
+        tolerance=0.0,
+    )
+    np.testing.assert_allclose(
+        exact_hybrid["position_pnl"], reference_detail, rtol=1e-10, atol=1e-9
+    )
+    revalued = exact_hybrid["revalued_cells"]
+    assert revalued.shape[1] == 2 and len(revalued) > 0
+    taylor = qp.bs_portfolio_scenarios(
+        scenario_positions, shocks, True, qp.ScenarioRevaluation.Taylor
+    )
+    assert np.all(taylor["position_pnl"][0] == 0.0)
 
     with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
         outputs = list(
@@ -183,6 +204,159 @@ def main() -> int:
     for output in outputs:
         np.testing.assert_array_equal(output, scenario_result["portfolio_pnl"])
 
+    book = qp.Portfolio(*positions.T)
+    assert len(book) == len(positions) and book.stale_count == len(positions)
+    book_risk = book.risk()
+    assert book_risk["repriced"] == len(positions) and book.stale_count == 0
+    np.testing.assert_array_equal(
+        book_risk["portfolio_totals"], result["portfolio_totals"]
+    )
+    for index, name in enumerate(POSITION_COLUMNS):
+        np.testing.assert_array_equal(book_risk["metrics"][name], actual[:, index])
+    spot_view = book.column("spot")
+    assert not spot_view.flags.writeable and not spot_view.flags.owndata
+    amended = positions[[3, 8]].copy()
+    amended[:, 2] *= 1.01
+    book.amend(np.array([3, 8]), *amended.T)
+    assert book.stale_count == 2 and spot_view[3] == amended[0, 2]
+    assert book.risk()["repriced"] == 2
+    expected_positions = positions.copy()
+    expected_positions[[3, 8]] = amended
+    np.testing.assert_array_equal(
+        book.risk()["portfolio_totals"],
+        qp.bs_portfolio_risk(expected_positions)["portfolio_totals"],
+    )
+    scenario_book = qp.Portfolio(*scenario_positions.T)
+    np.testing.assert_array_equal(
+        scenario_book.scenarios(shocks)["portfolio_pnl"],
+        aggregate_only["portfolio_pnl"],
+    )
+    # Views pin the columns: resizing the book is refused until they are released.
+    for resize in (lambda: book.add(*positions[:2].T), lambda: book.remove(0)):
+        try:
+            resize()
+        except BufferError:
+            pass
+        else:
+            raise AssertionError("book resized while column views were alive")
+    assert len(book) == len(positions)
+    del spot_view, book_risk
+    first_added = book.add(*positions[:2].T)
+    assert first_added == len(positions) and len(book) == len(positions) + 2
+    book.remove(0)
+    np.testing.assert_array_equal(book.column("spot")[0], positions[1, 2])
+    for bad_update in (
+        lambda: book.add(*invalid_row().T),
+        lambda: book.amend(np.array([len(book)]), *positions[:1].T),
+    ):
+        try:
+            bad_update()
+        except (ValueError, RuntimeError, IndexError):
+            pass
+        else:
+            raise AssertionError("invalid portfolio update did not fail closed")
+    assert len(book) == len(positions) + 1
+
+    engine = qp.TickRiskEngine(*positions.T, underlyings=np.arange(len(positions)) % 3)
+    np.testing.assert_allclose(
+        engine.totals(), result["portfolio_totals"], rtol=1e-12, atol=1e-12
+    )
+    assert engine.apply(1, spot=101.5) == len(positions) // 3
+    ticked = positions.copy()
+    ticked[1::3, 2] = 101.5
+    np.testing.assert_allclose(
+        engine.totals(),
+        qp.bs_portfolio_risk(ticked)["portfolio_totals"],
+        rtol=1e-10,
+        atol=1e-10,
+    )
+
+    underlyings = np.array([[100.0, 0.03, 0.01, 0.0], [45.0, 0.02, 0.0, 1.0]])
+    surfaces = [
+        qp.VolSurface(np.array([1.0]), np.array([100.0]), np.array([[0.24]])),
+        qp.VolSurface(np.array([1.0]), np.array([50.0]), np.array([[0.35]])),
+    ]
+    market_positions = np.array(
+        [
+            [1.0, 2.0, 0.0, 105.0, 0.75],
+            [-1.0, -1.5, 1.0, 40.0, 0.40],
+            [-1.0, 3.0, 0.0, 95.0, 1.25],
+        ]
+    )
+    market_shocks = qp.correlated_spot_shocks(
+        np.array([0.2, 0.3]), np.array([[1.0, 0.6], [0.6, 1.0]]), 10.0 / 252.0, 8, 3
+    )
+    assert market_shocks.shape == (8, 2, 5)
+    market_result = qp.bs_market_scenarios(
+        underlyings, surfaces, market_positions, market_shocks, True
+    )
+    flat = np.array(
+        [
+            [1.0, 2.0, 100.0, 105.0, 0.03, 0.01, 0.24, 0.75],
+            [-1.0, -1.5, 45.0, 40.0, 0.02, 0.0, 0.35, 0.40],
+            [-1.0, 3.0, 100.0, 95.0, 0.03, 0.01, 0.24, 1.25],
+        ]
+    )
+    for scenario in range(len(market_shocks)):
+        for row, underlying in enumerate((0, 1, 0)):
+            single = qp.bs_portfolio_scenarios(
+                flat[row : row + 1], market_shocks[scenario, underlying][None, :], False
+            )
+            np.testing.assert_allclose(
+                market_result["position_pnl"][scenario, row],
+                single["portfolio_pnl"][0],
+                rtol=1e-12,
+                atol=1e-12,
+            )
+
+    var_result = qp.portfolio_var(
+        underlyings,
+        surfaces,
+        market_positions,
+        np.array([0.2, 0.3]),
+        np.array([0.6, 0.6]),
+        0.01,
+        np.array([[1.0, 0.6], [0.6, 1.0]]),
+        10.0 / 252.0,
+        4000,
+        5,
+        0.99,
+    )
+    assert var_result["portfolio_pnl"].shape == (4000,)
+    assert math.isclose(
+        var_result["component_var"].sum(), var_result["var"], rel_tol=1e-9
+    )
+    assert math.isclose(
+        var_result["component_cvar"].sum(), var_result["cvar"], rel_tol=1e-9
+    )
+    assert var_result["incremental_var"].shape == (3,)
+
+    # Strided view: columns are read in place and match the single-column routine.
+    pnl_matrix = np.asfortranarray(var_result["portfolio_pnl"].reshape(1000, 4))[:, ::2]
+    batch = qp.var_cvar_batch(pnl_matrix, [0.99, 0.95])
+    assert batch["var"].shape == (2, 2)
+    for column in range(2):
+        for index, alpha in enumerate((0.99, 0.95)):
+            single = qp.var_cvar_from_pnl(pnl_matrix[:, column].tolist(), alpha)
+            assert batch["var"][column, index] == single.var
+            assert math.isclose(
+                batch["cvar"][column, index], single.cvar, rel_tol=1e-12
+            )
+
+    returns = (0.01 * np.sin(0.7 * np.arange(400))).tolist()
+    runs = qp.rolling_var_backtest(returns, [50, 120], [0.99, 0.95])
+    assert [run["window"] for run in runs] == [50, 120]
+    engine = qp.RollingVar(120, [0.99, 0.95])
+    for day, ret in enumerate(returns):
+        if day >= 120:
+            forecast = engine.forecast(1)
+            expected = qp.var_cvar_from_pnl(returns[day - 120 : day], 0.95)
+            assert forecast.var == expected.var == runs[1]["var"][day - 120, 1]
+        flags = engine.push(ret)
+        if day >= 120:
+            assert flags == runs[1]["exceptions"][day - 120].tolist()
+    assert engine.stats(0).N == runs[1]["stats"][0].N
+
     invalid_cases = [
         np.ones((2, 7)),
         np.array([[0.0, 1.0, 100.0, 100.0, 0.01, 0.0, 0.2, 1.0]]),
@@ -3,8 +3,17 @@
 #include "quant/math.hpp"
 #include "quant/risk.hpp"
 
+#ifdef QUANT_HAS_OPENMP
+#include <omp.h>
+#endif
+
+#include <algorithm>
 #include <cmath>
+#include <cstddef>
 #include <limits>
+#include <numbers>
+#include <numeric>
+#include <stdexcept>
 #include <vector>
 
 namespace {
@@ -16,6 +25,27 @@ double chi_square_tail_df1(double x) {
 
 double chi_square_tail_df2(double x) { return std::exp(-0.5 * x); }
 
+// Two underlyings on flat surfaces, so removing a position leaves the vol anchors unchanged.
+quant::portfolio::MarketState two_asset_market() {
+    using quant::portfolio::VolSurface;
+    return {{{100.0, 0.02, 0.0, 0}, {50.0, 0.02, 0.01, 1}},
+            {VolSurface{{1.0}, {100.0}, {0.2}}, VolSurface{{1.0}, {50.0}, {0.3}}}};
+}
+
+double sum(const std::vector<double>& values) { return std::accumulate(values.begin(), values.end(), 0.0); }
+
+template <typename Fn> auto with_threads(int threads, Fn&& fn) {
+#ifdef QUANT_HAS_OPENMP
+    const int previous = omp_get_max_threads();
+    omp_set_num_threads(threads);
+#endif
+    auto result = fn();
+#ifdef QUANT_HAS_OPENMP
+    omp_set_num_threads(previous);
+#endif
+    return result;
+}
+
 } // namespace
 
 TEST(RiskBacktest, KupiecPValuesBoundedAndAccurate) {
@@ -93,3 +123,286 @@ TEST(RiskBacktest, GbmVarMatchesAnalyticQuantile) {
     EXPECT_NEAR(stats.var, var_expected, 0.2);
     EXPECT_GT(stats.cvar, stats.var);
 }
+
+TEST(PortfolioVar, DeepInTheMoneyCallMatchesSpotQuantile) {
+    using quant::portfolio::VolSurface;
+    const quant::portfolio::MarketState market{{{100.0, 0.0, 0.0, 0}}, {VolSurface{{1.0}, {1.0}, {0.2}}}};
+    const std::vector<quant::portfolio::MarketPosition> book{
+        {quant::portfolio::OptionType::Call, 1.0, 0, 1.0, 1.0}};
+    const double horizon = 10.0 / 252.0;
+    const quant::risk::PortfolioVarParams params{.spot_vols = {0.2},
+                                                 .vol_vols = {0.0},
+                                                 .corr = {1.0},
+                                                 .horizon_years = horizon,
+                                                 .num_sims = 40000,
+                                                 .seed = 7,
+                                                 .alpha = 0.99};
+    const auto res = quant::risk::portfolio_var(market, book, params);
+    // A strike-1 call is the forward: its P&L is the spot move.
+    const double scale = 0.2 * std::sqrt(horizon);
+    const double z = quant::math::inverse_normal_cdf(0.01);
+    EXPECT_NEAR(res.total.var, -100.0 * std::expm1(-0.5 * scale * scale + scale * z), 0.3);
+    EXPECT_GT(res.total.cvar, res.total.var);
+    ASSERT_EQ(res.component_var.size(), 1u);
+    EXPECT_NEAR(res.component_var[0], res.total.var, 1e-9);
+    EXPECT_NEAR(res.component_cvar[0], res.total.cvar, 1e-9);
+    EXPECT_NEAR(res.incremental_var[0], res.total.var, 1e-12);
+}
+
+TEST(PortfolioVar, ContributionsAddUpAndIncrementalMatchesReducedBook) {
+    using quant::portfolio::OptionType;
+    const auto market = two_asset_market();
+    const std::vector<quant::portfolio::MarketPosition> book{{OptionType::Call, 10.0, 0, 105.0, 0.5},
+                                                             {OptionType::Put, -8.0, 1, 45.0, 0.25},
+                                                             {OptionType::Put, 5.0, 0, 95.0, 1.0}};
+    quant::risk::PortfolioVarParams params{.spot_vols = {0.25, 0.35},
+                                           .vol_vols = {0.8, 1.0},
+                                           .rate_vol = 0.01,
+                                           .corr = {1.0, 0.5, 0.5, 1.0},
+                                           .horizon_years = 5.0 / 252.0,
+                                           .num_sims = 20000,
+                                           .seed = 11,
+                                           .alpha = 0.975};
+    const auto res = quant::risk::portfolio_var(market, book, params);
+    EXPECT_GT(res.total.var, 0.0);
+    EXPECT_NEAR(sum(res.component_var), res.total.var, 1e-9 * res.total.var);
+    EXPECT_NEAR(sum(res.component_cvar), res.total.cvar, 1e-9 * res.total.cvar);
+
+    // Same seed and anchors: the reduced book sees identical factor draws.
+    const std::vector<quant::portfolio::MarketPosition> reduced{book[0], book[2]};
+    const auto without = quant::risk::portfolio_var(market, reduced, params);
+    EXPECT_NEAR(res.incremental_var[1], res.total.var - without.total.var, 1e-9);
+
+    // Full correlation over [spot_0, spot_1, vol_0, vol_1, rate] reproduces the spot-only form.
+    params.corr = {1.0, 0.5, 0.0, 0.0, 0.0, 0.5, 1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0,
+                   0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0};
+    const auto full = quant::risk::portfolio_var(market, book, params);
+    EXPECT_NEAR(full.total.var, res.total.var, 1e-9);
+}
+
+TEST(PortfolioVar, ChunkedContributionsForLargeBooks) {
+    using quant::portfolio::OptionType;
+    const auto market = two_asset_market();
+    std::vector<quant::portfolio::MarketPosition> book;
+    for (int i = 0; i < 300; ++i) {
+        const std::size_t underlying = static_cast<std::size_t>(i % 2);
+        const double spot = underlying == 0 ? 100.0 : 50.0;
+        book.push_back({i % 3 == 0 ? OptionType::Put : OptionType::Call, (i % 5) - 2.0, underlying,
+                        spot * (0.8 + 0.004 * i / 3.0), 0.1 + 0.01 * (i % 40)});
+    }
+    const quant::risk::PortfolioVarParams params{.spot_vols = {0.2, 0.3},
+                                                 .vol_vols = {0.5, 0.5},
+                                                 .rate_vol = 0.005,
+                                                 .corr = {1.0, -0.3, -0.3, 1.0},
+                                                 .horizon_years = 1.0 / 252.0,
+                                                 .num_sims = 15000,
+                                                 .seed = 3,
+                                                 .alpha = 0.99};
+    const auto res = quant::risk::portfolio_var(market, book, params);
+    ASSERT_EQ(res.incremental_var.size(), book.size());
+    EXPECT_NEAR(sum(res.component_var), res.total.var, 1e-9 * std::abs(res.total.var));
+    EXPECT_NEAR(sum(res.component_cvar), res.total.cvar, 1e-9 * std::abs(res.total.cvar));
+
+    auto no_contributions = params;
+    no_contributions.contributions = false;
+    const auto totals = quant::risk::portfolio_var(market, book, no_contributions);
+    EXPECT_EQ(totals.total.var, res.total.var);
+    EXPECT_TRUE(totals.component_var.empty());
+}
+
+TEST(PortfolioVar, RejectsInvalidInputs) {
+    const auto market = two_asset_market();
+    const std::vector<quant::portfolio::MarketPosition> book{
+        {quant::portfolio::OptionType::Call, 1.0, 0, 100.0, 1.0}};
+    quant::risk::PortfolioVarParams params{.spot_vols = {0.2, 0.3},
+                                           .vol_vols = {0.0, 0.0},
+                                           .corr = {1.0, 0.0, 0.0, 1.0},
+                                           .horizon_years = 0.01,
+                                           .num_sims = 100,
+                                           .seed = 1,
+                                           .alpha = 0.99};
+    EXPECT_NO_THROW(quant::risk::portfolio_var(market, book, params));
+    params.corr = {1.0, 1.5, 1.5, 1.0};
+    EXPECT_THROW(quant::risk::portfolio_var(market, book, params), std::invalid_argument);
+    params.corr = {1.0, 0.0, 0.0};
+    EXPECT_THROW(quant::risk::portfolio_var(market, book, params), std::invalid_argument);
+    params.corr = {1.0, 0.0, 0.0, 1.0};
+    params.alpha = 1.0;
+    EXPECT_THROW(quant::risk::portfolio_var(market, book, params), std::invalid_argument);
+    params.alpha = 0.99;
+    params.spot_vols = {0.2};
+    EXPECT_THROW(quant::risk::portfolio_var(market, book, params), std::invalid_argument);
+}
+
+TEST(RiskSelection, MatchesSortedReferenceAndBatchReadsStridedColumns) {
+    const std::size_t rows = 1001;
+    const std::size_t columns = 3;
+    // Row-major (rows, columns) samples with ties.
+    std::vector<double> matrix(rows * columns);
+    for (std::size_t r = 0; r < rows; ++r)
+        for (std::size_t c = 0; c < columns; ++c)
+            matrix[r * columns + c] = std::round(50.0 * std::sin(0.37 * r + 1.3 * c)) * (c + 1.0);
+    const std::vector<double> alphas{0.95, 0.99, 0.5, 0.975};
+
+    const auto batch = quant::risk::var_cvar_batch(matrix.data(), rows, columns,
+                                                   static_cast<std::ptrdiff_t>(columns), 1, alphas);
+    ASSERT_EQ(batch.var.size(), columns * alphas.size());
+    for (std::size_t c = 0; c < columns; ++c) {
+        std::vector<double> column(rows);
+        for (std::size_t r = 0; r < rows; ++r)
+            column[r] = matrix[r * columns + c];
+        std::vector<double> sorted = column;
+        std::sort(sorted.begin(), sorted.end());
+        for (std::size_t a = 0; a < alphas.size(); ++a) {
+            const auto idx = static_cast<std::size_t>(std::floor((1.0 - alphas[a]) * rows));
+            double es = 0.0;
+            for (std::size_t i = 0; i <= idx; ++i)
+                es -= sorted[i];
+            es /= static_cast<double>(idx + 1);
+            const auto single = quant::risk::var_cvar_from_pnl(column, alphas[a]);
+            EXPECT_EQ(single.var, -sorted[idx]);
+            EXPECT_NEAR(single.cvar, es, 1e-12 * std::abs(es) + 1e-12);
+            EXPECT_EQ(batch.var[c * alphas.size() + a], single.var);
+            EXPECT_NEAR(batch.cvar[c * alphas.size() + a], es, 1e-12 * std::abs(es) + 1e-12);
+        }
+    }
+
+    // Column-major copy read through the transposed strides gives the same answers.
+    std::vector<double> transposed(rows * columns);
+    for (std::size_t r = 0; r < rows; ++r)
+        for (std::size_t c = 0; c < columns; ++c)
+            transposed[c * rows + r] = matrix[r * columns + c];
+    const auto again = quant::risk::var_cvar_batch(transposed.data(), rows, columns, 1,
+                                                   static_cast<std::ptrdiff_t>(rows), alphas);
+    EXPECT_EQ(again.var, batch.var);
+
+    EXPECT_THROW(quant::risk::var_cvar_batch(matrix.data(), rows, columns, 3, 1, {1.0}),
+                 std::invalid_argument);
+    EXPECT_THROW(quant::risk::var_cvar_batch(matrix.data(), 0, columns, 3, 1, alphas), std::invalid_argument);
+}
+
+TEST(RiskBacktest, RollingHistoricalMatchesWindowRecomputation) {
+    // Quantised returns so windows contain ties.
+    std::vector<double> returns(600);
+    for (std::size_t t = 0; t < returns.size(); ++t)
+        returns[t] = 0.001 * std::round(20.0 * std::sin(0.71 * t) * std::cos(0.13 * t));
+    const quant::risk::RollingVarParams params{.window = 50, .alphas = {0.9, 0.99, 0.5}};
+    const auto res = quant::risk::rolling_var_backtest(returns, params);
+    ASSERT_EQ(res.forecasts, returns.size() - params.window);
+
+    std::vector<std::vector<int>> exceptions(params.alphas.size());
+    for (std::size_t f = 0; f < res.forecasts; ++f) {
+        const std::vector<double> window(returns.begin() + f, returns.begin() + f + params.window);
+        for (std::size_t a = 0; a < params.alphas.size(); ++a) {
+            const auto expected = quant::risk::var_cvar_from_pnl(window, params.alphas[a]);
+            const std::size_t cell = f * params.alphas.size() + a;
+            EXPECT_EQ(res.var[cell], expected.var);
+            EXPECT_NEAR(res.cvar[cell], expected.cvar, 1e-12);
+            const int breach = returns[params.window + f] < -expected.var ? 1 : 0;
+            EXPECT_EQ(res.exceptions[cell], breach);
+            exceptions[a].push_back(breach);
+        }
+    }
+    for (std::size_t a = 0; a < params.alphas.size(); ++a) {
+        const auto batch = quant::risk::kupiec_christoffersen(exceptions[a], params.alphas[a]);
+        EXPECT_EQ(res.stats[a].N, batch.N);
+        EXPECT_EQ(res.stats[a].lr_pof, batch.lr_pof);
+        EXPECT_EQ(res.stats[a].lr_ind, batch.lr_ind);
+    }
+}
+
+TEST(RiskBacktest, RollingFilteredHistoricalRescalesStandardisedResiduals) {
+    std::vector<double> returns(300);
+    for (std::size_t t = 0; t < returns.size(); ++t)
+        returns[t] = 0.01 * (1.0 + (t > 150 ? 1.5 : 0.0)) * std::sin(1.37 * t + 0.2);
+    const quant::risk::RollingVarParams params{.window = 40,
+                                               .alphas = {0.95},
+                                               .method = quant::risk::VarMethod::FilteredHistorical,
+                                               .ewma_lambda = 0.9};
+    quant::risk::RollingVar engine(params);
+
+    double variance = 0.0;
+    for (std::size_t i = 0; i < params.window; ++i)
+        variance += returns[i] * returns[i] / params.window;
+    std::vector<double> residuals;
+    for (std::size_t t = 0; t < returns.size(); ++t) {
+        if (t >= params.window) {
+            ASSERT_TRUE(engine.ready());
+            const std::vector<double> window(residuals.end() - params.window, residuals.end());
+            const auto expected = quant::risk::var_cvar_from_pnl(window, 0.95);
+            const auto forecast = engine.forecast(0);
+            EXPECT_NEAR(forecast.var, std::sqrt(variance) * expected.var, 1e-12);
+            EXPECT_NEAR(forecast.cvar, std::sqrt(variance) * expected.cvar, 1e-12);
+            EXPECT_EQ(engine.push(returns[t])[0], returns[t] < -forecast.var ? 1 : 0);
+        } else {
+            EXPECT_FALSE(engine.ready());
+            EXPECT_EQ(engine.push(returns[t])[0], 0);
+        }
+        residuals.push_back(returns[t] / std::sqrt(variance));
+        variance = 0.9 * variance + 0.1 * returns[t] * returns[t];
+    }
+    EXPECT_EQ(engine.stats(0).T, returns.size() - params.window);
+}
+
+TEST(RiskBacktest, KupiecUsesConfidenceAndRejectsBadRollingParams) {
+    // 5 exceptions in 100 days is on target for 95% VaR.
+    quant::risk::ExceptionTracker tracker(0.95);
+    for (int t = 0; t < 100; ++t)
+        tracker.push(t % 20 == 10);
+    const auto stats = tracker.stats();
+    EXPECT_NEAR(stats.lr_pof, 0.0, 1e-9);
+    EXPECT_NEAR(stats.p_pof, 1.0, 1e-6);
+
+    EXPECT_THROW(quant::risk::RollingVar({.window = 0}), std::invalid_argument);
+    EXPECT_THROW(quant::risk::RollingVar({.window = 10, .alphas = {1.0}}), std::invalid_argument);
+    EXPECT_THROW(
+        quant::risk::RollingVar(
+            {.window = 10, .method = quant::risk::VarMethod::FilteredHistorical, .ewma_lambda = 1.0}),
+        std::invalid_argument);
+    quant::risk::RollingVar engine({.window = 2});
+    EXPECT_THROW(engine.push(std::numeric_limits<double>::quiet_NaN()), std::invalid_argument);
+}
+
+TEST(RiskSimulation, GaussianPortfolioWithManyFactorsMatchesAnalytic) {
+    const std::size_t N = 150;
+    std::vector<double> mu(N), sigma(N), weights(N), corr(N * N, 0.3);
+    for (std::size_t i = 0; i < N; ++i) {
+        mu[i] = 0.02 + 0.0001 * i;
+        sigma[i] = 0.1 + 0.002 * i;
+        weights[i] = (i % 3 == 0 ? -0.5 : 1.0) / N;
+        corr[i * N + i] = 1.0;
+    }
+    const double h = 10.0 / 252.0;
+    const double alpha = 0.99;
+    const auto run = [&] {
+        return quant::risk::var_cvar_portfolio(mu, sigma, corr, weights, h, 40000, 17, alpha);
+    };
+    const auto one = with_threads(1, run);
+    const auto four = with_threads(4, run);
+    EXPECT_EQ(one.var, four.var);
+    EXPECT_EQ(one.cvar, four.cvar);
+
+    double drift = 0.0, variance = 0.0;
+    for (std::size_t i = 0; i < N; ++i) {
+        drift += weights[i] * mu[i] * h;
+        for (std::size_t j = 0; j < N; ++j)
+            variance += weights[i] * sigma[i] * weights[j] * sigma[j] * corr[i * N + j] * h;
+    }
+    const double sd = std::sqrt(variance);
+    const double z = quant::math::inverse_normal_cdf(1.0 - alpha);
+    const double density = std::exp(-0.5 * z * z) / std::sqrt(2.0 * std::numbers::pi);
+    EXPECT_NEAR(one.var, -(drift + sd * z), 0.08 * sd);
+    EXPECT_NEAR(one.cvar, -(drift - sd * density / (1.0 - alpha)), 0.08 * sd);
+}
+
+TEST(RiskSimulation, StudentTQuantileAndThreadInvariance) {
+    const double nu = 4.0;
+    const auto run = [&] { return quant::risk::var_cvar_t(0.0, 0.2, nu, 1.0, 1.0, 200000, 5, 0.99); };
+    const auto one = with_threads(1, run);
+    const auto four = with_threads(4, run);
+    EXPECT_EQ(one.var, four.var);
+    EXPECT_EQ(one.cvar, four.cvar);
+    // Unit-variance t(4) quantile: t_{0.99}(4) sqrt((nu - 2) / nu).
+    EXPECT_NEAR(one.var, 0.2 * 3.746947 * std::sqrt((nu - 2.0) / nu), 0.02);
+    EXPECT_GT(one.cvar, one.var);
+}
@@ -0,0 +1,114 @@
+#include <gtest/gtest.h>
+
+#include <algorithm>
+#include <cstdint>
+#include <vector>
+
+#include "quant/qmc/sobol.hpp"
+
+using quant::qmc::SobolSequence;
+
+TEST(SobolFast, CursorMatchesRandomAccess) {
+    const SobolSequence seq(37, true, 20240611ULL);
+    std::vector<double> expected(seq.dimension());
+    std::vector<double> actual(seq.dimension());
+    for (std::uint64_t start : {0ULL, 1ULL, 5ULL, 1023ULL, 123456789ULL}) {
+        auto cursor = seq.cursor(start);
+        for (std::uint64_t n = 0; n < 300; ++n) {
+            ASSERT_EQ(cursor.index(), start + n);
+            cursor.next(actual.data());
+            seq.generate(start + n, expected.data());
+            for (std::size_t d = 0; d < seq.dimension(); ++d) {
+                ASSERT_EQ(actual[d], expected[d]) << "index " << start + n << " dim " << d;
+            }
+        }
+    }
+}
+
+TEST(SobolFast, GenerateBlockMatchesRandomAccess) {
+    const SobolSequence seq(8);
+    const std::uint64_t begin = 77;
+    const std::size_t count = 64;
+    std::vector<double> block(count * seq.dimension());
+    seq.generate_block(begin, count, block.data());
+    for (std::size_t n = 0; n < count; ++n) {
+        const auto point = seq.generate(begin + n);
+        for (std::size_t d = 0; d < seq.dimension(); ++d) {
+            EXPECT_EQ(block[n * seq.dimension() + d], point[d]);
+        }
+    }
+}
+
+TEST(SobolFast, OneDimensionalProjectionsAreStratified) {
+    // Every coordinate of the first 2^k unscrambled points hits each dyadic bin exactly once,
+    // including dimensions beyond the original 64-dimension table.
+    const std::size_t dims = SobolSequence::kMaxSupportedDimension;
+    const SobolSequence seq(dims);
+    const std::size_t n = 256;
+    std::vector<double> block(n * dims);
+    seq.generate_block(0, n, block.data());
+    for (std::size_t d = 0; d < dims; ++d) {
+        std::vector<int> bins(n, 0);
+        for (std::size_t i = 0; i < n; ++i) {
+            const auto bin = static_cast<std::size_t>(block[i * dims + d] * static_cast<double>(n));
+            ++bins[std::min(bin, n - 1)];
+        }
+        for (std::size_t b = 0; b < n; ++b) {
+            ASSERT_EQ(bins[b], 1) << "dim " << d << " bin " << b;
+        }
+    }
+}
+
+TEST(SobolFast, LeadingDimensionsAreDistinct) {
+    const SobolSequence seq(2);
+    bool differs = false;
+    for (std::uint64_t i = 1; i < 16; ++i) {
+        const auto point = seq.generate(i);
+        differs = differs || (point[0] != point[1]);
+    }
+    EXPECT_TRUE(differs);
+}
+
+TEST(SobolFast, RejectsUnsupportedDimension) {
+    EXPECT_THROW(SobolSequence(0), std::invalid_argument);
+    EXPECT_THROW(SobolSequence(SobolSequence::kMaxSupportedDimension + 1), std::invalid_argument);
+}
+
+TEST(SobolFast, OwenScramblePreservesStratification) {
+    const std::size_t dims = 16;
+    const SobolSequence seq(dims, SobolSequence::Scramble::Owen, 99ULL);
+    const std::size_t n = 128;
+    std::vector<double> block(n * dims);
+    seq.generate_block(0, n, block.data());
+    for (std::size_t d = 0; d < dims; ++d) {
+        std::vector<int> bins(n, 0);
+        for (std::size_t i = 0; i < n; ++i) {
+            const auto bin = static_cast<std::size_t>(block[i * dims + d] * static_cast<double>(n));
+            ++bins[std::min(bin, n - 1)];
+        }
+        for (std::size_t b = 0; b < n; ++b) {
+            ASSERT_EQ(bins[b], 1) << "dim " << d << " bin " << b;
+        }
+    }
+}
+
+TEST(SobolFast, OwenScrambleDependsOnSeed) {
+    const SobolSequence a(4, SobolSequence::Scramble::Owen, 1ULL);
+    const SobolSequence b(4, SobolSequence::Scramble::Owen, 2ULL);
+    const SobolSequence plain(4);
+    bool differs_seed = false;
+    bool differs_plain = false;
+    for (std::uint64_t i = 0; i < 8; ++i) {
+        const auto pa = a.generate(i);
+        const auto pb = b.generate(i);
+        const auto pp = plain.generate(i);
+        for (std::size_t d = 0; d < 4; ++d) {
+            EXPECT_GT(pa[d], 0.0);
+            EXPECT_LT(pa[d], 1.0);
+            differs_seed = differs_seed || (pa[d] != pb[d]);
+            differs_plain = differs_plain || (pa[d] != pp[d]);
+        }
+    }
+    EXPECT_TRUE(differs_seed);
+    EXPECT_TRUE(differs_plain);
+}